@@ -1,60 +1,131 @@
 """Main function used as script to convert OntoUML JSON files into knowledge graphs, with the flexibility to \
 customize the output and control the execution mode for different use cases."""
 
-import glob
-import inspect
+import json
 import os
+import sys
 import time
 import warnings
-from pathlib import Path
-
-from rdflib import RDF, Graph
+from contextlib import closing
 
 try:
     from .modules import arguments as args
+except ImportError:
+    from modules import arguments as args
+
+# In script mode, the arguments are parsed before the decoding modules and RDFLib are imported, so that the help, the
+# version, and argument errors are reported without loading them.
+if __name__ == "__main__":
+    args.initialize_args_script()
+
+from rdflib import Graph
+
+try:
     from .modules.content_identity import resolve_base_uri
     from .modules.metadata import METADATA
     from .modules.property_assignments import (
         apply_property_assignment_policy,
-        collect_property_assignments,
+        PropertyAssignmentCollector,
+    )
+    from .modules.batch_inputs import (
+        BatchInput,
+        get_entry_output_stems,
+        get_json_input_stem,
+        iter_batch_inputs,
+        iter_entry_inputs,
+        list_batch_entries,
     )
     from .modules.input_output import (
+        load_json_content,
         safe_load_json_file,
         create_directory_if_not_exists,
         safe_write_graph_file,
+        serialize_graph,
     )
     from .modules.logger import initialize_logger
     from .modules.transformation_metadata import (
         build_transformation_metadata,
         get_transformation_configuration,
-        graph_with_metadata,
+        embedded_metadata,
     )
     from .modules.utils_general import get_date_time
+    from .modules.utils_graph import collect_ontouml_terms, remove_diagrammatic_resources, set_graph_ontouml_terms
     from .modules.utils_validations import validate_execution_mode
-    from .modules.errors import report_error_end_of_switch
+    from .modules.errors import report_error_end_of_switch, report_error_io_write
+    from .modules.output_compression import COMPRESSION_SUFFIXES
+    from .modules.output_partitions import write_partitioned_graph_files
+    from .modules.output_dataset import (
+        DatasetFileWriter,
+        get_dataset_graph_name,
+        get_dataset_provenance_graph_name,
+    )
+    from .modules.graph_store import close_output_graph
+    from .modules.sharding import decode_json_to_graph_sharded, decode_json_to_spilled_graph
+    from .modules.memory_budget import (
+        MemoryBudgetError,
+        estimate_graph_memory,
+        format_memory_size,
+        get_available_memory,
+    )
+    from .modules.spilled_graph import NTRIPLES_FORMATS
+    from .modules.source_visitor import SourceVisitor
+    from .modules.project_check import CheckFinding, check_json_data
+    from .modules.selection import select_project_elements
+    from .modules.lazy_store import create_lazy_project_graph
+    from .modules.diagnostics import DiagnosticsCollector, collect_diagnostics
+    from .modules.server import serve_json_lines
+    from .modules.watch import InputWatcher
     from .decoder.decode_main import decode_json_to_graph
 except ImportError:
-    from modules import arguments as args
     from modules.content_identity import resolve_base_uri
     from modules.metadata import METADATA
     from modules.property_assignments import (
         apply_property_assignment_policy,
-        collect_property_assignments,
+        PropertyAssignmentCollector,
+    )
+    from modules.batch_inputs import (
+        BatchInput,
+        get_entry_output_stems,
+        get_json_input_stem,
+        iter_batch_inputs,
+        iter_entry_inputs,
+        list_batch_entries,
     )
     from modules.input_output import (
+        load_json_content,
         safe_load_json_file,
         create_directory_if_not_exists,
         safe_write_graph_file,
+        serialize_graph,
     )
     from modules.logger import initialize_logger
     from modules.transformation_metadata import (
         build_transformation_metadata,
         get_transformation_configuration,
-        graph_with_metadata,
+        embedded_metadata,
     )
     from modules.utils_general import get_date_time
+    from modules.utils_graph import collect_ontouml_terms, remove_diagrammatic_resources, set_graph_ontouml_terms
     from modules.utils_validations import validate_execution_mode
-    from modules.errors import report_error_end_of_switch
+    from modules.errors import report_error_end_of_switch, report_error_io_write
+    from modules.output_compression import COMPRESSION_SUFFIXES
+    from modules.output_partitions import write_partitioned_graph_files
+    from modules.output_dataset import (
+        DatasetFileWriter,
+        get_dataset_graph_name,
+        get_dataset_provenance_graph_name,
+    )
+    from modules.graph_store import close_output_graph
+    from modules.sharding import decode_json_to_graph_sharded, decode_json_to_spilled_graph
+    from modules.memory_budget import MemoryBudgetError, estimate_graph_memory, format_memory_size, get_available_memory
+    from modules.spilled_graph import NTRIPLES_FORMATS
+    from modules.source_visitor import SourceVisitor
+    from modules.project_check import CheckFinding, check_json_data
+    from modules.selection import select_project_elements
+    from modules.lazy_store import create_lazy_project_graph
+    from modules.diagnostics import DiagnosticsCollector, collect_diagnostics
+    from modules.server import serve_json_lines
+    from modules.watch import InputWatcher
     from decoder.decode_main import decode_json_to_graph
 
 
@@ -77,6 +148,14 @@ def decode_ontouml_json2graph(
     append_content_hash: bool = False,
     path_order_policy: str = "warn",
     property_assignment_policy: str = "warn",
+    shard_processes: int = 1,
+    json_content: bytes | None = None,
+    store: str = "default",
+    store_configuration: str | None = None,
+    diagnostics: DiagnosticsCollector | None = None,
+    geometry_encoding: str = "points",
+    select: list[str] | None = None,
+    max_memory: int | str | None = None,
 ) -> Graph:
     """Convert OntoUML JSON data to a Knowledge Graph.
 
@@ -120,22 +199,39 @@ def decode_ontouml_json2graph(
                                        (default) and 'comment'. The latter adds their canonical JSON as a
                                        non-normative rdfs:comment annotation. (Optional)
     :type property_assignment_policy: str
+    :param shard_processes: Number of worker processes used to decode top-level packages and diagrams in parallel.
+                            Default is 1 (no sharding). (Optional)
+    :type shard_processes: int
+    :param json_content: Raw bytes of the JSON document, used instead of reading json_file_path. In this case,
+                         json_file_path only identifies the document, e.g., as an archive member. (Optional)
+    :type json_content: bytes or None
+    :param store: Name of the RDFLib store plugin that keeps the output graph. Default is 'default' (in memory).
+                  (Optional)
+    :type store: str
+    :param store_configuration: Configuration used to open the store before the conversion (e.g., a path). Triples
+                                already in the store are removed. (Optional)
+    :type store_configuration: str or None
+    :param diagnostics: Collector that records the warnings and correction messages of the conversion instead of
+                        issuing them, unless it emits them. (Optional)
+    :type diagnostics: DiagnosticsCollector or None
+    :param geometry_encoding: How diagram geometry is encoded. Valid values are 'points' (default) and 'compact'.
+                              The latter adds one non-normative coordinate literal per path or shape. (Optional)
+    :type geometry_encoding: str
+    :param select: IDs of the Packages and Diagrams to be decoded, or patterns matched against their names. Only
+                   these are decoded, with the model elements they reference, transitively. None (default) decodes the
+                   whole project. (Optional)
+    :type select: list[str] or None
+    :param max_memory: Memory budget of the conversion in bytes, or as a string with a K, M, G, or T suffix (e.g.,
+                       '2G'). A graph that is not expected to fit is decoded in parts spilled to temporary files, and
+                       the returned graph reads them from disk until it is closed. None (default) sets no budget.
+                       (Optional)
+    :type max_memory: int or str or None
 
     :return: JSON data decoded into a RDFLib's Graph that is compliant with the OntoUML Vocabulary.
     :rtype: Graph
     """
     logger = initialize_logger(execution_mode)
 
-    model_elements = [
-        "Class",
-        "Property",
-        "Generalization",
-        "GeneralizationSet",
-        "Relation",
-        "Literal",
-        "Cardinality",
-    ]
-
     validate_execution_mode(execution_mode)
 
     if execution_mode == "test":
@@ -148,6 +244,11 @@ def decode_ontouml_json2graph(
             transformation_metadata=transformation_metadata,
             path_order_policy=path_order_policy,
             property_assignment_policy=property_assignment_policy,
+            shard_processes=shard_processes,
+            store=store,
+            store_configuration=store_configuration,
+            geometry_encoding=geometry_encoding,
+            select=select,
         )
     elif execution_mode == "import":
         args.initialize_args_import(
@@ -164,6 +265,12 @@ def decode_ontouml_json2graph(
             append_content_hash=append_content_hash,
             path_order_policy=path_order_policy,
             property_assignment_policy=property_assignment_policy,
+            shard_processes=shard_processes,
+            store=store,
+            store_configuration=store_configuration,
+            geometry_encoding=geometry_encoding,
+            select=select,
+            max_memory=max_memory,
         )
 
     if execution_mode == "script" and not args.ARGUMENTS["silent"]:
@@ -190,8 +297,15 @@ def decode_ontouml_json2graph(
             )
 
     # Load JSON
-    json_data = safe_load_json_file(json_file_path)
-    property_assignment_records = collect_property_assignments(json_data)
+    if json_content is None:
+        json_data = safe_load_json_file(json_file_path)
+    else:
+        json_data = load_json_content(json_content, json_file_path)
+
+    # Property assignments are collected in the traversal that prepares the JSON data for decoding
+    source_visitor = SourceVisitor()
+    property_assignment_collector = PropertyAssignmentCollector()
+    property_assignment_collector.register(source_visitor)
 
     if execution_mode != "test":
         args.ARGUMENTS["base_uri"] = resolve_base_uri(
@@ -200,28 +314,59 @@ def decode_ontouml_json2graph(
             append_content_hash=args.ARGUMENTS["append_content_hash"],
         )
 
-    # Decode JSON into Graph
-    ontouml_graph = decode_json_to_graph(json_data, language, execution_mode)
-
-    # If set by user, remove all diagrammatic elements
-    if args.ARGUMENTS["model_only"]:
-        for s, _, o in ontouml_graph.triples((None, RDF.type, None)):
-            s_type = s.toPython()
-            o_type = o.fragment
-            # Remove if not a model element and if it is defined by of the ontology being handled
-            if (args.ARGUMENTS["base_uri"] in s_type) and (o_type not in model_elements):
-                ontouml_graph.remove((s, None, None))
-                ontouml_graph.remove((None, None, s))
-        if not args.ARGUMENTS["silent"]:
-            logger.info("All diagrammatic data removed from the output. The output contains only model elements.")
-
-    apply_property_assignment_policy(
-        records=property_assignment_records,
-        ontouml_graph=ontouml_graph,
-        policy=args.ARGUMENTS["property_assignment_policy"],
-        input_path=args.ARGUMENTS["input_path"],
-        base_uri=args.ARGUMENTS["base_uri"],
-    )
+    # Only the selected Packages and Diagrams are decoded, in the namespace derived from the complete project.
+    if args.ARGUMENTS["select"]:
+        json_data = select_project_elements(json_data, args.ARGUMENTS["select"])
+
+    spilled = args.ARGUMENTS["max_memory"] is not None and _requires_spilled_decoding(json_data, execution_mode)
+
+    # Decode JSON into Graph, collecting the OntoUML terms it uses so that building provenance does not scan it
+    with collect_diagnostics(diagnostics), collect_ontouml_terms() as used_ontouml_terms:
+        if spilled:
+            ontouml_graph = decode_json_to_spilled_graph(
+                json_data,
+                args.ARGUMENTS["language"],
+                execution_mode,
+                max_memory=args.ARGUMENTS["max_memory"],
+                source_visitor=source_visitor,
+            )
+        elif args.ARGUMENTS["shard_processes"] > 1:
+            ontouml_graph = decode_json_to_graph_sharded(
+                json_data,
+                args.ARGUMENTS["language"],
+                execution_mode,
+                processes=args.ARGUMENTS["shard_processes"],
+                source_visitor=source_visitor,
+            )
+        else:
+            ontouml_graph = decode_json_to_graph(
+                json_data, args.ARGUMENTS["language"], execution_mode, source_visitor=source_visitor
+            )
+
+        # If set by user, remove all diagrammatic elements
+        if args.ARGUMENTS["model_only"]:
+            # The shards of a spilled graph are reduced before they are spilled.
+            if not spilled:
+                remove_diagrammatic_resources(ontouml_graph, args.ARGUMENTS["base_uri"])
+            if not args.ARGUMENTS["silent"]:
+                logger.info("All diagrammatic data removed from the output. The output contains only model elements.")
+
+        apply_property_assignment_policy(
+            records=property_assignment_collector.records,
+            ontouml_graph=ontouml_graph,
+            policy=args.ARGUMENTS["property_assignment_policy"],
+            input_path=args.ARGUMENTS["input_path"],
+            base_uri=args.ARGUMENTS["base_uri"],
+        )
+
+    if diagnostics is not None and diagnostics.emit and not args.ARGUMENTS["silent"]:
+        for code, suppressed_count in diagnostics.get_suppressed_counts().items():
+            logger.warning(f"{suppressed_count} further {code} diagnostic(s) not shown due to the diagnostics limit.")
+
+    # Resources whose IRIs may fall in the OntoUML namespace are not collected, so such graphs are scanned instead.
+    base_uri = args.ARGUMENTS["base_uri"]
+    if not (base_uri.startswith(METADATA["conformsToBase"]) or METADATA["conformsToBase"].startswith(base_uri)):
+        set_graph_ontouml_terms(ontouml_graph, used_ontouml_terms)
 
     if execution_mode == "script" and not args.ARGUMENTS["silent"]:
         # Get software's execution conclusion time
@@ -234,32 +379,254 @@ def decode_ontouml_json2graph(
         metadata_graph = build_transformation_metadata(
             ontouml_graph=ontouml_graph,
             input_file_path=json_file_path,
-            output_file_name=f"{Path(json_file_path).stem} in-memory graph",
+            output_file_name=f"{get_json_input_stem(json_file_path)} in-memory graph",
             graph_format="",
             configuration=get_transformation_configuration(args.ARGUMENTS, graph_format=None),
+            input_content=json_content,
         )
-        return graph_with_metadata(ontouml_graph, metadata_graph)
+        # The returned graph is created by this call, so the provenance is added to it instead of to a copy.
+        ontouml_graph.addN((*triple, ontouml_graph) for triple in metadata_graph)
 
     return ontouml_graph
 
 
-def write_graph_file(ontouml_graph: Graph, execution_mode: str = "script") -> str:
+def _requires_spilled_decoding(json_data: dict, execution_mode: str) -> bool:
+    """Return True if the graph of the JSON data is not expected to fit in the memory left by the budget.
+
+    The graph is then decoded in shards spilled to disk. When that is not possible for the requested conversion, the
+    conversion fails before decoding starts.
+
+    :param json_data: Input JSON data loaded as a dictionary.
+    :type json_data: dict
+    :param execution_mode: Information about the execution mode. Valid values are 'import', 'script', and 'test'.
+    :type execution_mode: str
+    :return: True if the graph must be spilled to disk, False if it can be decoded in memory.
+    :rtype: bool
+    :raises MemoryBudgetError: If the graph does not fit in the budget and cannot be spilled to disk.
+    """
+    max_memory = args.ARGUMENTS["max_memory"]
+    required_memory = estimate_graph_memory(json_data).graph_bytes
+    available_memory = get_available_memory(max_memory)
+
+    # Graphs on other stores are not kept in memory.
+    if required_memory <= available_memory or args.ARGUMENTS["store"] != "default":
+        return False
+
+    message = (
+        f"Input file '{args.ARGUMENTS['input_path']}': the graph needs about {format_memory_size(required_memory)}, "
+        f"but only {format_memory_size(available_memory)} of the memory budget of {format_memory_size(max_memory)} "
+        f"is available"
+    )
+    if args.ARGUMENTS["correct"]:
+        raise MemoryBudgetError(f"{message}, and the correction of the graph requires it in memory.")
+    if execution_mode == "script" and not args.ARGUMENTS["batch_dataset"]:
+        if args.ARGUMENTS["format"] not in NTRIPLES_FORMATS or args.ARGUMENTS["partition"] != "none":
+            raise MemoryBudgetError(
+                f"{message}, and only an unpartitioned N-Triples output or a batch dataset can be written from a "
+                f"graph spilled to disk. Use one of the formats {list(NTRIPLES_FORMATS)} or a larger budget."
+            )
+
+    if not args.ARGUMENTS["silent"]:
+        initialize_logger().info(f"{message}. The graph is decoded in parts spilled to temporary files.")
+    return True
+
+
+def check_ontouml_json(
+    json_file_path: str,
+    model_only: bool = False,
+    correct: bool = False,
+    execution_mode: str = "import",
+    invalid_stereotype_policy: str = "preserve",
+    invalid_cardinality_policy: str = "preserve",
+    unresolved_model_element_policy: str = "omit",
+    path_order_policy: str = "warn",
+    property_assignment_policy: str = "warn",
+    json_content: bytes | None = None,
+) -> list[CheckFinding]:
+    """Check OntoUML JSON data against the source-level policies, without building or serializing a graph.
+
+    The findings are those that a conversion with the same options reports, except that all elements rejected by
+    error policies are reported instead of only the first one. Warnings are returned instead of being issued, and
+    the messages of the correction pass are returned instead of being logged.
+
+    :param json_file_path: Path to the JSON file to be checked provided by the user.
+    :type json_file_path: str
+    :param model_only: If True, the diagrammatic information is not checked. (Optional)
+    :type model_only: bool
+    :param correct: If True, check the constraints enforced by the correction pass. (Optional)
+    :type correct: bool
+    :param execution_mode: Information about the execution mode. Valid values are 'import' (default), 'script', and
+                           'test'. In script mode, the options are read from the command-line arguments. (Optional)
+    :type execution_mode: str
+    :param invalid_stereotype_policy: How to handle stereotypes invalid for their element type. Valid values are
+                                      'preserve', 'omit', and 'error'. Default is 'preserve'. (Optional)
+    :type invalid_stereotype_policy: str
+    :param invalid_cardinality_policy: How to handle invalid cardinalities. Valid values are 'preserve', 'repair',
+                                       and 'error'. Default is 'preserve'. (Optional)
+    :type invalid_cardinality_policy: str
+    :param unresolved_model_element_policy: How to handle unresolved modelElement references. Valid values are
+                                            'preserve', 'omit', and 'error'. Default is 'omit'. (Optional)
+    :type unresolved_model_element_policy: str
+    :param path_order_policy: How to handle path-point order. Valid values are 'warn' (default) and 'comment'.
+                              (Optional)
+    :type path_order_policy: str
+    :param property_assignment_policy: How to handle non-empty propertyAssignments maps. Valid values are 'warn'
+                                       (default) and 'comment'. (Optional)
+    :type property_assignment_policy: str
+    :param json_content: Raw bytes of the JSON document, used instead of reading json_file_path. (Optional)
+    :type json_content: bytes or None
+
+    :return: Findings of the check, errors first.
+    :rtype: list[CheckFinding]
+    """
+    validate_execution_mode(execution_mode)
+
+    if execution_mode != "script":
+        args.initialize_args_import(
+            input_path=json_file_path,
+            model_only=model_only,
+            silent=True,
+            correct=correct,
+            invalid_cardinality_policy=invalid_cardinality_policy,
+            invalid_stereotype_policy=invalid_stereotype_policy,
+            unresolved_model_element_policy=unresolved_model_element_policy,
+            path_order_policy=path_order_policy,
+            property_assignment_policy=property_assignment_policy,
+        )
+
+    if json_content is None:
+        json_data = safe_load_json_file(json_file_path)
+    else:
+        json_data = load_json_content(json_content, json_file_path)
+
+    if args.ARGUMENTS["select"]:
+        json_data = select_project_elements(json_data, args.ARGUMENTS["select"])
+
+    return check_json_data(json_data)
+
+
+def open_ontouml_json_lazily(
+    json_file_path: str,
+    base_uri: str | None = None,
+    language: str = "",
+    invalid_stereotype_policy: str = "preserve",
+    invalid_cardinality_policy: str = "preserve",
+    unresolved_model_element_policy: str = "omit",
+    append_content_hash: bool = False,
+) -> Graph:
+    """Load an OntoUML JSON project into a read-only graph whose triples are decoded when they are requested.
+
+    :param json_file_path: Path to the JSON file to be decoded.
+    :type json_file_path: str
+    :param base_uri: Base URI of the project's resources. Defaults to a namespace derived from the content. (Optional)
+    :type base_uri: str or None
+    :param language: Language tag to be added to the ontology's concepts. (Optional)
+    :type language: str
+    :param invalid_stereotype_policy: How to handle stereotypes invalid for their element type. Valid values are
+                                      'preserve', 'omit', and 'error'. Default is 'preserve'. (Optional)
+    :type invalid_stereotype_policy: str
+    :param invalid_cardinality_policy: How to handle invalid cardinalities. Valid values are 'preserve', 'repair',
+                                       and 'error'. Default is 'preserve'. (Optional)
+    :type invalid_cardinality_policy: str
+    :param unresolved_model_element_policy: How to handle unresolved modelElement references. Valid values are
+                                            'preserve', 'omit', and 'error'. Default is 'omit'. (Optional)
+    :type unresolved_model_element_policy: str
+    :param append_content_hash: If True, base_uri is treated as a parent and the content UUID is appended.
+                                (Optional)
+    :type append_content_hash: bool
+
+    :return: Graph on a LazyProjectStore of the project.
+    :rtype: Graph
+    """
+    args.initialize_args_import(
+        input_path=json_file_path,
+        base_uri=base_uri,
+        language=language,
+        invalid_cardinality_policy=invalid_cardinality_policy,
+        invalid_stereotype_policy=invalid_stereotype_policy,
+        unresolved_model_element_policy=unresolved_model_element_policy,
+        append_content_hash=append_content_hash,
+    )
+
+    json_data = safe_load_json_file(json_file_path)
+    args.ARGUMENTS["base_uri"] = resolve_base_uri(
+        json_data=json_data,
+        base_uri=args.ARGUMENTS["base_uri_input"],
+        append_content_hash=args.ARGUMENTS["append_content_hash"],
+    )
+
+    return create_lazy_project_graph(json_data)
+
+
+def check_all_ontouml_json() -> bool:
+    """Check the input file, or each JSON document of the input directory in batch mode, and print the findings.
+
+    Each finding is printed on one line of the standard output, after the path of its document and its severity.
+
+    :return: True if an error policy rejects the content of any checked document.
+    :rtype: bool
+    """
+    logger = initialize_logger()
+    if args.ARGUMENTS["decode_all"]:
+        batch_inputs = iter_batch_inputs(args.ARGUMENTS["input_path"])
+    else:
+        batch_inputs = [BatchInput(args.ARGUMENTS["input_path"], get_json_input_stem(args.ARGUMENTS["input_path"]))]
+
+    checked_documents = 0
+    finding_counts = {"error": 0, "warning": 0}
+    for batch_input in batch_inputs:
+        args.ARGUMENTS["input_path"] = batch_input.source_path
+        findings = check_ontouml_json(
+            batch_input.source_path, execution_mode="script", json_content=batch_input.content
+        )
+        for finding in findings:
+            print(f"{batch_input.source_path}: {finding.severity}: {finding.category}: {finding.message}")
+            finding_counts[finding.severity] += 1
+        checked_documents += 1
+
+    if not args.ARGUMENTS["silent"]:
+        logger.info(
+            f"{checked_documents} JSON document(s) checked: {finding_counts['error']} error(s) and "
+            f"{finding_counts['warning']} warning(s) found."
+        )
+
+    return finding_counts["error"] > 0
+
+
+def write_graph_file(
+    ontouml_graph: Graph,
+    execution_mode: str = "script",
+    output_stem: str | None = None,
+    input_content: bytes | None = None,
+    diagnostics: DiagnosticsCollector | None = None,
+) -> str:
     """Save the ontology graph received as argument into a file using the syntax defined by the user.
 
     When running in script mode, the result is saved in the folder specified by the user as argument.
     When running in test mode, the file is saved inside the 'results' directory created by this function.
+    If the 'partition' argument is not 'none', the graph is saved into several files listed in a JSON manifest.
 
     :param ontouml_graph: Graph compliant with the OntoUML Vocabulary.
     :type ontouml_graph: Graph
     :param execution_mode: Information about the execution mode.
                            Valid values are 'import' (default), 'script', and 'test'. (Optional)
     :type execution_mode: str
-
-    :return: Saved output file path.
+    :param output_stem: Output path relative to the output directory, without format and compression suffixes.
+                        Defaults to the input file name without its JSON and compression suffixes. (Optional)
+    :type output_stem: str or None
+    :param input_content: Raw bytes of the decoded JSON document when it was not read from the input path, used to
+                          identify the source in the transformation metadata. (Optional)
+    :type input_content: bytes or None
+    :param diagnostics: Diagnostics of the conversion, saved in a JSON report next to the output graph if requested
+                        with the 'diagnostics_report' argument. (Optional)
+    :type diagnostics: DiagnosticsCollector or None
+
+    :return: Saved output file path, or the path of the manifest of a partitioned output.
     :rtype: str
     """
     logger = initialize_logger()
-    loaded_file_name = Path(args.ARGUMENTS["input_path"]).stem
+    if output_stem is None:
+        output_stem = get_json_input_stem(args.ARGUMENTS["input_path"])
 
     if execution_mode == "test":
         # Collecting information for result file name and path
@@ -273,15 +640,21 @@ def write_graph_file(ontouml_graph: Graph, execution_mode: str = "script") -> st
     elif execution_mode == "script":
         base_path = args.ARGUMENTS["output_path"]
     else:
+        import inspect
+
         current_function = inspect.stack()[0][3]
         report_error_end_of_switch("execution_mode", current_function)
 
-    # Setting file complete path
-    output_file_name = loaded_file_name + "." + args.ARGUMENTS["format"]
-    output_file_path = base_path + os.path.sep + output_file_name
+    # Setting file complete path. A partitioned output is described by its manifest file.
+    compression_suffix = COMPRESSION_SUFFIXES[args.ARGUMENTS["compression"]]
+    if args.ARGUMENTS["partition"] == "none":
+        output_file_name = output_stem + "." + args.ARGUMENTS["format"] + compression_suffix
+    else:
+        output_file_name = output_stem + ".manifest.json"
+    output_file_path = os.path.join(base_path, *output_file_name.split("/"))
+    create_directory_if_not_exists(os.path.dirname(output_file_path), "output directory")
 
     transformation_metadata = args.ARGUMENTS["transformation_metadata"]
-    output_graph = ontouml_graph
     metadata_graph = Graph()
 
     if transformation_metadata in ("embedded", "sidecar"):
@@ -294,52 +667,324 @@ def write_graph_file(ontouml_graph: Graph, execution_mode: str = "script") -> st
                 args.ARGUMENTS,
                 graph_format=args.ARGUMENTS["format"],
             ),
+            include_generation_time=not args.ARGUMENTS["canonical"],
+            input_content=input_content,
         )
 
-    if transformation_metadata == "embedded":
-        output_graph = graph_with_metadata(ontouml_graph, metadata_graph)
-
-    safe_write_graph_file(output_graph, output_file_path, args.ARGUMENTS["format"])
+    # Embedded metadata is added to the model graph only while it is written, so the model graph is not copied.
+    with embedded_metadata(ontouml_graph, metadata_graph if transformation_metadata == "embedded" else Graph()):
+        if args.ARGUMENTS["partition"] == "none":
+            safe_write_graph_file(
+                ontouml_graph,
+                output_file_path,
+                args.ARGUMENTS["format"],
+                args.ARGUMENTS["canonical"],
+                args.ARGUMENTS["compression"],
+            )
+        else:
+            write_partitioned_graph_files(
+                ontouml_graph,
+                base_path,
+                output_stem,
+                args.ARGUMENTS["format"],
+                args.ARGUMENTS["partition"],
+                args.ARGUMENTS["partition_size"],
+                args.ARGUMENTS["canonical"],
+                args.ARGUMENTS["compression"],
+                input_path=args.ARGUMENTS["input_path"],
+            )
 
     if transformation_metadata == "sidecar":
-        sidecar_file_path = str(Path(output_file_path).with_suffix(".provenance.ttl"))
-        safe_write_graph_file(metadata_graph, sidecar_file_path, "ttl")
+        sidecar_file_path = os.path.join(base_path, *f"{output_stem}.provenance.ttl{compression_suffix}".split("/"))
+        safe_write_graph_file(
+            metadata_graph,
+            sidecar_file_path,
+            "ttl",
+            args.ARGUMENTS["canonical"],
+            args.ARGUMENTS["compression"],
+        )
         if not args.ARGUMENTS["silent"]:
             logger.info(f"Transformation metadata sidecar successfully saved at {sidecar_file_path}.")
 
+    write_diagnostics_report(base_path, output_stem, diagnostics)
+
     if not args.ARGUMENTS["silent"]:
-        logger.info(f"Output graph file successfully saved at {output_file_path}.\n")
+        if args.ARGUMENTS["partition"] == "none":
+            logger.info(f"Output graph file successfully saved at {output_file_path}.\n")
+        else:
+            logger.info(f"Output graph partitions successfully saved with their manifest at {output_file_path}.\n")
 
     return output_file_path
 
 
+def write_diagnostics_report(base_path: str, output_stem: str, diagnostics: DiagnosticsCollector | None) -> None:
+    """Save the diagnostics of a conversion in '<output_stem>.diagnostics.json' if the user requested a report.
+
+    :param base_path: Directory in which the report is saved.
+    :type base_path: str
+    :param output_stem: Output path relative to the base path, without format and compression suffixes.
+    :type output_stem: str
+    :param diagnostics: Diagnostics of the conversion, or None if they were not collected.
+    :type diagnostics: DiagnosticsCollector or None
+    """
+    if not args.ARGUMENTS["diagnostics_report"] or diagnostics is None:
+        return
+
+    report_file_path = os.path.join(base_path, *f"{output_stem}.diagnostics.json".split("/"))
+    create_directory_if_not_exists(os.path.dirname(report_file_path), "output directory")
+    try:
+        with open(report_file_path, "w", encoding="utf-8") as report_file:
+            json.dump({"input": args.ARGUMENTS["input_path"], **diagnostics.get_report()}, report_file, indent=2)
+    except OSError as error:
+        report_error_io_write(report_file_path, "diagnostics report file", error)
+    if not args.ARGUMENTS["silent"]:
+        initialize_logger().info(f"Diagnostics report successfully saved at {report_file_path}.")
+
+
+def create_script_diagnostics() -> DiagnosticsCollector | None:
+    """Return the collector of a conversion in script mode if the user limited or requested a report of diagnostics.
+
+    The collector emits the kept diagnostics, so the warnings and log messages are the usual ones up to the limit.
+
+    :return: Diagnostics collector, or None if diagnostics are issued without a collector.
+    :rtype: DiagnosticsCollector or None
+    """
+    if args.ARGUMENTS["diagnostics_limit"] is None and not args.ARGUMENTS["diagnostics_report"]:
+        return None
+    return DiagnosticsCollector(limit=args.ARGUMENTS["diagnostics_limit"], emit=True)
+
+
 def decode_all_ontouml_json2graph() -> None:
     """Decode multiple OntoUML JSON files in batch mode.
 
     This function processes a directory of OntoUML JSON files and converts each file into a corresponding
     knowledge graph using the specified options.
-    The output graphs are saved in the output directory chosen by the user as argument.
+    The output graphs are saved in the output directory chosen by the user as argument, or in a single dataset file
+    if the 'batch_dataset' argument is True.
+    """
+    if args.ARGUMENTS["batch_dataset"]:
+        write_batch_dataset_file()
+        return
+
+    shares_explicit_base_uri = (
+        args.ARGUMENTS["base_uri_input"] is not None and not args.ARGUMENTS["append_content_hash"]
+    )
+
+    # Archive members are read one at a time, so the number of inputs is only known at the end.
+    for input_number, batch_input in enumerate(iter_batch_inputs(args.ARGUMENTS["input_path"])):
+        if input_number == 1 and shares_explicit_base_uri:
+            warnings.warn(
+                "All batch outputs will use the same explicit base URI. Their resources can collide if the graphs "
+                "are combined. Use --base-uri-with-content-id to create a separate content-derived namespace for "
+                "each distinct JSON document.",
+                SharedBatchBaseURIWarning,
+                stacklevel=2,
+            )
+
+        _decode_batch_input(batch_input)
+
+
+def _decode_batch_input(batch_input: BatchInput) -> None:
+    """Decode one JSON document in script mode and save its output graph."""
+    args.ARGUMENTS["input_path"] = batch_input.source_path
+    diagnostics = create_script_diagnostics()
+    result_graph = decode_ontouml_json2graph(
+        json_file_path=batch_input.source_path,
+        execution_mode="script",
+        json_content=batch_input.content,
+        diagnostics=diagnostics,
+    )
+    write_graph_file(
+        result_graph,
+        execution_mode="script",
+        output_stem=batch_input.output_stem,
+        input_content=batch_input.content,
+        diagnostics=diagnostics,
+    )
+    close_output_graph(result_graph)
+
+
+def write_batch_dataset_file() -> str:
+    """Decode all JSON documents of the batch input and stream their graphs into a single dataset file.
+
+    The dataset is saved in the output directory as '<input directory name>.<format>' (plus the compression suffix),
+    with each graph in a named graph given by its base URI without the trailing '#'. Embedded transformation metadata
+    is written in the project's graph, and sidecar metadata in a companion graph named '<base URI>provenance'. A
+    document whose graph name was already written, i.e., a duplicate of an earlier document, is skipped.
+
+    :return: Saved dataset file path.
+    :rtype: str
+    """
+    logger = initialize_logger()
+    graph_format = args.ARGUMENTS["format"]
+    output_file_name = (
+        f"{get_json_input_stem(args.ARGUMENTS['input_path'])}.{graph_format}"
+        f"{COMPRESSION_SUFFIXES[args.ARGUMENTS['compression']]}"
+    )
+    output_file_path = os.path.join(args.ARGUMENTS["output_path"], output_file_name)
+    transformation_metadata = args.ARGUMENTS["transformation_metadata"]
+
+    try:
+        with closing(
+            DatasetFileWriter(output_file_path, graph_format, args.ARGUMENTS["compression"])
+        ) as dataset_writer:
+            for batch_input in iter_batch_inputs(args.ARGUMENTS["input_path"]):
+                args.ARGUMENTS["input_path"] = batch_input.source_path
+                diagnostics = create_script_diagnostics()
+                result_graph = decode_ontouml_json2graph(
+                    json_file_path=batch_input.source_path,
+                    execution_mode="script",
+                    json_content=batch_input.content,
+                    diagnostics=diagnostics,
+                )
+                graph_name = get_dataset_graph_name(args.ARGUMENTS["base_uri"])
+                if graph_name in dataset_writer.graph_names:
+                    logger.warning(
+                        f"{batch_input.source_path} has the same content as an earlier input. "
+                        f"Its graph <{graph_name}> is written only once."
+                    )
+                    close_output_graph(result_graph)
+                    continue
+
+                metadata_graph = Graph()
+                if transformation_metadata in ("embedded", "sidecar"):
+                    metadata_graph = build_transformation_metadata(
+                        ontouml_graph=result_graph,
+                        input_file_path=batch_input.source_path,
+                        output_file_name=output_file_name,
+                        graph_format=graph_format,
+                        configuration=get_transformation_configuration(args.ARGUMENTS, graph_format=graph_format),
+                        include_generation_time=not args.ARGUMENTS["canonical"],
+                        input_content=batch_input.content,
+                    )
+
+                with embedded_metadata(
+                    result_graph, metadata_graph if transformation_metadata == "embedded" else Graph()
+                ):
+                    dataset_writer.write_graph(result_graph, graph_name)
+                if transformation_metadata == "sidecar":
+                    dataset_writer.write_graph(
+                        metadata_graph, get_dataset_provenance_graph_name(args.ARGUMENTS["base_uri"])
+                    )
+
+                write_diagnostics_report(args.ARGUMENTS["output_path"], batch_input.output_stem, diagnostics)
+                close_output_graph(result_graph)
+    except OSError as error:
+        report_error_io_write(output_file_path, "output dataset file", error)
+
+    if not args.ARGUMENTS["silent"]:
+        logger.info(
+            f"Output dataset file with {len(dataset_writer.graph_names)} graphs successfully saved at "
+            f"{output_file_path}.\n"
+        )
+    return output_file_path
+
+
+def _decode_watched_input(watched_path: str, decode_all: bool) -> None:
+    """Decode a watched JSON file or archive, reporting failures without stopping watch mode."""
+    logger = initialize_logger()
+    if decode_all:
+        entry_paths = list_batch_entries(os.path.dirname(watched_path))
+        batch_inputs = iter_entry_inputs(watched_path, get_entry_output_stems(entry_paths).get(watched_path))
+    else:
+        batch_inputs = [BatchInput(watched_path, get_json_input_stem(watched_path))]
+
+    try:
+        # Entering catch_warnings resets the warning registries, so each reconversion reports its warnings again.
+        with warnings.catch_warnings():
+            for batch_input in batch_inputs:
+                _decode_batch_input(batch_input)
+    except Exception as error:
+        logger.error(f"Conversion of {watched_path} failed: {error!r}. Waiting for the next change.")
+
+
+def watch_ontouml_json2graph() -> None:
+    """Convert the input and then convert it again whenever it changes, until interrupted with Ctrl+C.
+
+    The input file, or the JSON files and archives of the input directory in batch mode, are polled every
+    watch_interval seconds. Only the files that changed are converted again, once they are unchanged for one interval.
+    The process stays alive between conversions, so the OntoUML Vocabulary and the cached terms are loaded only once.
     """
-    # Getting all
-    list_input_files = sorted(glob.glob(os.path.join(args.ARGUMENTS["input_path"], "*.json")))
-
-    if (
-        len(list_input_files) > 1
-        and args.ARGUMENTS["base_uri_input"] is not None
-        and not args.ARGUMENTS["append_content_hash"]
-    ):
-        warnings.warn(
-            "All batch outputs will use the same explicit base URI. Their resources can collide if the graphs are "
-            "combined. Use --base-uri-with-content-id to create a separate content-derived namespace for each "
-            "distinct JSON document.",
-            SharedBatchBaseURIWarning,
-            stacklevel=2,
+    logger = initialize_logger()
+    input_path = args.ARGUMENTS["input_path"]
+    decode_all = args.ARGUMENTS["decode_all"]
+    watch_interval = args.ARGUMENTS["watch_interval"]
+
+    watcher = InputWatcher(input_path, decode_all)
+    for watched_path in list_batch_entries(input_path) if decode_all else [input_path]:
+        _decode_watched_input(watched_path, decode_all)
+
+    if not args.ARGUMENTS["silent"]:
+        logger.info(f"Watching {input_path} for changes every {watch_interval} seconds. Press Ctrl+C to stop.")
+
+    try:
+        while True:
+            time.sleep(watch_interval)
+            for watched_path in watcher.poll():
+                if not args.ARGUMENTS["silent"]:
+                    logger.info(f"Change detected in {watched_path}.")
+                _decode_watched_input(watched_path, decode_all)
+    except KeyboardInterrupt:
+        if not args.ARGUMENTS["silent"]:
+            logger.info("Watch mode stopped.")
+
+
+def convert_server_job(
+    job_arguments: dict, source_name: str, json_content: bytes, output_file: str | None
+) -> dict[str, object]:
+    """Convert one job received in server mode.
+
+    Warnings raised during the conversion are returned in the result instead of being printed.
+
+    :param job_arguments: ARGUMENTS dictionary used to convert the job.
+    :type job_arguments: dict
+    :param source_name: Path or name that identifies the JSON document.
+    :type source_name: str
+    :param json_content: Raw bytes of the JSON document.
+    :type json_content: bytes
+    :param output_file: Path of the output file, or None to return the serialized graph.
+    :type output_file: str or None
+    :return: Either the serialized graph ('graph') or the saved output file path ('output_file'), with the output
+             format ('format') and the warnings raised ('warnings').
+    :rtype: dict[str, object]
+    """
+    args.ARGUMENTS = job_arguments
+    graph_format = job_arguments["format"]
+
+    with warnings.catch_warnings(record=True) as caught_warnings:
+        warnings.simplefilter("always")
+        result_graph = decode_ontouml_json2graph(
+            json_file_path=source_name,
+            execution_mode="script",
+            json_content=json_content,
         )
 
-    for input_file in list_input_files:
-        args.ARGUMENTS["input_path"] = input_file
-        result_graph = decode_ontouml_json2graph(json_file_path=input_file, execution_mode="script")
-        write_graph_file(result_graph, execution_mode="script")
+        if job_arguments["transformation_metadata"] == "embedded":
+            metadata_graph = build_transformation_metadata(
+                ontouml_graph=result_graph,
+                input_file_path=source_name,
+                output_file_name=os.path.basename(output_file or f"{get_json_input_stem(source_name)}.{graph_format}"),
+                graph_format=graph_format,
+                configuration=get_transformation_configuration(job_arguments, graph_format=graph_format),
+                include_generation_time=not job_arguments["canonical"],
+                input_content=json_content,
+            )
+            result_graph.addN((*triple, result_graph) for triple in metadata_graph)
+
+        if output_file is None:
+            result = {"graph": serialize_graph(result_graph, graph_format, job_arguments["canonical"])}
+        else:
+            create_directory_if_not_exists(os.path.dirname(output_file), "output directory")
+            safe_write_graph_file(
+                result_graph, output_file, graph_format, job_arguments["canonical"], job_arguments["compression"]
+            )
+            result = {"output_file": output_file}
+
+    result["format"] = graph_format
+    result["warnings"] = [
+        {"category": warning.category.__name__, "message": str(warning.message)} for warning in caught_warnings
+    ]
+    return result
 
 
 if __name__ == "__main__":
@@ -348,13 +993,21 @@ if __name__ == "__main__":
     This block of code is executed when the script is run as a standalone application (i.e., as a script).
     It processes user-provided arguments and executes the OntoUML JSON to Graph transformation.
     """
-    # Treat and publish user's arguments
-    args.initialize_args_script()
-
-    if args.ARGUMENTS["decode_all"]:
+    # The user's arguments were treated and published before the decoding modules were imported.
+    if args.ARGUMENTS["check"]:
+        sys.exit(1 if check_all_ontouml_json() else 0)
+    elif args.ARGUMENTS["serve"]:
+        serve_json_lines(convert_server_job, args.ARGUMENTS, args.ARGUMENTS["serve_workers"], sys.stdin, sys.stdout)
+    elif args.ARGUMENTS["watch"]:
+        watch_ontouml_json2graph()
+    elif args.ARGUMENTS["decode_all"]:
         decode_all_ontouml_json2graph()
     else:
         # Convert JSON to Knowledge Graph
-        decoded_graph = decode_ontouml_json2graph(json_file_path=args.ARGUMENTS["input_path"], execution_mode="script")
+        script_diagnostics = create_script_diagnostics()
+        decoded_graph = decode_ontouml_json2graph(
+            json_file_path=args.ARGUMENTS["input_path"], execution_mode="script", diagnostics=script_diagnostics
+        )
         # Saves knowledge graph
-        write_graph_file(decoded_graph, execution_mode="script")
+        write_graph_file(decoded_graph, execution_mode="script", diagnostics=script_diagnostics)
+        close_output_graph(decoded_graph)
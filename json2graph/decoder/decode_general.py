@@ -4,8 +4,8 @@ from rdflib import Graph, URIRef, Literal, RDF
 
 from ..modules import arguments as args
 from ..modules.logger import initialize_logger
-from ..modules.sparql_queries import GET_ELEMENT_AND_TYPE
-from ..modules.utils_graph import ontouml_ref, load_ontouml_vocabulary
+from ..modules.source_visitor import get_indexed_subdictionaries
+from ..modules.utils_graph import ontouml_ref, get_ontouml_element_types
 
 LOGGER = initialize_logger()
 
@@ -53,12 +53,12 @@ def count_elements_graph(ontouml_graph: Graph) -> dict:
     """
     element_counting = {}
 
-    ontouml_meta_graph = load_ontouml_vocabulary()
-    aggregated_graph = ontouml_meta_graph + ontouml_graph
-    query_answer = aggregated_graph.query(GET_ELEMENT_AND_TYPE)
+    element_types = get_ontouml_element_types()
 
-    for row in query_answer:
-        element_type = (row.inst_type).fragment
+    for _, _, inst_type in ontouml_graph.triples((None, RDF.type, None)):
+        if inst_type not in element_types:
+            continue
+        element_type = inst_type.fragment
 
         if element_type in element_counting:
             element_counting[element_type] += 1
@@ -104,6 +104,10 @@ def get_list_subdictionaries_for_specific_type(
     :rtype: list[dict]
     """
     if return_list is None:
+        # Documents being decoded were indexed by type in their source traversal.
+        indexed_list = get_indexed_subdictionaries(dictionary_data, wanted_type)
+        if indexed_list is not None:
+            return indexed_list
         return_list = []
 
     # When found, add a copy of the dictionary to the return_list
@@ -204,32 +208,3 @@ def get_all_ids_of_specific_type(
     list_ids_for_type = list(dict.fromkeys(list_ids_for_type))
 
     return list_ids_for_type
-
-
-def clean_null_data(dictionary_data) -> dict:
-    """Remove all empty values (i.e., keys associated with None) from the received dictionary.
-
-    If a value of the dictionary is another dictionary, this function recursively verify this sub-dictionary elements.
-    I.e., all empty fields, from all dictionaries composing the main dictionary are also cleaned.
-
-    :param dictionary_data: Dictionary to have its empty fields cleaned.
-    :type dictionary_data: dict
-    :return: Dictionary without empty fields.
-    :rtype: dict
-    """
-    # Using list() to force a copy of the keys. Avoids "RuntimeError: dictionary changed size during iteration".
-    for key in list(dictionary_data.keys()):
-        # Recursively treats sub-dictionaries inside lists
-        if type(dictionary_data[key]) is list:
-            for item in dictionary_data[key]:
-                if type(item) is dict:
-                    clean_null_data(item)
-
-        # Recursively treats sub-dictionaries
-        if type(dictionary_data[key]) is dict:
-            clean_null_data(dictionary_data[key])
-
-        if dictionary_data[key] is None:
-            dictionary_data.pop(key)
-
-    return dictionary_data
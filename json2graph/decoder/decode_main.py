@@ -2,23 +2,26 @@
 
 from rdflib import Graph, URIRef, Literal, RDF, XSD
 
-from ..decoder.decode_general import clean_null_data, count_elements_graph
+from ..decoder.decode_general import count_elements_graph
 from ..decoder.decode_obj_class import create_class_properties
 from ..decoder.decode_obj_diagram import create_diagram_properties
 from ..decoder.decode_obj_elementview import create_elementview_properties, ELEMENT_VIEW_TYPES
 from ..decoder.decode_obj_generalization import create_generalization_properties
 from ..decoder.decode_obj_generalizationset import create_generalizationset_properties
 from ..decoder.decode_obj_package import create_package_properties
-from ..decoder.decode_obj_path import create_path_properties
+from ..decoder.decode_obj_path import create_path_properties, validate_path_point_order
 from ..decoder.decode_obj_project import create_project_properties
-from ..decoder.decode_obj_property import create_property_properties
+from ..decoder.decode_obj_property import create_property_properties, validate_property_stereotype
 from ..decoder.decode_obj_rectangularshape import create_rectangularshape_properties
 from ..decoder.decode_obj_relation import create_relation_properties
 from ..modules import arguments as args
+from ..modules.graph_store import create_output_graph
 from ..modules.logger import initialize_logger
 from ..modules.metadata import METADATA
-from ..modules.model_element_references import apply_unresolved_model_element_policy
-from ..modules.text_values import warn_if_text_value_is_unsupported
+from ..modules.duplicate_ids import DuplicateIdDetector
+from ..modules.model_element_references import ModelElementIdCollector, apply_unresolved_model_element_policy
+from ..modules.source_visitor import SourceTypeIndex, SourceVisitor, active_type_index, remove_null_values
+from ..modules.text_values import register_text_value_validation
 from ..modules.utils_graph import ontouml_ref
 
 LOGGER = initialize_logger()
@@ -72,9 +75,8 @@ def decode_dictionary(dictionary_data: dict, ontouml_graph: Graph, language: str
             continue
 
         # A legacy Text.value field has no equivalent in OntoUML Vocabulary v1.1.1.
-        # Empty values are omitted silently; non-empty values are omitted with a warning.
+        # Non-empty values were reported when the source data was visited.
         if key == "value" and dictionary_data["type"] == "Text":
-            warn_if_text_value_is_unsupported(dictionary_data)
             continue
 
         # If it is of a restricted field, do not add other attributes now
@@ -115,7 +117,66 @@ def decode_dictionary(dictionary_data: dict, ontouml_graph: Graph, language: str
         ontouml_graph.add((new_instance, new_predicate, new_object))
 
 
-def decode_json_to_graph(json_data: dict, language: str, execution_mode: str) -> Graph:
+def visit_source_data(
+    json_data: dict,
+    source_visitor: SourceVisitor | None = None,
+    model_element_ids: set[str] | None = None,
+    shard: bool = False,
+) -> tuple[SourceTypeIndex, set[str]]:
+    """Prepare the loaded JSON data for decoding in a single traversal that runs all source policies.
+
+    After the callbacks already registered in the visitor, the traversal indexes the dictionaries by type, collects the
+    IDs of the project's model elements (if not informed), reports non-empty Text values and duplicate IDs (if the
+    data is not a shard), and finally removes all null values from the data.
+
+    :param json_data: Input JSON data loaded as a dictionary. Its null values are removed in place.
+    :type json_data: dict
+    :param source_visitor: Visitor with the callbacks of the caller's source policies. (Optional)
+    :type source_visitor: SourceVisitor or None
+    :param model_element_ids: Optional IDs of all elements defined in the complete project's model. (Optional)
+    :type model_element_ids: set[str] or None
+    :param shard: If True, json_data is one shard of a larger project, whose diagnostics are reported by the caller.
+    :type shard: bool
+    :return: Index of the data's dictionaries by type and the IDs of the project's model elements.
+    :rtype: tuple[SourceTypeIndex, set[str]]
+    """
+    if source_visitor is None:
+        source_visitor = SourceVisitor()
+
+    type_index = SourceTypeIndex(json_data)
+    type_index.register(source_visitor)
+
+    model_element_id_collector = None
+    if model_element_ids is None:
+        model_element_id_collector = ModelElementIdCollector(json_data)
+        model_element_id_collector.register(source_visitor)
+
+    duplicate_id_detector = None
+    if not shard:
+        register_text_value_validation(source_visitor)
+        duplicate_id_detector = DuplicateIdDetector()
+        duplicate_id_detector.register(source_visitor)
+
+    # Removing null values changes the visited dictionaries, so it is the last callback of each one.
+    source_visitor.register(remove_null_values)
+    source_visitor.visit(json_data)
+
+    if duplicate_id_detector is not None:
+        duplicate_id_detector.warn_duplicate_ids(args.ARGUMENTS["input_path"])
+
+    if model_element_id_collector is not None:
+        model_element_ids = model_element_id_collector.model_element_ids
+    return type_index, model_element_ids
+
+
+def decode_json_to_graph(
+    json_data: dict,
+    language: str,
+    execution_mode: str,
+    model_element_ids: set[str] | None = None,
+    shard: bool = False,
+    source_visitor: SourceVisitor | None = None,
+) -> Graph:
     """Receive the loaded JSON data and decodes it into a graph that complies to the OntoUML Vocabulary.
 
     :param json_data: Input JSON data loaded as a dictionary.
@@ -124,25 +185,46 @@ def decode_json_to_graph(json_data: dict, language: str, execution_mode: str) ->
     :type language: str
     :param execution_mode: Information about execution mode. Valid values are 'script', 'import', and 'test'.
     :type execution_mode: str
+    :param model_element_ids: Optional IDs of all elements defined in the complete project's model. Used when
+                              json_data is only a part of the project. (Optional)
+    :type model_element_ids: set[str] or None
+    :param shard: If True, json_data is one shard of a larger project and validations that require the complete
+                  graph are left to the caller. (Optional)
+    :type shard: bool
+    :param source_visitor: Visitor with the callbacks of the caller's source policies, run in the same traversal that
+                           prepares the data for decoding. (Optional)
+    :type source_visitor: SourceVisitor or None
     :return: Knowledge graph that complies with the OntoUML Vocabulary
     :rtype: Graph
     """
-    # Creating OntoUML Graph
-    ontouml_graph = Graph()
+    # Creating OntoUML Graph. Shards are always decoded in memory and merged into the selected store by the caller.
+    ontouml_graph = Graph() if shard else create_output_graph()
     ontouml_graph.bind("ontouml", METADATA["conformsToBase"])
     ontouml_graph.bind("", args.ARGUMENTS["base_uri"])
 
-    # Get clean data
+    # Get clean data, indexed by type
     # Dictionary data is all the JSON data loaded as a dictionary to be manipulated
-    dictionary_data = clean_null_data(json_data)
+    type_index, model_element_ids = visit_source_data(json_data, source_visitor, model_element_ids, shard)
+    dictionary_data = json_data
 
     # Validate only diagrammatic modelElement references before reference stubs can be decoded as real individuals.
-    apply_unresolved_model_element_policy(
+    omitted_references = apply_unresolved_model_element_policy(
         dictionary_data,
         args.ARGUMENTS["unresolved_model_element_policy"],
         args.ARGUMENTS["input_path"],
+        model_element_ids,
     )
+    for omitted_reference in omitted_references:
+        type_index.discard(omitted_reference)
 
+    with active_type_index(type_index):
+        _decode_indexed_data(dictionary_data, ontouml_graph, language, shard)
+
+    return ontouml_graph
+
+
+def _decode_indexed_data(dictionary_data: dict, ontouml_graph: Graph, language: str, shard: bool) -> None:
+    """Decode the prepared data into the graph, reading the dictionaries of each type from the active type index."""
     # GENERAL DECODING: creating all instances and setting their types.
     decode_dictionary(dictionary_data, ontouml_graph, language)
 
@@ -162,15 +244,20 @@ def decode_json_to_graph(json_data: dict, language: str, execution_mode: str) ->
         create_rectangularshape_properties(dictionary_data, ontouml_graph)
     if "Path" in element_counting:
         create_path_properties(dictionary_data, ontouml_graph)
+        # Path order is reported once for all Paths of the project, which may belong to other shards. The compact
+        # geometry encoding preserves it, so there is nothing to report.
+        if not shard and args.ARGUMENTS["geometry_encoding"] != "compact":
+            validate_path_point_order(dictionary_data, ontouml_graph)
     if set(ELEMENT_VIEW_TYPES).intersection(element_counting.keys()):
         create_elementview_properties(dictionary_data, ontouml_graph)
     if "Property" in element_counting:
         create_property_properties(dictionary_data, ontouml_graph)
+        # Property stereotypes are validated against their types' stereotypes, which may belong to other shards.
+        if not shard:
+            validate_property_stereotype(ontouml_graph)
     if "Generalization" in element_counting:
         create_generalization_properties(dictionary_data, ontouml_graph)
     if "GeneralizationSet" in element_counting:
         create_generalizationset_properties(dictionary_data, ontouml_graph)
     if "Relation" in element_counting:
         create_relation_properties(dictionary_data, ontouml_graph)
-
-    return ontouml_graph
@@ -11,16 +11,29 @@ import inspect
 
 from rdflib import Graph, URIRef, XSD, Literal
 
-from ..decoder.decode_general import (
-    get_stereotype,
-    get_list_subdictionaries_for_specific_type,
-)
+from ..decoder.decode_general import get_stereotype
 from ..modules import arguments as args
 from ..modules.errors import report_error_end_of_switch
 from ..modules.messages import print_decode_log_message
+from ..modules.source_elements import SourceElement, SourceElementTable, get_source_elements
 from ..modules.stereotypes import set_stereotype_relation
 from ..modules.utils_graph import ontouml_ref
 
+# OntologicalNature individuals of the restrictedTo values of classes.
+RESTRICTION_NATURE_MAPPING = {
+    "abstract": "abstractNature",
+    "collective": "collectiveNature",
+    "event": "eventNature",
+    "extrinsic-mode": "extrinsicModeNature",
+    "functional-complex": "functionalComplexNature",
+    "intrinsic-mode": "intrinsicModeNature",
+    "quality": "qualityNature",
+    "quantity": "quantityNature",
+    "relator": "relatorNature",
+    "situation": "situationNature",
+    "type": "typeNature",
+}
+
 
 def validate_class_attribute_constraints(class_dict: dict) -> None:
     """Verify all Class dictionaries and check if the constraints related to classes were correctly considered and \
@@ -299,27 +312,13 @@ def set_class_restrictedto_ontologicalnature(class_dict: dict, ontouml_graph: Gr
     :param ontouml_graph: Knowledge graph that complies with the OntoUML Vocabulary.
     :type ontouml_graph: Graph
     """
-    restriction_nature_mapping = {
-        "abstract": "abstractNature",
-        "collective": "collectiveNature",
-        "event": "eventNature",
-        "extrinsic-mode": "extrinsicModeNature",
-        "functional-complex": "functionalComplexNature",
-        "intrinsic-mode": "intrinsicModeNature",
-        "quality": "qualityNature",
-        "quantity": "quantityNature",
-        "relator": "relatorNature",
-        "situation": "situationNature",
-        "type": "typeNature",
-    }
-
     if "restrictedTo" in class_dict:
         for restriction in class_dict["restrictedTo"]:
             ontouml_graph.add(
                 (
                     URIRef(args.ARGUMENTS["base_uri"] + class_dict["id"]),
                     ontouml_ref("restrictedTo"),
-                    ontouml_ref(restriction_nature_mapping[restriction]),
+                    ontouml_ref(RESTRICTION_NATURE_MAPPING[restriction]),
                 )
             )
 
@@ -354,40 +353,40 @@ def set_class_attributes(class_dict: dict, ontouml_graph: Graph) -> None:
         )
 
 
-def set_class_attribute_property(class_dict: dict, ontouml_graph: Graph) -> None:
+def set_class_attribute_property(
+    class_element: SourceElement, source_elements: SourceElementTable, ontouml_graph: Graph
+) -> None:
     """Set ontouml:attribute relation between an ontouml:Class and an ontouml:Property.
 
-    :param class_dict: Class object loaded as a dictionary.
-    :type class_dict: dict
+    :param class_element: Class's entry in the table of the JSON data's objects.
+    :type class_element: SourceElement
+    :param source_elements: Table of the JSON data's objects.
+    :type source_elements: SourceElementTable
     :param ontouml_graph: Knowledge graph that complies with the OntoUML Vocabulary.
     :type ontouml_graph: Graph
     """
-    list_related_properties = get_list_subdictionaries_for_specific_type(class_dict, "Property")
-
-    for related_property in list_related_properties:
-        statement_subject = URIRef(args.ARGUMENTS["base_uri"] + class_dict["id"])
-        statement_predicate = ontouml_ref("attribute")
-        statement_object = URIRef(args.ARGUMENTS["base_uri"] + related_property["id"])
+    statement_predicate = ontouml_ref("attribute")
 
-        ontouml_graph.add((statement_subject, statement_predicate, statement_object))
+    for related_property in source_elements.get_nested_elements(class_element, "Property"):
+        ontouml_graph.add((class_element.uri, statement_predicate, related_property.uri))
 
 
-def set_class_literal_literal(class_dict: dict, ontouml_graph: Graph) -> None:
+def set_class_literal_literal(
+    class_element: SourceElement, source_elements: SourceElementTable, ontouml_graph: Graph
+) -> None:
     """Set ontouml:literal relation between an ontouml:Class and its related ontouml:Literal individuals.
 
-    :param class_dict: Class object loaded as a dictionary.
-    :type class_dict: dict
+    :param class_element: Class's entry in the table of the JSON data's objects.
+    :type class_element: SourceElement
+    :param source_elements: Table of the JSON data's objects.
+    :type source_elements: SourceElementTable
     :param ontouml_graph: Knowledge graph that complies with the OntoUML Vocabulary.
     :type ontouml_graph: Graph
     """
-    list_related_literals = get_list_subdictionaries_for_specific_type(class_dict, "Literal")
+    statement_predicate = ontouml_ref("literal")
 
-    for related_literal in list_related_literals:
-        statement_subject = URIRef(args.ARGUMENTS["base_uri"] + class_dict["id"])
-        statement_predicate = ontouml_ref("literal")
-        statement_object = URIRef(args.ARGUMENTS["base_uri"] + related_literal["id"])
-
-        ontouml_graph.add((statement_subject, statement_predicate, statement_object))
+    for related_literal in source_elements.get_nested_elements(class_element, "Literal"):
+        ontouml_graph.add((class_element.uri, statement_predicate, related_literal.uri))
 
 
 def create_class_properties(json_data: dict, ontouml_graph: Graph, element_counting: dict) -> None:
@@ -417,11 +416,13 @@ def create_class_properties(json_data: dict, ontouml_graph: Graph, element_count
     :param element_counting: Dictionary with types and respective quantities present on graph.
     :type element_counting: dict
     """
-    # Get all class' dictionaries
-    list_all_class_dicts = get_list_subdictionaries_for_specific_type(json_data, "Class")
+    # Get all classes from the table of the data's objects
+    source_elements = get_source_elements(json_data)
 
     # Treat each object dictionary
-    for class_dict in list_all_class_dicts:
+    for class_element in source_elements.get_elements("Class"):
+        class_dict = class_element.node.copy()
+
         # Skipping dictionaries that only make reference to classes (and not class dictionaries)
         if "name" not in class_dict:
             continue
@@ -445,8 +446,8 @@ def create_class_properties(json_data: dict, ontouml_graph: Graph, element_count
 
         # Treats relations between instances of Class and Property only if the formers exist
         if "Property" in element_counting:
-            set_class_attribute_property(class_dict, ontouml_graph)
+            set_class_attribute_property(class_element, source_elements, ontouml_graph)
 
         # Treats relations between instances of Class and Literal only if the formers exist
         if "Literal" in element_counting:
-            set_class_literal_literal(class_dict, ontouml_graph)
+            set_class_literal_literal(class_element, source_elements, ontouml_graph)
@@ -10,9 +10,9 @@ Function's nomenclatures:
 
 from rdflib import Graph, URIRef
 
-from ..decoder.decode_general import get_list_subdictionaries_for_specific_type
 from ..decoder.decode_obj_elementview import ELEMENT_VIEW_TYPES
 from ..modules import arguments as args
+from ..modules.source_elements import SourceElement, SourceElementTable, get_source_elements
 from ..modules.utils_graph import ontouml_ref
 
 
@@ -30,25 +30,23 @@ def set_diagram_owner_modelelement(diagram_dict: dict, ontouml_graph: Graph) ->
     ontouml_graph.add((statement_subject, statement_predicate, statement_object))
 
 
-def set_diagram_containsview_elementview(diagram_dict: dict, ontouml_graph: Graph) -> None:
+def set_diagram_containsview_elementview(
+    diagram_element: SourceElement, source_elements: SourceElementTable, ontouml_graph: Graph
+) -> None:
     """Set the ontouml:containsView property between an ontouml:Diagram and its related ontouml:ElementView.
 
-    :param diagram_dict: Diagram object loaded as a dictionary.
-    :type diagram_dict: dict
+    :param diagram_element: Diagram's entry in the table of the JSON data's objects.
+    :type diagram_element: SourceElement
+    :param source_elements: Table of the JSON data's objects.
+    :type source_elements: SourceElementTable
     :param ontouml_graph: Knowledge graph that complies with the OntoUML Vocabulary.
     :type ontouml_graph: Graph
     """
-    list_related_elementviews = []
+    statement_predicate = ontouml_ref("containsView")
 
     for view_type in ELEMENT_VIEW_TYPES:
-        list_related_elementviews += get_list_subdictionaries_for_specific_type(diagram_dict, view_type)
-
-    for related_elementview in list_related_elementviews:
-        statement_subject = URIRef(args.ARGUMENTS["base_uri"] + diagram_dict["id"])
-        statement_predicate = ontouml_ref("containsView")
-        statement_object = URIRef(args.ARGUMENTS["base_uri"] + related_elementview["id"])
-
-        ontouml_graph.add((statement_subject, statement_predicate, statement_object))
+        for related_elementview in source_elements.get_nested_elements(diagram_element, view_type):
+            ontouml_graph.add((diagram_element.uri, statement_predicate, related_elementview.uri))
 
 
 def create_diagram_properties(json_data: dict, ontouml_graph: Graph, element_counting: dict) -> None:
@@ -69,11 +67,11 @@ def create_diagram_properties(json_data: dict, ontouml_graph: Graph, element_cou
     :type element_counting: dict
     """
     # Setting diagram properties
-    diagrams_dicts_list = get_list_subdictionaries_for_specific_type(json_data, "Diagram")
+    source_elements = get_source_elements(json_data)
 
-    for diagram_dict in diagrams_dicts_list:
-        set_diagram_owner_modelelement(diagram_dict, ontouml_graph)
+    for diagram_element in source_elements.get_elements("Diagram"):
+        set_diagram_owner_modelelement(diagram_element.node, ontouml_graph)
 
         # Treats relations between instances of Diagram and ElementView only if the formers exist
         if any(item in ELEMENT_VIEW_TYPES for item in element_counting.keys()):
-            set_diagram_containsview_elementview(diagram_dict, ontouml_graph)
+            set_diagram_containsview_elementview(diagram_element, source_elements, ontouml_graph)
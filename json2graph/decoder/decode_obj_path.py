@@ -15,6 +15,7 @@ from ..decoder.decode_general import (
     create_point,
 )
 from ..modules import arguments as args
+from ..modules.geometry_encoding import JSON2GRAPH, add_compact_path_points
 from ..modules.path_order import apply_path_order_policy
 from ..modules.utils_graph import ontouml_ref
 
@@ -59,6 +60,11 @@ def create_path_properties(json_data: dict, ontouml_graph: Graph) -> None:
     Created properties:
         - ontouml:point (range ontouml:Point)
 
+    With the 'compact' geometry encoding, no ontouml:Point is created. The points of each Path are added in their
+    source order as a single non-normative json2graph:points literal instead.
+
+    The path order policy is applied afterward by validate_path_point_order.
+
     :param json_data: JSON's data to have its fields decoded loaded into a dictionary.
     :type json_data: dict
     :param ontouml_graph: Knowledge graph that complies with the OntoUML Vocabulary.
@@ -66,10 +72,34 @@ def create_path_properties(json_data: dict, ontouml_graph: Graph) -> None:
     """
     list_path_dicts = get_list_subdictionaries_for_specific_type(json_data, "Path")
 
+    # The compact geometry encoding keeps each Path's points, in order, in a single non-normative literal
+    if args.ARGUMENTS["geometry_encoding"] == "compact":
+        ontouml_graph.bind("json2graph", JSON2GRAPH)
+        for path_dict in list_path_dicts:
+            if not path_dict["points"]:
+                continue
+            add_compact_path_points(
+                URIRef(args.ARGUMENTS["base_uri"] + path_dict["id"]), path_dict["points"], ontouml_graph
+            )
+        return
+
     # Treat each object dictionary
     for path_dict in list_path_dicts:
         set_path_path_point(path_dict, ontouml_graph)
 
+
+def validate_path_point_order(json_data: dict, ontouml_graph: Graph) -> None:
+    """Apply the path order policy to all Path objects of the informed JSON data.
+
+    Paths are evaluated together so that a single aggregated diagnostic is reported for the whole project.
+
+    :param json_data: JSON's data to have its fields decoded loaded into a dictionary.
+    :type json_data: dict
+    :param ontouml_graph: Knowledge graph that complies with the OntoUML Vocabulary.
+    :type ontouml_graph: Graph
+    """
+    list_path_dicts = get_list_subdictionaries_for_specific_type(json_data, "Path")
+
     apply_path_order_policy(
         path_dicts=list_path_dicts,
         ontouml_graph=ontouml_graph,
@@ -10,38 +10,41 @@ Function's nomenclatures:
 
 from rdflib import Graph, URIRef
 
-from ..decoder.decode_general import (
-    get_all_ids_of_specific_type,
-    get_list_subdictionaries_for_specific_type,
-)
 from ..modules import arguments as args
+from ..modules.source_elements import SourceElement, SourceElementTable, get_source_elements
 from ..modules.utils_graph import ontouml_ref
 
 
-def set_ontoumlelement_project_project(project_dict: dict, ontouml_graph: Graph, element_counting: dict) -> None:
+def set_ontoumlelement_project_project(
+    project_element: SourceElement, source_elements: SourceElementTable, ontouml_graph: Graph, element_counting: dict
+) -> None:
     """Set the ontouml:project object property between an ontouml:Project (obj) and all its related entities (subj).
 
-    :param project_dict: Project's data to have its fields decoded.
-    :type project_dict: dict
+    :param project_element: Project's entry in the table of the JSON data's objects.
+    :type project_element: SourceElement
+    :param source_elements: Table of the JSON data's objects.
+    :type source_elements: SourceElementTable
     :param ontouml_graph: Knowledge graph that complies with the OntoUML Vocabulary.
     :type ontouml_graph: Graph
     :param element_counting: Dictionary with types and respective quantities present on graph.
     :type element_counting: dict
     """
+    statement_predicate = ontouml_ref("project")
+
     # The list of available types can be found in the element_counting dictionary.
     for available_type in element_counting.keys():
         # Projects do not have project properties with other projects
         if available_type == "Project":
             continue
 
-        # Get every project's related objects' ids
-        list_objects_ids = get_all_ids_of_specific_type(project_dict, available_type)
+        # Get every project's related objects' URIs, without duplicates
+        related_uris = dict.fromkeys(
+            related_element.uri
+            for related_element in source_elements.get_nested_elements(project_element, available_type)
+        )
 
-        for json_object_id in list_objects_ids:
-            statement_subject = URIRef(args.ARGUMENTS["base_uri"] + json_object_id)
-            statement_predicate = ontouml_ref("project")
-            statement_object = URIRef(args.ARGUMENTS["base_uri"] + project_dict["id"])
-            ontouml_graph.add((statement_subject, statement_predicate, statement_object))
+        for statement_subject in related_uris:
+            ontouml_graph.add((statement_subject, statement_predicate, project_element.uri))
 
 
 def set_project_model_package(project_dict: dict, ontouml_graph: Graph) -> None:
@@ -59,22 +62,27 @@ def set_project_model_package(project_dict: dict, ontouml_graph: Graph) -> None:
         ontouml_graph.add((statement_subject, statement_predicate, statement_object))
 
 
-def set_project_diagram_diagram(project_dict: dict, ontouml_graph: Graph) -> None:
+def set_project_diagram_diagram(
+    project_element: SourceElement, source_elements: SourceElementTable, ontouml_graph: Graph
+) -> None:
     """Set the ontouml:diagram object property between an ontouml:Project and its related ontouml:Diagram entities.
 
-    :param project_dict: Project's data to have its fields decoded.
-    :type project_dict: dict
+    :param project_element: Project's entry in the table of the JSON data's objects.
+    :type project_element: SourceElement
+    :param source_elements: Table of the JSON data's objects.
+    :type source_elements: SourceElementTable
     :param ontouml_graph: Knowledge graph that complies with the OntoUML Vocabulary.
     :type ontouml_graph: Graph
     """
+    statement_predicate = ontouml_ref("diagram")
+
     # Getting all Diagrams for a specific Project
-    list_all_diagram_ids = get_all_ids_of_specific_type(project_dict, "Diagram")
+    diagram_uris = dict.fromkeys(
+        diagram_element.uri for diagram_element in source_elements.get_nested_elements(project_element, "Diagram")
+    )
 
-    for diagram_id in list_all_diagram_ids:
-        statement_subject = URIRef(args.ARGUMENTS["base_uri"] + project_dict["id"])
-        statement_predicate = ontouml_ref("diagram")
-        statement_object = URIRef(args.ARGUMENTS["base_uri"] + diagram_id)
-        ontouml_graph.add((statement_subject, statement_predicate, statement_object))
+    for statement_object in diagram_uris:
+        ontouml_graph.add((project_element.uri, statement_predicate, statement_object))
 
 
 def create_project_properties(json_data: dict, ontouml_graph: Graph, element_counting: dict) -> None:
@@ -97,13 +105,13 @@ def create_project_properties(json_data: dict, ontouml_graph: Graph, element_cou
     :param element_counting: Dictionary with types and respective quantities present on graph.
     :type element_counting: dict
     """
-    # Getting all Project dictionaries
-    projects_dicts_list = get_list_subdictionaries_for_specific_type(json_data, "Project")
+    # Getting all Projects from the table of the data's objects
+    source_elements = get_source_elements(json_data)
 
-    for project_dict in projects_dicts_list:
-        set_ontoumlelement_project_project(project_dict, ontouml_graph, element_counting)
-        set_project_model_package(project_dict, ontouml_graph)
+    for project_element in source_elements.get_elements("Project"):
+        set_ontoumlelement_project_project(project_element, source_elements, ontouml_graph, element_counting)
+        set_project_model_package(project_element.node, ontouml_graph)
 
         # Treats relations between instances of Project and Diagram only if the formers exist
         if "Diagram" in element_counting:
-            set_project_diagram_diagram(project_dict, ontouml_graph)
+            set_project_diagram_diagram(project_element, source_elements, ontouml_graph)
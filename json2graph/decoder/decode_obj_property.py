@@ -17,7 +17,7 @@ from ..modules.logger import initialize_logger
 from ..modules.messages import print_decode_log_message
 from ..modules.sparql_queries import GET_CLASS_STEREOTYPE_ATTRIBUTE_STEREOTYPE
 from ..modules.stereotypes import set_stereotype_relation
-from ..modules.utils_graph import load_ontouml_vocabulary, ontouml_ref
+from ..modules.utils_graph import ontouml_ref
 
 LOGGER = initialize_logger()
 
@@ -40,9 +40,9 @@ def validate_property_stereotype(ontouml_graph: Graph) -> None:
     if not args.ARGUMENTS["correct"]:
         return
 
-    ontouml_meta_graph = load_ontouml_vocabulary()
-    aggregated_graph = ontouml_meta_graph + ontouml_graph
-    query_answer = aggregated_graph.query(GET_CLASS_STEREOTYPE_ATTRIBUTE_STEREOTYPE)
+    # The query only matches asserted triples, so it runs on the graph itself instead of on a copy merged with the
+    # vocabulary, which would duplicate graphs kept in a disk-backed store.
+    query_answer = ontouml_graph.query(GET_CLASS_STEREOTYPE_ATTRIBUTE_STEREOTYPE)
 
     for row in query_answer:
         class_id = (row.class_id).fragment
@@ -296,7 +296,7 @@ def create_property_properties(json_data: dict, ontouml_graph: Graph) -> None:
         - ontouml:isOrdered (range xsd:boolean)
         - ontouml:isReadOnly (range xsd:boolean)
 
-    Performs validation for ontouml:stereotype.
+    The semantic validation of ontouml:stereotype is performed afterward by validate_property_stereotype.
 
     :param json_data: JSON's data to have its fields decoded loaded into a dictionary.
     :type json_data: dict
@@ -314,5 +314,3 @@ def create_property_properties(json_data: dict, ontouml_graph: Graph) -> None:
         set_property_defaults(property_dict, ontouml_graph)
         set_property_relations(property_dict, ontouml_graph)
         set_cardinality_relations(property_dict, ontouml_graph)
-
-    validate_property_stereotype(ontouml_graph)
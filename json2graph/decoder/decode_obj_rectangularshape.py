@@ -15,6 +15,7 @@ from ..decoder.decode_general import (
     create_point,
 )
 from ..modules import arguments as args
+from ..modules.geometry_encoding import JSON2GRAPH, add_compact_position
 from ..modules.utils_graph import ontouml_ref
 
 
@@ -59,6 +60,9 @@ def create_rectangularshape_properties(json_data: dict, ontouml_graph: Graph) ->
         - ontouml:xCoordinate (domain ontouml:Point, range xsd:integer)
         - ontouml:yCoordinate (domain ontouml:Point, range xsd:integer)
 
+    With the 'compact' geometry encoding, no ontouml:Point is created. The position of each shape is added as a single
+    non-normative json2graph:topLeftPosition literal instead.
+
     # The ontouml:height and ontouml:width data properties are not assigned in this function, as they can be directly
     obtained in the general decoding.
 
@@ -72,6 +76,18 @@ def create_rectangularshape_properties(json_data: dict, ontouml_graph: Graph) ->
     list_all_text_dicts = get_list_subdictionaries_for_specific_type(json_data, "Text")
     list_all_rectangularshape_dicts = list_all_rectangle_dicts + list_all_text_dicts
 
+    # The compact geometry encoding keeps each shape's position in a single non-normative literal
+    if args.ARGUMENTS["geometry_encoding"] == "compact":
+        ontouml_graph.bind("json2graph", JSON2GRAPH)
+        for rectangularshape_dict in list_all_rectangularshape_dicts:
+            add_compact_position(
+                URIRef(args.ARGUMENTS["base_uri"] + rectangularshape_dict["id"]),
+                rectangularshape_dict["x"],
+                rectangularshape_dict["y"],
+                ontouml_graph,
+            )
+        return
+
     # Treat each object dictionary
     for rectangularshape_dict in list_all_rectangularshape_dicts:
         set_rectangularshape_coordinates(rectangularshape_dict, ontouml_graph)
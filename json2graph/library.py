@@ -1,10 +1,38 @@
 """Expose the supported Python interface for OntoUML JSON-to-RDF conversion."""
 
+from collections.abc import Iterator
+
 from rdflib import Graph
+from rdflib.term import Node
 
-from .decode import decode_ontouml_json2graph
+from .decode import check_ontouml_json, decode_ontouml_json2graph, open_ontouml_json_lazily
+from .modules.canonical_output import CANONICAL_GRAPH_FORMATS
+from .modules.diagnostics import Diagnostic, DiagnosticsCollector
+from .modules.option_values import GRAPH_FORMATS, OUTPUT_PARTITIONS
 from .modules.errors import report_error_requirement_not_met
+from .modules.graph_snapshot import iter_graph_snapshot
+from .modules.memory_budget import MemoryBudgetError
 from .modules.input_output import safe_write_graph_file
+from .modules.utils_graph import load_graph_safely
+from .modules.output_compression import get_compression_from_path, validate_output_compression
+from .modules.output_partitions import DEFAULT_PARTITION_SIZE, write_partitioned_graph_files
+from .modules.project_check import CheckFinding
+from .modules.utils_validations import validate_partition_size, validate_snapshot_compression
+
+__all__ = [
+    "CheckFinding",
+    "Diagnostic",
+    "DiagnosticsCollector",
+    "MemoryBudgetError",
+    "check_json_project",
+    "decode_json_model",
+    "decode_json_project",
+    "iter_graph_file_triples",
+    "load_graph_file",
+    "open_json_project",
+    "save_graph_file",
+    "save_partitioned_graph_files",
+]
 
 
 def decode_json_project(
@@ -19,6 +47,13 @@ def decode_json_project(
     append_content_hash: bool = False,
     path_order_policy: str = "warn",
     property_assignment_policy: str = "warn",
+    shard_processes: int = 1,
+    store: str = "default",
+    store_configuration: str | None = None,
+    diagnostics: DiagnosticsCollector | None = None,
+    geometry_encoding: str = "points",
+    select: list[str] | None = None,
+    max_memory: int | str | None = None,
 ) -> Graph:
     """Decode an OntoUML JSON project, including supported diagrammatic data.
 
@@ -67,8 +102,51 @@ def decode_json_project(
                                        in a non-normative comment with
                                        ``comment``. Default is ``warn``.
     :type property_assignment_policy: str
+    :param shard_processes: Decode top-level packages and diagram groups in
+                            up to this number of worker processes and merge
+                            the results. Default is 1 (no sharding).
+    :type shard_processes: int
+    :param store: Name of the registered RDFLib store plugin that keeps the
+                  returned graph, e.g., a disk-backed store for graphs larger
+                  than the available memory. Default is ``default`` (in
+                  memory).
+    :type store: str
+    :param store_configuration: Open the store with this configuration,
+                                usually a path or connection URL, removing
+                                the triples already in it. Close the returned
+                                graph when it is no longer needed.
+    :type store_configuration: str or None
+    :param diagnostics: Record the policy warnings and the correction
+                        messages in this collector instead of issuing them.
+                        It keeps a limited number of diagnostics per code,
+                        counts all of them, and returns a JSON-serializable
+                        report with ``get_report()``.
+    :type diagnostics: DiagnosticsCollector or None
+    :param geometry_encoding: Encode diagram geometry as ``ontouml:Point``
+                              individuals with ``points``, or with
+                              ``compact`` as one non-normative
+                              ``json2graph:points`` or
+                              ``json2graph:topLeftPosition`` literal per path
+                              or shape, which keeps path-point order.
+                              Default is ``points``.
+    :type geometry_encoding: str
+    :param select: Decode only the Packages and Diagrams with these IDs or
+                   with names matching these ``fnmatch`` patterns, plus the
+                   model elements they reference, transitively. The base URI
+                   is still derived from the complete project. Default is
+                   ``None`` (the whole project).
+    :type select: list[str] or None
+    :param max_memory: Memory budget of the conversion in bytes or as a
+                       string with a ``K``, ``M``, ``G``, or ``T`` suffix,
+                       e.g., ``"2G"``. A graph that is not expected to fit is
+                       decoded in parts spilled to temporary files and read
+                       from disk. Close the returned graph to delete them.
+                       Default is ``None`` (no budget).
+    :type max_memory: int or str or None
     :return: Decoded RDF graph.
     :rtype: Graph
+    :raises MemoryBudgetError: If the conversion cannot fit in
+                               ``max_memory``. It is a ``ValueError``.
     :raises ValueError: If an option is invalid or an ``error`` policy rejects
                         source content.
     :raises OSError: If the input file cannot be read.
@@ -88,11 +166,143 @@ def decode_json_project(
         append_content_hash=append_content_hash,
         path_order_policy=path_order_policy,
         property_assignment_policy=property_assignment_policy,
+        shard_processes=shard_processes,
+        store=store,
+        store_configuration=store_configuration,
+        diagnostics=diagnostics,
+        geometry_encoding=geometry_encoding,
+        select=select,
+        max_memory=max_memory,
     )
 
     return decoded_graph_project
 
 
+def check_json_project(
+    json_file_path: str,
+    correct: bool = False,
+    invalid_stereotype_policy: str = "preserve",
+    invalid_cardinality_policy: str = "preserve",
+    unresolved_model_element_policy: str = "omit",
+    path_order_policy: str = "warn",
+    property_assignment_policy: str = "warn",
+) -> list[CheckFinding]:
+    """Check an OntoUML JSON project against the source-level policies.
+
+    No graph is built or serialized, so a check is much faster than a
+    conversion. The findings are those that a conversion with the same
+    options reports, but every element rejected by an ``error`` policy is
+    reported instead of only the first one, and warnings are returned instead
+    of being issued.
+
+    :param json_file_path: Path to the OntoUML JSON file.
+    :type json_file_path: str
+    :param correct: Also check the constraints of the legacy class and
+                    property correction pass.
+    :type correct: bool
+    :param invalid_stereotype_policy: Policy for stereotypes invalid for their
+                                      element type: ``preserve``, ``omit``, or
+                                      ``error``. Default is ``preserve``.
+    :type invalid_stereotype_policy: str
+    :param invalid_cardinality_policy: Policy for invalid cardinalities:
+                                       ``preserve``, ``repair``, or ``error``.
+                                       Default is ``preserve``.
+    :type invalid_cardinality_policy: str
+    :param unresolved_model_element_policy: Policy for unresolved diagrammatic
+                                            ``modelElement`` references:
+                                            ``preserve``, ``omit``, or
+                                            ``error``. Default is ``omit``.
+    :type unresolved_model_element_policy: str
+    :param path_order_policy: Policy for path-point order: ``warn`` or
+                              ``comment``. Default is ``warn``.
+    :type path_order_policy: str
+    :param property_assignment_policy: Policy for non-empty
+                                       ``propertyAssignments``: ``warn`` or
+                                       ``comment``. Default is ``warn``.
+    :type property_assignment_policy: str
+    :return: Findings with a ``severity`` (``error`` or ``warning``), a
+             ``category``, and a ``message``, errors first. The project
+             converts with these options if no finding is an error.
+    :rtype: list[CheckFinding]
+    :raises ValueError: If an option is invalid.
+    :raises OSError: If the input file cannot be read.
+    """
+    return check_ontouml_json(
+        json_file_path=json_file_path,
+        correct=correct,
+        execution_mode="import",
+        invalid_stereotype_policy=invalid_stereotype_policy,
+        invalid_cardinality_policy=invalid_cardinality_policy,
+        unresolved_model_element_policy=unresolved_model_element_policy,
+        path_order_policy=path_order_policy,
+        property_assignment_policy=property_assignment_policy,
+    )
+
+
+def open_json_project(
+    json_file_path: str,
+    base_uri: str | None = None,
+    language: str = "",
+    invalid_stereotype_policy: str = "preserve",
+    invalid_cardinality_policy: str = "preserve",
+    unresolved_model_element_policy: str = "omit",
+    append_content_hash: bool = False,
+) -> Graph:
+    """Open an OntoUML JSON project as a read-only graph decoded on demand.
+
+    The returned graph answers ``triples()`` lookups and SPARQL queries
+    right after the JSON file is loaded. Only the parts of the project that
+    describe the requested subjects are decoded, with the same decoders and
+    options as :func:`decode_json_project`, and their triples are cached.
+    Asking for the instances of an OntoUML type needs no decoding. Patterns
+    without a subject and ``len()`` decode the complete project.
+
+    The triples are the ones :func:`decode_json_project` returns with the
+    same options. Warnings of the source-level checks are issued when the
+    project is opened, and the ones of each decoded part, as well as the
+    errors of ``error`` policies, when the part is first queried. The graph
+    cannot be modified, and it must not be queried from several threads.
+
+    :param json_file_path: Path to the OntoUML JSON file.
+    :type json_file_path: str
+    :param base_uri: Namespace for generated resources. When omitted, a
+                     deterministic content-derived ``urn:uuid:`` namespace is
+                     used.
+    :type base_uri: str or None
+    :param language: Language tag for source ``name`` literals.
+    :type language: str
+    :param invalid_stereotype_policy: Policy for stereotypes invalid for their
+                                      element type: ``preserve``, ``omit``, or
+                                      ``error``. Default is ``preserve``.
+    :type invalid_stereotype_policy: str
+    :param invalid_cardinality_policy: Policy for invalid cardinalities:
+                                       ``preserve``, ``repair``, or ``error``.
+                                       Default is ``preserve``.
+    :type invalid_cardinality_policy: str
+    :param unresolved_model_element_policy: Policy for unresolved diagrammatic
+                                            ``modelElement`` references:
+                                            ``preserve``, ``omit``, or
+                                            ``error``. Default is ``omit``.
+    :type unresolved_model_element_policy: str
+    :param append_content_hash: Treat ``base_uri`` as a parent and append the
+                                content UUID.
+    :type append_content_hash: bool
+    :return: Read-only graph on a lazily decoding store.
+    :rtype: Graph
+    :raises ValueError: If an option is invalid.
+    :raises OSError: If the input file cannot be read.
+    """
+    return open_ontouml_json_lazily(
+        json_file_path=json_file_path,
+        base_uri=base_uri,
+        language=language,
+        invalid_stereotype_policy=invalid_stereotype_policy,
+        invalid_cardinality_policy=invalid_cardinality_policy,
+        unresolved_model_element_policy=unresolved_model_element_policy,
+        append_content_hash=append_content_hash,
+    )
+
+
 def decode_json_model(
     json_file_path: str,
     base_uri: str | None = None,
@@ -105,6 +315,12 @@ def decode_json_model(
     append_content_hash: bool = False,
     path_order_policy: str = "warn",
     property_assignment_policy: str = "warn",
+    shard_processes: int = 1,
+    store: str = "default",
+    store_configuration: str | None = None,
+    diagnostics: DiagnosticsCollector | None = None,
+    select: list[str] | None = None,
+    max_memory: int | str | None = None,
 ) -> Graph:
     """Decode the domain-level model from an OntoUML JSON project.
 
@@ -153,8 +369,40 @@ def decode_json_model(
                                        on retained model elements with ``warn``
                                        or ``comment``. Default is ``warn``.
     :type property_assignment_policy: str
+    :param shard_processes: Decode top-level packages and diagram groups in
+                            up to this number of worker processes and merge
+                            the results. Default is 1 (no sharding).
+    :type shard_processes: int
+    :param store: Name of the registered RDFLib store plugin that keeps the
+                  returned graph, e.g., a disk-backed store for graphs larger
+                  than the available memory. Default is ``default`` (in
+                  memory).
+    :type store: str
+    :param store_configuration: Open the store with this configuration,
+                                usually a path or connection URL, removing
+                                the triples already in it. Close the returned
+                                graph when it is no longer needed.
+    :type store_configuration: str or None
+    :param diagnostics: Record the policy warnings and the correction
+                        messages in this collector instead of issuing them.
+                        It keeps a limited number of diagnostics per code,
+                        counts all of them, and returns a JSON-serializable
+                        report with ``get_report()``.
+    :type diagnostics: DiagnosticsCollector or None
+    :param select: Decode only the Packages with these IDs or with names
+                   matching these ``fnmatch`` patterns, plus the model
+                   elements they reference, transitively. Diagram selectors
+                   keep the model elements the diagrams show. Default is
+                   ``None`` (the whole model).
+    :type select: list[str] or None
+    :param max_memory: Memory budget of the conversion, as in
+                       ``decode_json_project``. Default is ``None`` (no
+                       budget).
+    :type max_memory: int or str or None
     :return: Decoded model-only RDF graph.
     :rtype: Graph
+    :raises MemoryBudgetError: If the conversion cannot fit in
+                               ``max_memory``. It is a ``ValueError``.
     :raises ValueError: If an option is invalid or an ``error`` policy rejects
                         source content.
     :raises OSError: If the input file cannot be read.
@@ -174,17 +422,43 @@ def decode_json_model(
         append_content_hash=append_content_hash,
         path_order_policy=path_order_policy,
         property_assignment_policy=property_assignment_policy,
+        shard_processes=shard_processes,
+        store=store,
+        store_configuration=store_configuration,
+        diagnostics=diagnostics,
+        select=select,
+        max_memory=max_memory,
     )
 
     return decoded_graph_model
 
 
-def save_graph_file(ontouml_graph: Graph, output_file_path: str, syntax: str) -> None:
+def save_graph_file(
+    ontouml_graph: Graph,
+    output_file_path: str,
+    syntax: str,
+    canonical: bool = False,
+    compression: str | None = None,
+) -> None:
     """Serialize an RDFLib graph to the requested file.
 
     Accepted syntax names are ``turtle``, ``ttl``, ``turtle2``, ``xml``,
     ``pretty-xml``, ``json-ld``, ``ntriples``, ``nt``, ``nt11``, ``n3``,
-    ``trig``, ``trix``, and ``nquads``.
+    ``trig``, ``trix``, ``nquads``, and ``snapshot``.
+
+    The ``snapshot`` syntax writes a compact binary graph snapshot that is
+    reloaded without parsing with :func:`load_graph_file` or streamed with
+    :func:`iter_graph_file_triples`. Snapshots cannot be compressed.
+
+    Canonical output writes the same graph with the same bytes, so unchanged
+    graphs can be detected with a file hash or a line diff. It is available
+    for ``ntriples``, ``nt``, and ``nt11``, written as sorted canonical
+    N-Triples, and for ``turtle`` and ``ttl``, written as deterministic
+    Turtle. Blank nodes are relabeled canonically.
+
+    Compressed output is streamed through the compressor while the graph is
+    serialized. When ``compression`` is omitted, it is selected by the
+    ``.gz``, ``.xz``, or ``.zst`` suffix of ``output_file_path``.
 
     :param ontouml_graph: Graph to serialize.
     :type ontouml_graph: Graph
@@ -193,7 +467,16 @@ def save_graph_file(ontouml_graph: Graph, output_file_path: str, syntax: str) ->
     :type output_file_path: str
     :param syntax: Supported RDFLib serialization name.
     :type syntax: str
-    :raises ValueError: If ``syntax`` is not supported.
+    :param canonical: Write byte-stable canonical output.
+    :type canonical: bool
+    :param compression: Compress the output with ``none``, ``gzip``, ``xz``,
+                        or ``zstd``. Zstandard requires Python 3.14 or the
+                        ``zstandard`` package. By default, it is inferred
+                        from the output file suffix.
+    :type compression: str or None
+    :raises ValueError: If ``syntax`` is not supported, has no canonical form
+                        when ``canonical`` is requested, or the compression
+                        is invalid or unavailable.
     :raises OSError: If the output file cannot be written.
     """
     valid_syntaxes = [
@@ -210,9 +493,127 @@ def save_graph_file(ontouml_graph: Graph, output_file_path: str, syntax: str) ->
         "trig",
         "trix",
         "nquads",
+        "snapshot",
     ]
 
+    if compression is None:
+        compression = get_compression_from_path(output_file_path)
+    validate_output_compression(compression)
+    validate_snapshot_compression(syntax, compression)
+
     if syntax not in valid_syntaxes:
         report_error_requirement_not_met("Invalid syntax used as argument.")
+    elif canonical and syntax not in CANONICAL_GRAPH_FORMATS:
+        report_error_requirement_not_met(f"Canonical output is not available for the '{syntax}' syntax.")
     else:
-        safe_write_graph_file(ontouml_graph, output_file_path, syntax)
+        safe_write_graph_file(ontouml_graph, output_file_path, syntax, canonical, compression)
+
+
+def save_partitioned_graph_files(
+    ontouml_graph: Graph,
+    output_directory: str,
+    output_stem: str,
+    syntax: str,
+    partition_by: str,
+    partition_size: int = DEFAULT_PARTITION_SIZE,
+    canonical: bool = False,
+    compression: str = "none",
+) -> str:
+    """Serialize an RDFLib graph into several files and a JSON manifest.
+
+    The graph is split by top-level ``package``, by ``diagram``, by OntoUML
+    element ``type``, or into chunks of at most ``partition_size``
+    ``triples``. Each triple is written to exactly one partition file,
+    named ``<output_stem>.part-<number>.<syntax>``, so loading all of them
+    produces the original graph. Resources outside all top-level packages or
+    diagrams, and resources without an OntoUML type, are written to a last
+    common partition.
+
+    The manifest, ``<output_stem>.manifest.json``, lists the partition
+    files with their keys, triple counts, sizes in bytes, and SHA-256
+    hashes.
+
+    :param ontouml_graph: Graph to serialize.
+    :type ontouml_graph: Graph
+    :param output_directory: Directory in which the files are saved.
+    :type output_directory: str
+    :param output_stem: Name of the files without their suffixes.
+    :type output_stem: str
+    :param syntax: Supported RDFLib serialization name, as accepted by
+                   :func:`save_graph_file`.
+    :type syntax: str
+    :param partition_by: ``package``, ``diagram``, ``type``, or
+                         ``triples``.
+    :type partition_by: str
+    :param partition_size: Maximum number of triples of each partition when
+                           partitioning by ``triples``. Default is
+                           1,000,000.
+    :type partition_size: int
+    :param canonical: Write each partition as byte-stable canonical output.
+    :type canonical: bool
+    :param compression: Compress each partition with ``none`` (default),
+                        ``gzip``, ``xz``, or ``zstd``.
+    :type compression: str
+    :return: Path of the saved manifest.
+    :rtype: str
+    :raises ValueError: If the syntax, partitioning, partition size, or
+                        compression is invalid.
+    :raises OSError: If an output file cannot be written.
+    """
+    validate_output_compression(compression)
+    validate_snapshot_compression(syntax, compression)
+    validate_partition_size(partition_size)
+
+    if syntax not in GRAPH_FORMATS:
+        report_error_requirement_not_met("Invalid syntax used as argument.")
+    elif canonical and syntax not in CANONICAL_GRAPH_FORMATS:
+        report_error_requirement_not_met(f"Canonical output is not available for the '{syntax}' syntax.")
+    elif partition_by not in OUTPUT_PARTITIONS or partition_by == "none":
+        report_error_requirement_not_met(
+            f"Invalid partitioning '{partition_by}'. Valid values are: {list(OUTPUT_PARTITIONS[1:])}."
+        )
+
+    return write_partitioned_graph_files(
+        ontouml_graph, output_directory, output_stem, syntax, partition_by, partition_size, canonical, compression
+    )
+
+
+def load_graph_file(graph_file_path: str, syntax: str | None = None) -> Graph:
+    """Load a graph file, such as one written by :func:`save_graph_file`.
+
+    Graph snapshots are memory-mapped and decoded from their term table and
+    integer triple arrays, which is considerably faster than parsing a
+    textual serialization. Other files are parsed with RDFLib.
+
+    :param graph_file_path: Path of the graph file.
+    :type graph_file_path: str
+    :param syntax: RDFLib parser name or ``snapshot``. By default, it is
+                   inferred from the file suffix, and files ending with
+                   ``.snapshot`` are loaded as snapshots.
+    :type syntax: str or None
+    :return: Loaded RDF graph.
+    :rtype: Graph
+    :raises ValueError: If a snapshot is invalid or has an unsupported
+                        version.
+    :raises OSError: If the file cannot be read.
+    """
+    return load_graph_safely(graph_file_path, syntax if syntax is not None else "not_provided")
+
+
+def iter_graph_file_triples(snapshot_file_path: str) -> Iterator[tuple[Node, Node, Node]]:
+    """Stream the triples of a graph snapshot without building a graph.
+
+    The triples are decoded directly from the memory-mapped snapshot, and
+    each distinct term is decoded once. The file stays mapped until the
+    iterator is exhausted or closed.
+
+    :param snapshot_file_path: Path of a snapshot written with the
+                               ``snapshot`` syntax.
+    :type snapshot_file_path: str
+    :return: Iterator over the snapshot's triples.
+    :rtype: Iterator[tuple[Node, Node, Node]]
+    :raises ValueError: If the snapshot is invalid or has an unsupported
+                        version.
+    :raises OSError: If the file cannot be read.
+    """
+    return iter_graph_snapshot(snapshot_file_path)
@@ -12,15 +12,33 @@ import os
 
 from .errors import report_error_requirement_not_met
 from .cardinalities import INVALID_CARDINALITY_POLICIES
-from .input_output import create_directory_if_not_exists
 from .logger import initialize_logger
 from .metadata import METADATA
 from .model_element_references import UNRESOLVED_MODEL_ELEMENT_POLICIES
-from .path_order import PATH_ORDER_POLICIES
-from .property_assignments import PROPERTY_ASSIGNMENT_POLICIES
-from .stereotypes import INVALID_STEREOTYPE_POLICIES
-from .transformation_metadata import TRANSFORMATION_METADATA_MODES
-from .utils_validations import validate_arg_input
+from .option_values import (
+    CANONICAL_GRAPH_FORMATS,
+    DATASET_FORMATS,
+    GEOMETRY_ENCODINGS,
+    GRAPH_FORMATS,
+    INVALID_STEREOTYPE_POLICIES,
+    OUTPUT_PARTITIONS,
+    PATH_ORDER_POLICIES,
+    PROPERTY_ASSIGNMENT_POLICIES,
+    TRANSFORMATION_METADATA_MODES,
+)
+from .output_compression import OUTPUT_COMPRESSIONS, validate_output_compression
+from .utils_validations import (
+    validate_arg_input,
+    validate_diagnostics_limit,
+    validate_max_memory,
+    validate_partition_size,
+    validate_selectors,
+    validate_serve_workers,
+    validate_shard_processes,
+    validate_snapshot_compression,
+    validate_store_options,
+    validate_watch_interval,
+)
 
 ARGUMENTS = {}
 
@@ -32,24 +50,6 @@ def initialize_args_script() -> None:
 
     The ARGUMENTS variable must be initialized in every possible execution mode.
     """
-    # Formats for saving graphs supported by RDFLib
-    # https://rdflib.readthedocs.io/en/stable/intro_to_parsing.html#saving-rdf
-    allowed_graph_formats = [
-        "turtle",
-        "ttl",
-        "turtle2",
-        "xml",
-        "pretty-xml",
-        "json-ld",
-        "ntriples",
-        "nt",
-        "nt11",
-        "n3",
-        "trig",
-        "trix",
-        "nquads",
-    ]
-
     # Parsing user's arguments
 
     # PARSING ARGUMENTS
@@ -74,8 +74,8 @@ def initialize_args_script() -> None:
         "--input_path",
         type=str,
         action="store",
-        required=True,
-        help="The path of the JSON file or directory with JSON files to be decoded.",
+        default=None,
+        help="The path of the JSON file or directory with JSON files to be decoded. Required unless --serve is used.",
     )
     args_parser.add_argument(
         "-o",
@@ -90,17 +90,57 @@ def initialize_args_script() -> None:
         "-a",
         "--decode_all",
         action="store_true",
-        help="Convert direct *.json children of the input directory (non-recursive).",
+        help="Convert direct *.json, *.json.gz, and *.json.xz children of the input directory and the JSON members "
+        "of its zip and tar archives (non-recursive).",
+    )
+    args_parser.add_argument(
+        "--batch-dataset",
+        action="store_true",
+        default=False,
+        help="With -a/--decode_all, write all graphs into one nquads or trig dataset file named after the input "
+        "directory, each in a named graph given by its content-derived base URI.",
     )
     args_parser.add_argument(
         "-f",
         "--format",
         type=str,
         action="store",
-        choices=allowed_graph_formats,
+        choices=GRAPH_FORMATS,
         default="ttl",
         help="Format to save the decoded file. Default is 'ttl'.",
     )
+    args_parser.add_argument(
+        "--canonical",
+        action="store_true",
+        default=False,
+        help="Write byte-stable canonical output: sorted N-Triples for the nt, ntriples, and nt11 formats, or "
+        "deterministic Turtle. Provenance omits its generation time. Other formats are rejected.",
+    )
+    args_parser.add_argument(
+        "--compression",
+        type=str,
+        action="store",
+        choices=OUTPUT_COMPRESSIONS,
+        default="none",
+        help="Compress the output file and sidecar while writing them, adding the .gz, .xz, or .zst suffix. "
+        "Default is 'none'.",
+    )
+    args_parser.add_argument(
+        "--partition",
+        type=str,
+        action="store",
+        choices=OUTPUT_PARTITIONS,
+        default="none",
+        help="Write the output graph into several files, one per top-level package, diagram, element type, or "
+        "chunk of at most --partition-size triples, and a JSON manifest listing them. Default is 'none'.",
+    )
+    args_parser.add_argument(
+        "--partition-size",
+        type=int,
+        action="store",
+        default=1000000,
+        help="Maximum number of triples of each file written with --partition triples. Default is 1000000.",
+    )
     args_parser.add_argument(
         "-l",
         "--language",
@@ -147,6 +187,15 @@ def initialize_args_script() -> None:
         action="store_true",
         help="Keep only model elements, eliminating all diagrammatic data from output.",
     )
+    args_parser.add_argument(
+        "--select",
+        type=str,
+        action="append",
+        default=None,
+        metavar="SELECTOR",
+        help="Decode only the Package or Diagram with this ID or with a name matching this pattern (e.g., 'Sales*'), "
+        "plus the model elements it references. Can be repeated.",
+    )
     args_parser.add_argument(
         "--invalid-cardinality-policy",
         type=str,
@@ -189,6 +238,48 @@ def initialize_args_script() -> None:
         help="Handle non-empty propertyAssignments maps: warn and omit them, or add canonical JSON in a "
         "non-normative rdfs:comment. Default is 'warn'.",
     )
+    args_parser.add_argument(
+        "--geometry-encoding",
+        type=str,
+        action="store",
+        choices=GEOMETRY_ENCODINGS,
+        default="points",
+        help="Encode diagram geometry as ontouml:Point individuals, or as one non-normative coordinate literal per "
+        "path or shape. Default is 'points'.",
+    )
+    args_parser.add_argument(
+        "--shard-processes",
+        type=int,
+        action="store",
+        default=1,
+        help="Decode each top-level model package and groups of diagrams in up to this number of worker processes "
+        "and merge the results. Default is 1 (no sharding).",
+    )
+    args_parser.add_argument(
+        "--max-memory",
+        type=str,
+        action="store",
+        default=None,
+        help="Memory budget of the conversion in bytes or with a K, M, G, or T suffix, e.g., '2G'. A graph that is "
+        "not expected to fit is decoded in parts spilled to temporary files and written as N-Triples or into a batch "
+        "dataset. Conversions that cannot fit fail before decoding. Default is no budget.",
+    )
+    args_parser.add_argument(
+        "--store",
+        type=str,
+        action="store",
+        default="default",
+        help="Name of the RDFLib store plugin that keeps the output graph, e.g., a disk-backed store for graphs "
+        "larger than the available memory. Default is 'default' (in memory).",
+    )
+    args_parser.add_argument(
+        "--store-configuration",
+        type=str,
+        action="store",
+        default=None,
+        help="Open the store with this configuration (usually a path or connection URL) before each conversion. "
+        "Triples already in the store are removed. Requires --store.",
+    )
     args_parser.add_argument(
         "--transformation-metadata",
         type=str,
@@ -198,6 +289,59 @@ def initialize_args_script() -> None:
         help="Transformation provenance: none, embedded in the output, or a separate Turtle sidecar. "
         "Default is 'none'.",
     )
+    args_parser.add_argument(
+        "--diagnostics-limit",
+        type=int,
+        action="store",
+        default=None,
+        help="Maximum number of warnings and correction messages of each code that are printed and kept in the "
+        "diagnostics report. Further ones are only counted and summarized. Default is no limit.",
+    )
+    args_parser.add_argument(
+        "--diagnostics-report",
+        action="store_true",
+        default=False,
+        help="Save the warnings and correction messages of each conversion, with their counts per code, in a JSON "
+        "file next to the output graph.",
+    )
+    args_parser.add_argument(
+        "--watch",
+        action="store_true",
+        default=False,
+        help="After converting the input, keep running and convert the input file, or the changed files of the "
+        "input directory, again whenever they change. Stop with Ctrl+C.",
+    )
+    args_parser.add_argument(
+        "--watch-interval",
+        type=float,
+        action="store",
+        default=1.0,
+        help="Seconds between checks for changed inputs in watch mode. A change is converted once the file is "
+        "unchanged for one interval. Default is 1.0.",
+    )
+    args_parser.add_argument(
+        "--serve",
+        action="store_true",
+        default=False,
+        help="Read conversion jobs as JSON lines from standard input and write one JSON response line per job to "
+        "standard output, keeping the process and its caches alive. The other options are the job defaults.",
+    )
+    args_parser.add_argument(
+        "--serve-workers",
+        type=int,
+        action="store",
+        default=1,
+        help="Number of worker processes that convert jobs concurrently in server mode. Default is 1 (jobs are "
+        "converted one at a time in the server process).",
+    )
+
+    args_parser.add_argument(
+        "--check",
+        action="store_true",
+        default=False,
+        help="Check the input against the source-level policies without building or writing a graph. Each finding "
+        "is printed on one line. The exit status is 1 if an error policy rejects the content of any input.",
+    )
 
     # AUTOMATIC ARGUMENTS
     args_parser.add_argument("-v", "--version", action="version", help="Print the software version and exit.")
@@ -212,29 +356,94 @@ def initialize_args_script() -> None:
         "append_content_hash": append_content_hash,
         "base_uri": requested_base_uri,
         "base_uri_input": requested_base_uri,
+        "batch_dataset": arguments.batch_dataset,
+        "canonical": arguments.canonical,
+        "check": arguments.check,
+        "compression": arguments.compression,
         "correct": arguments.correct,
         "decode_all": arguments.decode_all,
+        "diagnostics_limit": arguments.diagnostics_limit,
+        "diagnostics_report": arguments.diagnostics_report,
         "format": arguments.format,
-        "input_path": os.path.abspath(arguments.input_path),
+        "geometry_encoding": arguments.geometry_encoding,
+        "input_path": os.path.abspath(arguments.input_path) if arguments.input_path is not None else None,
         "invalid_cardinality_policy": arguments.invalid_cardinality_policy,
         "invalid_stereotype_policy": arguments.invalid_stereotype_policy,
         "language": arguments.language,
+        "max_memory": validate_max_memory(arguments.max_memory),
         "model_only": arguments.model_only,
         "output_path": os.path.abspath(arguments.output_path),
+        "partition": arguments.partition,
+        "partition_size": arguments.partition_size,
         "path_order_policy": arguments.path_order_policy,
         "property_assignment_policy": arguments.property_assignment_policy,
+        "select": arguments.select,
+        "shard_processes": arguments.shard_processes,
         "silent": arguments.silent,
+        "store": arguments.store,
+        "store_configuration": arguments.store_configuration,
         "transformation_metadata": arguments.transformation_metadata,
         "unresolved_model_element_policy": arguments.unresolved_model_element_policy,
+        "serve": arguments.serve,
+        "serve_workers": arguments.serve_workers,
+        "watch": arguments.watch,
+        "watch_interval": arguments.watch_interval,
     }
 
     # Input validation
-    validate_arg_input(arguments.input_path, arguments.decode_all)
+    if arguments.check and (arguments.serve or arguments.watch):
+        args_parser.error("argument --check: not allowed with --serve or --watch")
+    if arguments.serve:
+        if arguments.input_path is not None or arguments.decode_all or arguments.watch:
+            args_parser.error("argument --serve: not allowed with -i/--input_path, -a/--decode_all, or --watch")
+        validate_serve_workers(arguments.serve_workers)
+        if arguments.transformation_metadata == "sidecar":
+            report_error_requirement_not_met("Sidecar transformation metadata is not available in server mode.")
+        if arguments.store != "default":
+            report_error_requirement_not_met("Only the default store is available in server mode.")
+        if arguments.partition != "none":
+            report_error_requirement_not_met("Partitioned output is not available in server mode.")
+        if arguments.max_memory is not None:
+            report_error_requirement_not_met("A memory budget is not available in server mode.")
+    elif arguments.input_path is None:
+        args_parser.error("the following arguments are required: -i/--input_path")
+    else:
+        validate_arg_input(arguments.input_path, arguments.decode_all)
+    validate_shard_processes(arguments.shard_processes)
+    validate_store_options(arguments.store, arguments.store_configuration)
+    validate_watch_interval(arguments.watch_interval)
+    validate_diagnostics_limit(arguments.diagnostics_limit)
+    validate_partition_size(arguments.partition_size)
+    if arguments.batch_dataset:
+        if not arguments.decode_all or arguments.watch:
+            args_parser.error("argument --batch-dataset: requires -a/--decode_all and is not allowed with --watch")
+        if arguments.format not in DATASET_FORMATS:
+            report_error_requirement_not_met(
+                f"A batch dataset cannot be written in the '{arguments.format}' format. "
+                f"Valid formats are: {list(DATASET_FORMATS)}."
+            )
+        if arguments.partition != "none":
+            report_error_requirement_not_met("A batch dataset cannot be partitioned.")
+        if arguments.base_uri is not None:
+            report_error_requirement_not_met(
+                "The graphs of a batch dataset are named by their base URIs, which must differ. "
+                "Use --base-uri-with-content-id instead of --base-uri."
+            )
+    validate_output_compression(arguments.compression)
+    validate_snapshot_compression(arguments.format, arguments.compression)
+    if arguments.canonical and arguments.format not in CANONICAL_GRAPH_FORMATS:
+        report_error_requirement_not_met(
+            f"Canonical output is not available for the '{arguments.format}' format. "
+            f"Valid formats are: {list(CANONICAL_GRAPH_FORMATS)}."
+        )
 
     # Output validation
     if os.path.isfile(arguments.output_path):
         report_error_requirement_not_met("Provided output path is not a directory. Execution finished.")
-    if not os.path.exists(arguments.output_path):
+    if not arguments.check and not os.path.exists(arguments.output_path):
+        # Imported here because input_output loads RDFLib, which is not needed to parse the arguments.
+        from .input_output import create_directory_if_not_exists
+
         create_directory_if_not_exists(arguments.output_path, "output directory")
         LOGGER.info("The provided output directory did not exist and was created.")
 
@@ -260,6 +469,12 @@ def initialize_args_import(
     append_content_hash: bool = False,
     path_order_policy: str = "warn",
     property_assignment_policy: str = "warn",
+    shard_processes: int = 1,
+    store: str = "default",
+    store_configuration: str | None = None,
+    geometry_encoding: str = "points",
+    select: list[str] | None = None,
+    max_memory: int | str | None = None,
 ):
     """Initialize the global variable ARGUMENTS of type dictionary, which contains user-provided \
     (when executed in script mode) or default arguments (when executed as a library or for testing).
@@ -305,8 +520,30 @@ def initialize_args_import(
                                        (default) and 'comment'. The latter adds their canonical JSON as a
                                        non-normative rdfs:comment annotation. (Optional)
     :type property_assignment_policy: str
+    :param shard_processes: Number of worker processes used to decode top-level packages and diagrams in parallel.
+                            Default is 1 (no sharding). (Optional)
+    :type shard_processes: int
+    :param store: Name of the RDFLib store plugin that keeps the output graph. Default is 'default' (in memory).
+                  (Optional)
+    :type store: str
+    :param store_configuration: Configuration used to open the store before the conversion (e.g., a path). Triples
+                                already in the store are removed. (Optional)
+    :type store_configuration: str or None
+    :param geometry_encoding: How diagram geometry is encoded. Valid values are 'points' (default) and 'compact'.
+                              The latter adds one non-normative coordinate literal per path or shape. (Optional)
+    :type geometry_encoding: str
+    :param select: IDs or name patterns of the Packages and Diagrams to be decoded, with the model elements they
+                   reference. None (default) decodes the whole project. (Optional)
+    :type select: list[str] or None
+    :param max_memory: Memory budget of the conversion in bytes, or as a string with a K, M, G, or T suffix. None
+                       (default) sets no budget. (Optional)
+    :type max_memory: int or str or None
     """
     validate_arg_input(input_path, decode_all=False)
+    validate_shard_processes(shard_processes)
+    validate_store_options(store, store_configuration)
+    validate_selectors(select)
+    max_memory_bytes = validate_max_memory(max_memory)
 
     if invalid_cardinality_policy not in INVALID_CARDINALITY_POLICIES:
         report_error_requirement_not_met(
@@ -337,6 +574,11 @@ def initialize_args_import(
             f"{list(PROPERTY_ASSIGNMENT_POLICIES)}."
         )
 
+    if geometry_encoding not in GEOMETRY_ENCODINGS:
+        report_error_requirement_not_met(
+            f"Invalid geometry encoding '{geometry_encoding}'. Valid values are: {list(GEOMETRY_ENCODINGS)}."
+        )
+
     if transformation_metadata not in TRANSFORMATION_METADATA_MODES:
         report_error_requirement_not_met(
             f"Invalid transformation metadata mode '{transformation_metadata}'. Valid values are: "
@@ -352,15 +594,29 @@ def initialize_args_import(
     ARGUMENTS["base_uri_input"] = base_uri
     ARGUMENTS["correct"] = correct
     ARGUMENTS["format"] = graph_format
+    ARGUMENTS["geometry_encoding"] = geometry_encoding
     ARGUMENTS["input_path"] = input_path
     ARGUMENTS["invalid_cardinality_policy"] = invalid_cardinality_policy
     ARGUMENTS["invalid_stereotype_policy"] = invalid_stereotype_policy
     ARGUMENTS["language"] = language
+    ARGUMENTS["max_memory"] = max_memory_bytes
     ARGUMENTS["model_only"] = model_only
     ARGUMENTS["output_path"] = output_path
     ARGUMENTS["path_order_policy"] = path_order_policy
     ARGUMENTS["property_assignment_policy"] = property_assignment_policy
+    ARGUMENTS["select"] = list(select) if select is not None else None
+    ARGUMENTS["shard_processes"] = shard_processes
+    ARGUMENTS["batch_dataset"] = False
+    ARGUMENTS["canonical"] = False
+    ARGUMENTS["check"] = False
+    ARGUMENTS["diagnostics_limit"] = None
+    ARGUMENTS["diagnostics_report"] = False
+    ARGUMENTS["compression"] = "none"
+    ARGUMENTS["partition"] = "none"
+    ARGUMENTS["partition_size"] = 1000000
     ARGUMENTS["silent"] = silent
+    ARGUMENTS["store"] = store
+    ARGUMENTS["store_configuration"] = store_configuration
     ARGUMENTS["transformation_metadata"] = transformation_metadata
     ARGUMENTS["unresolved_model_element_policy"] = unresolved_model_element_policy
 
@@ -374,6 +630,11 @@ def initialize_args_test(
     transformation_metadata: str = "none",
     path_order_policy: str = "warn",
     property_assignment_policy: str = "warn",
+    shard_processes: int = 1,
+    store: str = "default",
+    store_configuration: str | None = None,
+    geometry_encoding: str = "points",
+    select: list[str] | None = None,
 ):
     """Initialize the global variable ARGUMENTS of type dictionary, which contains user-provided \
     (when executed in script mode) or default arguments (when executed as a library or for testing).
@@ -397,8 +658,21 @@ def initialize_args_test(
     :param property_assignment_policy: How to handle non-empty propertyAssignments maps. Valid values are 'warn' and
                                        'comment'. (Optional)
     :type property_assignment_policy: str
+    :param shard_processes: Number of worker processes used to decode top-level packages and diagrams. (Optional)
+    :type shard_processes: int
+    :param store: Name of the RDFLib store plugin that keeps the output graph. (Optional)
+    :type store: str
+    :param store_configuration: Configuration used to open the store before the conversion. (Optional)
+    :type store_configuration: str or None
+    :param geometry_encoding: How diagram geometry is encoded. Valid values are 'points' and 'compact'. (Optional)
+    :type geometry_encoding: str
+    :param select: IDs or name patterns of the Packages and Diagrams to be decoded. (Optional)
+    :type select: list[str] or None
     """
     validate_arg_input(input_path, decode_all=False)
+    validate_shard_processes(shard_processes)
+    validate_store_options(store, store_configuration)
+    validate_selectors(select)
 
     if invalid_cardinality_policy not in INVALID_CARDINALITY_POLICIES:
         report_error_requirement_not_met(
@@ -429,6 +703,11 @@ def initialize_args_test(
             f"{list(PROPERTY_ASSIGNMENT_POLICIES)}."
         )
 
+    if geometry_encoding not in GEOMETRY_ENCODINGS:
+        report_error_requirement_not_met(
+            f"Invalid geometry encoding '{geometry_encoding}'. Valid values are: {list(GEOMETRY_ENCODINGS)}."
+        )
+
     if transformation_metadata not in TRANSFORMATION_METADATA_MODES:
         report_error_requirement_not_met(
             f"Invalid transformation metadata mode '{transformation_metadata}'. Valid values are: "
@@ -440,14 +719,28 @@ def initialize_args_test(
     ARGUMENTS["base_uri_input"] = "https://example.org#"
     ARGUMENTS["correct"] = True
     ARGUMENTS["format"] = "ttl"
+    ARGUMENTS["geometry_encoding"] = geometry_encoding
     ARGUMENTS["input_path"] = input_path
     ARGUMENTS["invalid_cardinality_policy"] = invalid_cardinality_policy
     ARGUMENTS["invalid_stereotype_policy"] = invalid_stereotype_policy
     ARGUMENTS["language"] = language
+    ARGUMENTS["max_memory"] = None
     ARGUMENTS["model_only"] = False
     ARGUMENTS["output_path"] = "tests" + os.path.sep + "results"
     ARGUMENTS["path_order_policy"] = path_order_policy
     ARGUMENTS["property_assignment_policy"] = property_assignment_policy
+    ARGUMENTS["select"] = list(select) if select is not None else None
+    ARGUMENTS["shard_processes"] = shard_processes
+    ARGUMENTS["batch_dataset"] = False
+    ARGUMENTS["canonical"] = False
+    ARGUMENTS["check"] = False
+    ARGUMENTS["diagnostics_limit"] = None
+    ARGUMENTS["diagnostics_report"] = False
+    ARGUMENTS["compression"] = "none"
+    ARGUMENTS["partition"] = "none"
+    ARGUMENTS["partition_size"] = 1000000
     ARGUMENTS["silent"] = True
+    ARGUMENTS["store"] = store
+    ARGUMENTS["store_configuration"] = store_configuration
     ARGUMENTS["transformation_metadata"] = transformation_metadata
     ARGUMENTS["unresolved_model_element_policy"] = unresolved_model_element_policy
@@ -0,0 +1,187 @@
+"""Enumerate the JSON inputs of a batch directory, including compressed files and archive members.
+
+A batch directory may contain plain (.json), gzip-compressed (.json.gz), and xz-compressed (.json.xz) JSON files, as
+well as zip and tar archives of projects. Archive members are read into memory one at a time, in archive order, and
+are never extracted to disk. Tar archives are read as streams, so compressed tar archives are decompressed only once.
+"""
+
+import os
+import tarfile
+import warnings
+import zipfile
+from collections import Counter
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import PurePosixPath
+
+JSON_INPUT_SUFFIXES = (".json", ".json.gz", ".json.xz")
+ARCHIVE_INPUT_SUFFIXES = (".zip", ".tar", ".tar.gz", ".tgz", ".tar.xz", ".txz")
+
+
+class UnsafeArchiveMemberWarning(UserWarning):
+    """Warn that an archive member was skipped because its path leaves the output directory."""
+
+
+@dataclass(frozen=True)
+class BatchInput:
+    """One JSON document to be decoded in batch mode.
+
+    :ivar source_path: Path of the JSON file, or archive path followed by the member path for archive members.
+    :vartype source_path: str
+    :ivar output_stem: Output path relative to the output directory, without format and compression suffixes.
+    :vartype output_stem: str
+    :ivar content: Raw member bytes for archive members, or None for files that are read from source_path.
+    :vartype content: bytes or None
+    """
+
+    source_path: str
+    output_stem: str
+    content: bytes | None = None
+
+
+def _strip_suffix(name: str, suffixes: tuple[str, ...]) -> str:
+    """Remove the longest matching suffix from a file or member name."""
+    for suffix in sorted(suffixes, key=len, reverse=True):
+        if name.endswith(suffix):
+            return name[: -len(suffix)]
+    return name
+
+
+def get_json_input_stem(input_path: str) -> str:
+    """Return the name of a JSON input file without its JSON and compression suffixes.
+
+    :param input_path: Path of a .json, .json.gz, or .json.xz file.
+    :type input_path: str
+    :return: File name without suffixes, used to name the output files.
+    :rtype: str
+    """
+    return _strip_suffix(os.path.basename(input_path), JSON_INPUT_SUFFIXES)
+
+
+def _is_hidden_member(member_name: str) -> bool:
+    """Return True if an archive member is hidden, e.g., a macOS resource fork ('__MACOSX/._a.json')."""
+    # Parent directory references are not hidden: they are reported as unsafe.
+    return any(
+        (part.startswith(".") and part != "..") or part == "__MACOSX" for part in PurePosixPath(member_name).parts
+    )
+
+
+def _member_output_stem(archive_path: str, archive_stem: str, member_name: str) -> str | None:
+    """Return the output stem of an archive member, or None if the member path is not safe to write under."""
+    member_path = PurePosixPath(member_name)
+    if member_path.is_absolute() or ".." in member_path.parts:
+        warnings.warn(
+            f"Archive member '{member_name}' of '{archive_path}' was skipped because its path is absolute or "
+            f"refers to a parent directory.",
+            UnsafeArchiveMemberWarning,
+            stacklevel=3,
+        )
+        return None
+
+    member_stem = _strip_suffix(member_path.as_posix(), (".json",))
+    return f"{archive_stem}/{member_stem}"
+
+
+def _iter_zip_members(archive_path: str, archive_stem: str) -> Iterator[BatchInput]:
+    """Yield the JSON members of a zip archive in archive order."""
+    with zipfile.ZipFile(archive_path) as archive:
+        for member in archive.infolist():
+            if member.is_dir() or not member.filename.endswith(".json") or _is_hidden_member(member.filename):
+                continue
+            output_stem = _member_output_stem(archive_path, archive_stem, member.filename)
+            if output_stem is not None:
+                yield BatchInput(f"{archive_path}/{member.filename}", output_stem, archive.read(member))
+
+
+def _iter_tar_members(archive_path: str, archive_stem: str) -> Iterator[BatchInput]:
+    """Yield the JSON members of a (possibly compressed) tar archive in archive order, reading it as a stream."""
+    with tarfile.open(archive_path, "r|*") as archive:
+        for member in archive:
+            if not member.isfile() or not member.name.endswith(".json") or _is_hidden_member(member.name):
+                continue
+            output_stem = _member_output_stem(archive_path, archive_stem, member.name)
+            if output_stem is not None:
+                yield BatchInput(f"{archive_path}/{member.name}", output_stem, archive.extractfile(member).read())
+
+
+def get_entry_output_stems(entry_paths: list[str]) -> dict[str, str]:
+    """Return the output stem of each batch directory entry.
+
+    The output stem of an entry is its name without its JSON, compression, or archive suffixes. JSON files are
+    written to '<stem>.<format>' and archive members below '<stem>/', so when several JSON files or several archives
+    share a stem (e.g., 'a.zip' and 'a.tar.gz'), each of them keeps its whole name as its stem instead.
+
+    :param entry_paths: Paths of the entries returned by list_batch_entries.
+    :type entry_paths: list[str]
+    :return: Output stem of each entry path.
+    :rtype: dict[str, str]
+    """
+    entry_keys = {}
+    for entry_path in entry_paths:
+        entry_name = os.path.basename(entry_path)
+        if entry_name.endswith(JSON_INPUT_SUFFIXES):
+            entry_keys[entry_path] = ("json", _strip_suffix(entry_name, JSON_INPUT_SUFFIXES))
+        else:
+            entry_keys[entry_path] = ("archive", _strip_suffix(entry_name, ARCHIVE_INPUT_SUFFIXES))
+
+    key_counts = Counter(entry_keys.values())
+    return {
+        entry_path: entry_key[1] if key_counts[entry_key] == 1 else os.path.basename(entry_path)
+        for entry_path, entry_key in entry_keys.items()
+    }
+
+
+def iter_batch_inputs(input_directory: str) -> Iterator[BatchInput]:
+    """Yield the JSON documents of a batch directory.
+
+    Direct, non-hidden children of the directory are processed in sorted path order; subdirectories are not searched.
+    Archive members are yielded in archive order when their archive is reached.
+
+    :param input_directory: Directory provided as input in batch mode.
+    :type input_directory: str
+    :return: Iterator over the batch inputs.
+    :rtype: Iterator[BatchInput]
+    """
+    entry_paths = list_batch_entries(input_directory)
+    for entry_path, output_stem in get_entry_output_stems(entry_paths).items():
+        yield from iter_entry_inputs(entry_path, output_stem)
+
+
+def list_batch_entries(input_directory: str) -> list[str]:
+    """Return the paths of the direct, non-hidden JSON files and archives of a batch directory in sorted order.
+
+    :param input_directory: Directory provided as input in batch mode.
+    :type input_directory: str
+    :return: Paths of the entries that provide batch inputs.
+    :rtype: list[str]
+    """
+    entry_paths = []
+    for entry_name in sorted(os.listdir(input_directory)):
+        entry_path = os.path.join(input_directory, entry_name)
+        if entry_name.startswith(".") or not os.path.isfile(entry_path):
+            continue
+        if entry_name.endswith(JSON_INPUT_SUFFIXES + ARCHIVE_INPUT_SUFFIXES):
+            entry_paths.append(entry_path)
+    return entry_paths
+
+
+def iter_entry_inputs(entry_path: str, output_stem: str | None = None) -> Iterator[BatchInput]:
+    """Yield the JSON documents of one batch directory entry: the file itself, or the JSON members of an archive.
+
+    Hidden archive members, such as the resource forks that macOS adds to zip archives, are skipped.
+
+    :param entry_path: Path of a JSON file or archive returned by list_batch_entries.
+    :type entry_path: str
+    :param output_stem: Output stem of the entry returned by get_entry_output_stems. Defaults to the entry name without
+                        its suffixes. (Optional)
+    :type output_stem: str or None
+    :return: Iterator over the batch inputs of the entry.
+    :rtype: Iterator[BatchInput]
+    """
+    entry_name = os.path.basename(entry_path)
+    if entry_name.endswith(JSON_INPUT_SUFFIXES):
+        yield BatchInput(entry_path, output_stem or get_json_input_stem(entry_path))
+    elif entry_name.endswith(".zip"):
+        yield from _iter_zip_members(entry_path, output_stem or _strip_suffix(entry_name, ARCHIVE_INPUT_SUFFIXES))
+    elif entry_name.endswith(ARCHIVE_INPUT_SUFFIXES):
+        yield from _iter_tar_members(entry_path, output_stem or _strip_suffix(entry_name, ARCHIVE_INPUT_SUFFIXES))
@@ -0,0 +1,129 @@
+"""Write graphs in a canonical, byte-stable form.
+
+Canonical output is available as sorted canonical N-Triples or as the deterministic Turtle produced by the specialized
+Turtle writer. In both cases, blank nodes are relabeled from the triples in which they occur, so the same graph is
+always written with the same bytes and unchanged outputs can be detected with a plain file hash or line diff.
+"""
+
+import re
+from typing import TextIO
+
+from rdflib import XSD, BNode, Graph, Literal, URIRef
+from rdflib.compare import to_canonical_graph
+
+from .option_values import CANONICAL_GRAPH_FORMATS
+from .turtle_writer import write_turtle
+
+_INVALID_IRI_CHARACTERS = re.compile(r'[\x00-\x20<>"{}|^`\\]')
+
+# Canonical N-Triples escaping: ECHAR for these characters, UCHAR for the remaining control characters.
+_CANONICAL_STRING_ESCAPES = {
+    **{code: f"\\u{code:04X}" for code in (*range(0x20), 0x7F)},
+    ord("\b"): "\\b",
+    ord("\t"): "\\t",
+    ord("\n"): "\\n",
+    ord("\f"): "\\f",
+    ord("\r"): "\\r",
+    ord('"'): '\\"',
+    ord("\\"): "\\\\",
+}
+
+
+def format_ntriples_term(term) -> str:
+    """Return the canonical N-Triples representation of an RDF term.
+
+    :param term: IRI, blank node, or literal to be written.
+    :type term: Node
+    :return: Term as written in N-Triples, N-Quads, and TriG documents.
+    :rtype: str
+    :raises ValueError: If an IRI contains characters that N-Triples cannot represent.
+    """
+    if isinstance(term, URIRef):
+        if _INVALID_IRI_CHARACTERS.search(term):
+            raise ValueError(f"'{term}' is not a valid IRI and cannot be written as N-Triples.")
+        return f"<{term}>"
+    if isinstance(term, BNode):
+        return f"_:{term}"
+    if isinstance(term, Literal):
+        quoted_form = '"' + str(term).translate(_CANONICAL_STRING_ESCAPES) + '"'
+        if term.language:
+            return f"{quoted_form}@{term.language}"
+        if term.datatype and term.datatype != XSD.string:
+            return f"{quoted_form}^^{format_ntriples_term(term.datatype)}"
+        return quoted_form
+    raise ValueError(f"Term {term!r} cannot be written as N-Triples.")
+
+
+def with_canonical_blank_nodes(ontouml_graph: Graph) -> Graph:
+    """Return the graph with blank nodes relabeled canonically, or the graph itself when it has no blank nodes.
+
+    Only the triples that contain blank nodes are canonicalized, so the cost does not depend on the size of the rest
+    of the graph.
+
+    :param ontouml_graph: Graph whose blank nodes are relabeled.
+    :type ontouml_graph: Graph
+    :return: Graph with the same triples up to blank-node labels, and the same namespace bindings.
+    :rtype: Graph
+    """
+    blank_node_graph = Graph()
+    for triple in ontouml_graph:
+        if isinstance(triple[0], BNode) or isinstance(triple[2], BNode):
+            blank_node_graph.add(triple)
+
+    if not len(blank_node_graph):
+        return ontouml_graph
+
+    canonical_graph = Graph()
+    for prefix, namespace in ontouml_graph.namespaces():
+        canonical_graph.bind(prefix, namespace)
+    canonical_graph += ontouml_graph - blank_node_graph
+    canonical_graph += to_canonical_graph(blank_node_graph)
+    return canonical_graph
+
+
+def write_canonical_ntriples(ontouml_graph: Graph, output_stream: TextIO) -> None:
+    """Write a graph as canonical N-Triples, one triple per line in code point order.
+
+    :param ontouml_graph: Graph to be written.
+    :type ontouml_graph: Graph
+    :param output_stream: Text stream that receives the N-Triples document.
+    :type output_stream: TextIO
+    :raises ValueError: If the graph contains an IRI that cannot be written as N-Triples.
+    """
+    term_cache = {}
+
+    def format_term(term) -> str:
+        formatted_term = term_cache.get(term)
+        if formatted_term is None:
+            formatted_term = term_cache[term] = format_ntriples_term(term)
+        return formatted_term
+
+    lines = sorted(
+        f"{format_term(subject)} {format_term(predicate)} {format_term(obj)} .\n"
+        for subject, predicate, obj in ontouml_graph
+    )
+    output_stream.writelines(lines)
+
+
+def write_canonical_graph(ontouml_graph: Graph, output_stream: TextIO, syntax: str) -> None:
+    """Write a graph in canonical form to a text stream.
+
+    :param ontouml_graph: Graph to be written.
+    :type ontouml_graph: Graph
+    :param output_stream: Text stream that receives the canonical document.
+    :type output_stream: TextIO
+    :param syntax: One of the syntaxes in CANONICAL_GRAPH_FORMATS.
+    :type syntax: str
+    :raises ValueError: If the syntax has no canonical form or the graph contains an IRI that cannot be written.
+    """
+    if syntax not in CANONICAL_GRAPH_FORMATS:
+        raise ValueError(
+            f"Canonical output is not available for the '{syntax}' format. "
+            f"Valid formats are: {list(CANONICAL_GRAPH_FORMATS)}."
+        )
+
+    canonical_graph = with_canonical_blank_nodes(ontouml_graph)
+    if syntax in ("turtle", "ttl"):
+        write_turtle(canonical_graph, output_stream)
+    else:
+        write_canonical_ntriples(canonical_graph, output_stream)
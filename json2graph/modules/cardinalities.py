@@ -1,7 +1,10 @@
 """Validate OntoUML cardinalities and apply the configured handling policy."""
 
 import re
-import warnings
+from functools import lru_cache
+
+from .diagnostics import issue_warning
+from .utils_general import SOURCE_VALUE_CACHE_SIZE
 
 INVALID_CARDINALITY_POLICIES = ("preserve", "repair", "error")
 
@@ -60,6 +63,15 @@ def _repair_cardinality(cardinality: str) -> tuple[str, str, str] | None:
     return None
 
 
+@lru_cache(maxsize=SOURCE_VALUE_CACHE_SIZE)
+def _classify_cardinality(cardinality: str) -> tuple[tuple[str, str, str] | None, tuple[str, str, str] | None]:
+    """Return the parsed cardinality, or None when invalid, and the repaired cardinality of an invalid one, if any."""
+    parsed = _parse_valid_cardinality(cardinality)
+    if parsed is not None:
+        return parsed, None
+    return None, _repair_cardinality(cardinality)
+
+
 def resolve_cardinality(
     cardinality: str,
     property_id: str,
@@ -71,7 +83,8 @@ def resolve_cardinality(
             f"Invalid cardinality policy '{policy}'. Valid values are: {list(INVALID_CARDINALITY_POLICIES)}."
         )
 
-    parsed = _parse_valid_cardinality(cardinality)
+    # The parsing of each distinct value is computed once, while the warnings are issued for every property.
+    parsed, repaired = _classify_cardinality(cardinality)
     if parsed is not None:
         return parsed
 
@@ -83,13 +96,13 @@ def resolve_cardinality(
         )
 
     if policy == "repair":
-        repaired = _repair_cardinality(cardinality)
         if repaired is not None:
             repaired_value, lower_bound, upper_bound = repaired
-            warnings.warn(
+            issue_warning(
                 f"{message} It was repaired to '{repaired_value}' because the invalid cardinality policy is "
                 "'repair'.",
                 CardinalityRepairWarning,
+                element_id=property_id,
                 stacklevel=2,
             )
             return repaired
@@ -101,9 +114,10 @@ def resolve_cardinality(
     else:
         action = "The original cardinalityValue was preserved and lowerBound and upperBound were omitted."
 
-    warnings.warn(
+    issue_warning(
         f"{message} {action} The invalid cardinality policy is '{policy}'.",
         InvalidCardinalityWarning,
+        element_id=property_id,
         stacklevel=2,
     )
     return cardinality, None, None
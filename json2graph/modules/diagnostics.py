@@ -0,0 +1,168 @@
+"""Collect the diagnostics of a conversion as compact coded records, aggregated and limited per code.
+
+Without an active collector, diagnostics are issued as before: policy findings as Python warnings and correction
+messages as log lines. While a DiagnosticsCollector is active, they are recorded in it instead. Only the first records
+of each code are kept, and the others are only counted, so models with many similar findings neither flood the output
+nor grow the warning registries of a long-running process. The legacy warnings and log lines of the kept records can
+still be issued by enabling the collector's emit adapter.
+"""
+
+import warnings
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+# Collectors that receive the diagnostics issued while they are active. The innermost one is used.
+_DIAGNOSTICS_COLLECTORS: list["DiagnosticsCollector"] = []
+
+
+@dataclass(frozen=True, slots=True)
+class Diagnostic:
+    """One diagnostic recorded during a conversion.
+
+    :ivar code: Name of the warning class (e.g., 'InvalidStereotypeWarning') or code of the correction pass message
+                (e.g., 'DGA1').
+    :vartype code: str
+    :ivar message: Description of the diagnostic, as issued without a collector.
+    :vartype message: str
+    :ivar element_id: ID of the JSON object the diagnostic refers to, if any.
+    :vartype element_id: str or None
+    :ivar category: Warning class issued for the diagnostic, or None for correction pass messages, which are logged.
+    :vartype category: type[Warning] or None
+    """
+
+    code: str
+    message: str
+    element_id: str | None = None
+    category: type[Warning] | None = None
+
+
+class DiagnosticsCollector:
+    """Record the diagnostics issued while the collector is active, keeping at most a limited number per code.
+
+    :ivar records: Kept diagnostics, in the order in which they were issued.
+    :vartype records: list[Diagnostic]
+    :ivar counts: Number of diagnostics issued per code, including the ones that were not kept.
+    :vartype counts: dict[str, int]
+    """
+
+    def __init__(self, limit: int | None = None, emit: bool = False) -> None:
+        """Create an empty collector.
+
+        :param limit: Maximum number of diagnostics kept per code. None (default) keeps all of them. (Optional)
+        :type limit: int or None
+        :param emit: If True, also issue the warnings and log lines of the kept diagnostics. (Optional)
+        :type emit: bool
+        """
+        if limit is not None and (type(limit) is not int or limit < 0):
+            raise ValueError("The diagnostics limit must be a non-negative integer.")
+
+        self.limit = limit
+        self.emit = emit
+        self.records: list[Diagnostic] = []
+        self.counts: dict[str, int] = {}
+
+    def add(
+        self,
+        code: str,
+        get_message: Callable[[], str],
+        element_id: str | None = None,
+        category: type[Warning] | None = None,
+    ) -> Diagnostic | None:
+        """Count a diagnostic and keep it if the limit of its code was not reached.
+
+        :param code: Code of the diagnostic.
+        :type code: str
+        :param get_message: Function that builds the message, called only if the diagnostic is kept.
+        :type get_message: Callable[[], str]
+        :param element_id: ID of the JSON object the diagnostic refers to. (Optional)
+        :type element_id: str or None
+        :param category: Warning class of the diagnostic, or None for correction pass messages. (Optional)
+        :type category: type[Warning] or None
+        :return: The kept diagnostic, or None if it was only counted.
+        :rtype: Diagnostic or None
+        """
+        count = self.counts.get(code, 0) + 1
+        self.counts[code] = count
+        if self.limit is not None and count > self.limit:
+            return None
+
+        diagnostic = Diagnostic(code, get_message(), element_id, category)
+        self.records.append(diagnostic)
+        return diagnostic
+
+    def get_suppressed_counts(self) -> dict[str, int]:
+        """Return the number of diagnostics of each code that were counted but not kept.
+
+        :return: Dictionary from code to number of suppressed diagnostics, only for codes with suppressed ones.
+        :rtype: dict[str, int]
+        """
+        if self.limit is None:
+            return {}
+        return {code: count - self.limit for code, count in sorted(self.counts.items()) if count > self.limit}
+
+    def get_report(self) -> dict:
+        """Return the collected diagnostics as a dictionary that can be serialized as JSON.
+
+        :return: Dictionary with the 'limit', the total 'counts' and 'suppressed' counts per code, and the kept
+                 'diagnostics', each with its 'code', 'element_id', and 'message'.
+        :rtype: dict
+        """
+        return {
+            "limit": self.limit,
+            "counts": dict(sorted(self.counts.items())),
+            "suppressed": self.get_suppressed_counts(),
+            "diagnostics": [
+                {"code": record.code, "element_id": record.element_id, "message": record.message}
+                for record in self.records
+            ],
+        }
+
+
+def get_active_diagnostics_collector() -> DiagnosticsCollector | None:
+    """Return the innermost active collector, or None if diagnostics are issued without a collector.
+
+    :return: Active collector, if any.
+    :rtype: DiagnosticsCollector or None
+    """
+    return _DIAGNOSTICS_COLLECTORS[-1] if _DIAGNOSTICS_COLLECTORS else None
+
+
+@contextmanager
+def collect_diagnostics(collector: DiagnosticsCollector | None) -> Iterator[DiagnosticsCollector | None]:
+    """Record the diagnostics issued while the context is active in a collector. With None, nothing changes.
+
+    :param collector: Collector that receives the diagnostics, or None to issue them without a collector.
+    :type collector: DiagnosticsCollector or None
+    :return: Context manager yielding the collector.
+    :rtype: Iterator[DiagnosticsCollector or None]
+    """
+    if collector is None:
+        yield None
+        return
+
+    _DIAGNOSTICS_COLLECTORS.append(collector)
+    try:
+        yield collector
+    finally:
+        _DIAGNOSTICS_COLLECTORS.remove(collector)
+
+
+def issue_warning(message: str, category: type[Warning], element_id: str | None = None, stacklevel: int = 2) -> None:
+    """Record a warning in the active collector or, without one or with its emit adapter, issue it as usual.
+
+    :param message: Warning message.
+    :type message: str
+    :param category: Warning class, whose name is the diagnostic's code.
+    :type category: type[Warning]
+    :param element_id: ID of the JSON object the warning refers to. (Optional)
+    :type element_id: str or None
+    :param stacklevel: Stack level of the warning, as passed to warnings.warn by the caller. (Optional)
+    :type stacklevel: int
+    """
+    collector = get_active_diagnostics_collector()
+    if collector is not None:
+        if collector.add(category.__name__, lambda: message, element_id, category) is None or not collector.emit:
+            return
+
+    warnings.warn(message, category, stacklevel=stacklevel + 1)
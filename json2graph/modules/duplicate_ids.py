@@ -0,0 +1,58 @@
+"""Detect objects that the source data defines more than once with the same ID."""
+
+from collections import defaultdict
+
+from .diagnostics import issue_warning
+from .source_visitor import SourceVisitor
+
+
+class DuplicateIdWarning(UserWarning):
+    """Warn that several objects of the source data are defined with the same ID."""
+
+
+class DuplicateIdDetector:
+    """Detect, in a source traversal, IDs shared by more than one object definition.
+
+    An object with any non-null field besides its ID and type is a definition. Objects with only an ID and a type are
+    references to a definition and may repeat freely.
+    """
+
+    def __init__(self) -> None:
+        """Create a detector that has not seen any definition."""
+        self._definition_types: dict[str, list[str]] = defaultdict(list)
+
+    def register(self, visitor: SourceVisitor) -> None:
+        """Register the detecting callback in a visitor. It must run before null values are removed.
+
+        :param visitor: Visitor of the source data.
+        :type visitor: SourceVisitor
+        """
+        visitor.register(self._visit_object)
+
+    def _visit_object(self, source_object: dict) -> None:
+        object_id = source_object.get("id")
+        if isinstance(object_id, str) and any(
+            value is not None for key, value in source_object.items() if key not in ("id", "type")
+        ):
+            self._definition_types[object_id].append(str(source_object.get("type", "Element")))
+
+    def warn_duplicate_ids(self, input_path: str) -> None:
+        """Warn about all IDs defined by more than one object, once the traversal ended.
+
+        :param input_path: Path of the JSON file containing the definitions.
+        :type input_path: str
+        """
+        duplicate_ids = "; ".join(
+            f"ID '{object_id}' ({', '.join(object_types)})"
+            for object_id, object_types in self._definition_types.items()
+            if len(object_types) > 1
+        )
+        if not duplicate_ids:
+            return
+
+        issue_warning(
+            f"Input file '{input_path}': the following IDs are defined by more than one object: {duplicate_ids}. "
+            f"Objects with the same ID are converted into a single resource that merges their statements.",
+            DuplicateIdWarning,
+            stacklevel=3,
+        )
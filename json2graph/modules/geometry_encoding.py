@@ -0,0 +1,48 @@
+"""Encode diagram geometry as OntoUML Vocabulary Points or as compact, non-normative coordinate literals.
+
+By default, every Path point and every RectangularShape position is an ontouml:Point individual with its
+ontouml:xCoordinate and ontouml:yCoordinate, linked by ontouml:point or ontouml:topLeftPosition: four triples per
+coordinate pair. The 'compact' encoding replaces them with a single literal per shape, meant for round-tripping layouts.
+Its terms are not part of the OntoUML Vocabulary, so graphs using it do not conform to the vocabulary's geometry.
+"""
+
+from collections.abc import Iterable
+
+from rdflib import Graph, Literal, Namespace, URIRef
+
+# Non-normative terms of the compact geometry encoding.
+JSON2GRAPH = Namespace("https://w3id.org/ontouml/json2graph#")
+
+
+def _format_point_list(points: Iterable[tuple[object, object]]) -> Literal:
+    """Return the coordinate pairs as a json2graph:pointList literal, e.g., '10,20 30,40', as in SVG polylines."""
+    return Literal(" ".join(f"{x_coord},{y_coord}" for x_coord, y_coord in points), datatype=JSON2GRAPH.pointList)
+
+
+def add_compact_path_points(path_uri: URIRef, point_dicts: list[dict], ontouml_graph: Graph) -> None:
+    """Add all points of a Path, in their source order, as a single json2graph:points literal.
+
+    :param path_uri: URI of the ontouml:Path.
+    :type path_uri: URIRef
+    :param point_dicts: Source points of the Path, each with 'x' and 'y' fields.
+    :type point_dicts: list[dict]
+    :param ontouml_graph: Knowledge graph that complies with the OntoUML Vocabulary.
+    :type ontouml_graph: Graph
+    """
+    point_list = _format_point_list((point_dict["x"], point_dict["y"]) for point_dict in point_dicts)
+    ontouml_graph.add((path_uri, JSON2GRAPH.points, point_list))
+
+
+def add_compact_position(shape_uri: URIRef, x_coord: object, y_coord: object, ontouml_graph: Graph) -> None:
+    """Add the top-left position of a RectangularShape as a single json2graph:topLeftPosition literal.
+
+    :param shape_uri: URI of the ontouml:RectangularShape.
+    :type shape_uri: URIRef
+    :param x_coord: Horizontal coordinate of the shape's top-left corner.
+    :type x_coord: object
+    :param y_coord: Vertical coordinate of the shape's top-left corner.
+    :type y_coord: object
+    :param ontouml_graph: Knowledge graph that complies with the OntoUML Vocabulary.
+    :type ontouml_graph: Graph
+    """
+    ontouml_graph.add((shape_uri, JSON2GRAPH.topLeftPosition, _format_point_list([(x_coord, y_coord)])))
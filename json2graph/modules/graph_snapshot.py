@@ -0,0 +1,242 @@
+"""Write and load graphs in a compact binary snapshot format.
+
+Re-parsing a textual RDF serialization dominates the time needed to reload converted graphs. A snapshot stores each
+distinct term once, in a dictionary-encoded term table, and each triple as three integer term indexes, so it is loaded
+from a memory-mapped file without parsing any RDF syntax. All integers are little-endian. A snapshot consists of:
+
+1. A header with the magic bytes, the format version, and the sizes of the following sections.
+2. The graph's namespace bindings, as a UTF-8 JSON object mapping prefixes to namespaces.
+3. The term offsets: term count + 1 unsigned 64-bit offsets of the term records in the term data.
+4. The term data: for each term, a kind byte, the 32-bit length of the term's value, its UTF-8 value, and, for
+   language-tagged and typed literals, the UTF-8 language tag or datatype IRI.
+5. Padding to a multiple of four bytes, followed by the triples: three unsigned 32-bit term indexes per triple.
+
+Terms are sorted by kind and value and triples by their term indexes, so a graph without blank nodes is always written
+with the same bytes.
+"""
+
+import json
+import mmap
+import struct
+import sys
+from array import array
+from collections.abc import Iterator
+from typing import BinaryIO
+
+from rdflib import BNode, Graph, Literal, URIRef
+from rdflib.term import Node
+
+from .errors import report_error_io_read, report_error_requirement_not_met
+
+SNAPSHOT_MAGIC = b"J2GSNAP\x00"
+SNAPSHOT_VERSION = 1
+
+# Magic bytes, version, reserved, term count, triple count, term data size, namespace data size.
+_HEADER = struct.Struct("<8sIIQQQQ")
+_TERM_VALUE_LENGTH = struct.Struct("<I")
+
+# Kind byte of each term in the term table.
+_IRI, _BLANK_NODE, _LITERAL, _LANGUAGE_LITERAL, _TYPED_LITERAL = range(5)
+
+_MAXIMUM_TERM_COUNT = 2**32
+
+
+def _get_term_record(term: Node) -> tuple[int, str, str]:
+    """Return the kind, value, and language tag or datatype IRI of a term."""
+    if isinstance(term, URIRef):
+        return _IRI, str(term), ""
+    if isinstance(term, BNode):
+        return _BLANK_NODE, str(term), ""
+    if isinstance(term, Literal):
+        if term.language is not None:
+            return _LANGUAGE_LITERAL, str(term), term.language
+        if term.datatype is not None:
+            return _TYPED_LITERAL, str(term), str(term.datatype)
+        return _LITERAL, str(term), ""
+    raise ValueError(f"Term '{term}' of type {type(term).__name__} cannot be written in a graph snapshot.")
+
+
+def write_graph_snapshot(ontouml_graph: Graph, output_stream: BinaryIO) -> None:
+    """Write a graph into a binary stream in the snapshot format.
+
+    :param ontouml_graph: Graph to be written.
+    :type ontouml_graph: Graph
+    :param output_stream: Binary stream that receives the snapshot.
+    :type output_stream: BinaryIO
+    """
+    term_records = {}
+    for triple in ontouml_graph:
+        for term in triple:
+            if term not in term_records:
+                term_records[term] = _get_term_record(term)
+
+    sorted_terms = sorted(term_records, key=term_records.__getitem__)
+    if len(sorted_terms) >= _MAXIMUM_TERM_COUNT:
+        report_error_requirement_not_met("The graph has too many distinct terms to be written as a snapshot.")
+    term_indexes = {term: index for index, term in enumerate(sorted_terms)}
+
+    term_offsets = array("Q", [0])
+    term_data = bytearray()
+    for term in sorted_terms:
+        kind, value, extra = term_records[term]
+        encoded_value = value.encode("utf-8", "surrogatepass")
+        term_data.append(kind)
+        term_data += _TERM_VALUE_LENGTH.pack(len(encoded_value))
+        term_data += encoded_value
+        term_data += extra.encode("utf-8")
+        term_offsets.append(len(term_data))
+
+    triples = array("I")
+    for triple in sorted(tuple(term_indexes[term] for term in triple) for triple in ontouml_graph):
+        triples.extend(triple)
+
+    namespace_data = json.dumps(
+        {prefix: str(namespace) for prefix, namespace in ontouml_graph.namespaces()}, sort_keys=True
+    ).encode("utf-8")
+
+    if sys.byteorder != "little":
+        term_offsets.byteswap()
+        triples.byteswap()
+
+    output_stream.write(
+        _HEADER.pack(
+            SNAPSHOT_MAGIC,
+            SNAPSHOT_VERSION,
+            0,
+            len(sorted_terms),
+            len(triples) // 3,
+            len(term_data),
+            len(namespace_data),
+        )
+    )
+    output_stream.write(namespace_data)
+    output_stream.write(term_offsets.tobytes())
+    output_stream.write(term_data)
+    output_stream.write(b"\x00" * (-(len(namespace_data) + len(term_data)) % 4))
+    output_stream.write(triples.tobytes())
+
+
+def _decode_term(term_data: memoryview, start: int, end: int) -> Node:
+    """Decode the term record stored between two offsets of the term data."""
+    kind = term_data[start]
+    value_start = start + 5
+    value_end = value_start + _TERM_VALUE_LENGTH.unpack_from(term_data, start + 1)[0]
+    value = bytes(term_data[value_start:value_end]).decode("utf-8", "surrogatepass")
+    if kind == _IRI:
+        return URIRef(value)
+    if kind == _BLANK_NODE:
+        return BNode(value)
+    if kind == _LITERAL:
+        return Literal(value)
+    extra = bytes(term_data[value_end:end]).decode("utf-8")
+    if kind == _LANGUAGE_LITERAL:
+        return Literal(value, lang=extra)
+    if kind == _TYPED_LITERAL:
+        return Literal(value, datatype=URIRef(extra))
+    raise ValueError(f"Unknown term kind {kind} in graph snapshot.")
+
+
+def _read_integers(snapshot_view: memoryview, start: int, count: int, type_code: str) -> memoryview | array:
+    """Return a view of count little-endian integers, copying them only on big-endian platforms."""
+    end = start + count * struct.calcsize(type_code)
+    integers = snapshot_view[start:end].cast(type_code)
+    if sys.byteorder == "little":
+        return integers
+    swapped_integers = array(type_code, integers)
+    integers.release()
+    swapped_integers.byteswap()
+    return swapped_integers
+
+
+def _iter_snapshot_content(snapshot_path: str, graph: Graph | None) -> Iterator[tuple[Node, Node, Node]]:
+    """Memory-map a snapshot, binding its namespaces in graph (if informed) and yielding its triples."""
+    try:
+        # The mapping stays valid after the file is closed.
+        with open(snapshot_path, "rb") as snapshot_file:
+            snapshot_map = mmap.mmap(snapshot_file.fileno(), 0, access=mmap.ACCESS_READ)
+    except OSError as error:
+        report_error_io_read(snapshot_path, "graph snapshot file", error)
+    except ValueError:
+        # Empty files cannot be mapped.
+        report_error_requirement_not_met(f"File {snapshot_path} is not a graph snapshot.")
+
+    snapshot_view = memoryview(snapshot_map)
+    views = [snapshot_view]
+    try:
+        if len(snapshot_view) < _HEADER.size:
+            report_error_requirement_not_met(f"File {snapshot_path} is not a graph snapshot.")
+        magic, version, _, term_count, triple_count, term_data_size, namespace_data_size = _HEADER.unpack_from(
+            snapshot_view
+        )
+        if magic != SNAPSHOT_MAGIC:
+            report_error_requirement_not_met(f"File {snapshot_path} is not a graph snapshot.")
+        if version != SNAPSHOT_VERSION:
+            report_error_requirement_not_met(
+                f"Graph snapshot {snapshot_path} has version {version}. Supported version is {SNAPSHOT_VERSION}."
+            )
+
+        namespaces_start = _HEADER.size
+        offsets_start = namespaces_start + namespace_data_size
+        term_data_start = offsets_start + (term_count + 1) * 8
+        term_data_end = term_data_start + term_data_size
+        triples_start = term_data_end + (-(namespace_data_size + term_data_size) % 4)
+        if triples_start + triple_count * 12 != len(snapshot_view):
+            report_error_requirement_not_met(f"Graph snapshot {snapshot_path} is truncated or corrupted.")
+
+        if graph is not None:
+            namespaces = json.loads(bytes(snapshot_view[namespaces_start:offsets_start]).decode("utf-8"))
+            for prefix, namespace in namespaces.items():
+                graph.bind(prefix, namespace, override=True)
+
+        term_offsets = _read_integers(snapshot_view, offsets_start, term_count + 1, "Q")
+        term_data = snapshot_view[term_data_start:term_data_end]
+        triples = _read_integers(snapshot_view, triples_start, triple_count * 3, "I")
+        views.extend(view for view in (term_offsets, term_data, triples) if isinstance(view, memoryview))
+
+        # Terms are decoded when first used, so streaming a few triples does not decode the whole term table.
+        terms = [None] * term_count
+        for position in range(0, triple_count * 3, 3):
+            triple = []
+            triple_end = position + 3
+            for term_index in triples[position:triple_end]:
+                term = terms[term_index]
+                if term is None:
+                    term = terms[term_index] = _decode_term(
+                        term_data, term_offsets[term_index], term_offsets[term_index + 1]
+                    )
+                triple.append(term)
+            yield tuple(triple)
+    finally:
+        for view in reversed(views):
+            view.release()
+        snapshot_map.close()
+
+
+def iter_graph_snapshot(snapshot_path: str) -> Iterator[tuple[Node, Node, Node]]:
+    """Stream the triples of a graph snapshot from the memory-mapped file, without building a graph.
+
+    The file stays mapped until the iterator is exhausted or closed.
+
+    :param snapshot_path: Path of the snapshot file.
+    :type snapshot_path: str
+    :return: Iterator over the snapshot's triples, in the order in which they are stored.
+    :rtype: Iterator[tuple[Node, Node, Node]]
+    :raises ValueError: If the file is not a valid snapshot of a supported version.
+    :raises OSError: If the file cannot be read.
+    """
+    return _iter_snapshot_content(snapshot_path, None)
+
+
+def load_graph_snapshot(snapshot_path: str) -> Graph:
+    """Load a graph snapshot into a new graph, binding the namespaces stored in it.
+
+    :param snapshot_path: Path of the snapshot file.
+    :type snapshot_path: str
+    :return: Graph with the snapshot's triples.
+    :rtype: Graph
+    :raises ValueError: If the file is not a valid snapshot of a supported version.
+    :raises OSError: If the file cannot be read.
+    """
+    snapshot_graph = Graph()
+    snapshot_graph.addN((*triple, snapshot_graph) for triple in _iter_snapshot_content(snapshot_path, snapshot_graph))
+    return snapshot_graph
@@ -0,0 +1,70 @@
+"""Create the output graph on the RDFLib store selected by the user.
+
+By default, graphs are kept in RDFLib's in-memory store. Any registered RDFLib Store plugin can be selected instead,
+e.g., a disk-backed store for graphs larger than the available memory. When a store configuration (usually a path or
+a connection URL) is informed, the store is opened with it and is used as working storage for one conversion: triples
+already in the store are removed when the conversion starts.
+"""
+
+from rdflib import Graph
+from rdflib.plugin import PluginException, get
+from rdflib.store import CORRUPTED_STORE, NO_STORE, Store
+
+from . import arguments as args
+from .errors import report_error_requirement_not_met
+from .spilled_graph import is_spilled_graph
+
+DEFAULT_STORE = "default"
+
+
+def create_output_graph() -> Graph:
+    """Create an empty graph on the store selected in the ARGUMENTS 'store' and 'store_configuration' keys.
+
+    :return: Empty graph on the selected store, opened when a store configuration is informed.
+    :rtype: Graph
+    """
+    store = args.ARGUMENTS["store"]
+    store_configuration = args.ARGUMENTS["store_configuration"]
+
+    if store == DEFAULT_STORE:
+        return Graph()
+
+    try:
+        get(store, Store)
+    except PluginException:
+        report_error_requirement_not_met(
+            f"No RDFLib store plugin is registered with the name '{store}'. Disk-backed stores are usually provided "
+            f"by optional packages (e.g., 'berkeleydb' for the 'BerkeleyDB' store)."
+        )
+
+    ontouml_graph = Graph(store=store)
+    if store_configuration is not None:
+        try:
+            open_result = ontouml_graph.open(store_configuration, create=True)
+        except Exception as error:
+            report_error_requirement_not_met(
+                f"The '{store}' store could not be opened with configuration '{store_configuration}': {error}."
+            )
+        if open_result in (NO_STORE, CORRUPTED_STORE):
+            report_error_requirement_not_met(
+                f"The '{store}' store could not be opened with configuration '{store_configuration}'."
+            )
+        ontouml_graph.remove((None, None, None))
+
+    return ontouml_graph
+
+
+def close_output_graph(ontouml_graph: Graph) -> None:
+    """Close the store of an output graph created by create_output_graph, committing pending changes.
+
+    Graphs on the default store, or on stores that were not opened with a configuration, are left unchanged. Graphs
+    spilled to disk are closed, which deletes their temporary files.
+
+    :param ontouml_graph: Graph returned by create_output_graph or by the decoding of a project spilled to disk.
+    :type ontouml_graph: Graph
+    """
+    if is_spilled_graph(ontouml_graph):
+        ontouml_graph.close()
+        return
+    if args.ARGUMENTS["store"] != DEFAULT_STORE and args.ARGUMENTS["store_configuration"] is not None:
+        ontouml_graph.close(commit_pending_transaction=True)
@@ -1,13 +1,22 @@
 """IO functions used in diverse occasions."""
 
+import gzip
+import io
 import json
+import lzma
 import os
 import warnings
+from typing import BinaryIO
 
 from rdflib import Graph, URIRef
 
+from .canonical_output import write_canonical_graph
 from .errors import report_error_io_read, report_error_io_write
+from .graph_snapshot import write_graph_snapshot
 from .logger import initialize_logger
+from .output_compression import open_output_stream
+from .spilled_graph import NTRIPLES_FORMATS, is_spilled_graph
+from .turtle_writer import write_turtle
 from .utils_graph import rename_uriref_resource, fix_uri
 
 LOGGER = initialize_logger()
@@ -33,52 +42,148 @@ def create_directory_if_not_exists(directory_path: str, file_description: str) -
         report_error_io_write(directory_path, file_description, error)
 
 
-def safe_load_json_file(json_path: str) -> dict:
-    """Safely loads the JSON file inputted by the user as an argument into a dictionary.
+def load_json_content(json_content: bytes, json_path: str) -> dict:
+    """Load the raw bytes of a JSON document into a dictionary.
 
-    :param json_path: Path to the JSON file to be loaded.
+    The content is decoded as UTF-8. Content that is not valid UTF-8 is decoded as CP1252 with a warning.
+
+    :param json_content: Raw bytes of the JSON document.
+    :type json_content: bytes
+    :param json_path: Path of the JSON document, used in diagnostics.
     :type json_path: str
     :return: Dictionary with loaded JSON's data.
     :rtype: dict
     """
     try:
-        with open(json_path, "r", encoding="utf-8") as read_file:
-            json_data = json.load(read_file)
+        json_data = json.loads(json_content.decode("utf-8"))
     except UnicodeDecodeError:
-        try:
-            with open(json_path, "r", encoding="cp1252") as read_file:
-                json_data = json.load(read_file)
-        except OSError as error:
-            file_description = "input json file"
-            report_error_io_read(json_path, file_description, error)
+        json_data = json.loads(json_content.decode("cp1252"))
 
         warnings.warn(
             f"JSON file {json_path} is not valid UTF-8; loaded using CP1252.",
             JSONEncodingFallbackWarning,
-            stacklevel=2,
+            stacklevel=3,
         )
-    except IOError as error:
-        file_description = "input json file"
-        report_error_io_read(json_path, file_description, error)
 
     LOGGER.debug(f"JSON file {json_path} successfully loaded to dictionary.")
 
     return json_data
 
 
-def safe_write_graph_file(ontouml_graph: Graph, output_file_path: str, syntax: str) -> None:
+def safe_read_json_file(json_path: str) -> bytes:
+    """Safely read the raw bytes of a JSON file, decompressing files with the .gz or .xz suffix.
+
+    :param json_path: Path to the JSON file to be read.
+    :type json_path: str
+    :return: Raw (decompressed) bytes of the JSON document.
+    :rtype: bytes
+    """
+    try:
+        if json_path.endswith(".gz"):
+            with gzip.open(json_path, "rb") as read_file:
+                json_content = read_file.read()
+        elif json_path.endswith(".xz"):
+            with lzma.open(json_path, "rb") as read_file:
+                json_content = read_file.read()
+        else:
+            with open(json_path, "rb") as read_file:
+                json_content = read_file.read()
+    except (OSError, lzma.LZMAError) as error:
+        file_description = "input json file"
+        report_error_io_read(json_path, file_description, error)
+
+    return json_content
+
+
+def safe_load_json_file(json_path: str) -> dict:
+    """Safely loads the JSON file inputted by the user as an argument into a dictionary.
+
+    Files with the .gz or .xz suffix are decompressed while they are read.
+
+    :param json_path: Path to the JSON file to be loaded.
+    :type json_path: str
+    :return: Dictionary with loaded JSON's data.
+    :rtype: dict
+    """
+    return load_json_content(safe_read_json_file(json_path), json_path)
+
+
+def _write_graph_stream(ontouml_graph: Graph, output_stream: BinaryIO, syntax: str, canonical: bool) -> None:
+    """Serialize the graph into a binary stream as UTF-8.
+
+    The specialized deterministic writers are used for canonical output and for Turtle output of plain graphs. Graphs
+    spilled to disk are written as N-Triples by copying their spill file.
+    """
+    if syntax == "snapshot":
+        write_graph_snapshot(ontouml_graph, output_stream)
+    elif syntax in NTRIPLES_FORMATS and is_spilled_graph(ontouml_graph):
+        text_stream = io.TextIOWrapper(output_stream, encoding="utf-8", newline="\n")
+        ontouml_graph.store.write_ntriples(text_stream, canonical)
+        text_stream.flush()
+        text_stream.detach()
+    elif canonical or (syntax in ("ttl", "turtle") and type(ontouml_graph) is Graph):
+        text_stream = io.TextIOWrapper(output_stream, encoding="utf-8", newline="\n")
+        if canonical:
+            write_canonical_graph(ontouml_graph, text_stream, syntax)
+        else:
+            write_turtle(ontouml_graph, text_stream)
+        text_stream.flush()
+        text_stream.detach()
+    else:
+        ontouml_graph.serialize(destination=output_stream, encoding="utf-8", format=syntax)
+
+
+def _serialize_graph_file(
+    ontouml_graph: Graph, output_file_path: str, syntax: str, canonical: bool, compression: str
+) -> None:
+    """Serialize the graph directly into the (optionally compressed) output stream."""
+    with open_output_stream(output_file_path, compression) as output_stream:
+        _write_graph_stream(ontouml_graph, output_stream, syntax, canonical)
+
+
+def serialize_graph(ontouml_graph: Graph, syntax: str, canonical: bool = False) -> str:
+    """Serialize the graph into a string with the same writers used for output files.
+
+    :param ontouml_graph: Graph compliant with the OntoUML Vocabulary.
+    :type ontouml_graph: Graph
+    :param syntax: Syntax used to serialize the graph.
+    :type syntax: str
+    :param canonical: If True, serialize the graph in canonical form. (Optional)
+    :type canonical: bool
+    :return: Serialized graph.
+    :rtype: str
+    """
+    output_stream = io.BytesIO()
+    _write_graph_stream(ontouml_graph, output_stream, syntax, canonical)
+    return output_stream.getvalue().decode("utf-8")
+
+
+def safe_write_graph_file(
+    ontouml_graph: Graph,
+    output_file_path: str,
+    syntax: str,
+    canonical: bool = False,
+    compression: str = "none",
+) -> None:
     """Safely saves the graph into a file in the informed destination with the desired syntax.
 
     :param ontouml_graph: Graph compliant with the OntoUML Vocabulary.
     :type ontouml_graph: Graph
     :param output_file_path: Complete path of the output file to be created (including name and extension).
     :type output_file_path: str
-    :param syntax: Syntax to be used for saving the ontology file.
+    :param syntax: Syntax to be used for saving the ontology file. Turtle output is written with sorted subjects,
+                   predicates, and objects, so the same graph always produces the same file.
     :type syntax: str
+    :param canonical: If True, write sorted canonical N-Triples or deterministic Turtle with canonical blank-node
+                      labels. Only the syntaxes in CANONICAL_GRAPH_FORMATS are accepted. (Optional)
+    :type canonical: bool
+    :param compression: Compressor the output is streamed through. Valid values are 'none' (default), 'gzip',
+                        'xz', and 'zstd'. (Optional)
+    :type compression: str
     """
     # Regular case (all URIRef resources have valid URIs)
     try:
-        ontouml_graph.serialize(destination=output_file_path, encoding="utf-8", format=syntax)
+        _serialize_graph_file(ontouml_graph, output_file_path, syntax, canonical, compression)
     except Exception:
         # Special treatment for the cases where the graph has URIRef resources that are not valid URIs
         try:
@@ -101,7 +206,7 @@ def safe_write_graph_file(ontouml_graph: Graph, output_file_path: str, syntax: s
                     new_o_name = new_o.toPython()
                     if old_o_name != new_o_name:
                         rename_uriref_resource(ontouml_graph, old_o, new_o)
-            ontouml_graph.serialize(destination=output_file_path, encoding="utf-8", format=syntax)
+            _serialize_graph_file(ontouml_graph, output_file_path, syntax, canonical, compression)
         except OSError as errorOS:
             file_description = "output graph file"
             report_error_io_write(output_file_path, file_description, errorOS)
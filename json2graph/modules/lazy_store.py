@@ -0,0 +1,263 @@
+"""Read-only RDFLib store that decodes an OntoUML project on demand.
+
+A graph on this store can be queried right after the JSON document is loaded, without decoding the whole project.
+The project is split into the shards used for parallel decoding, with one shard per diagram, and the URI of each
+identified object is indexed with the shards that define it. A triple pattern with a bound subject decodes only the
+shards of that subject with the regular decoders, against the IDs of the complete project's model, and the triples of
+each decoded subject are cached. Since every shard keeps the complete definitions of its objects, the triples of a
+subject are the ones that decoding the complete project produces.
+
+Patterns with an unbound subject decode all shards, except the ones that ask for the instances of an OntoUML type:
+every object defined in the JSON document with that type is one of them, so they are answered from the index.
+"""
+
+import re
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from rdflib import RDF, Graph, Namespace, URIRef
+from rdflib.graph import ModificationException
+from rdflib.store import Store
+from rdflib.term import Node
+
+from . import arguments as args
+from .metadata import METADATA
+from .path_order import apply_path_order_policy
+from .property_assignments import PropertyAssignmentCollector, apply_property_assignment_policy
+from .sharding import partition_project
+from .source_visitor import SourceVisitor, active_type_index
+from ..decoder.decode_general import get_list_subdictionaries_for_specific_type
+from ..decoder.decode_main import decode_json_to_graph, visit_source_data
+
+ONTOUML = Namespace(METADATA["conformsToBase"])
+
+# Types of the resources that the decoders create for source values without an ID, and the suffixes of their IDs.
+_DERIVED_TYPES = frozenset({ONTOUML.Cardinality, ONTOUML.Point})
+_DERIVED_ID_SUFFIX = re.compile(r"_(?:cardinality|point(?:_\d+)?)$")
+
+
+@contextmanager
+def _decoding_arguments(arguments: dict) -> Iterator[None]:
+    """Decode with the arguments of the store's conversion, restoring the current ones afterward."""
+    current_arguments = dict(args.ARGUMENTS)
+    args.ARGUMENTS.clear()
+    args.ARGUMENTS.update(arguments)
+    try:
+        yield
+    finally:
+        args.ARGUMENTS.clear()
+        args.ARGUMENTS.update(current_arguments)
+
+
+class LazyProjectStore(Store):
+    """Read-only store whose triples are decoded from an OntoUML JSON project when they are first requested.
+
+    The arguments in effect when the store is created (e.g., the base URI and the policies) are used for all its
+    decoding. The store is not thread-safe.
+    """
+
+    context_aware = False
+    formula_aware = False
+    transaction_aware = False
+    graph_aware = False
+
+    def __init__(self, json_data: dict) -> None:
+        """Prepare the project for decoding and index its objects by URI, without decoding it.
+
+        The source-level policies are applied to the complete project, so their warnings are issued here.
+
+        :param json_data: OntoUML project loaded as a dictionary. Its null values are removed in place.
+        :type json_data: dict
+        """
+        super().__init__()
+        self._arguments = dict(args.ARGUMENTS)
+        self._namespaces: dict[str, URIRef] = {}
+        self._prefixes: dict[URIRef, str] = {}
+
+        source_visitor = SourceVisitor()
+        property_assignment_collector = PropertyAssignmentCollector()
+        property_assignment_collector.register(source_visitor)
+        type_index, self._model_element_ids = visit_source_data(json_data, source_visitor)
+        # Without a graph, the policy reports all the assignments, which a complete decoding would also report.
+        apply_property_assignment_policy(
+            records=property_assignment_collector.records,
+            ontouml_graph=None,
+            policy=self._arguments["property_assignment_policy"],
+            input_path=self._arguments["input_path"],
+            base_uri=self._arguments["base_uri"],
+        )
+        # The shards are decoded without the path order policy, which is applied once to all Paths of the project.
+        with active_type_index(type_index):
+            apply_path_order_policy(
+                path_dicts=get_list_subdictionaries_for_specific_type(json_data, "Path"),
+                ontouml_graph=None,
+                policy=self._arguments["path_order_policy"],
+                input_path=self._arguments["input_path"],
+                base_uri=self._arguments["base_uri"],
+                model_only=self._arguments["model_only"],
+            )
+
+        diagrams = json_data.get("diagrams") if json_data.get("type") == "Project" else None
+        self._shards = partition_project(json_data, max(1, len(diagrams or [])))
+        self._decoded_shards: set[int] = set()
+        self._triples_by_subject: dict[Node, set[tuple[Node, Node]]] = {}
+        self._complete_subjects: set[Node] = set()
+
+        self._subject_shards: dict[URIRef, set[int]] = {}
+        self._defined_subjects: dict[URIRef, set[URIRef]] = {}
+        self._referenced_subjects: dict[URIRef, set[URIRef]] = {}
+        subject_types: dict[URIRef, set[URIRef]] = {}
+        references: list[tuple[URIRef, URIRef, int]] = []
+        base_uri = self._arguments["base_uri"]
+        for shard_number, shard_data in enumerate(self._shards):
+            pending_nodes = [shard_data]
+            while pending_nodes:
+                node = pending_nodes.pop()
+                # As in the general decoder, the dictionaries nested in a dictionary without ID are not decoded.
+                if "id" not in node:
+                    continue
+                if type(node.get("type")) is str:
+                    subject = URIRef(base_uri + node["id"])
+                    subject_type = URIRef(ONTOUML + node["type"])
+                    # Dictionaries with fewer than three fields only refer to objects defined elsewhere.
+                    if len(node) > 2:
+                        self._subject_shards.setdefault(subject, set()).add(shard_number)
+                        self._defined_subjects.setdefault(subject_type, set()).add(subject)
+                        subject_types.setdefault(subject, set()).add(subject_type)
+                    else:
+                        references.append((subject, subject_type, shard_number))
+                        self._referenced_subjects.setdefault(subject_type, set()).add(subject)
+                for value in node.values():
+                    if type(value) is dict:
+                        pending_nodes.append(value)
+                    elif type(value) is list:
+                        pending_nodes.extend(item for item in value if type(item) is dict)
+
+        # A reference only types its object, as the object's definitions do, so only the shards that define a subject
+        # are decoded for it, plus the ones that refer to it with another type or to an object that is never defined.
+        for subject, subject_type, shard_number in references:
+            if subject_type not in subject_types.get(subject, ()):
+                self._subject_shards.setdefault(subject, set()).add(shard_number)
+
+    def _decode_shard(self, shard_number: int) -> None:
+        """Decode one shard and add its triples to the cache of their subjects."""
+        with _decoding_arguments(self._arguments):
+            shard_graph = decode_json_to_graph(
+                self._shards[shard_number],
+                self._arguments["language"],
+                "import",
+                model_element_ids=self._model_element_ids,
+                shard=True,
+            )
+        for subject, predicate, node in shard_graph:
+            self._triples_by_subject.setdefault(subject, set()).add((predicate, node))
+        self._decoded_shards.add(shard_number)
+
+    def _decode_all_shards(self) -> None:
+        """Decode the shards that were not decoded yet, completing the cache of all subjects."""
+        for shard_number in range(len(self._shards)):
+            if shard_number not in self._decoded_shards:
+                self._decode_shard(shard_number)
+        self._complete_subjects.update(self._triples_by_subject)
+
+    def _get_subject_triples(self, subject: Node) -> set[tuple[Node, Node]]:
+        """Return the predicates and objects of a subject, decoding the shards in which it appears."""
+        if subject not in self._complete_subjects:
+            shard_numbers = self._subject_shards.get(subject)
+            if shard_numbers is None and isinstance(subject, URIRef):
+                owner_subject = URIRef(_DERIVED_ID_SUFFIX.sub("", subject))
+                shard_numbers = self._subject_shards.get(owner_subject) if owner_subject != subject else None
+            for shard_number in shard_numbers or ():
+                if shard_number not in self._decoded_shards:
+                    self._decode_shard(shard_number)
+            self._complete_subjects.add(subject)
+        return self._triples_by_subject.get(subject, set())
+
+    def triples(self, triple_pattern: tuple, context: Graph | None = None) -> Iterator[tuple[tuple, Iterator]]:
+        """Yield the triples that match a pattern, decoding only the shards needed to answer it.
+
+        :param triple_pattern: Subject, predicate, and object of the pattern, with None for unbound terms.
+        :type triple_pattern: tuple
+        :param context: Graph in which the triples are searched. It is ignored, since the store has one graph.
+        :type context: Graph or None
+        :return: Iterator of the matching triples, each with an empty iterator of contexts.
+        :rtype: Iterator[tuple[tuple, Iterator]]
+        """
+        subject, predicate, node = triple_pattern
+        if subject is not None:
+            subjects = [subject]
+        elif predicate == RDF.type and node is not None and node not in _DERIVED_TYPES:
+            # The decoders type every object defined in the document, so these triples need no decoding.
+            defined_subjects = self._defined_subjects.get(node, set())
+            for defined_subject in sorted(defined_subjects):
+                yield (defined_subject, predicate, node), iter(())
+            # A reference to an undefined object is typed only if a policy keeps it, which decoding verifies.
+            subjects = sorted(self._referenced_subjects.get(node, set()) - defined_subjects)
+        else:
+            self._decode_all_shards()
+            subjects = list(self._triples_by_subject)
+
+        for matched_subject in subjects:
+            for matched_predicate, matched_node in list(self._get_subject_triples(matched_subject)):
+                if (predicate is None or predicate == matched_predicate) and (node is None or node == matched_node):
+                    yield (matched_subject, matched_predicate, matched_node), iter(())
+
+    def __len__(self, context: Graph | None = None) -> int:
+        """Return the number of triples of the store, decoding the complete project."""
+        self._decode_all_shards()
+        return sum(len(subject_triples) for subject_triples in self._triples_by_subject.values())
+
+    def add(self, triple: tuple, context: Graph | None = None, quoted: bool = False) -> None:
+        """Reject the change, since the store is read-only."""
+        raise ModificationException()
+
+    def addN(self, quads) -> None:  # noqa: N802
+        """Reject the change, since the store is read-only."""
+        raise ModificationException()
+
+    def remove(self, triple_pattern: tuple, context: Graph | None = None) -> None:
+        """Reject the change, since the store is read-only."""
+        raise ModificationException()
+
+    def bind(self, prefix: str, namespace: URIRef, override: bool = True) -> None:
+        """Bind a prefix to a namespace, replacing earlier bindings of both if override is True."""
+        bound_namespace = self._namespaces.get(prefix)
+        bound_prefix = self._prefixes.get(namespace)
+        if override:
+            if bound_namespace is not None:
+                del self._prefixes[bound_namespace]
+            if bound_prefix is not None:
+                del self._namespaces[bound_prefix]
+            self._namespaces[prefix] = namespace
+            self._prefixes[namespace] = prefix
+        elif bound_namespace is None and bound_prefix is None:
+            self._namespaces[prefix] = namespace
+            self._prefixes[namespace] = prefix
+
+    def namespace(self, prefix: str) -> URIRef | None:
+        """Return the namespace bound to a prefix, if any."""
+        return self._namespaces.get(prefix)
+
+    def prefix(self, namespace: URIRef) -> str | None:
+        """Return the prefix bound to a namespace, if any."""
+        return self._prefixes.get(namespace)
+
+    def namespaces(self) -> Iterator[tuple[str, URIRef]]:
+        """Yield the bound prefixes and namespaces."""
+        yield from list(self._namespaces.items())
+
+
+def create_lazy_project_graph(json_data: dict) -> Graph:
+    """Create a read-only graph that decodes an OntoUML project when its triples are requested.
+
+    The current ARGUMENTS, including the resolved base URI, are used for the project's decoding.
+
+    :param json_data: OntoUML project loaded as a dictionary. Its null values are removed in place.
+    :type json_data: dict
+    :return: Graph on a LazyProjectStore of the project.
+    :rtype: Graph
+    """
+    ontouml_graph = Graph(store=LazyProjectStore(json_data))
+    ontouml_graph.bind("ontouml", METADATA["conformsToBase"])
+    ontouml_graph.bind("", args.ARGUMENTS["base_uri"])
+    return ontouml_graph
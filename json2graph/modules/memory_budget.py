@@ -0,0 +1,178 @@
+"""Estimate and monitor the memory of a conversion against a user-defined budget.
+
+Before a project is decoded, a pre-scan of its JSON document counts its objects, diagram points, and values, from
+which the number of output triples and the memory of the in-memory graph are estimated. When the graph is not
+expected to fit in the memory left by the budget, the project is decoded in shards whose triples are spilled to disk
+(see the spilled_graph module). The resident memory of the process is checked before and after each shard, so a
+conversion that cannot fit fails with a clear message instead of being killed by the operating system.
+
+This module does not depend on RDFLib, so the command-line parser can validate the budget before loading it.
+"""
+
+import os
+import re
+import sys
+from dataclasses import dataclass
+
+# Peak memory of one triple of a graph on RDFLib's in-memory store, including its terms and indexes, as measured when
+# decoding the test projects (about 1.3 kB) plus a margin for the allocator.
+GRAPH_BYTES_PER_TRIPLE = 1500
+
+_MEMORY_SIZE_PATTERN = re.compile(r"(?P<number>\d+(?:\.\d+)?)\s*(?P<unit>[KMGT]?)(?:I?B)?", re.IGNORECASE)
+_MEMORY_UNITS = {"": 1, "K": 1 << 10, "M": 1 << 20, "G": 1 << 30, "T": 1 << 40}
+
+
+class MemoryBudgetError(ValueError):
+    """Raised when a conversion cannot be performed within its memory budget."""
+
+
+@dataclass(slots=True)
+class MemoryEstimate:
+    """Size of a JSON document and of the graph expected from it.
+
+    :ivar objects: Number of objects defined in the document, i.e., identified objects that are not references.
+    :vartype objects: int
+    :ivar points: Number of diagram points, which become resources of their own.
+    :vartype points: int
+    :ivar values: Number of non-null scalar values, each of which usually becomes one triple.
+    :vartype values: int
+    """
+
+    objects: int
+    points: int
+    values: int
+
+    @property
+    def triples(self) -> int:
+        """Expected number of triples: one per value, plus the type and the containment of each object and point."""
+        return self.values + 2 * self.objects + 2 * self.points
+
+    @property
+    def graph_bytes(self) -> int:
+        """Expected memory of the graph on RDFLib's in-memory store, in bytes."""
+        return self.triples * GRAPH_BYTES_PER_TRIPLE
+
+
+def parse_memory_size(memory_size: int | str) -> int:
+    """Return the number of bytes of a memory size given as bytes or with a binary unit, e.g., '512M' or '2GiB'.
+
+    :param memory_size: Number of bytes, or a number followed by K, M, G, or T (optionally with 'B' or 'iB').
+    :type memory_size: int or str
+    :return: Positive number of bytes.
+    :rtype: int
+    :raises ValueError: If the size is not valid or not positive.
+    """
+    if type(memory_size) is int:
+        size = memory_size
+    else:
+        match = _MEMORY_SIZE_PATTERN.fullmatch(str(memory_size).strip())
+        if match is None:
+            raise ValueError(
+                f"Invalid memory size '{memory_size}'. Use a number of bytes or a number followed by K, M, G, or T "
+                f"(e.g., '512M' or '2G')."
+            )
+        size = int(float(match["number"]) * _MEMORY_UNITS[match["unit"].upper()])
+
+    if size < 1:
+        raise ValueError(f"The memory size must be positive, but {memory_size!r} was given.")
+    return size
+
+
+def format_memory_size(size: int) -> str:
+    """Return a memory size in MiB for messages."""
+    return f"{size / (1 << 20):.1f} MiB"
+
+
+def estimate_graph_memory(json_data: dict) -> MemoryEstimate:
+    """Count the objects, points, and values of a JSON document in a single traversal.
+
+    :param json_data: Input JSON data loaded as a dictionary.
+    :type json_data: dict
+    :return: Estimate of the graph decoded from the document.
+    :rtype: MemoryEstimate
+    """
+    objects = points = values = 0
+    pending_nodes = [json_data]
+    while pending_nodes:
+        node = pending_nodes.pop()
+        # Dictionaries with fewer than three fields only refer to objects defined elsewhere.
+        if "id" in node and type(node.get("type")) is str and len(node) > 2:
+            objects += 1
+        elif "x" in node and "y" in node and "id" not in node:
+            points += 1
+        for value in node.values():
+            if type(value) is dict:
+                pending_nodes.append(value)
+            elif type(value) is list:
+                for item in value:
+                    if type(item) is dict:
+                        pending_nodes.append(item)
+                    elif item is not None:
+                        values += 1
+            elif value is not None:
+                values += 1
+    return MemoryEstimate(objects, points, values)
+
+
+def get_resident_memory() -> int | None:
+    """Return the resident memory of the process in bytes.
+
+    On Linux, the current resident memory is read from /proc. On other POSIX systems, the peak resident memory is
+    returned instead, which is an upper bound of the current one.
+
+    :return: Resident memory in bytes, or None if it cannot be measured (e.g., on Windows).
+    :rtype: int or None
+    """
+    try:
+        with open("/proc/self/statm", encoding="ascii") as statm_file:
+            return int(statm_file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak_memory = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # The peak is informed in bytes on macOS and in kilobytes on the other systems.
+    return peak_memory if sys.platform == "darwin" else peak_memory * 1024
+
+
+def get_available_memory(max_memory: int) -> int:
+    """Return the part of the budget that the process does not use yet, in bytes (negative if already exceeded).
+
+    :param max_memory: Memory budget of the process in bytes.
+    :type max_memory: int
+    :return: Budget minus the current resident memory, or the whole budget if the memory cannot be measured.
+    :rtype: int
+    """
+    return max_memory - (get_resident_memory() or 0)
+
+
+def check_memory_budget(
+    max_memory: int,
+    required_memory: int,
+    task: str,
+    resident_memory: int | None = None,
+) -> None:
+    """Fail if a task that needs the informed memory would exceed the budget.
+
+    :param max_memory: Memory budget of the process in bytes.
+    :type max_memory: int
+    :param required_memory: Estimated memory that the task still needs, in bytes.
+    :type required_memory: int
+    :param task: Description of the task for the error message, e.g., 'decoding part 3 of 10'.
+    :type task: str
+    :param resident_memory: Memory the task starts from, in bytes. If not informed, the current resident memory of the
+                            process is used. (Optional)
+    :type resident_memory: int or None
+    :raises MemoryBudgetError: If the resident memory plus the required memory exceeds the budget.
+    """
+    if resident_memory is None:
+        resident_memory = get_resident_memory() or 0
+    if resident_memory + required_memory > max_memory:
+        raise MemoryBudgetError(
+            f"The memory budget of {format_memory_size(max_memory)} is not enough for {task}: the process uses "
+            f"{format_memory_size(resident_memory)} and the task needs about {format_memory_size(required_memory)} "
+            f"more. Increase the memory budget (--max-memory) or select fewer packages or diagrams."
+        )
@@ -2,14 +2,21 @@
 whenever possible."""
 
 import inspect
+import warnings
+from collections.abc import Iterator
+from contextlib import contextmanager
 
 from . import arguments as args
+from .diagnostics import Diagnostic, get_active_diagnostics_collector
 from .errors import report_error_end_of_switch
 from .logger import initialize_logger
 from ..decoder.decode_general import get_stereotype
 
 LOGGER = initialize_logger()
 
+# Lists that receive the decode log messages, as (warning code, message) pairs, instead of the logger.
+_DECODE_LOG_MESSAGE_COLLECTORS: list[list[tuple[str, str]]] = []
+
 
 def get_decode_log_message(
     object_dict: dict,
@@ -174,9 +181,63 @@ def print_decode_log_message(
     :param att_valid_stereotype: Optional attribute's stereotype to be displayed in a warning message.
     :type att_valid_stereotype: str
     """
+    # Collected messages are reported by the collector's owner, even in silent mode
+    if _DECODE_LOG_MESSAGE_COLLECTORS:
+        _DECODE_LOG_MESSAGE_COLLECTORS[-1].append(
+            (warning_code, get_decode_log_message(object_dict, warning_code, property_name, att_valid_stereotype))
+        )
+        return
+
+    # Recorded diagnostics are only logged by collectors that emit them, and only up to their limit
+    diagnostics_collector = get_active_diagnostics_collector()
+    if diagnostics_collector is not None:
+        diagnostic = diagnostics_collector.add(
+            warning_code,
+            lambda: get_decode_log_message(object_dict, warning_code, property_name, att_valid_stereotype),
+            object_dict.get("id"),
+        )
+        if diagnostic is not None and diagnostics_collector.emit and not args.ARGUMENTS["silent"]:
+            LOGGER.warning(diagnostic.message)
+        return
+
     # If in silent mode, exit function and do not print anything
     if args.ARGUMENTS["silent"]:
         return
 
     log_message = get_decode_log_message(object_dict, warning_code, property_name, att_valid_stereotype)
     LOGGER.warning(log_message)
+
+
+@contextmanager
+def collect_decode_log_messages() -> Iterator[list[tuple[str, str]]]:
+    """Collect the decode log messages printed while the context is active instead of logging them.
+
+    :return: Context manager yielding the list that receives the (warning code, message) pairs, in printing order.
+    :rtype: Iterator[list[tuple[str, str]]]
+    """
+    collected_messages = []
+    _DECODE_LOG_MESSAGE_COLLECTORS.append(collected_messages)
+    try:
+        yield collected_messages
+    finally:
+        _DECODE_LOG_MESSAGE_COLLECTORS.remove(collected_messages)
+
+
+def reissue_diagnostic(diagnostic: Diagnostic) -> None:
+    """Issue again a diagnostic recorded in another process, as a warning or as a log message.
+
+    :param diagnostic: Diagnostic recorded by a collector, e.g., in a worker process.
+    :type diagnostic: Diagnostic
+    """
+    diagnostics_collector = get_active_diagnostics_collector()
+    if diagnostics_collector is not None:
+        kept_diagnostic = diagnostics_collector.add(
+            diagnostic.code, lambda: diagnostic.message, diagnostic.element_id, diagnostic.category
+        )
+        if kept_diagnostic is None or not diagnostics_collector.emit:
+            return
+
+    if diagnostic.category is not None:
+        warnings.warn(diagnostic.message, diagnostic.category, stacklevel=2)
+    elif not args.ARGUMENTS["silent"]:
+        LOGGER.warning(diagnostic.message)
@@ -1,11 +1,10 @@
 """Load metadata about the ontouml-json2graph software.
 
 Metadata is loaded in one of two ways:
-    (a) Automatically read from the pyproject.toml file.
+    (a) Automatically read from the installed distribution or the pyproject.toml file, on first use.
     (b) Manually inserted.
 """
 
-from importlib.metadata import PackageNotFoundError, metadata
 from pathlib import Path
 import re
 
@@ -13,8 +12,6 @@ from .logger import initialize_logger
 
 LOGGER = initialize_logger()
 
-global METADATA
-
 
 def _read_source_project_version() -> str | None:
     """Return the PEP 621 project version when executing from a source checkout."""
@@ -44,29 +41,59 @@ def _read_source_project_version() -> str | None:
     return version_match.group(1)
 
 
-SOURCE_PROJECT_VERSION = _read_source_project_version()
+class _SoftwareMetadata(dict):
+    """Software metadata whose distribution fields are looked up on first use.
 
-# Get software's metadata directly from pyproject.toml config file
-try:
-    METADATA = dict(metadata("ontouml-json2graph"))
-# When developing, the metadata is not available and hence the information is manually declared
-except PackageNotFoundError:
-    LOGGER.warning("EXECUTING ON DEVELOPMENT MODE\n")
-    METADATA = {
-        "Summary": "OntoUML JSON2Graph Decoder",
-        "Version": SOURCE_PROJECT_VERSION or "X.X.X",
-        "Name": "ontouml-json2graph",
-        "Home-page": "https://w3id.org/ontouml/json2graph",
-    }
+    The OntoUML Vocabulary fields are always present. The distribution fields (e.g., 'Name', 'Summary', and
+    'Version') are loaded when one of them is first accessed, so importing the package does not query the installed
+    distributions or read pyproject.toml.
+    """
+
+    def __init__(self, static_fields: dict[str, str]) -> None:
+        super().__init__(static_fields)
+        self._distribution_loaded = False
+
+    def __missing__(self, key: str) -> str:
+        if self._distribution_loaded:
+            raise KeyError(key)
+        self._load_distribution_metadata()
+        return self[key]
+
+    def _load_distribution_metadata(self) -> None:
+        """Add the distribution fields, preferring the version of a source checkout."""
+        from importlib.metadata import PackageNotFoundError, metadata
 
-# A source checkout takes precedence over metadata from a separately installed
-# distribution, which may be absent or stale in the development environment.
-if SOURCE_PROJECT_VERSION is not None:
-    METADATA["Version"] = SOURCE_PROJECT_VERSION
+        self._distribution_loaded = True
+
+        # Get software's metadata directly from pyproject.toml config file
+        try:
+            distribution_fields = dict(metadata("ontouml-json2graph"))
+        # When developing, the metadata is not available and hence the information is manually declared
+        except PackageNotFoundError:
+            LOGGER.warning("EXECUTING ON DEVELOPMENT MODE\n")
+            distribution_fields = {
+                "Summary": "OntoUML JSON2Graph Decoder",
+                "Version": "X.X.X",
+                "Name": "ontouml-json2graph",
+                "Home-page": "https://w3id.org/ontouml/json2graph",
+            }
+
+        # A source checkout takes precedence over metadata from a separately installed
+        # distribution, which may be absent or stale in the development environment.
+        source_project_version = _read_source_project_version()
+        if source_project_version is not None:
+            distribution_fields["Version"] = source_project_version
+
+        distribution_fields.setdefault("Home-page", "https://w3id.org/ontouml/json2graph")
+        for key, value in distribution_fields.items():
+            self.setdefault(key, value)
 
-METADATA.setdefault("Home-page", "https://w3id.org/ontouml/json2graph")
 
 # Manually including additional metadata
-METADATA["conformsTo"] = "https://w3id.org/ontouml"
-METADATA["conformsToBase"] = "https://w3id.org/ontouml#"
-METADATA["conformsToVersion"] = "v1.1.1"
+METADATA = _SoftwareMetadata(
+    {
+        "conformsTo": "https://w3id.org/ontouml",
+        "conformsToBase": "https://w3id.org/ontouml#",
+        "conformsToVersion": "v1.1.1",
+    }
+)
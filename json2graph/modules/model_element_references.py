@@ -1,6 +1,7 @@
 """Validate diagrammatic references to model elements and apply the configured policy."""
 
-import warnings
+from .diagnostics import issue_warning
+from .source_visitor import SourceVisitor
 
 UNRESOLVED_MODEL_ELEMENT_POLICIES = ("preserve", "omit", "error")
 
@@ -39,36 +40,77 @@ def _collect_model_element_ids(model_package: dict) -> set[str]:
     return model_element_ids
 
 
-def apply_unresolved_model_element_policy(
-    project_data: dict,
-    policy: str,
-    input_path: str,
-) -> None:
-    """Handle unresolved ElementView.modelElement references according to policy.
+def collect_project_model_element_ids(project_data: dict) -> set[str]:
+    """Collect IDs of all elements defined by a Project's model package and its nested packages."""
+    model_package = project_data.get("model")
+    if not isinstance(model_package, dict):
+        return set()
+    return _collect_model_element_ids(model_package)
 
-    Only ``modelElement`` references on objects contained by diagrams are
-    evaluated. Other reference categories, including ``source``, ``target``,
-    ``propertyType``, ``general``, and ``specific``, are outside this policy.
+
+class ModelElementIdCollector:
+    """Collect, in a source traversal, the IDs of the elements defined by a Project's model package.
+
+    Produces the same IDs as collect_project_model_element_ids without walking the model package separately.
+
+    :ivar model_element_ids: IDs collected in the traversal, complete after it ends.
+    :vartype model_element_ids: set[str]
+    """
+
+    def __init__(self, project_data: dict) -> None:
+        """Create a collector for the model package of a Project.
+
+        :param project_data: Project whose model element IDs are collected, or another document, which has none.
+        :type project_data: dict
+        """
+        self.model_element_ids = set()
+        model_package = project_data.get("model")
+        self._containing_packages = {id(model_package)} if isinstance(model_package, dict) else set()
+
+    def register(self, visitor: SourceVisitor) -> None:
+        """Register the collecting callback in the visitor of the project.
+
+        :param visitor: Visitor of the project dictionary received on initialization.
+        :type visitor: SourceVisitor
+        """
+        visitor.register(self._visit_package, "Package")
+
+    def _visit_package(self, package: dict) -> None:
+        # Packages are visited before their contents, so nested packages are known when they are reached.
+        if id(package) not in self._containing_packages:
+            return
+
+        package_id = package.get("id")
+        if isinstance(package_id, str):
+            self.model_element_ids.add(package_id)
+
+        for model_element in package.get("contents") or []:
+            if not isinstance(model_element, dict):
+                continue
+
+            model_element_id = model_element.get("id")
+            if isinstance(model_element_id, str):
+                self.model_element_ids.add(model_element_id)
+
+            if model_element.get("type") == "Package":
+                self._containing_packages.add(id(model_element))
+
+
+def find_unresolved_model_element_references(
+    project_data: dict, input_path: str, model_element_ids: set[str]
+) -> list[tuple[dict, str]]:
+    """Find the ElementViews of a project's diagrams whose modelElement reference is not defined in its model.
 
     :param project_data: Cleaned OntoUML Project dictionary to validate.
     :type project_data: dict
-    :param policy: One of ``preserve``, ``omit``, or ``error``.
-    :type policy: str
-    :param input_path: Path of the JSON file containing the reference.
+    :param input_path: Path of the JSON file containing the references.
     :type input_path: str
+    :param model_element_ids: IDs of the complete project's model elements.
+    :type model_element_ids: set[str]
+    :return: Each ElementView with an unresolved reference and the message that describes it, in document order.
+    :rtype: list[tuple[dict, str]]
     """
-    if policy not in UNRESOLVED_MODEL_ELEMENT_POLICIES:
-        raise ValueError(
-            f"Invalid unresolved modelElement policy '{policy}'. Valid values are: "
-            f"{list(UNRESOLVED_MODEL_ELEMENT_POLICIES)}."
-        )
-
-    model_package = project_data.get("model")
-    if not isinstance(model_package, dict):
-        model_element_ids = set()
-    else:
-        model_element_ids = _collect_model_element_ids(model_package)
-
+    unresolved_references = []
     for diagram in project_data.get("diagrams", []):
         if not isinstance(diagram, dict):
             continue
@@ -88,28 +130,72 @@ def apply_unresolved_model_element_policy(
             element_view_type = element_view.get("type", "ElementView")
             element_view_id = element_view.get("id", "unknown")
             referenced_type = model_element.get("type", "unknown")
-            message = (
-                f"Input file '{input_path}': {element_view_type} with ID '{element_view_id}' has unresolved "
-                f"modelElement reference '{referenced_id}' (declared type '{referenced_type}'), which is not "
-                f"defined in the project's model contents."
+            unresolved_references.append(
+                (
+                    element_view,
+                    f"Input file '{input_path}': {element_view_type} with ID '{element_view_id}' has unresolved "
+                    f"modelElement reference '{referenced_id}' (declared type '{referenced_type}'), which is not "
+                    f"defined in the project's model contents.",
+                )
             )
 
-            if policy == "error":
-                raise UnresolvedModelElementError(
-                    f"{message} Transformation aborted because the unresolved modelElement policy is 'error'."
-                )
+    return unresolved_references
 
-            if policy == "omit":
-                element_view.pop("modelElement")
-                action = (
-                    "The reference was omitted and the unresolved target was not materialized, while the "
-                    "ElementView was preserved"
-                )
-            else:
-                action = "The reference was preserved and the unresolved target was materialized"
 
-            warnings.warn(
-                f"{message} {action} because the unresolved modelElement policy is '{policy}'.",
-                UnresolvedModelElementWarning,
-                stacklevel=2,
+def apply_unresolved_model_element_policy(
+    project_data: dict,
+    policy: str,
+    input_path: str,
+    model_element_ids: set[str] | None = None,
+) -> list[dict]:
+    """Handle unresolved ElementView.modelElement references according to policy.
+
+    Only ``modelElement`` references on objects contained by diagrams are
+    evaluated. Other reference categories, including ``source``, ``target``,
+    ``propertyType``, ``general``, and ``specific``, are outside this policy.
+
+    :param project_data: Cleaned OntoUML Project dictionary to validate.
+    :type project_data: dict
+    :param policy: One of ``preserve``, ``omit``, or ``error``.
+    :type policy: str
+    :param input_path: Path of the JSON file containing the reference.
+    :type input_path: str
+    :param model_element_ids: Optional precomputed IDs of the complete project's model elements. Required when
+                              project_data contains only part of the project's model. (Optional)
+    :type model_element_ids: set[str] or None
+    :return: The reference dictionaries removed from project_data by the 'omit' policy.
+    :rtype: list[dict]
+    """
+    if policy not in UNRESOLVED_MODEL_ELEMENT_POLICIES:
+        raise ValueError(
+            f"Invalid unresolved modelElement policy '{policy}'. Valid values are: "
+            f"{list(UNRESOLVED_MODEL_ELEMENT_POLICIES)}."
+        )
+
+    if model_element_ids is None:
+        model_element_ids = collect_project_model_element_ids(project_data)
+
+    omitted_references = []
+    for element_view, message in find_unresolved_model_element_references(project_data, input_path, model_element_ids):
+        if policy == "error":
+            raise UnresolvedModelElementError(
+                f"{message} Transformation aborted because the unresolved modelElement policy is 'error'."
             )
+
+        if policy == "omit":
+            omitted_references.append(element_view.pop("modelElement"))
+            action = (
+                "The reference was omitted and the unresolved target was not materialized, while the "
+                "ElementView was preserved"
+            )
+        else:
+            action = "The reference was preserved and the unresolved target was materialized"
+
+        issue_warning(
+            f"{message} {action} because the unresolved modelElement policy is '{policy}'.",
+            UnresolvedModelElementWarning,
+            element_id=element_view.get("id"),
+            stacklevel=2,
+        )
+
+    return omitted_references
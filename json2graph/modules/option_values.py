@@ -0,0 +1,41 @@
+"""Valid values of the options whose handling modules depend on RDFLib.
+
+The command-line parser validates its choices against these values before the decoding modules, and RDFLib, are
+imported, so that printing the help or the version does not load them. The handling modules re-export the values.
+"""
+
+# Formats for saving graphs supported by RDFLib, and the binary graph snapshot format of the graph_snapshot module
+# https://rdflib.readthedocs.io/en/stable/intro_to_parsing.html#saving-rdf
+GRAPH_FORMATS = (
+    "turtle",
+    "ttl",
+    "turtle2",
+    "xml",
+    "pretty-xml",
+    "json-ld",
+    "ntriples",
+    "nt",
+    "nt11",
+    "n3",
+    "trig",
+    "trix",
+    "nquads",
+    "snapshot",
+)
+
+CANONICAL_GRAPH_FORMATS = ("turtle", "ttl", "ntriples", "nt", "nt11")
+
+# Formats in which the graphs of a batch conversion can be written as the named graphs of one dataset file
+DATASET_FORMATS = ("nquads", "trig")
+
+INVALID_STEREOTYPE_POLICIES = ("preserve", "omit", "error")
+
+PATH_ORDER_POLICIES = ("warn", "comment")
+
+PROPERTY_ASSIGNMENT_POLICIES = ("warn", "comment")
+
+TRANSFORMATION_METADATA_MODES = ("none", "embedded", "sidecar")
+
+GEOMETRY_ENCODINGS = ("points", "compact")
+
+OUTPUT_PARTITIONS = ("none", "package", "diagram", "type", "triples")
@@ -0,0 +1,111 @@
+"""Open compressed output streams for serialized graphs.
+
+Graphs are serialized directly into the compressor, so no uncompressed copy of the output is written to disk. Gzip
+streams are written without a timestamp or original filename, so that the same graph always produces the same bytes.
+"""
+
+import gzip
+import lzma
+from pathlib import Path
+from typing import BinaryIO, Callable
+
+from .errors import report_error_requirement_not_met
+
+OUTPUT_COMPRESSIONS = ("none", "gzip", "xz", "zstd")
+
+COMPRESSION_SUFFIXES = {
+    "none": "",
+    "gzip": ".gz",
+    "xz": ".xz",
+    "zstd": ".zst",
+}
+
+
+def get_compression_from_path(output_file_path: str) -> str:
+    """Return the compression selected by the suffix of an output file path.
+
+    :param output_file_path: Path of the output file.
+    :type output_file_path: str
+    :return: One of OUTPUT_COMPRESSIONS. Paths without a known compression suffix are not compressed.
+    :rtype: str
+    """
+    suffix = Path(output_file_path).suffix
+    for compression, compression_suffix in COMPRESSION_SUFFIXES.items():
+        if compression_suffix and suffix == compression_suffix:
+            return compression
+    return "none"
+
+
+class _ReproducibleGzipFile(gzip.GzipFile):
+    """Gzip stream without timestamp or filename in its header that also closes the file it writes to."""
+
+    def __init__(self, output_file_path: str) -> None:
+        self._output_file = open(output_file_path, "wb")
+        super().__init__(filename="", mode="wb", fileobj=self._output_file, mtime=0)
+
+    def close(self) -> None:
+        try:
+            super().close()
+        finally:
+            self._output_file.close()
+
+
+def _get_zstd_opener() -> Callable[[str], BinaryIO]:
+    """Return a function that opens a Zstandard output stream.
+
+    The standard library implementation (Python 3.14+) is preferred, with the optional zstandard package as fallback.
+    """
+    try:
+        from compression import zstd
+
+        return lambda output_file_path: zstd.open(output_file_path, "wb")
+    except ImportError:
+        pass
+
+    try:
+        import zstandard
+    except ImportError:
+        report_error_requirement_not_met(
+            "Zstandard compression requires Python 3.14 or later, or the 'zstandard' package to be installed."
+        )
+
+    return lambda output_file_path: zstandard.ZstdCompressor().stream_writer(open(output_file_path, "wb"))
+
+
+def validate_output_compression(compression: str) -> None:
+    """Validate a compression name and check that the compressor it requires is available.
+
+    :param compression: Compression name to be validated.
+    :type compression: str
+    """
+    if compression not in OUTPUT_COMPRESSIONS:
+        report_error_requirement_not_met(
+            f"Invalid output compression '{compression}'. Valid values are: {list(OUTPUT_COMPRESSIONS)}."
+        )
+
+    if compression == "zstd":
+        _get_zstd_opener()
+
+
+def open_output_stream(output_file_path: str, compression: str) -> BinaryIO:
+    """Open a binary stream that writes to the output file through the selected compressor.
+
+    :param output_file_path: Complete path of the output file to be created (including name and extension).
+    :type output_file_path: str
+    :param compression: One of OUTPUT_COMPRESSIONS.
+    :type compression: str
+    :return: Binary stream to be used as a context manager. Closing it finishes the compressed stream.
+    :rtype: BinaryIO
+    """
+    if compression == "none":
+        return open(output_file_path, "wb")
+    if compression == "gzip":
+        return _ReproducibleGzipFile(output_file_path)
+    if compression == "xz":
+        return lzma.open(output_file_path, "wb")
+    if compression == "zstd":
+        return _get_zstd_opener()(output_file_path)
+
+    report_error_requirement_not_met(
+        f"Invalid output compression '{compression}'. Valid values are: {list(OUTPUT_COMPRESSIONS)}."
+    )
@@ -0,0 +1,122 @@
+"""Stream the output graphs of a batch conversion into a single N-Quads or TriG dataset file.
+
+Triplestores load one large file in a single bulk transaction, while one output file per project is loaded with one
+transaction each. In a dataset file, each project's graph is a named graph whose name is the project's base URI
+without its trailing '#', so graphs with content-derived base URIs never share resources. The graphs are written one
+after the other, so only the graph being written is kept in memory.
+
+Blank node labels are scoped to the whole dataset document. They are therefore relabeled per named graph, so blank
+nodes of different projects (e.g., the fixed-label resources of their transformation metadata) are never merged.
+"""
+
+import io
+
+from rdflib import BNode, Graph, URIRef
+from rdflib.term import Node
+
+from .canonical_output import format_ntriples_term
+from .option_values import DATASET_FORMATS
+from .output_compression import open_output_stream
+from .utils_graph import fix_uri
+
+
+def get_dataset_graph_name(base_uri: str) -> URIRef:
+    """Return the name of the named graph that holds the resources of a base URI.
+
+    :param base_uri: Base URI of a converted project, e.g., 'urn:uuid:<content UUID>#'.
+    :type base_uri: str
+    :return: Base URI without its trailing '#'.
+    :rtype: URIRef
+    """
+    return URIRef(base_uri.removesuffix("#"))
+
+
+def get_dataset_provenance_graph_name(base_uri: str) -> URIRef:
+    """Return the name of the companion graph that holds the transformation metadata of a project.
+
+    :param base_uri: Base URI of a converted project.
+    :type base_uri: str
+    :return: The IRI '<base URI>provenance', e.g., 'urn:uuid:<content UUID>#provenance'.
+    :rtype: URIRef
+    """
+    return URIRef(base_uri + "provenance")
+
+
+class DatasetFileWriter:
+    """Write named graphs one at a time into an (optionally compressed) N-Quads or TriG file.
+
+    The file is finished by close(), e.g., with contextlib.closing.
+
+    :ivar graph_names: Names of the graphs already written.
+    :vartype graph_names: set[URIRef]
+    """
+
+    def __init__(self, output_file_path: str, syntax: str, compression: str = "none") -> None:
+        """Open the dataset file.
+
+        :param output_file_path: Complete path of the output file to be created (including name and extension).
+        :type output_file_path: str
+        :param syntax: One of DATASET_FORMATS.
+        :type syntax: str
+        :param compression: Compressor the output is streamed through. (Optional)
+        :type compression: str
+        :raises ValueError: If the syntax is not a dataset format.
+        """
+        if syntax not in DATASET_FORMATS:
+            raise ValueError(
+                f"The '{syntax}' format cannot hold named graphs. Valid formats are: {list(DATASET_FORMATS)}."
+            )
+        self._syntax = syntax
+        self._output_stream = open_output_stream(output_file_path, compression)
+        self._text_stream = io.TextIOWrapper(self._output_stream, encoding="utf-8", newline="\n")
+        self.graph_names: set[URIRef] = set()
+
+    def close(self) -> None:
+        """Finish the dataset file."""
+        self._text_stream.close()
+
+    def write_graph(self, ontouml_graph: Graph, graph_name: URIRef) -> int:
+        """Append the triples of a graph to the dataset as a named graph.
+
+        IRIs that are not valid in N-Quads or TriG are written percent-encoded, as in single-graph outputs.
+
+        :param ontouml_graph: Graph whose triples are written.
+        :type ontouml_graph: Graph
+        :param graph_name: Name of the graph in the dataset.
+        :type graph_name: URIRef
+        :return: Number of written triples.
+        :rtype: int
+        """
+        graph_number = len(self.graph_names)
+        self.graph_names.add(graph_name)
+        term_cache: dict[Node, str] = {}
+
+        def format_term(term: Node) -> str:
+            formatted_term = term_cache.get(term)
+            if formatted_term is None:
+                if isinstance(term, BNode):
+                    formatted_term = f"_:g{graph_number}b{len(term_cache)}"
+                elif isinstance(term, URIRef):
+                    try:
+                        formatted_term = format_ntriples_term(term)
+                    except ValueError:
+                        formatted_term = format_ntriples_term(URIRef(fix_uri(str(term))))
+                else:
+                    formatted_term = format_ntriples_term(term)
+                term_cache[term] = formatted_term
+            return formatted_term
+
+        formatted_graph_name = format_term(graph_name)
+        # N-Triples statements are valid TriG statements inside a graph block.
+        line_end = f" {formatted_graph_name} .\n" if self._syntax == "nquads" else " .\n"
+        if self._syntax == "trig":
+            self._text_stream.write(f"{formatted_graph_name} {{\n")
+
+        triple_count = 0
+        for subject, predicate, obj in ontouml_graph:
+            self._text_stream.write(f"{format_term(subject)} {format_term(predicate)} {format_term(obj)}{line_end}")
+            triple_count += 1
+
+        if self._syntax == "trig":
+            self._text_stream.write("}\n")
+        return triple_count
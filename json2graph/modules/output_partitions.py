@@ -0,0 +1,258 @@
+"""Write an output graph into several files, keyed by top-level package, diagram, or element type, or in chunks.
+
+Bulk loaders of triplestores load several files in parallel, but a single large output file is loaded by one thread.
+A partitioned output is a set of files of the same syntax, each holding the triples of some subjects, and a JSON
+manifest listing them with their triple counts, sizes, and SHA-256 hashes. Every triple is written to exactly one
+partition, so loading all partitions produces the same graph as loading the single output file.
+
+A resource is in the partition of a top-level package or diagram if the package or diagram owns it, directly or
+through owned resources (e.g., a package owns its contents, a class its attributes, a property its cardinality, and a
+diagram its views, their shapes, and their points). Blank nodes are kept in the partition of the subject that refers
+to them, so no blank node is split across files.
+"""
+
+import hashlib
+import json
+import os
+from collections.abc import Iterator
+
+from rdflib import RDF, BNode, Graph, Namespace
+from rdflib.term import Node
+
+from .errors import report_error_io_write
+from .input_output import create_directory_if_not_exists, safe_write_graph_file
+from .metadata import METADATA
+from .output_compression import COMPRESSION_SUFFIXES
+
+ONTOUML = Namespace(METADATA["conformsToBase"])
+
+# Predicates relating a resource to the resources it owns, i.e., that are only described as part of it.
+_OWNERSHIP_PREDICATES = frozenset(
+    {
+        ONTOUML.model,
+        ONTOUML.diagram,
+        ONTOUML.containsModelElement,
+        ONTOUML.containsView,
+        ONTOUML.shape,
+        ONTOUML.point,
+        ONTOUML.topLeftPosition,
+        ONTOUML.attribute,
+        ONTOUML.relationEnd,
+        ONTOUML.literal,
+        ONTOUML.cardinality,
+    }
+)
+
+DEFAULT_PARTITION_SIZE = 1_000_000
+
+
+def _get_subject_units(ontouml_graph: Graph) -> dict[Node, list[Node]]:
+    """Group each subject with the blank-node subjects it refers to, directly or through other blank nodes.
+
+    :return: Dictionary from the first subject of each group to all the subjects of the group.
+    """
+    subjects = set(ontouml_graph.subjects())
+    referenced_blank_nodes = {node for node in ontouml_graph.objects() if type(node) is BNode and node in subjects}
+    roots = [subject for subject in subjects if subject not in referenced_blank_nodes]
+
+    units = {}
+    claimed_subjects = set()
+    # Blank nodes that are only referenced by other blank nodes in a cycle form groups of their own.
+    for root in [*sorted(roots), *sorted(referenced_blank_nodes)]:
+        if root in claimed_subjects:
+            continue
+        claimed_subjects.add(root)
+        unit = [root]
+        pending_subjects = [root]
+        while pending_subjects:
+            for node in ontouml_graph.objects(pending_subjects.pop()):
+                if node in referenced_blank_nodes and node not in claimed_subjects:
+                    claimed_subjects.add(node)
+                    unit.append(node)
+                    pending_subjects.append(node)
+        units[root] = unit
+    return units
+
+
+def _get_owned_resources(ontouml_graph: Graph, owners: list[Node]) -> dict[Node, Node]:
+    """Map every resource owned by one of the owners, directly or indirectly, to that owner."""
+    owner_of = {}
+    for owner in owners:
+        owner_of.setdefault(owner, owner)
+        pending_resources = [owner]
+        while pending_resources:
+            for predicate, owned_resource in ontouml_graph.predicate_objects(pending_resources.pop()):
+                if predicate in _OWNERSHIP_PREDICATES and owned_resource not in owner_of:
+                    owner_of[owned_resource] = owner
+                    pending_resources.append(owned_resource)
+    return owner_of
+
+
+def _get_top_level_packages(ontouml_graph: Graph) -> list[Node]:
+    """Return the Packages directly contained in the root Package of the model."""
+    root_packages = set(ontouml_graph.objects(None, ONTOUML.model))
+    if not root_packages:
+        contained_elements = set(ontouml_graph.objects(None, ONTOUML.containsModelElement))
+        root_packages = set(ontouml_graph.subjects(RDF.type, ONTOUML.Package)) - contained_elements
+
+    return sorted(
+        content
+        for root_package in root_packages
+        for content in ontouml_graph.objects(root_package, ONTOUML.containsModelElement)
+        if (content, RDF.type, ONTOUML.Package) in ontouml_graph
+    )
+
+
+def _get_partition_key(ontouml_graph: Graph, subject: Node, partition_by: str, owner_of: dict[Node, Node]) -> Node:
+    """Return the top-level package, diagram, or OntoUML type that keys the partition of a subject, if any."""
+    if partition_by == "type":
+        ontouml_types = sorted(
+            subject_type for subject_type in ontouml_graph.objects(subject, RDF.type) if subject_type in ONTOUML
+        )
+        return ontouml_types[0] if ontouml_types else None
+    return owner_of.get(subject)
+
+
+def iter_graph_partitions(
+    ontouml_graph: Graph, partition_by: str, partition_size: int = DEFAULT_PARTITION_SIZE
+) -> Iterator[tuple[Node | None, list[Node]]]:
+    """Split the subjects of a graph into partitions, in a deterministic order.
+
+    :param ontouml_graph: Graph compliant with the OntoUML Vocabulary.
+    :type ontouml_graph: Graph
+    :param partition_by: Partitioning key: 'package', 'diagram', 'type', or 'triples'.
+    :type partition_by: str
+    :param partition_size: Maximum number of triples of each partition when partitioning by 'triples'. A partition
+                           only exceeds it if a single subject, with its blank nodes, has more triples. (Optional)
+    :type partition_size: int
+    :return: Iterator of the key of each partition (the IRI of a top-level package, a diagram, or an OntoUML type) and
+             the subjects whose triples it holds. The key is None for the partition of the subjects outside all keyed
+             partitions, which comes last, and for all partitions by number of triples.
+    :rtype: Iterator[tuple[Node or None, list[Node]]]
+    """
+    units = _get_subject_units(ontouml_graph)
+
+    if partition_by == "triples":
+        chunk_subjects = []
+        chunk_size = 0
+        for root in sorted(units):
+            unit_size = sum(1 for subject in units[root] for _ in ontouml_graph.predicate_objects(subject))
+            if chunk_subjects and chunk_size + unit_size > partition_size:
+                yield None, chunk_subjects
+                chunk_subjects = []
+                chunk_size = 0
+            chunk_subjects.extend(units[root])
+            chunk_size += unit_size
+        if chunk_subjects:
+            yield None, chunk_subjects
+        return
+
+    if partition_by == "package":
+        owner_of = _get_owned_resources(ontouml_graph, _get_top_level_packages(ontouml_graph))
+    elif partition_by == "diagram":
+        owner_of = _get_owned_resources(ontouml_graph, sorted(ontouml_graph.subjects(RDF.type, ONTOUML.Diagram)))
+    else:
+        owner_of = {}
+
+    partitions: dict[Node | None, list[Node]] = {}
+    for root in sorted(units):
+        partitions.setdefault(_get_partition_key(ontouml_graph, root, partition_by, owner_of), []).extend(units[root])
+
+    for key in sorted(key for key in partitions if key is not None):
+        yield key, partitions[key]
+    if None in partitions:
+        yield None, partitions[None]
+
+
+def _get_file_digest(file_path: str) -> tuple[int, str]:
+    """Return the size in bytes and the hexadecimal SHA-256 digest of a file."""
+    file_hash = hashlib.sha256()
+    with open(file_path, "rb") as read_file:
+        for block in iter(lambda: read_file.read(1 << 20), b""):
+            file_hash.update(block)
+    return os.path.getsize(file_path), file_hash.hexdigest()
+
+
+def write_partitioned_graph_files(
+    ontouml_graph: Graph,
+    output_directory: str,
+    output_stem: str,
+    syntax: str,
+    partition_by: str,
+    partition_size: int = DEFAULT_PARTITION_SIZE,
+    canonical: bool = False,
+    compression: str = "none",
+    input_path: str | None = None,
+) -> str:
+    """Write the graph into one file per partition and a JSON manifest describing them.
+
+    The partitions are saved as '<output_stem>.part-<number>.<syntax>' (plus the compression suffix), and the manifest
+    as '<output_stem>.manifest.json'. Only the triples of one partition are copied at a time.
+
+    :param ontouml_graph: Graph compliant with the OntoUML Vocabulary.
+    :type ontouml_graph: Graph
+    :param output_directory: Directory in which the files are saved.
+    :type output_directory: str
+    :param output_stem: Output path relative to the output directory, without format and compression suffixes.
+    :type output_stem: str
+    :param syntax: Syntax used to serialize the partitions.
+    :type syntax: str
+    :param partition_by: Partitioning key: 'package', 'diagram', 'type', or 'triples'.
+    :type partition_by: str
+    :param partition_size: Maximum number of triples of each partition when partitioning by 'triples'. (Optional)
+    :type partition_size: int
+    :param canonical: If True, write each partition in canonical form. (Optional)
+    :type canonical: bool
+    :param compression: Compressor each partition is streamed through. (Optional)
+    :type compression: str
+    :param input_path: Path of the decoded JSON file, recorded in the manifest. (Optional)
+    :type input_path: str or None
+    :return: Saved manifest file path.
+    :rtype: str
+    """
+    manifest_file_path = os.path.join(output_directory, *f"{output_stem}.manifest.json".split("/"))
+    create_directory_if_not_exists(os.path.dirname(manifest_file_path), "output directory")
+    stem_name = os.path.basename(output_stem)
+
+    partition_records = []
+    for number, (key, subjects) in enumerate(iter_graph_partitions(ontouml_graph, partition_by, partition_size), 1):
+        partition_graph = Graph()
+        for prefix, namespace in ontouml_graph.namespaces():
+            partition_graph.bind(prefix, namespace, override=True, replace=True)
+        for subject in subjects:
+            partition_graph.addN(
+                (subject, predicate, node, partition_graph)
+                for predicate, node in ontouml_graph.predicate_objects(subject)
+            )
+
+        partition_file_name = f"{stem_name}.part-{number:04d}.{syntax}{COMPRESSION_SUFFIXES[compression]}"
+        partition_file_path = os.path.join(os.path.dirname(manifest_file_path), partition_file_name)
+        safe_write_graph_file(partition_graph, partition_file_path, syntax, canonical, compression)
+        partition_file_size, partition_file_sha256 = _get_file_digest(partition_file_path)
+        partition_records.append(
+            {
+                "file": partition_file_name,
+                "key": str(key) if key is not None else None,
+                "triples": len(partition_graph),
+                "bytes": partition_file_size,
+                "sha256": partition_file_sha256,
+            }
+        )
+
+    manifest = {
+        "input": input_path,
+        "format": syntax,
+        "compression": compression,
+        "canonical": canonical,
+        "partition": partition_by,
+        "partition_size": partition_size if partition_by == "triples" else None,
+        "triples": sum(record["triples"] for record in partition_records),
+        "partitions": partition_records,
+    }
+    try:
+        with open(manifest_file_path, "w", encoding="utf-8") as manifest_file:
+            json.dump(manifest, manifest_file, indent=2)
+    except OSError as error:
+        report_error_io_write(manifest_file_path, "output partition manifest file", error)
+
+    return manifest_file_path
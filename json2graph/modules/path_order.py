@@ -1,11 +1,11 @@
 """Handle path-point order that the OntoUML Vocabulary cannot represent."""
 
-import warnings
 from collections.abc import Iterable
 
 from rdflib import Graph, Literal, RDFS, URIRef
 
-PATH_ORDER_POLICIES = ("warn", "comment")
+from .diagnostics import issue_warning
+from .option_values import PATH_ORDER_POLICIES
 
 
 class PathPointOrderWarning(UserWarning):
@@ -19,13 +19,16 @@ def _format_point_sequence(points: Iterable[dict]) -> str:
 
 def apply_path_order_policy(
     path_dicts: list[dict],
-    ontouml_graph: Graph,
+    ontouml_graph: Graph | None,
     policy: str,
     input_path: str,
     base_uri: str,
     model_only: bool,
 ) -> None:
-    """Warn about path-point order loss or preserve it as a non-normative textual annotation."""
+    """Warn about path-point order loss or preserve it as a non-normative textual annotation.
+
+    When no graph is informed, the policy is only checked: the warning is issued, but no annotation is added.
+    """
     if policy not in PATH_ORDER_POLICIES:
         raise ValueError(f"Invalid path order policy '{policy}'. Valid values are: {list(PATH_ORDER_POLICIES)}.")
 
@@ -38,16 +41,17 @@ def apply_path_order_policy(
 
     first_path_id = affected_paths[0]["id"]
     if policy == "comment":
-        ontouml_graph.bind("rdfs", RDFS)
-        for path_dict in affected_paths:
-            point_sequence = _format_point_sequence(path_dict["points"])
-            ontouml_graph.add(
-                (
-                    URIRef(base_uri + path_dict["id"]),
-                    RDFS.comment,
-                    Literal(f"Source JSON path point order: {point_sequence}."),
+        if ontouml_graph is not None:
+            ontouml_graph.bind("rdfs", RDFS)
+            for path_dict in affected_paths:
+                point_sequence = _format_point_sequence(path_dict["points"])
+                ontouml_graph.add(
+                    (
+                        URIRef(base_uri + path_dict["id"]),
+                        RDFS.comment,
+                        Literal(f"Source JSON path point order: {point_sequence}."),
+                    )
                 )
-            )
         action = (
             "The source sequences were added as non-normative rdfs:comment annotations because the path order "
             "policy is 'comment'."
@@ -55,7 +59,7 @@ def apply_path_order_policy(
     else:
         action = "The point triples were emitted without order because the path order policy is 'warn'."
 
-    warnings.warn(
+    issue_warning(
         f"Input file '{input_path}': {len(affected_paths)} Path object(s) contain ordered point sequences that "
         f"the OntoUML Vocabulary does not represent (first affected Path ID: '{first_path_id}'). {action}",
         PathPointOrderWarning,
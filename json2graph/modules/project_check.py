@@ -0,0 +1,216 @@
+"""Check a project against the source-level policies without building or serializing a graph.
+
+The check runs the same policies as a conversion on the loaded JSON data: stereotype validity, cardinality parsing,
+unresolved modelElement references, property assignments, path order, Text values, duplicate IDs, and, when enabled,
+the class and property constraints of the correction pass. Instead of aborting at the first content rejected by an
+error policy, every rejected element is reported.
+"""
+
+import warnings
+from dataclasses import dataclass
+
+from . import arguments as args
+from .cardinalities import InvalidCardinalityError, resolve_cardinality
+from .messages import collect_decode_log_messages, print_decode_log_message
+from .model_element_references import (
+    UnresolvedModelElementError,
+    apply_unresolved_model_element_policy,
+    find_unresolved_model_element_references,
+)
+from .path_order import apply_path_order_policy
+from .property_assignments import PropertyAssignmentCollector, apply_property_assignment_policy
+from .source_visitor import SourceVisitor, active_type_index
+from .stereotypes import InvalidStereotypeError, resolve_stereotype
+from ..decoder.decode_general import get_list_subdictionaries_for_specific_type, get_stereotype
+from ..decoder.decode_main import visit_source_data
+from ..decoder.decode_obj_class import validate_class_attribute_constraints, validate_class_order_constraints
+
+
+@dataclass(frozen=True)
+class CheckFinding:
+    """One problem found when a project is checked.
+
+    :ivar severity: 'error' if an error policy rejects the content, so converting it fails, or 'warning'.
+    :vartype severity: str
+    :ivar category: Name of the warning or exception class, or code of the correction pass message (e.g., 'VCA1').
+    :vartype category: str
+    :ivar message: Description of the problem, as reported by a conversion.
+    :vartype message: str
+    """
+
+    severity: str
+    category: str
+    message: str
+
+
+def _error_finding(error: ValueError) -> CheckFinding:
+    """Return the finding of a content error raised by an error policy."""
+    return CheckFinding("error", type(error).__name__, str(error))
+
+
+def _check_model_element_references(json_data: dict, model_element_ids: set[str]) -> list[CheckFinding]:
+    """Apply the unresolved modelElement policy, reporting every rejected reference when the policy is 'error'."""
+    policy = args.ARGUMENTS["unresolved_model_element_policy"]
+    if policy != "error":
+        apply_unresolved_model_element_policy(json_data, policy, args.ARGUMENTS["input_path"], model_element_ids)
+        return []
+
+    return [
+        _error_finding(
+            UnresolvedModelElementError(
+                f"{message} Transformation aborted because the unresolved modelElement policy is 'error'."
+            )
+        )
+        for _, message in find_unresolved_model_element_references(
+            json_data, args.ARGUMENTS["input_path"], model_element_ids
+        )
+    ]
+
+
+def _check_classes(json_data: dict, errors: list[CheckFinding]) -> dict[str, tuple[str, str]]:
+    """Check the Classes as create_class_properties decodes them, returning their asserted stereotypes and names."""
+    asserted_class_stereotypes = {}
+
+    for class_dict in get_list_subdictionaries_for_specific_type(json_data, "Class"):
+        # Skipping dictionaries that only make reference to classes
+        if "name" not in class_dict:
+            continue
+
+        validate_class_attribute_constraints(class_dict)
+        validate_class_order_constraints(class_dict)
+
+        if get_stereotype(class_dict) == "null":
+            print_decode_log_message(class_dict, "VCS1", "stereotype")
+            continue
+
+        try:
+            class_stereotype = resolve_stereotype(class_dict, args.ARGUMENTS["invalid_stereotype_policy"])
+        except InvalidStereotypeError as error:
+            errors.append(_error_finding(error))
+            continue
+        if class_stereotype is not None:
+            asserted_class_stereotypes[class_dict["id"]] = (class_stereotype, class_dict["name"])
+
+    return asserted_class_stereotypes
+
+
+def _check_relations(json_data: dict, errors: list[CheckFinding]) -> None:
+    """Check the stereotypes of the Relations as create_relation_properties decodes them."""
+    for relation_dict in get_list_subdictionaries_for_specific_type(json_data, "Relation"):
+        # Removing possible dictionaries that are only references
+        if len(relation_dict) < 3 or get_stereotype(relation_dict) == "null":
+            continue
+
+        try:
+            resolve_stereotype(relation_dict, args.ARGUMENTS["invalid_stereotype_policy"])
+        except InvalidStereotypeError as error:
+            errors.append(_error_finding(error))
+
+
+def _check_properties(
+    json_data: dict, asserted_class_stereotypes: dict[str, tuple[str, str]], errors: list[CheckFinding]
+) -> None:
+    """Check the stereotypes and cardinalities of the Properties, and the constraints of validate_property_stereotype.
+
+    The graph query of validate_property_stereotype matches begin and end stereotypes of properties typed by classes
+    with an asserted stereotype, so only its VPS2 case is reachable.
+    """
+    for property_dict in get_list_subdictionaries_for_specific_type(json_data, "Property"):
+        # Removing possible dictionaries that are only references
+        if len(property_dict) < 3:
+            continue
+
+        property_stereotype = None
+        if "stereotype" in property_dict:
+            try:
+                property_stereotype = resolve_stereotype(property_dict, args.ARGUMENTS["invalid_stereotype_policy"])
+            except InvalidStereotypeError as error:
+                errors.append(_error_finding(error))
+
+        if "cardinality" in property_dict:
+            try:
+                resolve_cardinality(
+                    property_dict["cardinality"], property_dict["id"], args.ARGUMENTS["invalid_cardinality_policy"]
+                )
+            except InvalidCardinalityError as error:
+                errors.append(_error_finding(error))
+
+        if not args.ARGUMENTS["correct"] or property_stereotype not in ("begin", "end"):
+            continue
+        class_id = property_dict.get("propertyType", {}).get("id")
+        if class_id not in asserted_class_stereotypes:
+            continue
+
+        class_stereotype, class_name = asserted_class_stereotypes[class_id]
+        if class_stereotype != "event":
+            dict_argument = {
+                "type": "Class",
+                "name": class_name,
+                "id": class_id,
+                "stereotype": class_stereotype,
+                "propID": property_dict["id"],
+                "propST": property_stereotype,
+            }
+            print_decode_log_message(dict_argument, "VPS2")
+
+
+def _check_generalization_sets(json_data: dict) -> None:
+    """Report the GeneralizationSets without generalizations, which create_generalizationset_properties skips."""
+    for generalizationset_dict in get_list_subdictionaries_for_specific_type(json_data, "GeneralizationSet"):
+        if len(generalizationset_dict) >= 3 and "generalizations" not in generalizationset_dict:
+            print_decode_log_message(
+                object_dict=generalizationset_dict, warning_code="WGS", property_name="generalizations"
+            )
+
+
+def check_json_data(json_data: dict) -> list[CheckFinding]:
+    """Check loaded JSON data against the source-level policies of the ARGUMENTS, without creating a graph.
+
+    :param json_data: Input JSON data loaded as a dictionary. It is modified as in a conversion.
+    :type json_data: dict
+    :return: Findings of the check: first the errors, then the warnings in the order in which they were raised, and
+             finally the messages of the correction pass.
+    :rtype: list[CheckFinding]
+    """
+    errors = []
+
+    with warnings.catch_warnings(record=True) as caught_warnings, collect_decode_log_messages() as log_messages:
+        warnings.simplefilter("always")
+
+        source_visitor = SourceVisitor()
+        property_assignment_collector = PropertyAssignmentCollector()
+        property_assignment_collector.register(source_visitor)
+        type_index, model_element_ids = visit_source_data(json_data, source_visitor)
+
+        errors.extend(_check_model_element_references(json_data, model_element_ids))
+
+        with active_type_index(type_index):
+            asserted_class_stereotypes = _check_classes(json_data, errors)
+            _check_relations(json_data, errors)
+            _check_properties(json_data, asserted_class_stereotypes, errors)
+            _check_generalization_sets(json_data)
+
+            # The compact geometry encoding preserves path-point order.
+            if args.ARGUMENTS["geometry_encoding"] != "compact":
+                apply_path_order_policy(
+                    path_dicts=get_list_subdictionaries_for_specific_type(json_data, "Path"),
+                    ontouml_graph=None,
+                    policy=args.ARGUMENTS["path_order_policy"],
+                    input_path=args.ARGUMENTS["input_path"],
+                    base_uri=args.ARGUMENTS["base_uri"],
+                    model_only=args.ARGUMENTS["model_only"],
+                )
+
+        apply_property_assignment_policy(
+            records=property_assignment_collector.records,
+            ontouml_graph=None,
+            policy=args.ARGUMENTS["property_assignment_policy"],
+            input_path=args.ARGUMENTS["input_path"],
+            base_uri=args.ARGUMENTS["base_uri"],
+        )
+
+    return [
+        *errors,
+        *(CheckFinding("warning", caught.category.__name__, str(caught.message)) for caught in caught_warnings),
+        *(CheckFinding("warning", code, message) for code, message in log_messages),
+    ]
@@ -1,12 +1,13 @@
 """Handle property assignments that the OntoUML Vocabulary cannot represent."""
 
 import json
-import warnings
 from dataclasses import dataclass
 
 from rdflib import Graph, Literal, RDFS, URIRef
 
-PROPERTY_ASSIGNMENT_POLICIES = ("warn", "comment")
+from .diagnostics import issue_warning
+from .option_values import PROPERTY_ASSIGNMENT_POLICIES
+from .source_visitor import SourceVisitor
 
 
 class PropertyAssignmentWarning(UserWarning):
@@ -23,47 +24,55 @@ class PropertyAssignmentRecord:
     keys: tuple[str, ...]
 
 
-def collect_property_assignments(json_data: object) -> list[PropertyAssignmentRecord]:
-    """Collect non-empty property-assignment maps before null cleanup mutates the source data."""
-    records = []
-
-    def visit(value: object) -> None:
-        if isinstance(value, dict):
-            assignments = value.get("propertyAssignments")
-            element_id = value.get("id")
-            if isinstance(assignments, dict) and assignments and isinstance(element_id, str):
-                records.append(
-                    PropertyAssignmentRecord(
-                        element_id=element_id,
-                        element_type=str(value.get("type", "Element")),
-                        canonical_json=json.dumps(
-                            assignments,
-                            ensure_ascii=False,
-                            separators=(",", ":"),
-                            sort_keys=True,
-                        ),
-                        keys=tuple(sorted(assignments)),
-                    )
+class PropertyAssignmentCollector:
+    """Collect non-empty property-assignment maps in a source traversal, before null cleanup mutates the source data.
+
+    :ivar records: Records collected in the traversal, in document order.
+    :vartype records: list[PropertyAssignmentRecord]
+    """
+
+    def __init__(self) -> None:
+        """Create a collector without records."""
+        self.records = []
+
+    def register(self, visitor: SourceVisitor) -> None:
+        """Register the collecting callback in a visitor. It must run before null values are removed.
+
+        :param visitor: Visitor of the source data.
+        :type visitor: SourceVisitor
+        """
+        visitor.register(self._visit_element)
+
+    def _visit_element(self, element: dict) -> None:
+        assignments = element.get("propertyAssignments")
+        element_id = element.get("id")
+        if isinstance(assignments, dict) and assignments and isinstance(element_id, str):
+            self.records.append(
+                PropertyAssignmentRecord(
+                    element_id=element_id,
+                    element_type=str(element.get("type", "Element")),
+                    canonical_json=json.dumps(
+                        assignments,
+                        ensure_ascii=False,
+                        separators=(",", ":"),
+                        sort_keys=True,
+                    ),
+                    keys=tuple(sorted(assignments)),
                 )
-
-            for nested_value in value.values():
-                visit(nested_value)
-        elif isinstance(value, list):
-            for item in value:
-                visit(item)
-
-    visit(json_data)
-    return records
+            )
 
 
 def apply_property_assignment_policy(
     records: list[PropertyAssignmentRecord],
-    ontouml_graph: Graph,
+    ontouml_graph: Graph | None,
     policy: str,
     input_path: str,
     base_uri: str,
 ) -> None:
-    """Warn about omitted assignments or preserve them as non-normative textual annotations."""
+    """Warn about omitted assignments or preserve them as non-normative textual annotations.
+
+    When no graph is informed, the policy is only checked: all records are reported, but no annotation is added.
+    """
     if policy not in PROPERTY_ASSIGNMENT_POLICIES:
         raise ValueError(
             f"Invalid property assignment policy '{policy}'. Valid values are: "
@@ -73,7 +82,8 @@ def apply_property_assignment_policy(
     affected_records = [
         record
         for record in records
-        if next(ontouml_graph.triples((URIRef(base_uri + record.element_id), None, None)), None) is not None
+        if ontouml_graph is None
+        or next(ontouml_graph.triples((URIRef(base_uri + record.element_id), None, None)), None) is not None
     ]
     if not affected_records:
         return
@@ -84,15 +94,16 @@ def apply_property_assignment_policy(
     )
 
     if policy == "comment":
-        ontouml_graph.bind("rdfs", RDFS)
-        for record in affected_records:
-            ontouml_graph.add(
-                (
-                    URIRef(base_uri + record.element_id),
-                    RDFS.comment,
-                    Literal(f"Source JSON propertyAssignments: {record.canonical_json}"),
+        if ontouml_graph is not None:
+            ontouml_graph.bind("rdfs", RDFS)
+            for record in affected_records:
+                ontouml_graph.add(
+                    (
+                        URIRef(base_uri + record.element_id),
+                        RDFS.comment,
+                        Literal(f"Source JSON propertyAssignments: {record.canonical_json}"),
+                    )
                 )
-            )
         action = (
             "The source maps were added as non-normative rdfs:comment annotations because the property assignment "
             "policy is 'comment'; they still have no formal OntoUML Vocabulary semantics."
@@ -100,7 +111,7 @@ def apply_property_assignment_policy(
     else:
         action = "The assignments were omitted because the property assignment policy is 'warn'."
 
-    warnings.warn(
+    issue_warning(
         f"Input file '{input_path}': {len(affected_records)} converted element(s) contain non-empty "
         f"propertyAssignments maps that the OntoUML Vocabulary does not represent: {affected_elements}. {action}",
         PropertyAssignmentWarning,
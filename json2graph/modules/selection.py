@@ -0,0 +1,173 @@
+"""Reduce a project to selected Packages and Diagrams and the model elements they depend on.
+
+A selector is the ID of a Package or Diagram, or a pattern (with the wildcards of fnmatch) matched against their names.
+A selected Package is kept with all its contents and a selected Diagram with all its views. The model elements that the
+kept objects reference (e.g., property types, generalization ends, relation ends, or the elements shown in a diagram)
+are added with everything nested in them, and so on transitively, so the result contains no dangling reference to a
+model element. Packages that are not selected but contain kept elements, or are referenced, are kept without their
+other contents, so every containment in the result is also a containment in the complete project.
+"""
+
+from collections.abc import Iterator
+from fnmatch import fnmatchcase
+
+
+class ElementSelectionError(ValueError):
+    """Raised when a selection cannot be applied to a project."""
+
+
+class _ModelIndex:
+    """Locate the definition of each model element in the project's model.
+
+    Every model element is assigned to its unit: the content of a Package that contains it, at any depth (e.g., a
+    Property is assigned to its Class or Relation). Packages are their own units.
+    """
+
+    def __init__(self, model_package: dict) -> None:
+        self.units: dict[str, dict] = {}
+        self.package_parents: dict[str, str | None] = {model_package["id"]: None}
+        self.unit_parents: dict[int, str] = {}
+        self.packages: dict[str, dict] = {model_package["id"]: model_package}
+
+        pending_packages = [model_package]
+        while pending_packages:
+            package = pending_packages.pop()
+            for content in package.get("contents") or []:
+                if type(content) is not dict or "id" not in content:
+                    continue
+                if content.get("type") == "Package":
+                    self.packages.setdefault(content["id"], content)
+                    self.package_parents.setdefault(content["id"], package["id"])
+                    pending_packages.append(content)
+                    continue
+                self.unit_parents[id(content)] = package["id"]
+                for node in _iter_dictionaries(content):
+                    # Dictionaries with fewer than three fields only refer to elements defined elsewhere.
+                    if "id" in node and type(node.get("type")) is str and len(node) > 2:
+                        self.units.setdefault(node["id"], content)
+
+    def get_package_chain(self, package_id: str) -> list[str]:
+        """Return the IDs of a Package and of all Packages that contain it."""
+        chain = []
+        while package_id is not None:
+            chain.append(package_id)
+            package_id = self.package_parents[package_id]
+        return chain
+
+
+def _iter_dictionaries(root: dict) -> Iterator[dict]:
+    """Yield a dictionary and all dictionaries nested in it, in document order."""
+    pending_nodes = [root]
+    while pending_nodes:
+        node = pending_nodes.pop()
+        yield node
+        children = []
+        for value in node.values():
+            if type(value) is dict:
+                children.append(value)
+            elif type(value) is list:
+                children.extend(item for item in value if type(item) is dict)
+        pending_nodes.extend(reversed(children))
+
+
+def _matches(node: dict, selectors: list[str]) -> bool:
+    """Return True if a selector is the object's ID or matches its name."""
+    name = node.get("name")
+    return any(selector == node["id"] or (type(name) is str and fnmatchcase(name, selector)) for selector in selectors)
+
+
+def _prune_package(package: dict, kept_package_ids: set[str], full_package_ids: set[str], kept_units: set[int]) -> dict:
+    """Return a shallow copy of a Package that contains only its kept contents."""
+    pruned_contents = []
+    for content in package.get("contents") or []:
+        if type(content) is not dict:
+            continue
+        if content.get("type") == "Package" and "id" in content:
+            if content["id"] in full_package_ids:
+                pruned_contents.append(content)
+            elif content["id"] in kept_package_ids:
+                pruned_contents.append(_prune_package(content, kept_package_ids, full_package_ids, kept_units))
+        elif id(content) in kept_units:
+            pruned_contents.append(content)
+
+    pruned_package = {key: value for key, value in package.items() if key != "contents"}
+    if "contents" in package:
+        pruned_package["contents"] = pruned_contents
+    return pruned_package
+
+
+def select_project_elements(json_data: dict, selectors: list[str]) -> dict:
+    """Return a copy of a project reduced to the selected Packages and Diagrams and the elements they depend on.
+
+    The returned document shares the kept dictionaries with the informed one, which is not modified.
+
+    :param json_data: OntoUML Project loaded as a dictionary, which may still contain null values.
+    :type json_data: dict
+    :param selectors: IDs of Packages or Diagrams, or fnmatch patterns matched against their names.
+    :type selectors: list[str]
+    :return: Reduced project.
+    :rtype: dict
+    :raises ElementSelectionError: If the document is not a Project or a selector matches no Package or Diagram.
+    """
+    if json_data.get("type") != "Project":
+        raise ElementSelectionError("Only the contents of a Project can be selected.")
+
+    model_package = json_data.get("model")
+    model_index = _ModelIndex(model_package) if isinstance(model_package, dict) and "id" in model_package else None
+    packages = model_index.packages if model_index is not None else {}
+    diagrams = [diagram for diagram in json_data.get("diagrams") or [] if type(diagram) is dict and "id" in diagram]
+
+    selected_package_ids = {package_id for package_id, package in packages.items() if _matches(package, selectors)}
+    selected_diagrams = [diagram for diagram in diagrams if _matches(diagram, selectors)]
+
+    candidates = [*packages.values(), *diagrams]
+    unmatched_selectors = [
+        selector for selector in selectors if not any(_matches(node, [selector]) for node in candidates)
+    ]
+    if unmatched_selectors:
+        raise ElementSelectionError(
+            f"The selector(s) {unmatched_selectors} match no Package or Diagram ID or name of the project."
+        )
+
+    selected_data = {key: value for key, value in json_data.items() if key not in ("model", "diagrams")}
+    if "diagrams" in json_data:
+        selected_data["diagrams"] = selected_diagrams
+    if model_index is None:
+        if "model" in json_data:
+            selected_data["model"] = model_package
+        return selected_data
+
+    # Selected Packages are kept with all their contents, including nested Packages.
+    full_package_ids = set()
+    kept_package_ids = set()
+    for package_id in selected_package_ids:
+        full_package_ids.update(
+            node["id"] for node in _iter_dictionaries(packages[package_id]) if node.get("type") == "Package"
+        )
+        kept_package_ids.update(model_index.get_package_chain(package_id))
+
+    # Transitively add the units of the model elements referenced by the kept objects.
+    kept_units: set[int] = set()
+    pending_roots = [packages[package_id] for package_id in selected_package_ids] + selected_diagrams
+    while pending_roots:
+        for node in _iter_dictionaries(pending_roots.pop()):
+            if "id" not in node:
+                continue
+            if node.get("type") == "Package" and node["id"] in packages:
+                kept_package_ids.update(model_index.get_package_chain(node["id"]))
+                continue
+            unit = model_index.units.get(node["id"])
+            if unit is None or id(unit) in kept_units:
+                continue
+            kept_units.add(id(unit))
+            unit_parent_id = model_index.unit_parents[id(unit)]
+            # Units of selected Packages are already visited with them.
+            if unit_parent_id not in full_package_ids:
+                kept_package_ids.update(model_index.get_package_chain(unit_parent_id))
+                pending_roots.append(unit)
+
+    if model_package["id"] in full_package_ids:
+        selected_data["model"] = model_package
+    else:
+        selected_data["model"] = _prune_package(model_package, kept_package_ids, full_package_ids, kept_units)
+    return selected_data
@@ -0,0 +1,275 @@
+"""Serve conversion jobs over a JSON-lines protocol on standard input and output.
+
+Each input line is a JSON object describing one job, and each job produces exactly one JSON response line. Jobs are
+converted in the server process or, with more than one worker, in a pool of worker processes that stay alive between
+jobs, so the OntoUML Vocabulary and the cached terms are loaded only once per process. Results returned in responses
+are kept in a bounded cache keyed by the SHA-256 hash of the JSON content and the effective options.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import TextIO
+
+from .cardinalities import INVALID_CARDINALITY_POLICIES
+from .input_output import safe_read_json_file
+from .model_element_references import UNRESOLVED_MODEL_ELEMENT_POLICIES
+from .option_values import (
+    CANONICAL_GRAPH_FORMATS,
+    GEOMETRY_ENCODINGS,
+    GRAPH_FORMATS,
+    INVALID_STEREOTYPE_POLICIES,
+    PATH_ORDER_POLICIES,
+    PROPERTY_ASSIGNMENT_POLICIES,
+)
+from .output_compression import OUTPUT_COMPRESSIONS
+from .utils_graph import get_ontouml_element_types
+
+SERVER_JOB_OPTION_VALUES = {
+    "format": GRAPH_FORMATS,
+    "compression": OUTPUT_COMPRESSIONS,
+    "invalid_cardinality_policy": INVALID_CARDINALITY_POLICIES,
+    "invalid_stereotype_policy": INVALID_STEREOTYPE_POLICIES,
+    "unresolved_model_element_policy": UNRESOLVED_MODEL_ELEMENT_POLICIES,
+    "path_order_policy": PATH_ORDER_POLICIES,
+    "property_assignment_policy": PROPERTY_ASSIGNMENT_POLICIES,
+    "geometry_encoding": GEOMETRY_ENCODINGS,
+    "transformation_metadata": ("none", "embedded"),
+}
+
+SERVER_JOB_BOOLEAN_OPTIONS = ("append_content_hash", "canonical", "correct", "model_only")
+
+SERVER_JOB_OPTIONS = (*SERVER_JOB_OPTION_VALUES, *SERVER_JOB_BOOLEAN_OPTIONS, "base_uri", "language")
+
+# Number of serialized results kept for jobs that are submitted again with the same content and options.
+SERVER_RESULT_CACHE_SIZE = 256
+
+# Conversion function run for each job: (job arguments, source name, JSON content, output file) -> result.
+ConvertJob = Callable[[dict, str, bytes, str | None], dict]
+
+
+@dataclass(frozen=True)
+class ServerJob:
+    """One conversion job read from the server's input.
+
+    :ivar job_id: Value of the job's 'id' member, echoed in its response.
+    :ivar arguments: ARGUMENTS dictionary used to convert the job.
+    :vartype arguments: dict
+    :ivar source_name: Input path of the job, or 'stdin.json' for inline content.
+    :vartype source_name: str
+    :ivar content: Raw bytes of the JSON document.
+    :vartype content: bytes
+    :ivar output_file: Path of the output file, or None to return the serialized graph in the response.
+    :vartype output_file: str or None
+    :ivar cache_key: Key of the job's result in the result cache, or None if the result is not cached.
+    :vartype cache_key: str or None
+    """
+
+    job_id: object
+    arguments: dict
+    source_name: str
+    content: bytes
+    output_file: str | None
+    cache_key: str | None
+
+
+def get_job_arguments(default_arguments: Mapping[str, object], options: Mapping[str, object]) -> dict:
+    """Return the ARGUMENTS dictionary of a job, overriding the server's arguments with the job's options.
+
+    :param default_arguments: ARGUMENTS dictionary of the server, initialized from the command line.
+    :type default_arguments: Mapping[str, object]
+    :param options: Options of the job, named as the ARGUMENTS keys.
+    :type options: Mapping[str, object]
+    :return: ARGUMENTS dictionary used to convert the job.
+    :rtype: dict
+    :raises ValueError: If an option is unknown or has an invalid value.
+    """
+    unknown_options = sorted(set(options).difference(SERVER_JOB_OPTIONS))
+    if unknown_options:
+        raise ValueError(f"Unknown job options: {unknown_options}. Valid options are: {sorted(SERVER_JOB_OPTIONS)}.")
+
+    for option, valid_values in SERVER_JOB_OPTION_VALUES.items():
+        if option in options and options[option] not in valid_values:
+            raise ValueError(f"Invalid value for job option '{option}'. Valid values are: {list(valid_values)}.")
+    for option in SERVER_JOB_BOOLEAN_OPTIONS:
+        if option in options and type(options[option]) is not bool:
+            raise ValueError(f"Job option '{option}' must be a boolean.")
+    if type(options.get("language", "")) is not str:
+        raise ValueError("Job option 'language' must be a string.")
+    if options.get("base_uri") is not None and type(options["base_uri"]) is not str:
+        raise ValueError("Job option 'base_uri' must be a string or null.")
+
+    job_arguments = {**default_arguments, **options}
+    if "base_uri" in options:
+        job_arguments["base_uri_input"] = options["base_uri"]
+    if job_arguments["format"] == "snapshot" and job_arguments["compression"] != "none":
+        raise ValueError("Graph snapshots are memory-mapped when loaded and cannot be compressed.")
+    if job_arguments["canonical"] and job_arguments["format"] not in CANONICAL_GRAPH_FORMATS:
+        raise ValueError(
+            f"Canonical output is not available for the '{job_arguments['format']}' format. "
+            f"Valid formats are: {list(CANONICAL_GRAPH_FORMATS)}."
+        )
+    return job_arguments
+
+
+def parse_server_job(job_line: str, default_arguments: Mapping[str, object]) -> ServerJob:
+    """Parse one input line of the server into a job.
+
+    A job is a JSON object with the members 'id' (optional, echoed in the response), 'content' (the JSON document, as
+    a JSON value or as a string) or 'input_path' (a JSON file, optionally gzip- or xz-compressed), 'options'
+    (optional), and 'output_file' (optional, relative to the server's output directory).
+
+    :param job_line: Input line with the job's JSON object.
+    :type job_line: str
+    :param default_arguments: ARGUMENTS dictionary of the server, initialized from the command line.
+    :type default_arguments: Mapping[str, object]
+    :return: Parsed job.
+    :rtype: ServerJob
+    :raises ValueError: If the line does not describe a valid job.
+    :raises OSError: If the job's input file cannot be read.
+    """
+    job = json.loads(job_line)
+    if not isinstance(job, dict):
+        raise ValueError("A job must be a JSON object.")
+
+    if ("content" in job) == ("input_path" in job):
+        raise ValueError("A job must have exactly one of the members 'content' and 'input_path'.")
+    if "input_path" in job:
+        source_name = str(job["input_path"])
+        content = safe_read_json_file(source_name)
+    else:
+        source_name = "stdin.json"
+        content = job["content"] if isinstance(job["content"], str) else json.dumps(job["content"])
+        content = content.encode("utf-8")
+
+    options = job.get("options", {})
+    if not isinstance(options, dict):
+        raise ValueError("The member 'options' of a job must be a JSON object.")
+    job_arguments = get_job_arguments(default_arguments, options)
+    job_arguments["input_path"] = source_name
+
+    output_file = job.get("output_file")
+    cache_key = None
+    if output_file is None and job_arguments["format"] == "snapshot":
+        raise ValueError("Graph snapshots are binary and can only be written to an 'output_file'.")
+    if output_file is not None:
+        output_file = os.path.join(default_arguments["output_path"], str(output_file))
+    else:
+        job_options = {option: job_arguments[option] for option in sorted(SERVER_JOB_OPTIONS)}
+        cache_key = hashlib.sha256(content).hexdigest() + json.dumps([source_name, job_options], sort_keys=True)
+
+    return ServerJob(job.get("id"), job_arguments, source_name, content, output_file, cache_key)
+
+
+def _run_job(convert_job: ConvertJob, job: ServerJob) -> dict:
+    """Convert a job and return its response, reporting conversion errors in the response."""
+    try:
+        response = {"status": "ok", **convert_job(job.arguments, job.source_name, job.content, job.output_file)}
+    except Exception as error:
+        response = {"status": "error", "error": f"{type(error).__name__}: {error}"}
+    return {"id": job.job_id, **response}
+
+
+class _ResultCache:
+    """Least recently used cache of job responses, safe to use from several threads."""
+
+    def __init__(self, maximum_size: int) -> None:
+        self._responses = OrderedDict()
+        self._maximum_size = maximum_size
+        self._lock = threading.Lock()
+
+    def get(self, cache_key: str) -> dict | None:
+        with self._lock:
+            response = self._responses.get(cache_key)
+            if response is not None:
+                self._responses.move_to_end(cache_key)
+            return response
+
+    def put(self, cache_key: str, response: dict) -> None:
+        with self._lock:
+            self._responses[cache_key] = response
+            self._responses.move_to_end(cache_key)
+            if len(self._responses) > self._maximum_size:
+                self._responses.popitem(last=False)
+
+
+def serve_json_lines(
+    convert_job: ConvertJob,
+    default_arguments: Mapping[str, object],
+    workers: int,
+    input_stream: TextIO,
+    output_stream: TextIO,
+) -> None:
+    """Convert the jobs read from the input stream until it ends, writing one response line per job.
+
+    With one worker, jobs are converted in order in the calling process. With more workers, jobs are converted
+    concurrently and responses are written as jobs finish; at most two jobs per worker are in progress or waiting, so
+    reading stops while the workers are busy. Responses carry the job's 'id' and a 'status' of 'ok' or 'error'.
+
+    :param convert_job: Module-level function that converts one job and returns the response members.
+    :type convert_job: ConvertJob
+    :param default_arguments: ARGUMENTS dictionary of the server, initialized from the command line.
+    :type default_arguments: Mapping[str, object]
+    :param workers: Number of jobs converted concurrently.
+    :type workers: int
+    :param input_stream: Stream with one JSON job per line.
+    :type input_stream: TextIO
+    :param output_stream: Stream that receives one JSON response per line.
+    :type output_stream: TextIO
+    """
+    result_cache = _ResultCache(SERVER_RESULT_CACHE_SIZE)
+    output_lock = threading.Lock()
+    job_slots = threading.BoundedSemaphore(2 * workers)
+
+    def write_response(response: dict, cache_key: str | None = None) -> None:
+        if cache_key is not None and response["status"] == "ok":
+            result_cache.put(cache_key, response)
+        with output_lock:
+            output_stream.write(json.dumps(response, ensure_ascii=False) + "\n")
+            output_stream.flush()
+
+    def finish_job(future: Future, cache_key: str | None) -> None:
+        try:
+            write_response(future.result(), cache_key)
+        finally:
+            job_slots.release()
+
+    # Loaded before the workers start, so forked workers inherit the parsed vocabulary.
+    get_ontouml_element_types()
+    executor = ProcessPoolExecutor(max_workers=workers, initializer=get_ontouml_element_types) if workers > 1 else None
+
+    try:
+        for job_line in input_stream:
+            if not job_line.strip():
+                continue
+
+            job_id = None
+            try:
+                job_id = json.loads(job_line).get("id")
+            except (ValueError, AttributeError):
+                pass
+            try:
+                job = parse_server_job(job_line, default_arguments)
+            except (ValueError, OSError) as error:
+                write_response({"id": job_id, "status": "error", "error": f"{type(error).__name__}: {error}"})
+                continue
+
+            cached_response = result_cache.get(job.cache_key) if job.cache_key is not None else None
+            if cached_response is not None:
+                write_response({**cached_response, "id": job.job_id, "cached": True})
+            elif executor is None:
+                write_response(_run_job(convert_job, job), job.cache_key)
+            else:
+                job_slots.acquire()
+                future = executor.submit(_run_job, convert_job, job)
+                future.add_done_callback(
+                    lambda done_future, cache_key=job.cache_key: finish_job(done_future, cache_key)
+                )
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=True)
@@ -0,0 +1,264 @@
+"""Decode a single large project in worker processes and merge the partial graphs.
+
+A project is partitioned into shards: one per top-level Package of the project's model, one for the remaining
+top-level model contents, and up to one per worker process for the diagrams. Every shard keeps the Project and the
+root model Package without their other contents, so the triples that describe them are identical in all shards and
+collapse when the partial graphs are merged.
+
+The same shards are used to decode a project that does not fit in its memory budget: they are decoded one at a time
+in this process, and their triples are spilled to disk instead of being merged in memory.
+"""
+
+import math
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+from rdflib import Graph, URIRef
+
+from . import arguments as args
+from .diagnostics import Diagnostic, DiagnosticsCollector, collect_diagnostics
+from .graph_store import create_output_graph
+from .memory_budget import check_memory_budget, estimate_graph_memory, get_available_memory, get_resident_memory
+from .messages import reissue_diagnostic
+from .metadata import METADATA
+from .source_visitor import SourceVisitor, active_type_index
+from .spilled_graph import TripleSpill
+from .utils_graph import add_collected_ontouml_terms, collect_ontouml_terms, remove_diagrammatic_resources
+from ..decoder.decode_main import decode_json_to_graph, visit_source_data
+from ..decoder.decode_obj_path import validate_path_point_order
+from ..decoder.decode_obj_property import validate_property_stereotype
+
+
+def _project_shell(project_data: dict, model_contents: list[dict] | None, diagrams: list[dict] | None) -> dict:
+    """Return a shallow copy of the project containing only the informed model contents and diagrams."""
+    shard_data = {key: value for key, value in project_data.items() if key not in ("model", "diagrams")}
+
+    model_package = project_data.get("model")
+    if isinstance(model_package, dict):
+        shard_data["model"] = {key: value for key, value in model_package.items() if key != "contents"}
+        if model_contents is not None:
+            shard_data["model"]["contents"] = model_contents
+
+    if diagrams is not None:
+        shard_data["diagrams"] = diagrams
+
+    return shard_data
+
+
+def _split_evenly(items: list[dict], parts: int) -> list[list[dict]]:
+    """Split a list into at most ``parts`` contiguous, non-empty chunks of similar length."""
+    parts = max(1, min(parts, len(items)))
+    chunk_size, remainder = divmod(len(items), parts)
+    chunks = []
+    start = 0
+    for index in range(parts):
+        end = start + chunk_size + (1 if index < remainder else 0)
+        chunks.append(items[start:end])
+        start = end
+    return chunks
+
+
+def partition_project(project_data: dict, processes: int) -> list[dict]:
+    """Partition a Project into shard documents that can be decoded independently.
+
+    :param project_data: OntoUML Project dictionary, which may still contain null values.
+    :type project_data: dict
+    :param processes: Number of worker processes, used to group diagrams into at most this number of shards.
+    :type processes: int
+    :return: Shard documents in deterministic order. A single shard means the project cannot be partitioned.
+    :rtype: list[dict]
+    """
+    if project_data.get("type") != "Project":
+        return [project_data]
+
+    model_package = project_data.get("model")
+    model_contents = (model_package.get("contents") or []) if isinstance(model_package, dict) else []
+    diagrams = [diagram for diagram in project_data.get("diagrams") or [] if isinstance(diagram, dict)]
+
+    package_contents = [content for content in model_contents if content.get("type") == "Package"]
+    other_contents = [content for content in model_contents if content.get("type") != "Package"]
+
+    shards = [_project_shell(project_data, [package], None) for package in package_contents]
+    if other_contents or not shards:
+        shards.append(_project_shell(project_data, other_contents, None))
+    for diagram_group in _split_evenly(diagrams, processes) if diagrams else []:
+        shards.append(_project_shell(project_data, None, diagram_group))
+
+    if len(shards) == 1:
+        return [project_data]
+    return shards
+
+
+def _decode_shard(
+    shard_data: dict,
+    arguments: dict,
+    language: str,
+    execution_mode: str,
+    model_element_ids: set[str],
+) -> tuple[list[tuple], list[tuple[type[Warning], str]], list[Diagnostic], set[URIRef]]:
+    """Decode one shard in a worker process.
+
+    :return: Triples of the shard, the warnings and diagnostics raised while decoding it, and its OntoUML terms.
+    """
+    args.ARGUMENTS.clear()
+    args.ARGUMENTS.update(arguments)
+
+    # All diagnostics are recorded, so the caller's collector applies its limits as in sequential decoding.
+    with (
+        warnings.catch_warnings(record=True) as caught_warnings,
+        collect_diagnostics(DiagnosticsCollector()) as shard_diagnostics,
+        collect_ontouml_terms() as used_ontouml_terms,
+    ):
+        warnings.simplefilter("always")
+        shard_graph = decode_json_to_graph(
+            shard_data,
+            language,
+            execution_mode,
+            model_element_ids=model_element_ids,
+            shard=True,
+        )
+
+    warning_records = [(caught.category, str(caught.message)) for caught in caught_warnings]
+    return list(shard_graph), warning_records, shard_diagnostics.records, used_ontouml_terms
+
+
+def decode_json_to_graph_sharded(
+    json_data: dict,
+    language: str,
+    execution_mode: str,
+    processes: int,
+    source_visitor: SourceVisitor | None = None,
+) -> Graph:
+    """Decode a project in parallel shards and merge them into the graph that a sequential decoding produces.
+
+    Shards are decoded against a read-only table with the IDs of the complete project's model, so references that
+    cross shard boundaries are resolved exactly as in sequential decoding. Warnings and diagnostics raised by workers
+    are reissued in this process in shard order. Validations and diagnostics that depend on the complete project are
+    performed after the merge.
+
+    :param json_data: Input JSON data loaded as a dictionary.
+    :type json_data: dict
+    :param language: Language tag to be added to the ontology's concepts.
+    :type language: str
+    :param execution_mode: Information about execution mode. Valid values are 'script', 'import', and 'test'.
+    :type execution_mode: str
+    :param processes: Maximum number of worker processes.
+    :type processes: int
+    :param source_visitor: Visitor with the callbacks of the caller's source policies, run in the traversal that
+                           prepares the complete project for decoding. (Optional)
+    :type source_visitor: SourceVisitor or None
+    :return: Knowledge graph that complies with the OntoUML Vocabulary
+    :rtype: Graph
+    """
+    shards = partition_project(json_data, processes)
+
+    if processes <= 1 or len(shards) == 1:
+        return decode_json_to_graph(json_data, language, execution_mode, source_visitor=source_visitor)
+
+    # The complete project is visited once, and each worker visits only its shard.
+    type_index, model_element_ids = visit_source_data(json_data, source_visitor)
+
+    with ProcessPoolExecutor(max_workers=min(processes, len(shards))) as executor:
+        shard_results = list(
+            executor.map(
+                _decode_shard,
+                shards,
+                repeat(dict(args.ARGUMENTS)),
+                repeat(language),
+                repeat(execution_mode),
+                repeat(model_element_ids),
+            )
+        )
+
+    ontouml_graph = create_output_graph()
+    ontouml_graph.bind("ontouml", METADATA["conformsToBase"])
+    ontouml_graph.bind("", args.ARGUMENTS["base_uri"])
+
+    for shard_triples, shard_warnings, shard_diagnostics, shard_ontouml_terms in shard_results:
+        for triple in shard_triples:
+            ontouml_graph.add(triple)
+        add_collected_ontouml_terms(shard_ontouml_terms)
+        for category, message in shard_warnings:
+            warnings.warn(message, category, stacklevel=2)
+        for diagnostic in shard_diagnostics:
+            reissue_diagnostic(diagnostic)
+
+    # As in sequential decoding, the compact geometry encoding preserves path order, so there is nothing to report.
+    if args.ARGUMENTS["geometry_encoding"] != "compact":
+        with active_type_index(type_index):
+            validate_path_point_order(json_data, ontouml_graph)
+    validate_property_stereotype(ontouml_graph)
+
+    return ontouml_graph
+
+
+def decode_json_to_spilled_graph(
+    json_data: dict,
+    language: str,
+    execution_mode: str,
+    max_memory: int,
+    source_visitor: SourceVisitor | None = None,
+) -> Graph:
+    """Decode a project one shard at a time within a memory budget, spilling the triples of each shard to disk.
+
+    The diagrams are grouped into as many shards as needed for each group's graph to fit in half of the memory left by
+    the budget. Before a shard is decoded, its estimated graph is checked against the budget, and after it is spilled,
+    the resident memory of the process is checked, so a project that cannot be decoded within the budget fails before
+    the process runs out of memory. The result holds the triples of a sequential decoding. Corrections of property
+    stereotypes require the complete graph in memory, so they must not be requested.
+
+    :param json_data: Input JSON data loaded as a dictionary.
+    :type json_data: dict
+    :param language: Language tag to be added to the ontology's concepts.
+    :type language: str
+    :param execution_mode: Information about execution mode. Valid values are 'script', 'import', and 'test'.
+    :type execution_mode: str
+    :param max_memory: Memory budget of the process in bytes.
+    :type max_memory: int
+    :param source_visitor: Visitor with the callbacks of the caller's source policies, run in the traversal that
+                           prepares the complete project for decoding. (Optional)
+    :type source_visitor: SourceVisitor or None
+    :return: Knowledge graph that complies with the OntoUML Vocabulary, on a SpilledTripleStore.
+    :rtype: Graph
+    :raises MemoryBudgetError: If a shard does not fit in the budget or the budget is exceeded while decoding.
+    """
+    diagrams = json_data.get("diagrams") if json_data.get("type") == "Project" else None
+    diagram_estimate = estimate_graph_memory({"diagrams": diagrams or []})
+    diagram_groups = math.ceil(diagram_estimate.graph_bytes / max(1, get_available_memory(max_memory) // 2))
+    shards = partition_project(json_data, max(1, diagram_groups))
+
+    # The complete project is visited once, and each shard is visited when it is decoded.
+    type_index, model_element_ids = visit_source_data(json_data, source_visitor)
+
+    # Memory freed by a decoded shard is reused by the next one but not returned to the operating system, so each
+    # shard is expected to fit on top of the memory used before the first one.
+    baseline_memory = get_resident_memory() or 0
+    triple_spill = TripleSpill()
+    for shard_number, shard_data in enumerate(shards, 1):
+        task = f"decoding part {shard_number} of {len(shards)}"
+        shard_estimate = estimate_graph_memory(shard_data)
+        check_memory_budget(max_memory, shard_estimate.graph_bytes, task, baseline_memory)
+        shard_graph = decode_json_to_graph(
+            shard_data,
+            language,
+            execution_mode,
+            model_element_ids=model_element_ids,
+            shard=True,
+        )
+        if args.ARGUMENTS["model_only"]:
+            remove_diagrammatic_resources(shard_graph, args.ARGUMENTS["base_uri"])
+        triple_spill.add_run(shard_graph)
+        del shard_graph
+        check_memory_budget(max_memory, 0, task)
+
+    ontouml_graph = Graph(store=triple_spill.finish())
+    ontouml_graph.bind("ontouml", METADATA["conformsToBase"])
+    ontouml_graph.bind("", args.ARGUMENTS["base_uri"])
+
+    # Path order annotations are few, so they are kept with the store's added triples in memory.
+    if args.ARGUMENTS["geometry_encoding"] != "compact":
+        with active_type_index(type_index):
+            validate_path_point_order(json_data, ontouml_graph)
+
+    return ontouml_graph
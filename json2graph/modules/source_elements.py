@@ -0,0 +1,170 @@
+"""Typed table of the identified objects of a loaded JSON document, used to resolve structural cross-references.
+
+The emitters that relate an object to the objects nested in it (e.g., a Project to all its elements, a Diagram to its
+views, or a Class to its attributes) used to walk a copy of the object's dictionary for every object and every wanted
+type. The table lists the objects once, in document order, in columns holding their type, ID, and dictionary (as
+references to the loaded values) and, in integer arrays, the positions of each type, the position of their container,
+and the end of their subtree. Since the objects nested in an object are the ones that follow it up to the end of its
+subtree, finding the nested objects of a type is an integer range lookup in the positions of that type.
+
+The table is a lookup structure: it is kept in addition to the loaded document, about six machine words per
+identified object, and it does not reduce the memory used by the document itself. Records and URIs are only created
+for the objects that a lookup returns.
+"""
+
+from array import array
+from bisect import bisect_left
+from collections import defaultdict
+from dataclasses import dataclass
+
+from rdflib import URIRef
+
+from . import arguments as args
+from .source_visitor import get_active_type_index
+
+
+@dataclass(slots=True)
+class SourceElement:
+    """One identified object of a JSON document, i.e., a dictionary with a 'type' and an 'id' field.
+
+    Records are created by the lookups of a SourceElementTable and are not stored in it.
+
+    :ivar index: Position of the object in the document order.
+    :vartype index: int
+    :ivar type: Value of the object's 'type' field.
+    :vartype type: str
+    :ivar id: Value of the object's 'id' field.
+    :vartype id: str
+    :ivar parent: Position of the nearest identified object that contains this one, or -1 if there is none.
+    :vartype parent: int
+    :ivar end: Position that follows the last identified object nested in this one.
+    :vartype end: int
+    :ivar node: Source dictionary of the object. It must not be modified through the table.
+    :vartype node: dict
+    """
+
+    index: int
+    type: str
+    id: str
+    parent: int
+    end: int
+    node: dict
+
+    @property
+    def uri(self) -> URIRef:
+        """URI of the object's individual in the output graph."""
+        return URIRef(args.ARGUMENTS["base_uri"] + self.id)
+
+
+class SourceElementTable:
+    """Identified objects of a JSON document in document order, indexed by type.
+
+    References to objects (e.g., {'id': ..., 'type': 'Class'} in a Property's 'propertyType') are identified objects
+    as well, so the lookups return the same objects as the recursive searches of the decoder.
+    """
+
+    def __init__(self, json_data: dict) -> None:
+        """Build the table of a document in a single traversal.
+
+        :param json_data: Input JSON data loaded as a dictionary.
+        :type json_data: dict
+        """
+        self._types: list[str] = []
+        self._ids: list[str] = []
+        self._nodes: list[dict] = []
+        self._parents = array("q")
+        self._ends = array("q")
+        self._indices_by_type: dict[str, array] = defaultdict(lambda: array("q"))
+
+        # Each stack entry is a dictionary and the position of the nearest identified object that contains it. A None
+        # entry closes the subtree of the identified object that was visited before its nested values.
+        pending_nodes: list[tuple[dict, int] | None] = [(json_data, -1)]
+        open_elements: list[int] = []
+        while pending_nodes:
+            pending_node = pending_nodes.pop()
+            if pending_node is None:
+                self._ends[open_elements.pop()] = len(self._ids)
+                continue
+
+            node, parent = pending_node
+            node_type = node.get("type")
+            if type(node_type) is str and "id" in node:
+                element_index = len(self._ids)
+                self._types.append(node_type)
+                self._ids.append(node["id"])
+                self._nodes.append(node)
+                self._parents.append(parent)
+                self._ends.append(-1)
+                self._indices_by_type[node_type].append(element_index)
+                open_elements.append(element_index)
+                pending_nodes.append(None)
+                parent = element_index
+
+            children = []
+            for value in node.values():
+                if type(value) is dict:
+                    children.append((value, parent))
+                elif type(value) is list:
+                    children.extend((item, parent) for item in value if type(item) is dict)
+            pending_nodes.extend(reversed(children))
+
+    def __len__(self) -> int:
+        """Return the number of identified objects in the table."""
+        return len(self._ids)
+
+    def get_element(self, index: int) -> SourceElement:
+        """Return the object at a position of the document order.
+
+        :param index: Position of the object.
+        :type index: int
+        :return: Record of the object.
+        :rtype: SourceElement
+        """
+        return SourceElement(
+            index, self._types[index], self._ids[index], self._parents[index], self._ends[index], self._nodes[index]
+        )
+
+    def get_elements(self, wanted_type: str) -> list[SourceElement]:
+        """Return the objects of a type, in document order.
+
+        :param wanted_type: Value of the 'type' field of the returned objects.
+        :type wanted_type: str
+        :return: Objects of the wanted type.
+        :rtype: list[SourceElement]
+        """
+        return [self.get_element(index) for index in self._indices_by_type.get(wanted_type, ())]
+
+    def get_nested_elements(self, element: SourceElement, wanted_type: str) -> list[SourceElement]:
+        """Return the objects of a type nested at any depth in an object, including the object itself if it matches.
+
+        :param element: Object whose subtree is searched.
+        :type element: SourceElement
+        :param wanted_type: Value of the 'type' field of the returned objects.
+        :type wanted_type: str
+        :return: Objects of the wanted type in the object's subtree, in document order.
+        :rtype: list[SourceElement]
+        """
+        indices = self._indices_by_type.get(wanted_type, ())
+        first_position = bisect_left(indices, element.index)
+        end_position = bisect_left(indices, element.end, first_position)
+        return [self.get_element(index) for index in indices[first_position:end_position]]
+
+
+def get_source_elements(json_data: dict) -> SourceElementTable:
+    """Return the table of a document, built once per conversion while the document's type index is active.
+
+    Without an active type index (e.g., when a decoder function is called directly), a new table is built.
+
+    :param json_data: Document whose identified objects are requested.
+    :type json_data: dict
+    :return: Table of the document's identified objects.
+    :rtype: SourceElementTable
+    """
+    type_index = get_active_type_index(json_data)
+    if type_index is None:
+        return SourceElementTable(json_data)
+
+    # Built on first use, after objects omitted by the source policies were removed from the document.
+    if type_index.source_elements is None:
+        type_index.source_elements = SourceElementTable(json_data)
+    return type_index.source_elements
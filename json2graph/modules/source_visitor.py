@@ -0,0 +1,188 @@
+"""Visit the dictionaries of a loaded JSON document in a single traversal shared by all source policies.
+
+Policies that inspect or prepare the source data before it is decoded (e.g., collecting property assignments, removing
+null values, or indexing objects by type) register callbacks in a SourceVisitor instead of walking the document on
+their own. The visitor reaches the same dictionaries as the decoder: dictionaries nested in other dictionaries and
+dictionaries that are items of lists.
+"""
+
+from collections import defaultdict
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+
+# Callback invoked with each visited dictionary.
+SourceCallback = Callable[[dict], None]
+
+# Type indexes used by get_list_subdictionaries_for_specific_type while their documents are decoded.
+_ACTIVE_TYPE_INDEXES: list["SourceTypeIndex"] = []
+
+
+class SourceVisitor:
+    """Dispatch every dictionary of a JSON document to the callbacks registered for it, in a single traversal.
+
+    Dictionaries are visited in document order, each one before its nested dictionaries. The callbacks of a
+    dictionary are invoked in registration order, so a callback that modifies the dictionary (e.g., removing its null
+    values) must be registered after the callbacks that need to see it unchanged. Callbacks may modify the visited
+    dictionary, as its nested values are read only after all its callbacks return.
+    """
+
+    def __init__(self) -> None:
+        """Create a visitor without callbacks."""
+        self._callbacks: list[tuple[str | None, SourceCallback]] = []
+
+    def register(self, callback: SourceCallback, node_type: str | None = None) -> None:
+        """Register a callback for the dictionaries of a type or, if no type is informed, for all dictionaries.
+
+        :param callback: Function invoked with each matching dictionary.
+        :type callback: SourceCallback
+        :param node_type: Value of the 'type' field of the dictionaries passed to the callback. (Optional)
+        :type node_type: str or None
+        """
+        self._callbacks.append((node_type, callback))
+
+    def visit(self, json_data: dict) -> None:
+        """Traverse the document once, invoking the registered callbacks for each of its dictionaries.
+
+        :param json_data: Input JSON data loaded as a dictionary.
+        :type json_data: dict
+        """
+        generic_callbacks = [callback for node_type, callback in self._callbacks if node_type is None]
+        # Callbacks of each type, merged with the generic ones in registration order.
+        typed_callbacks = {
+            wanted_type: [callback for node_type, callback in self._callbacks if node_type in (None, wanted_type)]
+            for wanted_type in {node_type for node_type, _ in self._callbacks if node_type is not None}
+        }
+
+        # An explicit stack keeps deeply nested documents within the interpreter's recursion limit.
+        pending_nodes = [json_data]
+        while pending_nodes:
+            node = pending_nodes.pop()
+
+            node_type = node.get("type")
+            callbacks = (
+                typed_callbacks.get(node_type, generic_callbacks) if type(node_type) is str else generic_callbacks
+            )
+            for callback in callbacks:
+                callback(node)
+
+            children = []
+            for value in node.values():
+                if type(value) is dict:
+                    children.append(value)
+                elif type(value) is list:
+                    children.extend(item for item in value if type(item) is dict)
+            pending_nodes.extend(reversed(children))
+
+
+def remove_null_values(node: dict) -> None:
+    """Remove the fields of a dictionary whose values are None. Registered last, after all other source callbacks.
+
+    :param node: Visited dictionary.
+    :type node: dict
+    """
+    for key in [key for key, value in node.items() if value is None]:
+        del node[key]
+
+
+class SourceTypeIndex:
+    """Index the dictionaries of a document by their 'type' field while the document is visited.
+
+    The decoder functions request the dictionaries of each object type from the index instead of walking the whole
+    document once per type.
+    """
+
+    def __init__(self, json_data: dict) -> None:
+        """Create an empty index, filled when it is registered in the visitor of the document.
+
+        :param json_data: Document whose dictionaries are indexed.
+        :type json_data: dict
+        """
+        self.json_data = json_data
+        self._nodes_by_type: dict[str, list[dict]] = defaultdict(list)
+        # Table of the document's identified objects, built by source_elements.get_source_elements on first use.
+        self.source_elements = None
+
+    def register(self, visitor: SourceVisitor) -> None:
+        """Register the indexing callback in a visitor.
+
+        :param visitor: Visitor of the indexed document.
+        :type visitor: SourceVisitor
+        """
+        visitor.register(self._add_node)
+
+    def _add_node(self, node: dict) -> None:
+        # Only string types can match the types requested by the decoder functions.
+        if type(node.get("type")) is str:
+            self._nodes_by_type[node["type"]].append(node)
+
+    def discard(self, removed_node: dict) -> None:
+        """Remove from the index a dictionary, and its nested dictionaries, removed from the document after the visit.
+
+        :param removed_node: Dictionary removed from the indexed document.
+        :type removed_node: dict
+        """
+        removed_ids = set()
+        pending_nodes = [removed_node]
+        while pending_nodes:
+            node = pending_nodes.pop()
+            removed_ids.add(id(node))
+            for value in node.values():
+                if type(value) is dict:
+                    pending_nodes.append(value)
+                elif type(value) is list:
+                    pending_nodes.extend(item for item in value if type(item) is dict)
+
+        for node_type, nodes in self._nodes_by_type.items():
+            self._nodes_by_type[node_type] = [node for node in nodes if id(node) not in removed_ids]
+
+    def get_copies(self, wanted_type: str) -> list[dict]:
+        """Return copies of the indexed dictionaries of a type, in document order.
+
+        :param wanted_type: Value of the 'type' field of the returned dictionaries.
+        :type wanted_type: str
+        :return: List of copies of the dictionaries of the wanted type.
+        :rtype: list[dict]
+        """
+        return [node.copy() for node in self._nodes_by_type.get(wanted_type, [])]
+
+
+@contextmanager
+def active_type_index(type_index: SourceTypeIndex) -> Iterator[None]:
+    """Answer the whole-document type lookups of the decoder functions from an index while the context is active.
+
+    :param type_index: Index of a completely visited document.
+    :type type_index: SourceTypeIndex
+    """
+    _ACTIVE_TYPE_INDEXES.append(type_index)
+    try:
+        yield
+    finally:
+        _ACTIVE_TYPE_INDEXES.remove(type_index)
+
+
+def get_active_type_index(json_data: dict) -> SourceTypeIndex | None:
+    """Return the active index of a document, or None if no active index covers it.
+
+    :param json_data: Indexed document.
+    :type json_data: dict
+    :return: Active index of the document, if any.
+    :rtype: SourceTypeIndex or None
+    """
+    for type_index in _ACTIVE_TYPE_INDEXES:
+        if type_index.json_data is json_data:
+            return type_index
+    return None
+
+
+def get_indexed_subdictionaries(json_data: dict, wanted_type: str) -> list[dict] | None:
+    """Return copies of a document's dictionaries of a type from its active index, or None if it is not indexed.
+
+    :param json_data: Document whose dictionaries are requested.
+    :type json_data: dict
+    :param wanted_type: Value of the 'type' field of the returned dictionaries.
+    :type wanted_type: str
+    :return: List of copies of the dictionaries of the wanted type, or None if no active index covers the document.
+    :rtype: list[dict] or None
+    """
+    type_index = get_active_type_index(json_data)
+    return None if type_index is None else type_index.get_copies(wanted_type)
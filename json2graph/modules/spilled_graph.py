@@ -0,0 +1,283 @@
+"""Keep the triples of a decoded graph in a temporary N-Triples file instead of memory.
+
+A project that does not fit in the memory budget is decoded one shard at a time. The triples of each shard are written
+to a temporary file as a run of sorted, distinct N-Triples lines, and the shard's graph is discarded. When all shards
+are decoded, the runs are merged into one sorted file without duplicates, i.e., the triples that are shared by several
+shards (e.g., the ones describing the Project) are kept once.
+
+The resulting graph is read-only for its decoded triples. Iterating over it or matching a triple pattern reads the
+file, and writing it as N-Triples copies the file's lines, so only a few lines are in memory at a time. Triples added
+afterward (e.g., transformation metadata or annotations of the source policies) are kept in memory and merged with
+the file's triples.
+"""
+
+import heapq
+import os
+import tempfile
+from collections.abc import Iterable, Iterator
+from typing import TextIO
+
+from rdflib import BNode, Graph, Literal, URIRef
+from rdflib.plugins.stores.memory import Memory
+from rdflib.term import Node
+
+from .canonical_output import format_ntriples_term, with_canonical_blank_nodes
+from .utils_graph import fix_uri
+
+# Serializations written directly from the file of a spilled graph.
+NTRIPLES_FORMATS = ("ntriples", "nt", "nt11")
+
+# Maximum number of files merged at once, which is also the maximum number of files open at once.
+_MERGE_FAN_IN = 64
+
+_STRING_UNESCAPES = {"b": "\b", "t": "\t", "n": "\n", "f": "\f", "r": "\r", '"': '"', "\\": "\\"}
+
+
+def _format_spilled_term(term: Node) -> str:
+    """Return the N-Triples representation of a term, percent-encoding IRIs that are not valid in N-Triples."""
+    try:
+        return format_ntriples_term(term)
+    except ValueError:
+        if not isinstance(term, URIRef):
+            raise
+        return format_ntriples_term(URIRef(fix_uri(str(term))))
+
+
+def _format_line(triple: tuple[Node, Node, Node]) -> str:
+    """Return the N-Triples line of a triple."""
+    subject, predicate, obj = triple
+    return f"{_format_spilled_term(subject)} {_format_spilled_term(predicate)} {_format_spilled_term(obj)} .\n"
+
+
+def _unescape_string(escaped_string: str) -> str:
+    """Return the lexical form of a literal whose characters were escaped by format_ntriples_term."""
+    if "\\" not in escaped_string:
+        return escaped_string
+
+    characters = []
+    position = 0
+    while position < len(escaped_string):
+        character = escaped_string[position]
+        if character != "\\":
+            characters.append(character)
+            position += 1
+        elif escaped_string[position + 1] == "u":
+            code_point_start, code_point_end = position + 2, position + 6
+            characters.append(chr(int(escaped_string[code_point_start:code_point_end], 16)))
+            position = code_point_end
+        else:
+            characters.append(_STRING_UNESCAPES[escaped_string[position + 1]])
+            position += 2
+    return "".join(characters)
+
+
+def _parse_term(formatted_term: str) -> Node:
+    """Return the term of an N-Triples representation written by _format_spilled_term."""
+    if formatted_term[0] == "<":
+        return URIRef(formatted_term[1:-1])
+    if formatted_term[0] == "_":
+        return BNode(formatted_term[2:])
+
+    closing_quote = formatted_term.rindex('"')
+    lexical_form = _unescape_string(formatted_term[1:closing_quote])
+    suffix_start = closing_quote + 1
+    suffix = formatted_term[suffix_start:]
+    if suffix.startswith("@"):
+        return Literal(lexical_form, lang=suffix[1:])
+    if suffix.startswith("^^"):
+        return Literal(lexical_form, datatype=URIRef(suffix[3:-1]))
+    return Literal(lexical_form)
+
+
+def _split_line(line: str) -> tuple[str, str, str]:
+    """Return the formatted subject, predicate, and object of an N-Triples line written by _format_line."""
+    # Formatted IRIs and blank nodes contain no spaces, and the object is followed by ' .\n'.
+    subject, predicate, obj = line.split(" ", 2)
+    return subject, predicate, obj[:-3]
+
+
+def _iter_distinct(lines: Iterable[str]) -> Iterator[str]:
+    """Yield the lines of a sorted iterable, skipping repeated lines."""
+    previous_line = None
+    for line in lines:
+        if line != previous_line:
+            yield line
+            previous_line = line
+
+
+def _merge_files(input_paths: list[str], output_path: str) -> int:
+    """Merge sorted files into one sorted file without repeated lines, returning its number of lines."""
+    line_count = 0
+    input_files = [open(input_path, encoding="utf-8", newline="\n") for input_path in input_paths]
+    try:
+        with open(output_path, "w", encoding="utf-8", newline="\n") as output_file:
+            for line in _iter_distinct(heapq.merge(*input_files)):
+                output_file.write(line)
+                line_count += 1
+    finally:
+        for input_file in input_files:
+            input_file.close()
+    for input_path in input_paths:
+        os.remove(input_path)
+    return line_count
+
+
+class TripleSpill:
+    """Collect the triples of a graph as sorted runs in a temporary directory, until they are merged into a store."""
+
+    def __init__(self) -> None:
+        """Create the temporary directory of the spill, in the directory used by the tempfile module."""
+        self._directory = tempfile.TemporaryDirectory(prefix="json2graph-spill-")
+        self._run_paths: list[str] = []
+        self._file_count = 0
+        self._has_blank_nodes = False
+
+    def _get_new_path(self) -> str:
+        """Return the path of a new file in the spill's directory."""
+        self._file_count += 1
+        return os.path.join(self._directory.name, f"{self._file_count:06d}.nt")
+
+    def add_run(self, triples: Iterable[tuple[Node, Node, Node]]) -> None:
+        """Write a set of triples to disk as a sorted run without repeated lines.
+
+        :param triples: Triples to be spilled, e.g., a graph. Its lines are sorted in memory.
+        :type triples: Iterable[tuple[Node, Node, Node]]
+        """
+        lines = set()
+        for triple in triples:
+            lines.add(_format_line(triple))
+            if not self._has_blank_nodes and (isinstance(triple[0], BNode) or isinstance(triple[2], BNode)):
+                self._has_blank_nodes = True
+
+        run_path = self._get_new_path()
+        with open(run_path, "w", encoding="utf-8", newline="\n") as run_file:
+            run_file.writelines(sorted(lines))
+        self._run_paths.append(run_path)
+
+    def finish(self) -> "SpilledTripleStore":
+        """Merge the runs into one sorted file without repeated lines and return the store that reads it.
+
+        Runs are merged in passes of at most _MERGE_FAN_IN files. The spill cannot be used afterward.
+
+        :return: Store of the spilled triples, which owns the temporary directory.
+        :rtype: SpilledTripleStore
+        """
+        run_paths = self._run_paths or [self._get_new_path()]
+        if not self._run_paths:
+            open(run_paths[0], "w", encoding="utf-8").close()
+
+        while True:
+            merged_paths = []
+            for start in range(0, len(run_paths), _MERGE_FAN_IN):
+                merged_path = self._get_new_path()
+                end = start + _MERGE_FAN_IN
+                line_count = _merge_files(run_paths[start:end], merged_path)
+                merged_paths.append(merged_path)
+            run_paths = merged_paths
+            if len(run_paths) == 1:
+                break
+
+        self._run_paths = []
+        return SpilledTripleStore(self._directory, run_paths[0], line_count, self._has_blank_nodes)
+
+
+class SpilledTripleStore(Memory):
+    """Store whose decoded triples are read from a sorted N-Triples file, and whose added triples are kept in memory.
+
+    Decoded triples cannot be removed: removing a pattern only removes the matching added triples. Closing the store
+    deletes its temporary directory.
+    """
+
+    def __init__(
+        self,
+        spill_directory: tempfile.TemporaryDirectory,
+        spill_file_path: str,
+        triple_count: int,
+        has_blank_nodes: bool,
+    ) -> None:
+        """Create the store of a merged spill. Use TripleSpill.finish instead.
+
+        :param spill_directory: Temporary directory that holds the spill file, deleted when the store is closed.
+        :type spill_directory: tempfile.TemporaryDirectory
+        :param spill_file_path: Path of the sorted N-Triples file without repeated lines.
+        :type spill_file_path: str
+        :param triple_count: Number of lines of the file.
+        :type triple_count: int
+        :param has_blank_nodes: If False, the file has no blank nodes, so patterns with blank nodes do not read it.
+        :type has_blank_nodes: bool
+        """
+        super().__init__()
+        self._spill_directory = spill_directory
+        self._spill_file_path = spill_file_path
+        self._spilled_triple_count = triple_count
+        self._has_blank_nodes = has_blank_nodes
+
+    def _iter_lines(self, context: Graph | None, include_spilled: bool = True) -> Iterator[str]:
+        """Yield the sorted, distinct lines of the spilled triples and of the triples added in the context."""
+        added_lines = sorted({_format_line(triple) for triple, _ in super().triples((None, None, None), context)})
+        if not include_spilled:
+            yield from added_lines
+            return
+
+        with open(self._spill_file_path, encoding="utf-8", newline="\n") as spill_file:
+            yield from _iter_distinct(heapq.merge(spill_file, added_lines))
+
+    def triples(self, triple_pattern: tuple, context: Graph | None = None) -> Iterator[tuple[tuple, Iterator]]:
+        """Yield the triples that match a pattern, reading the spill file once.
+
+        :param triple_pattern: Subject, predicate, and object of the pattern, with None for unbound terms.
+        :type triple_pattern: tuple
+        :param context: Graph in which the triples are searched.
+        :type context: Graph or None
+        :return: Iterator of the matching triples, each with an iterator of its contexts.
+        :rtype: Iterator[tuple[tuple, Iterator]]
+        """
+        bound_terms = [None if term is None else _format_spilled_term(term) for term in triple_pattern]
+        include_spilled = self._has_blank_nodes or not any(isinstance(term, BNode) for term in triple_pattern)
+
+        for line in self._iter_lines(context, include_spilled):
+            formatted_triple = _split_line(line)
+            if all(bound is None or bound == term for bound, term in zip(bound_terms, formatted_triple)):
+                yield tuple(_parse_term(term) for term in formatted_triple), iter((context,))
+
+    def __len__(self, context: Graph | None = None) -> int:
+        """Return the number of distinct triples of the store, reading the spill file if triples were added."""
+        if not super().__len__(context):
+            return self._spilled_triple_count
+        return sum(1 for _ in self._iter_lines(context))
+
+    def close(self, commit_pending_transaction: bool = False) -> None:
+        """Delete the spill file and its temporary directory."""
+        self._spill_directory.cleanup()
+
+    def write_ntriples(self, output_stream: TextIO, canonical: bool = False) -> None:
+        """Write all triples of the store as sorted N-Triples, copying the lines of the spill file.
+
+        :param output_stream: Text stream that receives the N-Triples document.
+        :type output_stream: TextIO
+        :param canonical: If True, the blank nodes of the added triples are relabeled canonically. (Optional)
+        :type canonical: bool
+        :raises ValueError: If canonical output is requested and the spill file has blank nodes.
+        """
+        if not canonical:
+            output_stream.writelines(self._iter_lines(None))
+            return
+
+        if self._has_blank_nodes:
+            raise ValueError("Canonical output is not available for a spilled graph with blank nodes.")
+        added_graph = Graph()
+        added_graph.addN((*triple, added_graph) for triple, _ in super().triples((None, None, None)))
+        added_lines = sorted({_format_line(triple) for triple in with_canonical_blank_nodes(added_graph)})
+        with open(self._spill_file_path, encoding="utf-8", newline="\n") as spill_file:
+            output_stream.writelines(_iter_distinct(heapq.merge(spill_file, added_lines)))
+
+
+def is_spilled_graph(ontouml_graph: Graph) -> bool:
+    """Return True if the graph's triples are kept in a spill file.
+
+    :param ontouml_graph: Graph to be checked.
+    :type ontouml_graph: Graph
+    :return: True if the graph is on a SpilledTripleStore.
+    :rtype: bool
+    """
+    return isinstance(ontouml_graph.store, SpilledTripleStore)
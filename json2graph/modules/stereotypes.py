@@ -1,14 +1,15 @@
 """Normalize OntoUML stereotypes and apply the configured handling policy."""
 
 import re
-import warnings
+from functools import lru_cache
 
 from rdflib import Graph, URIRef
 
+from .diagnostics import issue_warning
+from .option_values import INVALID_STEREOTYPE_POLICIES
+from .utils_general import SOURCE_VALUE_CACHE_SIZE
 from .utils_graph import ontouml_ref
 
-INVALID_STEREOTYPE_POLICIES = ("preserve", "omit", "error")
-
 CLASS_STEREOTYPES = frozenset(
     {
         "abstract",
@@ -80,6 +81,7 @@ class StereotypeNormalizationWarning(UserWarning):
     """Warn that a lexical stereotype variant was normalized to its canonical value."""
 
 
+@lru_cache(maxsize=SOURCE_VALUE_CACHE_SIZE)
 def normalize_stereotype(stereotype: str) -> str:
     """Convert a stereotype value to lowerCamelCase for use as an IRI fragment."""
     words = re.findall(
@@ -93,8 +95,38 @@ def normalize_stereotype(stereotype: str) -> str:
     return first_word + "".join(word.lower().capitalize() for word in words[1:])
 
 
-def set_stereotype_relation(element_dict: dict, ontouml_graph: Graph, policy: str, base_uri: str) -> None:
-    """Normalize and set an element's stereotype according to the selected policy."""
+@lru_cache(maxsize=SOURCE_VALUE_CACHE_SIZE)
+def _classify_stereotype(element_type: str, stereotype: str) -> tuple[str, str | None]:
+    """Return the normalized stereotype and, if it is invalid for the element type, the message details about the \
+    element types for which it is recognized."""
+    normalized_stereotype = normalize_stereotype(stereotype)
+    if normalized_stereotype in STEREOTYPES_BY_ELEMENT_TYPE.get(element_type, frozenset()):
+        return normalized_stereotype, None
+
+    recognized_element_types = [
+        recognized_type
+        for recognized_type, stereotypes in STEREOTYPES_BY_ELEMENT_TYPE.items()
+        if normalized_stereotype in stereotypes
+    ]
+    if recognized_element_types:
+        return (
+            normalized_stereotype,
+            f" It is recognized for {', '.join(recognized_element_types)}, but not for {element_type}.",
+        )
+    return normalized_stereotype, " It is not recognized for any supported element type."
+
+
+def resolve_stereotype(element_dict: dict, policy: str) -> str | None:
+    """Normalize an element's stereotype and validate it for the element's type according to the selected policy.
+
+    :param element_dict: Class, Relation, or Property dictionary with a 'stereotype' field.
+    :type element_dict: dict
+    :param policy: One of ``preserve``, ``omit``, or ``error``.
+    :type policy: str
+    :return: Normalized stereotype to be asserted for the element, or None if the policy omits it.
+    :rtype: str or None
+    :raises InvalidStereotypeError: If the stereotype is invalid and the policy is ``error``.
+    """
     if policy not in INVALID_STEREOTYPE_POLICIES:
         raise ValueError(
             f"Invalid stereotype policy '{policy}'. Valid values are: {list(INVALID_STEREOTYPE_POLICIES)}."
@@ -102,25 +134,11 @@ def set_stereotype_relation(element_dict: dict, ontouml_graph: Graph, policy: st
 
     element_type = element_dict["type"]
     original_stereotype = element_dict["stereotype"]
-    normalized_stereotype = normalize_stereotype(original_stereotype)
-    valid_stereotypes = STEREOTYPES_BY_ELEMENT_TYPE.get(element_type, frozenset())
-    stereotype_is_valid = normalized_stereotype in valid_stereotypes
+    # The classification of each distinct value is computed once, while the warnings are issued for every element.
+    normalized_stereotype, recognition_details = _classify_stereotype(element_type, original_stereotype)
 
-    if not stereotype_is_valid:
+    if recognition_details is not None:
         element_id = element_dict["id"]
-        recognized_element_types = [
-            recognized_type
-            for recognized_type, stereotypes in STEREOTYPES_BY_ELEMENT_TYPE.items()
-            if normalized_stereotype in stereotypes
-        ]
-
-        if recognized_element_types:
-            recognition_details = (
-                f" It is recognized for {', '.join(recognized_element_types)}, but not for {element_type}."
-            )
-        else:
-            recognition_details = " It is not recognized for any supported element type."
-
         message = (
             f"{element_type} with ID '{element_id}' has stereotype '{original_stereotype}', normalized as "
             f"'{normalized_stereotype}', which is not valid for {element_type}.{recognition_details}"
@@ -130,22 +148,33 @@ def set_stereotype_relation(element_dict: dict, ontouml_graph: Graph, policy: st
             raise InvalidStereotypeError(f"{message} Transformation aborted.")
 
         action = "preserved" if policy == "preserve" else "omitted"
-        warnings.warn(
+        issue_warning(
             f"{message} The stereotype triple was {action} because the invalid stereotype policy is '{policy}'.",
             InvalidStereotypeWarning,
-            stacklevel=2,
+            element_id=element_dict["id"],
+            stacklevel=3,
         )
 
         if policy == "omit":
-            return
+            return None
 
     elif original_stereotype != normalized_stereotype:
-        warnings.warn(
+        issue_warning(
             f"{element_type} with ID '{element_dict['id']}' has stereotype '{original_stereotype}', which was "
             f"normalized to the canonical {element_type} stereotype '{normalized_stereotype}'.",
             StereotypeNormalizationWarning,
-            stacklevel=2,
+            element_id=element_dict["id"],
+            stacklevel=3,
         )
 
+    return normalized_stereotype
+
+
+def set_stereotype_relation(element_dict: dict, ontouml_graph: Graph, policy: str, base_uri: str) -> None:
+    """Normalize and set an element's stereotype according to the selected policy."""
+    normalized_stereotype = resolve_stereotype(element_dict, policy)
+    if normalized_stereotype is None:
+        return
+
     element_uri = URIRef(base_uri + element_dict["id"])
     ontouml_graph.add((element_uri, ontouml_ref("stereotype"), ontouml_ref(normalized_stereotype)))
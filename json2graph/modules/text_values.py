@@ -1,6 +1,7 @@
 """Validation helpers for legacy textual values on diagrammatic Text shapes."""
 
-import warnings
+from .diagnostics import issue_warning
+from .source_visitor import SourceVisitor
 
 
 class UnsupportedTextValueWarning(UserWarning):
@@ -22,9 +23,25 @@ def warn_if_text_value_is_unsupported(text_shape: dict) -> None:
     value = text_shape.get("value")
 
     if value not in (None, ""):
-        warnings.warn(
+        issue_warning(
             f"Text shape '{text_shape['id']}' contains unsupported non-empty field 'value' ({value!r}). "
             "OntoUML Vocabulary v1.1.1 does not define a property for Text shape content, so the value was omitted.",
             UnsupportedTextValueWarning,
+            element_id=text_shape["id"],
             stacklevel=3,
         )
+
+
+def _validate_text_shape(text_shape: dict) -> None:
+    # Objects without ID are not decoded.
+    if "id" in text_shape:
+        warn_if_text_value_is_unsupported(text_shape)
+
+
+def register_text_value_validation(visitor: SourceVisitor) -> None:
+    """Register in a source visitor the validation of the ``value`` field of all Text shapes.
+
+    :param visitor: Visitor of the source data.
+    :type visitor: SourceVisitor
+    """
+    visitor.register(_validate_text_shape, "Text")
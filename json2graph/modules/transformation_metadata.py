@@ -2,17 +2,16 @@
 
 import hashlib
 import json
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime, timezone
-from functools import lru_cache
 from pathlib import Path
 from typing import Mapping
 
 from rdflib import BNode, Graph, Literal, Namespace, RDF, URIRef, XSD
 
 from .metadata import METADATA
-from .utils_graph import load_ontouml_vocabulary
-
-TRANSFORMATION_METADATA_MODES = ("none", "embedded", "sidecar")
+from .utils_graph import get_graph_ontouml_terms, get_ontouml_vocabulary_tables
 
 DCTERMS = Namespace("http://purl.org/dc/terms/")
 PROV = Namespace("http://www.w3.org/ns/prov#")
@@ -40,10 +39,16 @@ RDF_MEDIA_TYPES = {
 }
 
 CONFIGURATION_FIELDS = (
+    "batch_dataset",
+    "canonical",
+    "compression",
+    "geometry_encoding",
     "language",
     "model_only",
+    "partition",
     "path_order_policy",
     "property_assignment_policy",
+    "select",
     "correct",
     "invalid_cardinality_policy",
     "invalid_stereotype_policy",
@@ -75,8 +80,11 @@ def get_rdf_media_type(graph_format: str) -> URIRef | None:
     return URIRef(IANA_MEDIA_TYPE_BASE + media_type)
 
 
-def _sha256_identifier(input_file_path: str) -> str:
-    """Return a SHA-256 identifier for an input file without exposing its path."""
+def _sha256_identifier(input_file_path: str, input_content: bytes | None = None) -> str:
+    """Return a SHA-256 identifier for an input file, or for its already read content, without exposing its path."""
+    if input_content is not None:
+        return f"sha256:{hashlib.sha256(input_content).hexdigest()}"
+
     digest = hashlib.sha256()
     with open(input_file_path, "rb") as input_file:
         for chunk in iter(lambda: input_file.read(65536), b""):
@@ -84,20 +92,21 @@ def _sha256_identifier(input_file_path: str) -> str:
     return f"sha256:{digest.hexdigest()}"
 
 
-@lru_cache(maxsize=1)
 def _defined_ontouml_terms() -> frozenset[URIRef]:
     """Return the terms declared by the bundled OntoUML Vocabulary revision."""
-    vocabulary_graph = load_ontouml_vocabulary()
-    namespace = METADATA["conformsToBase"]
-    return frozenset(
-        subject
-        for subject in vocabulary_graph.subjects()
-        if isinstance(subject, URIRef) and str(subject).startswith(namespace)
-    )
+    return get_ontouml_vocabulary_tables().defined_terms
 
 
 def uses_only_declared_ontouml_terms(ontouml_graph: Graph) -> bool:
-    """Check that every used OntoUML predicate and object term is declared."""
+    """Check that every used OntoUML predicate and object term is declared.
+
+    The terms registered by the decoder for the graph are checked first. The graph's triples are only scanned when no
+    terms are registered or when a registered term is not declared, as it may have been referenced without being used.
+    """
+    registered_terms = get_graph_ontouml_terms(ontouml_graph)
+    if registered_terms is not None and registered_terms.issubset(_defined_ontouml_terms()):
+        return True
+
     namespace = METADATA["conformsToBase"]
     used_terms = {
         term
@@ -115,8 +124,14 @@ def build_transformation_metadata(
     graph_format: str,
     configuration: Mapping[str, object],
     generated_at: datetime | None = None,
+    include_generation_time: bool = True,
+    input_content: bytes | None = None,
 ) -> Graph:
-    """Describe the output artifact and the activity that generated it."""
+    """Describe the output artifact and the activity that generated it.
+
+    Canonical output omits the generation time, so that the same input and configuration always produce the same
+    provenance. Archive members are identified by their content, which is informed because they have no file path.
+    """
     metadata_graph = Graph()
     metadata_graph.bind("dct", DCTERMS)
     metadata_graph.bind("prov", PROV)
@@ -128,14 +143,15 @@ def build_transformation_metadata(
     software_agent = BNode("software-agent")
     configuration_entity = BNode("transformation-configuration")
 
-    generation_time = generated_at or datetime.now(timezone.utc)
-    generation_time = generation_time.astimezone(timezone.utc)
-    generation_literal = Literal(generation_time.isoformat().replace("+00:00", "Z"), datatype=XSD.dateTime)
-
     metadata_graph.add((output_artifact, RDF.type, PROV.Entity))
     metadata_graph.add((output_artifact, DCTERMS.title, Literal(output_file_name)))
     metadata_graph.add((output_artifact, PROV.wasGeneratedBy, transformation))
-    metadata_graph.add((output_artifact, PROV.generatedAtTime, generation_literal))
+
+    if include_generation_time:
+        generation_time = generated_at or datetime.now(timezone.utc)
+        generation_time = generation_time.astimezone(timezone.utc)
+        generation_literal = Literal(generation_time.isoformat().replace("+00:00", "Z"), datatype=XSD.dateTime)
+        metadata_graph.add((output_artifact, PROV.generatedAtTime, generation_literal))
 
     output_media_type = get_rdf_media_type(graph_format)
     if output_media_type is not None:
@@ -152,7 +168,9 @@ def build_transformation_metadata(
 
     metadata_graph.add((source_artifact, RDF.type, PROV.Entity))
     metadata_graph.add((source_artifact, DCTERMS.title, Literal(Path(input_file_path).name)))
-    metadata_graph.add((source_artifact, DCTERMS.identifier, Literal(_sha256_identifier(input_file_path))))
+    metadata_graph.add(
+        (source_artifact, DCTERMS.identifier, Literal(_sha256_identifier(input_file_path, input_content)))
+    )
     metadata_graph.add((source_artifact, DCTERMS["format"], JSON_MEDIA_TYPE))
 
     metadata_graph.add((software_agent, RDF.type, PROV.SoftwareAgent))
@@ -178,11 +196,23 @@ def build_transformation_metadata(
     return metadata_graph
 
 
-def graph_with_metadata(ontouml_graph: Graph, metadata_graph: Graph) -> Graph:
-    """Return a graph containing model and metadata triples without mutating the model graph."""
-    combined_graph = Graph()
-    for prefix, namespace in ontouml_graph.namespaces():
-        combined_graph.bind(prefix, namespace)
-    combined_graph += ontouml_graph
-    combined_graph += metadata_graph
-    return combined_graph
+@contextmanager
+def embedded_metadata(ontouml_graph: Graph, metadata_graph: Graph) -> Iterator[Graph]:
+    """Add the metadata triples to the model graph while the context is active, without copying the model graph.
+
+    On exit, only the triples that were added are removed, so the model graph is left as it was.
+
+    :param ontouml_graph: Model graph that temporarily receives the metadata triples.
+    :type ontouml_graph: Graph
+    :param metadata_graph: Graph with the transformation metadata.
+    :type metadata_graph: Graph
+    :return: Context manager yielding the model graph with the metadata triples.
+    :rtype: Iterator[Graph]
+    """
+    added_triples = [triple for triple in metadata_graph if triple not in ontouml_graph]
+    ontouml_graph.addN((*triple, ontouml_graph) for triple in added_triples)
+    try:
+        yield ontouml_graph
+    finally:
+        for triple in added_triples:
+            ontouml_graph.remove(triple)
@@ -0,0 +1,163 @@
+"""Deterministic Turtle writer specialized for the decoder's output graphs.
+
+The decoder's graphs use a few namespaces (the base URI, ontouml:, xsd:, and rdfs:), have simple subjects, and
+contain literals of a small set of datatypes. This writer serializes them in a single pass over the graph, without
+the subject-grouping and prefix-resolution analysis performed by RDFLib's generic Turtle serializer.
+
+Subjects, predicates, and objects are written in sorted order, so the same graph is always written with the same
+bytes. Blank-node labels are written as they are; canonical output relabels them beforehand.
+"""
+
+import re
+from typing import TextIO
+
+from rdflib import RDF, XSD, BNode, Graph, Literal, URIRef
+
+# Characters that cannot occur in an IRIREF (Turtle grammar, production [18]).
+_INVALID_IRI_CHARACTERS = re.compile(r'[\x00-\x20<>"{}|^`\\]')
+
+# Conservative subset of PN_LOCAL that never requires escaping.
+_SAFE_LOCAL_NAME = re.compile(r"[A-Za-z0-9_](?:[A-Za-z0-9_.-]*[A-Za-z0-9_-])?")
+
+_SAFE_BLANK_NODE_LABEL = re.compile(r"[A-Za-z0-9_][A-Za-z0-9_-]*")
+
+_INTEGER_LEXICAL_FORM = re.compile(r"[+-]?[0-9]+")
+
+_STRING_ESCAPES = {
+    **{code: f"\\u{code:04X}" for code in range(0x20)},
+    ord("\\"): "\\\\",
+    ord('"'): '\\"',
+    ord("\n"): "\\n",
+    ord("\r"): "\\r",
+    ord("\t"): "\\t",
+    ord("\b"): "\\b",
+    ord("\f"): "\\f",
+}
+
+_INDENT = "    "
+
+
+def _term_sort_key(term) -> tuple:
+    """Order IRIs before blank nodes and blank nodes before literals, then by their lexical content."""
+    if isinstance(term, URIRef):
+        return 0, str(term), "", ""
+    if isinstance(term, BNode):
+        return 1, str(term), "", ""
+    return 2, str(term), str(term.datatype or ""), term.language or ""
+
+
+class _TermFormatter:
+    """Format RDF terms as Turtle, collecting the prefixes used and caching repeated terms."""
+
+    def __init__(self, ontouml_graph: Graph) -> None:
+        self.prefixes = {str(namespace): prefix for prefix, namespace in ontouml_graph.namespace_manager.namespaces()}
+        self.used_prefixes = {}
+        self.blank_node_labels = {}
+        self.cache = {RDF.type: "a"}
+
+    def format(self, term) -> str:
+        """Return the Turtle representation of an RDF term.
+
+        :raises ValueError: If an IRI contains characters that Turtle cannot represent.
+        """
+        formatted_term = self.cache.get(term)
+        if formatted_term is None:
+            if isinstance(term, URIRef):
+                formatted_term = self._format_iri(term)
+            elif isinstance(term, Literal):
+                formatted_term = self._format_literal(term)
+            elif isinstance(term, BNode):
+                formatted_term = self._format_blank_node(term)
+            else:
+                raise ValueError(f"Term {term!r} cannot be written as Turtle.")
+            self.cache[term] = formatted_term
+        return formatted_term
+
+    def _format_iri(self, iri: URIRef) -> str:
+        """Return an IRI as a prefixed name when a bound namespace allows it, or as an IRI reference."""
+        iri_value = str(iri)
+        if _INVALID_IRI_CHARACTERS.search(iri_value):
+            raise ValueError(f"'{iri_value}' is not a valid IRI and cannot be written as Turtle.")
+
+        split_position = max(iri_value.rfind("#"), iri_value.rfind("/")) + 1
+        namespace = iri_value[:split_position]
+        local_name = iri_value[split_position:]
+        prefix = self.prefixes.get(namespace)
+
+        if prefix is not None and _SAFE_LOCAL_NAME.fullmatch(local_name):
+            self.used_prefixes[prefix] = namespace
+            return f"{prefix}:{local_name}"
+        return f"<{iri_value}>"
+
+    def _format_literal(self, literal: Literal) -> str:
+        """Return a literal using the abbreviated numeric and boolean forms when its lexical form allows it."""
+        lexical_form = str(literal)
+
+        if literal.datatype == XSD.integer and _INTEGER_LEXICAL_FORM.fullmatch(lexical_form):
+            return lexical_form
+        if literal.datatype == XSD.boolean and lexical_form in ("true", "false"):
+            return lexical_form
+
+        quoted_form = '"' + lexical_form.translate(_STRING_ESCAPES) + '"'
+        if literal.language:
+            return f"{quoted_form}@{literal.language}"
+        if literal.datatype:
+            return f"{quoted_form}^^{self.format(literal.datatype)}"
+        return quoted_form
+
+    def _format_blank_node(self, blank_node: BNode) -> str:
+        """Return a blank node label, replacing labels that are not valid in Turtle."""
+        label = str(blank_node)
+        if not _SAFE_BLANK_NODE_LABEL.fullmatch(label):
+            label = self.blank_node_labels.setdefault(label, f"b{len(self.blank_node_labels)}")
+        return f"_:{label}"
+
+
+def _predicate_sort_key(term) -> tuple:
+    """Order rdf:type before the other predicates, which are ordered as other terms."""
+    return term != RDF.type, _term_sort_key(term)
+
+
+def write_turtle(ontouml_graph: Graph, output_stream: TextIO) -> None:
+    """Write a graph as deterministic Turtle to a text stream.
+
+    All terms are formatted before writing starts, so an invalid IRI is reported before any output is produced and
+    the prefixes used are known. Subject blocks are then written one at a time.
+
+    :param ontouml_graph: Graph to be written.
+    :type ontouml_graph: Graph
+    :param output_stream: Text stream that receives the Turtle document.
+    :type output_stream: TextIO
+    :raises ValueError: If the graph contains an IRI that cannot be written as Turtle.
+    """
+    formatter = _TermFormatter(ontouml_graph)
+
+    subjects = {}
+    for subject, predicate, obj in ontouml_graph:
+        subjects.setdefault(subject, {}).setdefault(predicate, []).append(obj)
+
+    # Terms are formatted in writing order, so replaced blank-node labels are numbered deterministically.
+    sorted_subjects = sorted(subjects, key=_term_sort_key)
+    for subject in sorted_subjects:
+        predicates = subjects[subject]
+        for predicate in sorted(predicates, key=_predicate_sort_key):
+            predicates[predicate].sort(key=_term_sort_key)
+            for obj in predicates[predicate]:
+                formatter.format(obj)
+            formatter.format(predicate)
+        formatter.format(subject)
+
+    for prefix in sorted(formatter.used_prefixes):
+        output_stream.write(f"@prefix {prefix}: <{formatter.used_prefixes[prefix]}> .\n")
+    if formatter.used_prefixes:
+        output_stream.write("\n")
+
+    for subject_number, subject in enumerate(sorted_subjects):
+        predicates = subjects.pop(subject)
+        predicate_lines = []
+        for predicate in sorted(predicates, key=_predicate_sort_key):
+            objects = [formatter.format(obj) for obj in predicates[predicate]]
+            predicate_lines.append(f"{formatter.format(predicate)} " + f",\n{_INDENT * 2}".join(objects))
+        if subject_number:
+            output_stream.write("\n")
+        output_stream.write(f"{formatter.format(subject)} " + f" ;\n{_INDENT}".join(predicate_lines) + " .\n")
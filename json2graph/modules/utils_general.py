@@ -2,6 +2,10 @@
 
 from datetime import datetime
 
+# Number of distinct raw source values (e.g., stereotypes or cardinalities) whose normalization is memoized by each
+# normalization function. Models reuse few distinct values, so the bound is only reached by malformed inputs.
+SOURCE_VALUE_CACHE_SIZE = 1024
+
 
 def get_date_time(date_time_format: str) -> str:
     """Return a string with date and time according to the specified format received as argument.
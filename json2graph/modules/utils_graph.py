@@ -1,32 +1,113 @@
 """Util functions related to graphs."""
 
-import os
 import urllib
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from functools import lru_cache
+from weakref import WeakKeyDictionary
 
-from rdflib import Graph, URIRef
+from rdflib import RDF, Graph, URIRef
 
 from .errors import report_error_io_read
+from .graph_snapshot import load_graph_snapshot
 from .logger import initialize_logger
 from .metadata import METADATA
+from .vocabulary_tables import (
+    VocabularyTables,
+    compile_vocabulary_tables,
+    get_vocabulary_file_path,
+    load_vocabulary_tables,
+)
 
 LOGGER = initialize_logger()
 
+# Types of the resources kept in model-only output.
+MODEL_ELEMENT_TYPES = ("Class", "Property", "Generalization", "GeneralizationSet", "Relation", "Literal", "Cardinality")
+
+# Number of distinct OntoUML Vocabulary entities whose URIRefs are kept by ontouml_ref.
+ONTOUML_REF_CACHE_SIZE = 1024
+
+# Sets that receive the terms returned by ontouml_ref while collect_ontouml_terms contexts are active.
+_ONTOUML_TERM_COLLECTORS: list[set[URIRef]] = []
+
+# OntoUML terms referenced while decoding each graph, registered with set_graph_ontouml_terms.
+_GRAPH_ONTOUML_TERMS: WeakKeyDictionary = WeakKeyDictionary()
+
+
+@lru_cache(maxsize=ONTOUML_REF_CACHE_SIZE)
+def _create_ontouml_ref(entity: str) -> URIRef:
+    """Return the URIRef of an OntoUML Vocabulary's entity."""
+    return URIRef(METADATA["conformsTo"] + "#" + entity)
+
 
 def ontouml_ref(entity: str) -> URIRef:
     """Receive the name of the OntoUML Vocabulary's entity as a string and returns the corresponding URIRef.
 
+    The returned URIRef is added to the sets of the active collect_ontouml_terms contexts.
+
     :param entity: OntoUML Vocabulary entity (class, property, or individual) to have its URIRef returned.
     :type entity: str
     :return: URIRef of the informed OntoUML Vocabulary's entity.
     :rtype: URIRef
     """
-    entity_uri = METADATA["conformsTo"] + "#" + entity
+    entity_uriref = _create_ontouml_ref(entity)
 
-    entity_uriref = URIRef(entity_uri)
+    for collected_terms in _ONTOUML_TERM_COLLECTORS:
+        collected_terms.add(entity_uriref)
 
     return entity_uriref
 
 
+@contextmanager
+def collect_ontouml_terms() -> Iterator[set[URIRef]]:
+    """Collect the OntoUML terms returned by ontouml_ref while the context is active.
+
+    The decoder creates every OntoUML term it emits with ontouml_ref, so the collected set contains all OntoUML terms
+    of the decoded graph. It may also contain terms that were only referenced, e.g., in comparisons.
+
+    :return: Context manager yielding the set that receives the collected terms.
+    :rtype: Iterator[set[URIRef]]
+    """
+    collected_terms = set()
+    _ONTOUML_TERM_COLLECTORS.append(collected_terms)
+    try:
+        yield collected_terms
+    finally:
+        _ONTOUML_TERM_COLLECTORS.remove(collected_terms)
+
+
+def add_collected_ontouml_terms(terms: Iterable[URIRef]) -> None:
+    """Add terms collected elsewhere, e.g., in a worker process, to the sets of the active collectors.
+
+    :param terms: OntoUML terms to be added.
+    :type terms: Iterable[URIRef]
+    """
+    for collected_terms in _ONTOUML_TERM_COLLECTORS:
+        collected_terms.update(terms)
+
+
+def set_graph_ontouml_terms(ontouml_graph: Graph, terms: Iterable[URIRef]) -> None:
+    """Register the OntoUML terms referenced while decoding a graph, for as long as the graph exists.
+
+    :param ontouml_graph: Decoded graph.
+    :type ontouml_graph: Graph
+    :param terms: Superset of the OntoUML terms used in the graph's triples.
+    :type terms: Iterable[URIRef]
+    """
+    _GRAPH_ONTOUML_TERMS[ontouml_graph] = frozenset(terms)
+
+
+def get_graph_ontouml_terms(ontouml_graph: Graph) -> frozenset[URIRef] | None:
+    """Return the OntoUML terms registered for a graph with set_graph_ontouml_terms.
+
+    :param ontouml_graph: Graph whose terms are returned.
+    :type ontouml_graph: Graph
+    :return: Registered terms, or None if no terms were registered for the graph.
+    :rtype: frozenset[URIRef] or None
+    """
+    return _GRAPH_ONTOUML_TERMS.get(ontouml_graph)
+
+
 def load_ontouml_vocabulary(enable_remote: bool = False) -> Graph:
     """Load the OntoUML Vocabulary to the working memory.
 
@@ -47,9 +128,7 @@ def load_ontouml_vocabulary(enable_remote: bool = False) -> Graph:
     ontology_graph = Graph()
 
     # Guarantees that the file will be found as it searches using this file as basis
-    package_dir = os.path.dirname(os.path.dirname(__file__))
-    file_location = "resources" + os.path.sep + "ontouml_" + METADATA["conformsToVersion"] + ".ttl"
-    file_path = os.path.join(package_dir, file_location)
+    file_path = get_vocabulary_file_path(METADATA["conformsToVersion"])
 
     if enable_remote:
         remote_option = "https://w3id.org/ontouml/vocabulary/" + METADATA["conformsToVersion"]
@@ -66,17 +145,59 @@ def load_ontouml_vocabulary(enable_remote: bool = False) -> Graph:
     return ontology_graph
 
 
+@lru_cache(maxsize=1)
+def get_ontouml_vocabulary() -> Graph:
+    """Return the local OntoUML Vocabulary, loading it only on the first call.
+
+    The returned graph is shared by all callers and must not be modified. Use load_ontouml_vocabulary to obtain a
+    graph that can be changed.
+
+    :return: Shared RDFLib graph with the local OntoUML Vocabulary.
+    :rtype: Graph
+    """
+    return load_ontouml_vocabulary()
+
+
+@lru_cache(maxsize=1)
+def get_ontouml_vocabulary_tables() -> VocabularyTables:
+    """Return the tables of the local OntoUML Vocabulary, loading them only on the first call.
+
+    The tables precompiled with the package are used if they match the vocabulary's Turtle file. Otherwise, the
+    vocabulary is parsed and the tables are computed from it.
+
+    :return: Tables of the local OntoUML Vocabulary.
+    :rtype: VocabularyTables
+    """
+    vocabulary_tables = load_vocabulary_tables(METADATA["conformsToVersion"])
+    if vocabulary_tables is None:
+        vocabulary_tables = compile_vocabulary_tables(get_ontouml_vocabulary(), METADATA["conformsToBase"])
+    return vocabulary_tables
+
+
+def get_ontouml_element_types() -> frozenset[URIRef]:
+    """Return the classes of the OntoUML Vocabulary that are direct or indirect subclasses of ontouml:OntoumlElement.
+
+    :return: URIRefs of all OntoUML element types.
+    :rtype: frozenset[URIRef]
+    """
+    return get_ontouml_vocabulary_tables().element_types
+
+
 def load_graph_safely(ontology_file: str, out_format: str = "not_provided") -> Graph:
     """Safely load graph from file to working memory using arguments provided by the user, which are the file path \
     and (optionally) the file type.
 
     :param ontology_file: Path to the ontology file to be loaded into the working memory.
     :type ontology_file: str
-    :param out_format: Optional argument. Format of the file to be loaded.
+    :param out_format: Optional argument. Format of the file to be loaded. Graph snapshots, whose format is
+                       'snapshot' and whose default suffix is '.snapshot', are memory-mapped instead of parsed.
     :type out_format: str
     :return: RDFLib graph loaded as object.
     :rtype: Graph
     """
+    if out_format == "snapshot" or (out_format == "not_provided" and ontology_file.endswith(".snapshot")):
+        return load_graph_snapshot(ontology_file)
+
     ontology_graph = Graph()
 
     try:
@@ -152,3 +273,20 @@ def rename_uriref_resource(graph: Graph, old_resource: URIRef, new_resource: URI
         if o == old_resource:
             graph.add((s, p, new_resource))
             graph.remove((s, p, old_resource))
+
+
+def remove_diagrammatic_resources(ontouml_graph: Graph, base_uri: str) -> None:
+    """Remove the resources of the project that are not model elements, with all triples in which they occur.
+
+    :param ontouml_graph: Decoded graph, which is changed in place.
+    :type ontouml_graph: Graph
+    :param base_uri: Base URI of the project's resources. Resources of other namespaces are kept.
+    :type base_uri: str
+    """
+    for s, _, o in list(ontouml_graph.triples((None, RDF.type, None))):
+        s_type = s.toPython()
+        o_type = o.fragment
+        # Remove if not a model element and if it is defined by of the ontology being handled
+        if (base_uri in s_type) and (o_type not in MODEL_ELEMENT_TYPES):
+            ontouml_graph.remove((s, None, None))
+            ontouml_graph.remove((None, None, s))
@@ -1,9 +1,10 @@
 """Functions that performs validations for different functions or parameters used in the software."""
 
-import inspect
+import math
 import os
 
 from .errors import report_error_invalid_parameter, report_error_requirement_not_met
+from .memory_budget import parse_memory_size
 
 
 def validate_arg_input(input_path: str, decode_all: bool) -> None:
@@ -29,6 +30,119 @@ def validate_arg_input(input_path: str, decode_all: bool) -> None:
         report_error_requirement_not_met("Provided input file must be of JSON type. Execution finished.")
 
 
+def validate_shard_processes(shard_processes: int) -> None:
+    """Validate the number of worker processes used for sharded decoding.
+
+    :param shard_processes: Number of worker processes. Must be a positive integer.
+    :type shard_processes: int
+    """
+    if type(shard_processes) is not int or shard_processes < 1:
+        report_error_requirement_not_met("The number of shard processes must be a positive integer.")
+
+
+def validate_max_memory(max_memory: int | str | None) -> int | None:
+    """Validate the memory budget of a conversion and return it in bytes.
+
+    :param max_memory: Number of bytes, or a number followed by K, M, G, or T (e.g., '512M'). None means no budget.
+    :type max_memory: int or str or None
+    :return: Memory budget in bytes, or None if no budget was informed.
+    :rtype: int or None
+    """
+    if max_memory is None:
+        return None
+    try:
+        return parse_memory_size(max_memory)
+    except ValueError as error:
+        report_error_requirement_not_met(str(error))
+
+
+def validate_serve_workers(serve_workers: int) -> None:
+    """Validate the number of worker processes that convert jobs in server mode.
+
+    :param serve_workers: Number of worker processes. Must be a positive integer.
+    :type serve_workers: int
+    """
+    if type(serve_workers) is not int or serve_workers < 1:
+        report_error_requirement_not_met("The number of server worker processes must be a positive integer.")
+
+
+def validate_watch_interval(watch_interval: float) -> None:
+    """Validate the number of seconds between checks for changed inputs in watch mode.
+
+    :param watch_interval: Polling interval in seconds. Must be a positive, finite number.
+    :type watch_interval: float
+    """
+    if not (watch_interval > 0 and math.isfinite(watch_interval)):
+        report_error_requirement_not_met("The watch interval must be a positive, finite number of seconds.")
+
+
+def validate_diagnostics_limit(diagnostics_limit: int | None) -> None:
+    """Validate the maximum number of diagnostics of each code that are printed and reported.
+
+    :param diagnostics_limit: Maximum number of diagnostics per code. Must be a non-negative integer or None.
+    :type diagnostics_limit: int or None
+    """
+    if diagnostics_limit is not None and (type(diagnostics_limit) is not int or diagnostics_limit < 0):
+        report_error_requirement_not_met("The diagnostics limit must be a non-negative integer.")
+
+
+def validate_partition_size(partition_size: int) -> None:
+    """Validate the maximum number of triples of each output partition.
+
+    :param partition_size: Maximum number of triples per partition. Must be a positive integer.
+    :type partition_size: int
+    """
+    if type(partition_size) is not int or partition_size < 1:
+        report_error_requirement_not_met("The partition size must be a positive number of triples.")
+
+
+def validate_selectors(selectors: list[str] | None) -> None:
+    """Validate the IDs or name patterns of the Packages and Diagrams selected for decoding.
+
+    :param selectors: List of non-empty strings, or None to decode the whole project.
+    :type selectors: list[str] or None
+    """
+    if selectors is not None and (
+        isinstance(selectors, str)
+        or not selectors
+        or not all(isinstance(selector, str) and selector for selector in selectors)
+    ):
+        report_error_requirement_not_met(
+            "The selection must be a non-empty list of Package or Diagram IDs or name patterns."
+        )
+
+
+def validate_store_options(store: str, store_configuration: str | None) -> None:
+    """Validate the RDFLib store that keeps the output graph and its configuration.
+
+    Whether a store plugin with the informed name is registered is only verified when the graph is created, so that
+    RDFLib is not loaded while the arguments are parsed.
+
+    :param store: Name of a registered RDFLib Store plugin, or 'default' for RDFLib's in-memory store.
+    :type store: str
+    :param store_configuration: Configuration used to open the store (e.g., a path), or None to not open it.
+    :type store_configuration: str or None
+    """
+    if type(store) is not str or not store:
+        report_error_requirement_not_met("The store must be the non-empty name of an RDFLib store plugin.")
+    if store_configuration is not None and (type(store_configuration) is not str or not store_configuration):
+        report_error_requirement_not_met("The store configuration must be a non-empty string.")
+    if store_configuration is not None and store == "default":
+        report_error_requirement_not_met("A store configuration requires a store other than 'default'.")
+
+
+def validate_snapshot_compression(graph_format: str, compression: str) -> None:
+    """Validate that graph snapshots, which are memory-mapped when loaded, are not compressed.
+
+    :param graph_format: Format of the output graph.
+    :type graph_format: str
+    :param compression: Compressor the output is streamed through.
+    :type compression: str
+    """
+    if graph_format == "snapshot" and compression != "none":
+        report_error_requirement_not_met("Graph snapshots are memory-mapped when loaded and cannot be compressed.")
+
+
 def validate_execution_mode(execution_mode):
     """Validate the provided execution mode against a list of valid modes.
 
@@ -41,5 +155,7 @@ def validate_execution_mode(execution_mode):
     """
     valid_execution_modes = ["script", "import", "test"]
     if execution_mode not in valid_execution_modes:
+        import inspect
+
         current_function = inspect.stack()[0][3]
         report_error_invalid_parameter(execution_mode, valid_execution_modes, current_function)
@@ -0,0 +1,156 @@
+"""Precompiled tables of the bundled OntoUML Vocabulary versions.
+
+Parsing the vocabulary's Turtle file with RDFLib is a noticeable share of the startup time of short-lived processes.
+The tables that the decoder needs from the vocabulary (the OntoUML element types and the declared terms) are therefore
+compiled into a JSON file next to each bundled Turtle file. Each table file records the SHA-256 hash of the Turtle
+file it was compiled from, and it is only used while that hash matches, so a stale table file is never trusted.
+
+Run ``python update_vocabulary_tables.py`` from the repository root after changing a bundled vocabulary file.
+"""
+
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+
+from rdflib import RDFS, Graph, URIRef
+
+from .logger import initialize_logger
+
+LOGGER = initialize_logger()
+
+# Version of the table file layout. Table files with another version are ignored.
+VOCABULARY_TABLES_FORMAT_VERSION = 1
+
+_RESOURCES_DIRECTORY = os.path.join(os.path.dirname(os.path.dirname(__file__)), "resources")
+
+
+@dataclass(frozen=True)
+class VocabularyTables:
+    """Tables of an OntoUML Vocabulary version used by the decoder.
+
+    :ivar element_types: Classes that are direct or indirect subclasses of ontouml:OntoumlElement.
+    :vartype element_types: frozenset[URIRef]
+    :ivar defined_terms: Terms declared in the vocabulary's namespace.
+    :vartype defined_terms: frozenset[URIRef]
+    """
+
+    element_types: frozenset[URIRef]
+    defined_terms: frozenset[URIRef]
+
+
+def get_vocabulary_file_path(vocabulary_version: str) -> str:
+    """Return the path of the bundled Turtle file of an OntoUML Vocabulary version.
+
+    :param vocabulary_version: Version of the vocabulary (e.g., 'v1.1.1').
+    :type vocabulary_version: str
+    :return: Path of the vocabulary's Turtle file.
+    :rtype: str
+    """
+    return os.path.join(_RESOURCES_DIRECTORY, f"ontouml_{vocabulary_version}.ttl")
+
+
+def get_vocabulary_tables_file_path(vocabulary_version: str) -> str:
+    """Return the path of the precompiled table file of an OntoUML Vocabulary version.
+
+    :param vocabulary_version: Version of the vocabulary (e.g., 'v1.1.1').
+    :type vocabulary_version: str
+    :return: Path of the vocabulary's table file.
+    :rtype: str
+    """
+    return os.path.join(_RESOURCES_DIRECTORY, f"ontouml_{vocabulary_version}.tables.json")
+
+
+def _get_file_sha256(file_path: str) -> str:
+    """Return the hexadecimal SHA-256 digest of a file's content."""
+    with open(file_path, "rb") as read_file:
+        return hashlib.sha256(read_file.read()).hexdigest()
+
+
+def compile_vocabulary_tables(vocabulary_graph: Graph, namespace: str) -> VocabularyTables:
+    """Compute the tables of an OntoUML Vocabulary from its parsed graph.
+
+    :param vocabulary_graph: Parsed OntoUML Vocabulary.
+    :type vocabulary_graph: Graph
+    :param namespace: Namespace of the vocabulary's terms (e.g., 'https://w3id.org/ontouml#').
+    :type namespace: str
+    :return: Tables of the vocabulary.
+    :rtype: VocabularyTables
+    """
+    ontouml_element = URIRef(namespace + "OntoumlElement")
+    element_types = frozenset(
+        element_type
+        for element_type in vocabulary_graph.transitive_subjects(RDFS.subClassOf, ontouml_element)
+        if element_type != ontouml_element
+    )
+    defined_terms = frozenset(
+        subject
+        for subject in vocabulary_graph.subjects()
+        if isinstance(subject, URIRef) and str(subject).startswith(namespace)
+    )
+    return VocabularyTables(element_types, defined_terms)
+
+
+def build_vocabulary_tables_file(vocabulary_version: str, namespace: str) -> str:
+    """Parse a bundled vocabulary version and write its table file, recording the hash of the parsed Turtle file.
+
+    :param vocabulary_version: Version of the vocabulary (e.g., 'v1.1.1').
+    :type vocabulary_version: str
+    :param namespace: Namespace of the vocabulary's terms.
+    :type namespace: str
+    :return: Path of the written table file.
+    :rtype: str
+    """
+    vocabulary_file_path = get_vocabulary_file_path(vocabulary_version)
+    vocabulary_graph = Graph()
+    vocabulary_graph.parse(vocabulary_file_path, encoding="utf-8", format="ttl")
+    tables = compile_vocabulary_tables(vocabulary_graph, namespace)
+
+    tables_file_path = get_vocabulary_tables_file_path(vocabulary_version)
+    with open(tables_file_path, "w", encoding="utf-8", newline="\n") as tables_file:
+        json.dump(
+            {
+                "format_version": VOCABULARY_TABLES_FORMAT_VERSION,
+                "vocabulary_version": vocabulary_version,
+                "source_sha256": _get_file_sha256(vocabulary_file_path),
+                "element_types": sorted(tables.element_types),
+                "defined_terms": sorted(tables.defined_terms),
+            },
+            tables_file,
+            indent=1,
+        )
+        tables_file.write("\n")
+
+    return tables_file_path
+
+
+def load_vocabulary_tables(vocabulary_version: str) -> VocabularyTables | None:
+    """Load the precompiled tables of a bundled vocabulary version if they match its Turtle file.
+
+    :param vocabulary_version: Version of the vocabulary (e.g., 'v1.1.1').
+    :type vocabulary_version: str
+    :return: Tables of the vocabulary, or None if the table file is missing, has another format version, or was
+             compiled from a different Turtle file.
+    :rtype: VocabularyTables or None
+    """
+    tables_file_path = get_vocabulary_tables_file_path(vocabulary_version)
+    try:
+        with open(tables_file_path, encoding="utf-8") as tables_file:
+            tables_data = json.load(tables_file)
+        source_sha256 = _get_file_sha256(get_vocabulary_file_path(vocabulary_version))
+    except (OSError, ValueError) as error:
+        LOGGER.debug(f"OntoUML Vocabulary tables not loaded from {tables_file_path}: {error}.")
+        return None
+
+    if tables_data.get("format_version") != VOCABULARY_TABLES_FORMAT_VERSION:
+        LOGGER.debug(f"OntoUML Vocabulary tables in {tables_file_path} have an unsupported format version.")
+        return None
+    if tables_data.get("source_sha256") != source_sha256:
+        LOGGER.debug(f"OntoUML Vocabulary tables in {tables_file_path} are stale and were ignored.")
+        return None
+
+    LOGGER.debug(f"OntoUML Vocabulary tables successfully loaded from {tables_file_path}.")
+    return VocabularyTables(
+        element_types=frozenset(URIRef(term) for term in tables_data["element_types"]),
+        defined_terms=frozenset(URIRef(term) for term in tables_data["defined_terms"]),
+    )
@@ -0,0 +1,94 @@
+"""Detect changed JSON inputs for watch mode.
+
+Inputs are polled: each poll records the modification time and size of the watched file, or of the JSON files and
+archives of the watched directory. A changed input is reported only when a later poll finds it unchanged, so a burst of
+rapid saves results in a single reconversion of the last saved content.
+"""
+
+import os
+
+from .batch_inputs import list_batch_entries
+
+# Modification time in nanoseconds and size in bytes of a watched input.
+InputSignature = tuple[int, int]
+
+
+def snapshot_watched_inputs(input_path: str, decode_all: bool) -> dict[str, InputSignature]:
+    """Return the signatures of the inputs watched in single-file or batch mode.
+
+    Inputs that disappear while the snapshot is taken are not included.
+
+    :param input_path: JSON file or batch directory provided as input.
+    :type input_path: str
+    :param decode_all: If True, input_path is a batch directory whose JSON files and archives are watched.
+    :type decode_all: bool
+    :return: Dictionary mapping each watched path to its signature.
+    :rtype: dict[str, InputSignature]
+    """
+    if decode_all:
+        try:
+            watched_paths = list_batch_entries(input_path)
+        except OSError:
+            watched_paths = []
+    else:
+        watched_paths = [input_path]
+
+    snapshot = {}
+    for watched_path in watched_paths:
+        try:
+            file_status = os.stat(watched_path)
+        except OSError:
+            continue
+        snapshot[watched_path] = (file_status.st_mtime_ns, file_status.st_size)
+    return snapshot
+
+
+class InputWatcher:
+    """Report watched inputs that changed since they were last converted and then stopped changing.
+
+    :ivar input_path: JSON file or batch directory provided as input.
+    :vartype input_path: str
+    :ivar decode_all: If True, input_path is a batch directory.
+    :vartype decode_all: bool
+    """
+
+    def __init__(self, input_path: str, decode_all: bool) -> None:
+        """Create a watcher whose baseline is the current state of the inputs, which are considered converted.
+
+        :param input_path: JSON file or batch directory provided as input.
+        :type input_path: str
+        :param decode_all: If True, input_path is a batch directory whose JSON files and archives are watched.
+        :type decode_all: bool
+        """
+        self.input_path = input_path
+        self.decode_all = decode_all
+        self._converted = snapshot_watched_inputs(input_path, decode_all)
+        self._pending = {}
+
+    def poll(self) -> list[str]:
+        """Return, in sorted order, the inputs that must be converted again.
+
+        An input is returned when its signature differs from the one it had when last converted and equals the one
+        observed in the previous poll. Returned inputs are considered converted from then on.
+
+        :return: Paths of the changed inputs whose content is stable.
+        :rtype: list[str]
+        """
+        snapshot = snapshot_watched_inputs(self.input_path, self.decode_all)
+        changed_paths = []
+
+        for watched_path, signature in snapshot.items():
+            if self._converted.get(watched_path) == signature:
+                self._pending.pop(watched_path, None)
+            elif self._pending.get(watched_path) != signature:
+                self._pending[watched_path] = signature
+            else:
+                del self._pending[watched_path]
+                self._converted[watched_path] = signature
+                changed_paths.append(watched_path)
+
+        for removed_path in set(self._converted).union(self._pending).difference(snapshot):
+            self._converted.pop(removed_path, None)
+            self._pending.pop(removed_path, None)
+
+        return sorted(changed_paths)
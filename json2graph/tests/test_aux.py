@@ -3,7 +3,7 @@
 import glob
 import os
 
-from rdflib import Graph
+from rdflib import BNode, Graph
 from rdflib.compare import graph_diff, to_isomorphic
 
 from json2graph.modules import arguments as args
@@ -30,29 +30,35 @@ def get_test_list() -> list[str]:
     return list_test_files
 
 
-def print_graphs_differences(iso_result_graph: Graph, iso_expected_graph: Graph, test_name: str):
+def has_blank_nodes(graph: Graph) -> bool:
+    """Return whether any triple of the graph has a blank node as subject or object.
+
+    :param graph: Graph to be inspected.
+    :type graph: Graph
+    :return: True if the graph contains a blank node.
+    :rtype: bool
+    """
+    return any(isinstance(subject, BNode) or isinstance(obj, BNode) for subject, _, obj in graph)
+
+
+def write_graphs_differences(in_both: Graph, in_resulting: Graph, in_expected: Graph, test_name: str) -> None:
     """Print three files:
         - test*_both.ttl: contains the statements that are present in both the resulting and expected graphs.
-        - test*_or.ttl: contains the statements that are present only in the resulting graph.
-        - test*_oe.ttl: contains the statements that are present only in the expected graph.
-
-    :param iso_result_graph: Isomorphic resulting graph.
-    :type iso_result_graph: Graph
-    :param iso_expected_graph: Isomorphic expected graph.
-    :type iso_expected_graph: Graph
+        - test*_only_result.ttl: contains the statements that are present only in the resulting graph.
+        - test*_only_expect.ttl: contains the statements that are present only in the expected graph.
+
+    :param in_both: Statements present in both graphs.
+    :type in_both: Graph
+    :param in_resulting: Statements present only in the resulting graph.
+    :type in_resulting: Graph
+    :param in_expected: Statements present only in the expected graph.
+    :type in_expected: Graph
     :param test_name: Name of the test to be used for printing comparison if evaluation result is negative.
     :type test_name: str
     """
-    in_both, in_resulting, in_expected = graph_diff(iso_result_graph, iso_expected_graph)
-
-    in_both.bind("ontouml", METADATA["conformsToBase"])
-    in_both.bind("", args.ARGUMENTS["base_uri"])
-
-    in_resulting.bind("ontouml", METADATA["conformsToBase"])
-    in_resulting.bind("", args.ARGUMENTS["base_uri"])
-
-    in_expected.bind("ontouml", METADATA["conformsToBase"])
-    in_expected.bind("", args.ARGUMENTS["base_uri"])
+    for difference_graph in (in_both, in_resulting, in_expected):
+        difference_graph.bind("ontouml", METADATA["conformsToBase"])
+        difference_graph.bind("", args.ARGUMENTS["base_uri"])
 
     base_path = "results"
     base_test = base_path + os.path.sep + test_name
@@ -62,9 +68,26 @@ def print_graphs_differences(iso_result_graph: Graph, iso_expected_graph: Graph,
     safe_write_graph_file(in_expected, base_test + "_only_expect.ttl", "ttl")
 
 
+def print_graphs_differences(iso_result_graph: Graph, iso_expected_graph: Graph, test_name: str):
+    """Print the statements in both graphs and in only one of them, as described in write_graphs_differences.
+
+    :param iso_result_graph: Isomorphic resulting graph.
+    :type iso_result_graph: Graph
+    :param iso_expected_graph: Isomorphic expected graph.
+    :type iso_expected_graph: Graph
+    :param test_name: Name of the test to be used for printing comparison if evaluation result is negative.
+    :type test_name: str
+    """
+    in_both, in_resulting, in_expected = graph_diff(iso_result_graph, iso_expected_graph)
+    write_graphs_differences(in_both, in_resulting, in_expected, test_name)
+
+
 def compare_graphs(resulting_graph_path: str, expected_graph_path: str, test_name: str) -> bool:
     """Verify if resulting graph corresponds to expected graph.
 
+    Graphs without blank nodes are equal exactly when their sets of triples are equal, so they are compared as hashed
+    triple sets. Canonical labeling with RDFLib's isomorphism algorithm is only used when a graph has blank nodes.
+
     :param resulting_graph_path: Path to the generated resulting graph file.
     :type resulting_graph_path: str
     :param expected_graph_path: Path to the expected graph file.
@@ -77,12 +100,27 @@ def compare_graphs(resulting_graph_path: str, expected_graph_path: str, test_nam
     result_graph = load_graph_safely(resulting_graph_path)
     expected_graph = load_graph_safely(expected_graph_path)
 
-    iso_result_graph = to_isomorphic(result_graph)
-    iso_expected_graph = to_isomorphic(expected_graph)
+    if has_blank_nodes(result_graph) or has_blank_nodes(expected_graph):
+        iso_result_graph = to_isomorphic(result_graph)
+        iso_expected_graph = to_isomorphic(expected_graph)
+
+        is_equal = iso_result_graph == iso_expected_graph
+
+        if not is_equal:
+            print_graphs_differences(iso_result_graph, iso_expected_graph, test_name)
+
+        return is_equal
+
+    result_triples = set(result_graph)
+    expected_triples = set(expected_graph)
 
-    is_equal = iso_result_graph == iso_expected_graph
+    is_equal = result_triples == expected_triples
 
     if not is_equal:
-        print_graphs_differences(iso_result_graph, iso_expected_graph, test_name)
+        in_both, in_resulting, in_expected = Graph(), Graph(), Graph()
+        in_both.addN((*triple, in_both) for triple in result_triples & expected_triples)
+        in_resulting.addN((*triple, in_resulting) for triple in result_triples - expected_triples)
+        in_expected.addN((*triple, in_expected) for triple in expected_triples - result_triples)
+        write_graphs_differences(in_both, in_resulting, in_expected, test_name)
 
     return is_equal
@@ -14,34 +14,73 @@ The tests will ensure the correct functioning of the OntoUML JSON2Graph software
 if the generated graph does not match the expected graph.
 """
 
+import gzip
 import hashlib
+import importlib.util
+import io
 import json
+import lzma
+import signal
 import subprocess
 import sys
+import tarfile
+import time
 import warnings
+import zipfile
 from pathlib import Path
 
 import pytest
 import tomli
-from rdflib import RDF, RDFS, XSD, Graph, Literal, Namespace, URIRef
+from rdflib import RDF, RDFS, XSD, BNode, Dataset, Graph, Literal, Namespace, URIRef
+from rdflib.compare import to_isomorphic
+from rdflib.graph import ModificationException
+from rdflib.plugin import register as register_plugin
+from rdflib.plugins.stores.memory import Memory
+from rdflib.store import VALID_STORE, Store
 
 from .test_aux import compare_graphs, get_test_list
 from ..decode import decode_ontouml_json2graph, write_graph_file
-from ..library import decode_json_model, decode_json_project
+from ..library import (
+    DiagnosticsCollector,
+    MemoryBudgetError,
+    check_json_project,
+    decode_json_model,
+    decode_json_project,
+    iter_graph_file_triples,
+    load_graph_file,
+    open_json_project,
+    save_graph_file,
+    save_partitioned_graph_files,
+)
+from ..modules import arguments as args
+from ..modules.batch_inputs import iter_batch_inputs
 from ..modules.cardinalities import (
     CardinalityRepairWarning,
     InvalidCardinalityError,
     InvalidCardinalityWarning,
+    resolve_cardinality,
 )
 from ..modules.content_identity import create_content_uuid, resolve_base_uri
-from ..modules.input_output import JSONEncodingFallbackWarning, safe_load_json_file
+from ..modules.duplicate_ids import DuplicateIdWarning
+from ..modules.geometry_encoding import JSON2GRAPH
+from ..modules.input_output import (
+    JSONEncodingFallbackWarning,
+    safe_load_json_file,
+    safe_write_graph_file,
+    serialize_graph,
+)
 from ..modules.metadata import METADATA, _read_source_project_version
 from ..modules.model_element_references import (
     UnresolvedModelElementError,
     UnresolvedModelElementWarning,
 )
 from ..modules.path_order import PathPointOrderWarning
+from ..modules.selection import ElementSelectionError
+from ..modules.spilled_graph import is_spilled_graph
+from ..modules.sharding import partition_project
 from ..modules.property_assignments import PropertyAssignmentWarning
+from ..modules.source_elements import SourceElementTable
+from ..modules.source_visitor import SourceVisitor, remove_null_values
 from ..modules.stereotypes import (
     InvalidStereotypeError,
     InvalidStereotypeWarning,
@@ -51,7 +90,10 @@ from ..modules.stereotypes import (
 )
 from ..modules.text_values import UnsupportedTextValueWarning
 from ..modules.transformation_metadata import get_rdf_media_type
-from ..modules.utils_graph import load_ontouml_vocabulary
+from ..modules.utils_graph import get_graph_ontouml_terms, load_ontouml_vocabulary
+from ..modules import lazy_store, memory_budget, sharding, vocabulary_tables
+from ..modules.memory_budget import GRAPH_BYTES_PER_TRIPLE
+from ..modules.watch import InputWatcher
 
 LIST_OF_TESTS = get_test_list()
 
@@ -434,6 +476,32 @@ def test_ontouml_json2graph(input_file: str) -> None:
     assert is_equal
 
 
+def test_compare_graphs_reports_differences_of_graphs_with_and_without_blank_nodes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Verify that graphs are compared as triple sets, or as isomorphic graphs when they have blank nodes."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setitem(args.ARGUMENTS, "base_uri", BASE_URI)
+    (tmp_path / "results").mkdir()
+    class_triple = (URIRef(BASE_URI + "class"), RDF.type, ONTOUML.Class)
+    name_triple = (URIRef(BASE_URI + "class"), ONTOUML.name, Literal("Class"))
+    graph_files = {
+        "expected": build_turtle_writer_graph([class_triple, name_triple]),
+        "different": build_turtle_writer_graph([class_triple]),
+        "first_blank": build_turtle_writer_graph([class_triple, (URIRef(BASE_URI + "class"), RDFS.seeAlso, BNode())]),
+        "second_blank": build_turtle_writer_graph([class_triple, (URIRef(BASE_URI + "class"), RDFS.seeAlso, BNode())]),
+    }
+    for name, graph in graph_files.items():
+        save_graph_file(graph, f"{name}.ttl", "ttl")
+
+    assert compare_graphs("expected.ttl", "expected.ttl", "same")
+    assert compare_graphs("first_blank.ttl", "second_blank.ttl", "blank")
+    assert not compare_graphs("different.ttl", "expected.ttl", "different")
+    assert set(Graph().parse("results/different_both.ttl")) == {class_triple}
+    assert not set(Graph().parse("results/different_only_result.ttl"))
+    assert set(Graph().parse("results/different_only_expect.ttl")) == {name_triple}
+
+
 def test_model_only_preserves_enumeration_literals() -> None:
     """Verify that model-only decoding preserves literals while removing diagrammatic elements."""
     ontouml_graph = decode_ontouml_json2graph(
@@ -493,6 +561,20 @@ def test_default_path_order_policy_warns_without_adding_an_annotation(tmp_path:
     assert not any(ontouml_graph.triples((path_uri, RDFS.comment, None)))
 
 
+def test_lazily_opened_project_reports_path_order_when_opened(tmp_path: Path) -> None:
+    """Verify that the path order of a lazily opened project is reported once, as in a complete decoding."""
+    input_file = write_path_project(tmp_path)
+
+    with warnings.catch_warnings(record=True) as caught_warnings:
+        warnings.simplefilter("always")
+        lazy_graph = open_json_project(str(input_file), base_uri=BASE_URI)
+        assert [caught.category for caught in caught_warnings] == [PathPointOrderWarning]
+
+        # Decoding the shards does not report it again.
+        assert (URIRef(BASE_URI + "view-1_path"), RDF.type, ONTOUML.Path) in set(lazy_graph)
+        assert [caught.category for caught in caught_warnings] == [PathPointOrderWarning]
+
+
 def test_comment_path_order_policy_adds_the_source_sequence_as_text(tmp_path: Path) -> None:
     """Verify that explicit comment mode adds a deterministic, non-normative annotation."""
     input_file = write_path_project(tmp_path)
@@ -725,6 +807,186 @@ def test_non_empty_text_shape_value_is_warned_and_omitted(tmp_path: Path) -> Non
     assert not any(ontouml_graph.triples((text_shape_uri, ONTOUML.value, None)))
 
 
+def test_source_visitor_dispatches_all_callbacks_in_one_traversal() -> None:
+    """Verify that callbacks see every object in document order, in registration order, before null removal."""
+    json_data = {
+        "id": "project",
+        "type": "Project",
+        "description": None,
+        "model": {"id": "package", "type": "Package", "contents": [{"id": "class", "type": "Class", "name": None}]},
+        "diagrams": [{"id": "diagram", "type": "Diagram", "owner": {"id": "package", "type": "Package"}}],
+    }
+    visited_objects = []
+
+    source_visitor = SourceVisitor()
+    source_visitor.register(lambda node: visited_objects.append(("any", node["id"], len(node))))
+    source_visitor.register(lambda node: visited_objects.append(("Package", node["id"], len(node))), "Package")
+    source_visitor.register(remove_null_values)
+    source_visitor.visit(json_data)
+
+    assert visited_objects == [
+        ("any", "project", 5),
+        ("any", "package", 3),
+        ("Package", "package", 3),
+        ("any", "class", 3),
+        ("any", "diagram", 3),
+        ("any", "package", 2),
+        ("Package", "package", 2),
+    ]
+    assert "description" not in json_data
+    assert json_data["model"]["contents"][0] == {"id": "class", "type": "Class"}
+
+
+def test_compact_geometry_encoding_keeps_point_order_in_one_literal_per_shape() -> None:
+    """Verify that compact geometry replaces the Point individuals and preserves the source point order."""
+    input_file = Path(__file__).parent / "test_files" / "test_029.json"
+    path_points = {}
+    shape_positions = {}
+    source_visitor = SourceVisitor()
+    source_visitor.register(
+        lambda node: path_points.update({node["id"]: " ".join(f"{pt['x']},{pt['y']}" for pt in node["points"])}), "Path"
+    )
+    for shape_type in ("Rectangle", "Text"):
+        source_visitor.register(
+            lambda node: shape_positions.update({node["id"]: f"{node['x']},{node['y']}"}), shape_type
+        )
+    source_visitor.visit(json.loads(input_file.read_text(encoding="utf-8")))
+
+    points_graph = decode_json_project(str(input_file), base_uri=BASE_URI)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", PathPointOrderWarning)
+        compact_graph = decode_json_project(str(input_file), base_uri=BASE_URI, geometry_encoding="compact")
+
+    assert not any(compact_graph.triples((None, RDF.type, ONTOUML.Point)))
+    for path_id, point_list in path_points.items():
+        assert compact_graph.value(URIRef(BASE_URI + path_id), JSON2GRAPH.points) == Literal(
+            point_list, datatype=JSON2GRAPH.pointList
+        )
+    for shape_id, position in shape_positions.items():
+        assert compact_graph.value(URIRef(BASE_URI + shape_id), JSON2GRAPH.topLeftPosition) == Literal(
+            position, datatype=JSON2GRAPH.pointList
+        )
+    point_count = sum(len(point_list.split()) for point_list in path_points.values())
+    assert len(points_graph) - len(compact_graph) == 4 * point_count - len(path_points) + 3 * len(shape_positions)
+
+
+SELECTION_INPUT_FILE = str(Path(__file__).parent / "test_files" / "test_048.json")
+
+
+@pytest.mark.parametrize(
+    ("selectors", "selected_type", "selected_uri"),
+    [
+        (["UFO-B"], ONTOUML.Package, URIRef(BASE_URI + "iK94t6GAqACCgyt")),
+        (["C5MIVt6GAqACCh9L"], ONTOUML.Diagram, URIRef(BASE_URI + "C5MIVt6GAqACCh9L")),
+        (["UFO-?", "Risk *"], ONTOUML.Diagram, URIRef(BASE_URI + "hDVPJt6GAqACCicK")),
+    ],
+)
+def test_selected_packages_and_diagrams_are_decoded_with_their_dependencies(
+    selectors: list[str], selected_type: URIRef, selected_uri: URIRef
+) -> None:
+    """Verify that a selection is decoded as a closed subset of the complete project's graph."""
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        full_graph = decode_json_project(SELECTION_INPUT_FILE, base_uri=BASE_URI)
+        selected_graph = decode_json_project(SELECTION_INPUT_FILE, base_uri=BASE_URI, select=selectors)
+
+    assert (selected_uri, RDF.type, selected_type) in selected_graph
+    assert 0 < len(selected_graph) < len(full_graph)
+    assert not selected_graph - full_graph
+    for _, _, referenced_resource in selected_graph:
+        if isinstance(referenced_resource, URIRef) and str(referenced_resource).startswith(BASE_URI):
+            assert (referenced_resource, RDF.type, None) in selected_graph
+
+
+def test_selection_keeps_the_project_namespace_and_rejects_unmatched_selectors() -> None:
+    """Verify that the derived base URI does not depend on the selection and that unknown selectors are errors."""
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        full_graph = decode_json_model(SELECTION_INPUT_FILE)
+        selected_graph = decode_json_model(SELECTION_INPUT_FILE, select=["UFO-A"])
+
+    assert not selected_graph - full_graph
+    assert not any(selected_graph.triples((None, RDF.type, ONTOUML.Diagram)))
+    with pytest.raises(ElementSelectionError, match=r"\['Missing\*'\] match no Package or Diagram"):
+        decode_json_project(SELECTION_INPUT_FILE, base_uri=BASE_URI, select=["UFO-A", "Missing*"])
+
+
+def test_lazily_opened_project_decodes_only_the_queried_subjects(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Verify that a lazy project graph answers like the decoded graph while decoding only the shards it needs."""
+    decoded_shards = []
+    decode_json_to_graph = lazy_store.decode_json_to_graph
+
+    def decode_recorded_shard(shard_data: dict, *arguments, **options) -> Graph:
+        decoded_shards.append(shard_data)
+        return decode_json_to_graph(shard_data, *arguments, **options)
+
+    monkeypatch.setattr(lazy_store, "decode_json_to_graph", decode_recorded_shard)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        decoded_graph = decode_json_project(SELECTION_INPUT_FILE, base_uri=BASE_URI)
+        lazy_graph = open_json_project(SELECTION_INPUT_FILE, base_uri=BASE_URI)
+
+        classes = set(lazy_graph.subjects(RDF.type, ONTOUML.Class))
+        assert classes == set(decoded_graph.subjects(RDF.type, ONTOUML.Class)) and not decoded_shards
+
+        queried_class = sorted(classes)[0]
+        queried_property = decoded_graph.value(queried_class, ONTOUML.attribute) or queried_class
+        for subject in (queried_class, queried_property, URIRef(f"{queried_property}_cardinality")):
+            assert set(lazy_graph.predicate_objects(subject)) == set(decoded_graph.predicate_objects(subject))
+        assert len(decoded_shards) == 1
+        query = f"SELECT ?name WHERE {{ <{queried_class}> <{ONTOUML.name}> ?name }}"
+        assert set(lazy_graph.query(query)) == set(decoded_graph.query(query))
+
+        assert set(lazy_graph) == set(decoded_graph)
+        assert len(lazy_graph) == len(decoded_graph)
+    with pytest.raises(ModificationException):
+        lazy_graph.add((queried_class, RDFS.label, Literal("changed")))
+
+
+def test_source_element_table_resolves_nested_objects_by_range(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Verify that the nested objects of a type are looked up in the subtree of an object, references included."""
+    monkeypatch.setitem(args.ARGUMENTS, "base_uri", BASE_URI)
+    json_data = {
+        "id": "project",
+        "type": "Project",
+        "model": {
+            "id": "package",
+            "type": "Package",
+            "contents": [
+                {"id": "class-1", "type": "Class", "properties": [{"id": "property-1", "type": "Property"}]},
+                {"id": "class-2", "type": "Class", "properties": [{"id": "property-2", "type": "Property"}]},
+            ],
+        },
+        "diagrams": [{"id": "diagram", "type": "Diagram", "owner": {"id": "package", "type": "Package"}}],
+    }
+
+    source_elements = SourceElementTable(json_data)
+    project, package, class_1, _, class_2, _, diagram, _ = map(source_elements.get_element, range(len(source_elements)))
+
+    assert [element.id for element in source_elements.get_elements("Package")] == ["package", "package"]
+    assert (class_1.parent, class_1.end, class_1.uri) == (package.index, class_2.index, URIRef(BASE_URI + "class-1"))
+    assert [element.id for element in source_elements.get_nested_elements(class_2, "Property")] == ["property-2"]
+    assert [element.id for element in source_elements.get_nested_elements(package, "Property")] == [
+        "property-1",
+        "property-2",
+    ]
+    assert [element.id for element in source_elements.get_nested_elements(diagram, "Package")] == ["package"]
+    assert [element.id for element in source_elements.get_nested_elements(project, "Class")] == ["class-1", "class-2"]
+    assert source_elements.get_nested_elements(class_1, "Diagram") == []
+
+
+def test_duplicate_object_ids_are_warned() -> None:
+    """Verify that IDs shared by object definitions are reported once, while repeated references are accepted."""
+    duplicate_id_file = str(Path(__file__).parent / "test_files" / "test_030.json")
+
+    with pytest.warns(DuplicateIdWarning, match=r"ID 'SN2M1JGGAqACNxH' \(Class, ClassView\)"):
+        decode_ontouml_json2graph(json_file_path=duplicate_id_file, base_uri=BASE_URI)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", DuplicateIdWarning)
+        decode_ontouml_json2graph(json_file_path=ENUMERATION_INPUT_FILE, base_uri=BASE_URI)
+
+
 @pytest.mark.parametrize(
     ("width", "height"),
     [
@@ -769,6 +1031,39 @@ def test_bundled_vocabulary_111_defines_non_negative_dimensions() -> None:
     assert (ONTOUML.height, RDFS.range, XSD.positiveInteger) not in ontouml_vocabulary
 
 
+@pytest.mark.parametrize("vocabulary_version", ["v1.0.0", "v1.1.0", "v1.1.1"])
+def test_bundled_vocabulary_tables_match_their_turtle_files(vocabulary_version: str) -> None:
+    """Verify that the precompiled tables are current and equal to the tables computed from the parsed vocabulary."""
+    vocabulary_graph = Graph()
+    vocabulary_graph.parse(vocabulary_tables.get_vocabulary_file_path(vocabulary_version), format="ttl")
+
+    loaded_tables = vocabulary_tables.load_vocabulary_tables(vocabulary_version)
+
+    assert loaded_tables is not None
+    assert loaded_tables == vocabulary_tables.compile_vocabulary_tables(vocabulary_graph, str(ONTOUML))
+    assert ONTOUML.Class in loaded_tables.element_types
+    assert ONTOUML.OntoumlElement not in loaded_tables.element_types
+
+
+def test_stale_vocabulary_tables_are_ignored(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Verify that table files compiled from another Turtle file are not trusted."""
+    resources_dir = Path(vocabulary_tables.get_vocabulary_file_path("v1.1.1")).parent
+    for file_name in ("ontouml_v1.1.1.ttl", "ontouml_v1.1.1.tables.json"):
+        (tmp_path / file_name).write_bytes((resources_dir / file_name).read_bytes())
+    monkeypatch.setattr(vocabulary_tables, "_RESOURCES_DIRECTORY", str(tmp_path))
+
+    assert vocabulary_tables.load_vocabulary_tables("v1.1.1") is not None
+
+    with open(tmp_path / "ontouml_v1.1.1.ttl", "a", encoding="utf-8") as vocabulary_file:
+        vocabulary_file.write("\n# Changed after the tables were compiled.\n")
+
+    assert vocabulary_tables.load_vocabulary_tables("v1.1.1") is None
+
+    vocabulary_tables.build_vocabulary_tables_file("v1.1.1", str(ONTOUML))
+    assert vocabulary_tables.load_vocabulary_tables("v1.1.1") is not None
+    assert vocabulary_tables.load_vocabulary_tables("v1.0.0") is None
+
+
 @pytest.mark.parametrize(
     ("stereotype", "expected"),
     [
@@ -824,6 +1119,28 @@ def test_invalid_stereotype_policy(
     ontouml_graph.serialize(format="turtle")
 
 
+def test_memoized_source_values_are_still_reported_per_element() -> None:
+    """Verify that repeated stereotype and cardinality values are resolved once but warned for every element."""
+    normalize_stereotype.cache_clear()
+    elements = [
+        {"id": f"element-{number}", "type": "Class", "name": "Example", "stereotype": "Abstract Individual"}
+        for number in (1, 2)
+    ]
+    ontouml_graph = Graph()
+
+    with pytest.warns(InvalidStereotypeWarning) as stereotype_warnings:
+        for element in elements:
+            set_stereotype_relation(element, ontouml_graph, "preserve", BASE_URI)
+    with pytest.warns(CardinalityRepairWarning) as cardinality_warnings:
+        resolved_cardinalities = [resolve_cardinality("1,,*", f"property-{number}", "repair") for number in (1, 2)]
+
+    assert normalize_stereotype.cache_info().misses == 1
+    assert [str(warning.message).split("'")[1] for warning in stereotype_warnings] == ["element-1", "element-2"]
+    assert len(set(ontouml_graph.subjects(ONTOUML.stereotype, ONTOUML.abstractIndividual))) == 2
+    assert [str(warning.message).split("'")[1] for warning in cardinality_warnings] == ["property-1", "property-2"]
+    assert resolved_cardinalities == [("1..*", "1", "*")] * 2
+
+
 @pytest.mark.parametrize(
     ("element_type", "stereotype", "recognized_element_type"),
     [
@@ -1295,8 +1612,13 @@ def test_decode_json_model_exposes_unresolved_model_element_policy(tmp_path: Pat
     assert (referenced_element_uri, RDF.type, ONTOUML.Relation) in ontouml_graph
 
 
-def run_metadata_cli(input_file: Path, output_directory: Path, mode: str | None = None) -> subprocess.CompletedProcess:
-    """Run the command-line transformation with an optional metadata mode."""
+def run_metadata_cli(
+    input_file: Path,
+    output_directory: Path,
+    mode: str | None = None,
+    extra_arguments: tuple[str, ...] = (),
+) -> subprocess.CompletedProcess:
+    """Run the command-line transformation with an optional metadata mode and additional options."""
     command = [
         sys.executable,
         "-m",
@@ -1309,6 +1631,7 @@ def run_metadata_cli(input_file: Path, output_directory: Path, mode: str | None
     ]
     if mode is not None:
         command.extend(["--transformation-metadata", mode])
+    command.extend(extra_arguments)
     return subprocess.run(command, capture_output=True, check=False, text=True)
 
 
@@ -1575,6 +1898,50 @@ def test_batch_mode_allows_and_warns_about_an_explicit_shared_base(tmp_path: Pat
         assert (URIRef(BASE_URI + "class-1"), RDF.type, ONTOUML.Class) in output_graph
 
 
+def test_batch_dataset_writes_each_project_into_its_named_graph(tmp_path: Path) -> None:
+    """Verify that a batch dataset holds each distinct project and its provenance in graphs named by its base URI."""
+    input_directory = tmp_path / "inputs"
+    output_directory = tmp_path / "outputs"
+    input_directory.mkdir()
+    output_directory.mkdir()
+    first_input = write_cardinality_project(input_directory, "0..1").rename(input_directory / "first.json")
+    second_input = write_cardinality_project(input_directory, "1..*").rename(input_directory / "second.json")
+    (input_directory / "third.json").write_bytes(first_input.read_bytes())
+    command = [
+        sys.executable,
+        "-m",
+        "json2graph.decode",
+        "-a",
+        "-i",
+        str(input_directory),
+        "-o",
+        str(output_directory),
+        "--batch-dataset",
+        "-f",
+        "nquads",
+    ]
+
+    result = subprocess.run(
+        [*command, "--transformation-metadata", "sidecar"], capture_output=True, check=False, text=True
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert "third.json has the same content as an earlier input" in result.stderr
+    assert [output_file.name for output_file in output_directory.iterdir()] == ["inputs.nquads"]
+    dataset = Dataset().parse(output_directory / "inputs.nquads", format="nquads")
+    assert len([graph for graph in dataset.graphs() if len(graph)]) == 4
+    for input_file in (first_input, second_input):
+        base_uri = resolve_base_uri(json.loads(input_file.read_text(encoding="utf-8")))
+        project_graph = dataset.graph(URIRef(base_uri.removesuffix("#")))
+        assert to_isomorphic(project_graph) == to_isomorphic(decode_json_project(str(input_file)))
+        metadata_graph = dataset.graph(URIRef(base_uri + "provenance"))
+        assert (get_output_artifact(metadata_graph), DCTERMS.title, Literal("inputs.nquads")) in metadata_graph
+
+    for invalid_options in (["--base-uri", BASE_URI], ["-f", "ttl"]):
+        result = subprocess.run([*command, *invalid_options], capture_output=True, check=False, text=True)
+        assert result.returncode != 0
+
+
 def get_output_artifact(metadata_graph: Graph) -> URIRef:
     """Return the single entity generated by a recorded transformation activity."""
     output_artifacts = set(metadata_graph.subjects(PROV.wasGeneratedBy, None))
@@ -1679,15 +2046,21 @@ def test_embedded_metadata_describes_the_transformation(tmp_path: Path) -> None:
     assert configuration == {
         "append_content_hash": False,
         "base_uri": None,
+        "batch_dataset": False,
+        "canonical": False,
+        "compression": "none",
         "correct": False,
         "effective_base_uri": expected_base_uri,
         "format": "ttl",
+        "geometry_encoding": "points",
         "invalid_cardinality_policy": "preserve",
         "invalid_stereotype_policy": "preserve",
         "language": "",
         "model_only": False,
+        "partition": "none",
         "path_order_policy": "warn",
         "property_assignment_policy": "warn",
+        "select": None,
         "transformation_metadata": "embedded",
         "unresolved_model_element_policy": "omit",
     }
@@ -1696,6 +2069,23 @@ def test_embedded_metadata_describes_the_transformation(tmp_path: Path) -> None:
     assert not (tmp_path / "cardinality.provenance.ttl").exists()
 
 
+def test_writing_embedded_metadata_leaves_the_model_graph_unchanged(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Verify that embedded metadata is written with the model without being left in the model graph."""
+    monkeypatch.chdir(tmp_path)
+    ontouml_graph = decode_ontouml_json2graph(json_file_path=ENUMERATION_INPUT_FILE, execution_mode="test")
+    model_triples = set(ontouml_graph)
+    monkeypatch.setitem(args.ARGUMENTS, "transformation_metadata", "embedded")
+
+    output_file = write_graph_file(ontouml_graph, execution_mode="test")
+    output_graph = Graph().parse(output_file, format="turtle")
+
+    assert set(ontouml_graph) == model_triples
+    assert model_triples < set(output_graph)
+    assert any(output_graph.triples((None, RDF.type, PROV.Activity)))
+
+
 def test_metadata_records_comment_path_order_policy(tmp_path: Path) -> None:
     """Verify that provenance records the output-affecting path order option."""
     input_file = write_path_project(tmp_path)
@@ -1806,6 +2196,23 @@ def test_conformance_is_omitted_when_output_uses_an_undeclared_ontouml_term(tmp_
     assert not any(output_graph.triples((output_artifact, DCTERMS.conformsTo, None)))
 
 
+@pytest.mark.parametrize("shard_processes", [1, 2])
+def test_decoder_registers_every_ontouml_term_it_uses(shard_processes: int) -> None:
+    """Verify that the OntoUML terms collected while decoding cover all terms used in the graph."""
+    input_file = str(Path(__file__).parent / "test_files" / "test_048.json")
+
+    ontouml_graph = decode_json_project(json_file_path=input_file, shard_processes=shard_processes)
+    used_terms = {
+        term
+        for _, predicate, obj in ontouml_graph
+        for term in (predicate, obj)
+        if isinstance(term, URIRef) and term.startswith(str(ONTOUML))
+    }
+
+    assert used_terms <= get_graph_ontouml_terms(ontouml_graph)
+    assert get_graph_ontouml_terms(decode_json_project(json_file_path=input_file, base_uri=str(ONTOUML))) is None
+
+
 def test_library_embedded_metadata_never_creates_a_sidecar(tmp_path: Path) -> None:
     """Verify that in-memory library decoding has no implicit file-writing side effect."""
     input_file = write_cardinality_project(tmp_path, "0..1")
@@ -1909,3 +2316,868 @@ def test_batch_sidecars_describe_each_actual_source_file(tmp_path: Path) -> None
             DCTERMS.identifier,
             Literal(f"sha256:{expected_digest}"),
         ) in metadata_graph
+
+
+@pytest.mark.parametrize("geometry_encoding", ["points", "compact"])
+@pytest.mark.parametrize("test_name", ["test_013", "test_036", "test_041", "test_048"])
+def test_sharded_decoding_matches_sequential_decoding(test_name: str, geometry_encoding: str) -> None:
+    """Verify that decoding a project in shards produces the same graph and warnings as sequential decoding."""
+    input_file = str(Path(__file__).parent / "test_files" / f"{test_name}.json")
+
+    decoded_graphs = {}
+    raised_warnings = {}
+    for shard_processes in (1, 2):
+        with warnings.catch_warnings(record=True) as caught_warnings:
+            warnings.simplefilter("always")
+            decoded_graphs[shard_processes] = decode_json_project(
+                json_file_path=input_file,
+                base_uri=BASE_URI,
+                shard_processes=shard_processes,
+                geometry_encoding=geometry_encoding,
+                path_order_policy="comment",
+            )
+        raised_warnings[shard_processes] = sorted(
+            (caught.category.__name__, str(caught.message)) for caught in caught_warnings
+        )
+
+    assert set(decoded_graphs[2]) == set(decoded_graphs[1])
+    assert raised_warnings[2] == raised_warnings[1]
+
+
+def test_partition_project_splits_top_level_packages_and_diagram_groups() -> None:
+    """Verify that every shard keeps the project shell and that no content is lost or duplicated."""
+    project_data = safe_load_json_file(str(Path(__file__).parent / "test_files" / "test_048.json"))
+    top_level_packages = [content["id"] for content in project_data["model"]["contents"]]
+    diagrams = [diagram["id"] for diagram in project_data["diagrams"]]
+
+    shards = partition_project(project_data, processes=2)
+
+    assert len(shards) == len(top_level_packages) + 2
+    assert {shard["id"] for shard in shards} == {project_data["id"]}
+    assert [content["id"] for shard in shards for content in shard["model"].get("contents", [])] == top_level_packages
+    assert [diagram["id"] for shard in shards for diagram in shard.get("diagrams", [])] == diagrams
+
+
+@pytest.mark.parametrize("shard_processes", [0, -1, 1.5])
+def test_invalid_shard_processes_is_rejected(shard_processes: int) -> None:
+    """Verify that the number of shard processes must be a positive integer."""
+    with pytest.raises(ValueError):
+        decode_json_project(json_file_path=ENUMERATION_INPUT_FILE, shard_processes=shard_processes)
+
+
+class RecordingStore(Memory):
+    """In-memory RDFLib store that records how it is opened and closed, standing in for a disk-backed store."""
+
+    events = []
+
+    def open(self, configuration: str, create: bool = False) -> int:
+        RecordingStore.events.append(("open", configuration, create))
+        if configuration == "with-previous-content":
+            self.add((URIRef(BASE_URI + "previous"), RDF.type, ONTOUML.Class), None)
+        return VALID_STORE
+
+    def close(self, commit_pending_transaction: bool = False) -> None:
+        RecordingStore.events.append(("close", commit_pending_transaction))
+
+
+register_plugin("json2graph-test-recording", Store, __name__, "RecordingStore")
+
+
+@pytest.mark.parametrize("shard_processes", [1, 2])
+def test_output_graph_is_kept_in_the_selected_store(shard_processes: int) -> None:
+    """Verify that the graph is decoded into the selected, opened store, replacing its previous content."""
+    RecordingStore.events.clear()
+    input_file = str(Path(__file__).parent / "test_files" / "test_048.json")
+
+    stored_graph = decode_json_model(
+        json_file_path=input_file,
+        base_uri=BASE_URI,
+        shard_processes=shard_processes,
+        store="json2graph-test-recording",
+        store_configuration="with-previous-content",
+    )
+
+    assert isinstance(stored_graph.store, RecordingStore)
+    assert RecordingStore.events == [("open", "with-previous-content", True)]
+    assert set(stored_graph) == set(decode_json_model(json_file_path=input_file, base_uri=BASE_URI))
+    assert dict(stored_graph.namespaces())["ontouml"] == URIRef(str(ONTOUML))
+
+
+@pytest.mark.parametrize(
+    "store, store_configuration",
+    [("json2graph-test-missing", None), ("default", "store-path"), ("", None)],
+)
+def test_invalid_store_is_rejected(store: str, store_configuration: str | None) -> None:
+    """Verify that unregistered stores and configurations of the default store are rejected."""
+    with pytest.raises(ValueError):
+        decode_json_project(json_file_path=ENUMERATION_INPUT_FILE, store=store, store_configuration=store_configuration)
+
+
+def test_decoding_beyond_the_memory_budget_spills_the_graph_to_disk(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Verify that a graph larger than the memory budget is decoded in parts on disk with the same triples."""
+    input_file = Path(__file__).parent / "test_files" / "test_048.json"
+    estimate = memory_budget.estimate_graph_memory(safe_load_json_file(str(input_file)))
+    # The process is measured as using no memory, so the budget only has to hold the largest part.
+    monkeypatch.setattr(memory_budget, "get_resident_memory", lambda: 0)
+    monkeypatch.setattr(sharding, "get_resident_memory", lambda: 0)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        decoded_graph = decode_json_project(str(input_file), base_uri=BASE_URI, path_order_policy="comment")
+        spilled_graph = decode_json_project(
+            str(input_file), base_uri=BASE_URI, path_order_policy="comment", max_memory=estimate.graph_bytes // 2
+        )
+        spilled_model = decode_json_model(str(input_file), base_uri=BASE_URI, max_memory=estimate.graph_bytes // 2)
+        with pytest.raises(MemoryBudgetError, match="correction of the graph requires it in memory"):
+            decode_json_project(str(input_file), correct=True, max_memory=estimate.graph_bytes // 2)
+        with pytest.raises(MemoryBudgetError, match="is not enough for decoding part 1 of"):
+            decode_json_project(str(input_file), max_memory=GRAPH_BYTES_PER_TRIPLE)
+
+    assert is_spilled_graph(spilled_graph) and is_spilled_graph(spilled_model)
+    assert len(spilled_graph) == len(decoded_graph)
+    assert set(spilled_graph) == set(decoded_graph)
+    assert set(spilled_model) == set(decode_json_model(str(input_file), base_uri=BASE_URI))
+    queried_class = next(decoded_graph.subjects(RDF.type, ONTOUML.Class))
+    assert set(spilled_graph.predicate_objects(queried_class)) == set(decoded_graph.predicate_objects(queried_class))
+
+    save_graph_file(spilled_graph, str(tmp_path / "spilled.nt"), "nt", canonical=True)
+    save_graph_file(decoded_graph, str(tmp_path / "decoded.nt"), "nt", canonical=True)
+    assert (tmp_path / "spilled.nt").read_bytes() == (tmp_path / "decoded.nt").read_bytes()
+
+    spill_directory = Path(spilled_graph.store._spill_directory.name)
+    spilled_graph.close()
+    assert not spill_directory.exists()
+
+
+@pytest.mark.parametrize("max_memory", ["1", "0", "lots", "2X"])
+def test_command_line_memory_budget_fails_before_decoding(tmp_path: Path, max_memory: str) -> None:
+    """Verify that invalid budgets, and budgets that need spilling for an output that cannot be spilled, fail."""
+    result = run_metadata_cli(ENUMERATION_INPUT_FILE, tmp_path, extra_arguments=("--max-memory", max_memory))
+
+    assert result.returncode != 0
+    expected_message = "only an unpartitioned N-Triples output" if max_memory == "1" else "memory size"
+    assert expected_message in result.stderr
+    assert not list(tmp_path.glob("*.ttl"))
+
+
+def test_command_line_store_option(tmp_path: Path) -> None:
+    """Verify that the command line converts into the selected store and rejects stores in server mode."""
+    result = run_metadata_cli(
+        ENUMERATION_INPUT_FILE, tmp_path, extra_arguments=("--store", "Memory", "--store-configuration", "unused")
+    )
+    server_result = subprocess.run(
+        [sys.executable, "-m", "json2graph.decode", "--serve", "--store", "Memory"],
+        capture_output=True,
+        check=False,
+        input="",
+        text=True,
+    )
+
+    assert result.returncode == 0, result.stderr
+    output_graph = Graph().parse(tmp_path / f"{Path(ENUMERATION_INPUT_FILE).stem}.ttl", format="ttl")
+    assert set(output_graph) == set(decode_json_project(ENUMERATION_INPUT_FILE))
+    assert server_result.returncode != 0
+
+
+def build_turtle_writer_graph(triples: list[tuple]) -> Graph:
+    """Build a graph with the decoder's namespace bindings containing the informed triples."""
+    ontouml_graph = Graph()
+    ontouml_graph.bind("ontouml", ONTOUML)
+    ontouml_graph.bind("", BASE_URI)
+    for triple in triples:
+        ontouml_graph.add(triple)
+    return ontouml_graph
+
+
+TURTLE_WRITER_TRIPLES = [
+    (URIRef(BASE_URI + "class"), RDF.type, ONTOUML.Class),
+    (URIRef(BASE_URI + "class"), ONTOUML.name, Literal('Quote " backslash \\ line\nbreak\ttab\x01', lang="en")),
+    (URIRef(BASE_URI + "class"), ONTOUML.isAbstract, Literal(False)),
+    (URIRef(BASE_URI + "class"), ONTOUML.order, Literal("-3", datatype=XSD.integer)),
+    (URIRef(BASE_URI + "class"), ONTOUML.width, Literal(12, datatype=XSD.nonNegativeInteger)),
+    (URIRef(BASE_URI + "class"), ONTOUML.description, Literal("")),
+    (URIRef(BASE_URI + "class"), RDFS.seeAlso, URIRef("https://example.org/other#with.trailing.")),
+    (URIRef(BASE_URI + "class"), RDFS.seeAlso, URIRef("urn:uuid:4c3b2a19-0000-4000-8000-000000000000")),
+    (URIRef(BASE_URI + "class"), RDFS.comment, BNode("metadata")),
+    (BNode("metadata"), RDFS.label, Literal("café", datatype=XSD.string)),
+]
+
+
+def test_turtle_writer_output_parses_to_the_same_graph(tmp_path: Path) -> None:
+    """Verify that the specialized Turtle writer produces Turtle that reads back as the written graph."""
+    decoded_graph = decode_json_project(json_file_path=ENUMERATION_INPUT_FILE, base_uri=BASE_URI)
+
+    for ontouml_graph in (decoded_graph, build_turtle_writer_graph(TURTLE_WRITER_TRIPLES)):
+        output_file = tmp_path / "output.ttl"
+        safe_write_graph_file(ontouml_graph, str(output_file), "ttl")
+
+        assert to_isomorphic(Graph().parse(output_file, format="turtle")) == to_isomorphic(ontouml_graph)
+
+
+def test_turtle_writer_output_is_byte_stable(tmp_path: Path) -> None:
+    """Verify that the same graph is written with the same bytes regardless of triple insertion order."""
+    triples = [triple for triple in TURTLE_WRITER_TRIPLES if BNode("metadata") not in triple]
+    first_file = tmp_path / "first.ttl"
+    second_file = tmp_path / "second.ttl"
+
+    safe_write_graph_file(build_turtle_writer_graph(triples), str(first_file), "turtle")
+    safe_write_graph_file(build_turtle_writer_graph(list(reversed(triples))), str(second_file), "turtle")
+
+    assert first_file.read_bytes() == second_file.read_bytes()
+    assert first_file.read_text(encoding="utf-8").startswith(
+        f"@prefix : <{BASE_URI}> .\n@prefix ontouml: <{ONTOUML}> .\n"
+    )
+
+
+def test_turtle_writer_invalid_iri_falls_back_to_the_fixed_uri(tmp_path: Path) -> None:
+    """Verify that IRIs that cannot be written as Turtle are fixed before the graph is written."""
+    ontouml_graph = build_turtle_writer_graph([(URIRef(BASE_URI + "my class"), RDF.type, ONTOUML.Class)])
+    output_file = tmp_path / "output.ttl"
+
+    safe_write_graph_file(ontouml_graph, str(output_file), "ttl")
+
+    written_graph = Graph().parse(output_file, format="turtle")
+    assert set(written_graph) == {(URIRef(BASE_URI + "my%20class"), RDF.type, ONTOUML.Class)}
+
+
+@pytest.mark.parametrize("graph_format", ["nt", "ttl"])
+def test_canonical_cli_output_is_byte_identical_across_runs(tmp_path: Path, graph_format: str) -> None:
+    """Verify that canonical output, including embedded provenance, does not change between executions."""
+    input_file = write_cardinality_project(tmp_path, "0..1")
+    output_files = []
+
+    for run_name in ("first", "second"):
+        output_directory = tmp_path / run_name
+        result = run_metadata_cli(input_file, output_directory, "embedded", ("-f", graph_format, "--canonical"))
+        assert result.returncode == 0, result.stderr
+        output_files.append(output_directory / f"cardinality.{graph_format}")
+
+    assert output_files[0].read_bytes() == output_files[1].read_bytes()
+
+    output_graph = Graph().parse(output_files[0], format="nt" if graph_format == "nt" else "turtle")
+    assert not any(output_graph.triples((None, PROV.generatedAtTime, None)))
+    assert get_recorded_configuration(output_graph)["canonical"] is True
+    if graph_format == "nt":
+        lines = output_files[0].read_text(encoding="utf-8").splitlines()
+        assert lines == sorted(lines)
+
+
+def test_canonical_cli_output_rejects_formats_without_a_canonical_form(tmp_path: Path) -> None:
+    """Verify that canonical output is refused instead of silently writing non-canonical bytes."""
+    input_file = write_cardinality_project(tmp_path, "0..1")
+
+    result = run_metadata_cli(input_file, tmp_path, None, ("-f", "xml", "--canonical"))
+
+    assert result.returncode != 0
+    assert not (tmp_path / "cardinality.xml").exists()
+
+
+def test_canonical_ntriples_use_canonical_escapes_and_blank_node_labels(tmp_path: Path) -> None:
+    """Verify canonical N-Triples escaping and that blank-node labels do not depend on RDFLib's generated ones."""
+    written_lines = []
+    for blank_node in (BNode(), BNode()):
+        ontouml_graph = build_turtle_writer_graph(
+            [
+                (URIRef(BASE_URI + "class"), ONTOUML.name, Literal('a"b\\c\td\x7fe\x0bf', lang="en")),
+                (URIRef(BASE_URI + "class"), ONTOUML.description, Literal("text", datatype=XSD.string)),
+                (URIRef(BASE_URI + "class"), RDFS.comment, blank_node),
+                (blank_node, RDFS.label, Literal(7)),
+            ]
+        )
+        output_file = tmp_path / "output.nt"
+        save_graph_file(ontouml_graph, str(output_file), "nt", canonical=True)
+        written_lines.append(output_file.read_text(encoding="utf-8").splitlines())
+
+    assert written_lines[0] == written_lines[1]
+    assert f'<{BASE_URI}class> <{ONTOUML.name}> "a\\"b\\\\c\\td\\u007Fe\\u000Bf"@en .' in written_lines[0]
+    assert f'<{BASE_URI}class> <{ONTOUML.description}> "text" .' in written_lines[0]
+
+    with pytest.raises(ValueError):
+        save_graph_file(ontouml_graph, str(tmp_path / "output.xml"), "xml", canonical=True)
+
+
+@pytest.mark.parametrize(
+    ("compression", "suffix", "open_compressed"), [("gzip", ".gz", gzip.open), ("xz", ".xz", lzma.open)]
+)
+def test_cli_compresses_the_output_and_the_sidecar(
+    tmp_path: Path, compression: str, suffix: str, open_compressed: callable
+) -> None:
+    """Verify that the output file and its sidecar are written compressed with the selected suffix."""
+    input_file = write_cardinality_project(tmp_path, "0..1")
+
+    result = run_metadata_cli(input_file, tmp_path, "sidecar", ("-f", "nt", "--compression", compression))
+
+    assert result.returncode == 0, result.stderr
+    assert not (tmp_path / "cardinality.nt").exists()
+    with open_compressed(tmp_path / f"cardinality.nt{suffix}", "rb") as output_file:
+        output_graph = Graph().parse(data=output_file.read(), format="nt")
+    with open_compressed(tmp_path / f"cardinality.provenance.ttl{suffix}", "rb") as sidecar_file:
+        metadata_graph = Graph().parse(data=sidecar_file.read(), format="turtle")
+
+    assert any(output_graph.triples((None, RDF.type, ONTOUML.Class)))
+    assert (get_output_artifact(metadata_graph), DCTERMS.title, Literal(f"cardinality.nt{suffix}")) in metadata_graph
+    assert get_recorded_configuration(metadata_graph)["compression"] == compression
+
+
+def test_save_graph_file_infers_compression_from_the_suffix(tmp_path: Path) -> None:
+    """Verify that library output is compressed according to its suffix and that gzip output is reproducible."""
+    ontouml_graph = decode_json_project(json_file_path=ENUMERATION_INPUT_FILE, base_uri=BASE_URI)
+
+    save_graph_file(ontouml_graph, str(tmp_path / "first.ttl.gz"), "ttl")
+    save_graph_file(ontouml_graph, str(tmp_path / "second.ttl.gz"), "ttl")
+    save_graph_file(ontouml_graph, str(tmp_path / "output.ttl.xz"), "ttl")
+
+    assert (tmp_path / "first.ttl.gz").read_bytes() == (tmp_path / "second.ttl.gz").read_bytes()
+    for output_file, open_compressed in (
+        (tmp_path / "first.ttl.gz", gzip.open),
+        (tmp_path / "output.ttl.xz", lzma.open),
+    ):
+        with open_compressed(output_file, "rb") as compressed_file:
+            written_graph = Graph().parse(data=compressed_file.read(), format="turtle")
+        assert set(written_graph) == set(ontouml_graph)
+
+
+def load_graph_partitions(manifest_file: Path) -> tuple[dict, list[Graph]]:
+    """Load a partition manifest and the graphs of its partitions, verifying their recorded sizes and hashes."""
+    manifest = json.loads(manifest_file.read_text(encoding="utf-8"))
+    partition_graphs = []
+    for partition in manifest["partitions"]:
+        partition_content = (manifest_file.parent / partition["file"]).read_bytes()
+        assert partition["bytes"] == len(partition_content)
+        assert partition["sha256"] == hashlib.sha256(partition_content).hexdigest()
+        partition_graph = Graph().parse(data=partition_content, format=manifest["format"])
+        assert partition["triples"] == len(partition_graph)
+        partition_graphs.append(partition_graph)
+    return manifest, partition_graphs
+
+
+@pytest.mark.parametrize("partition_by", ["package", "diagram", "type", "triples"])
+def test_partitioned_output_writes_each_triple_once_with_a_manifest(tmp_path: Path, partition_by: str) -> None:
+    """Verify that the partitions hold disjoint sets of triples whose union is the graph, keeping blank nodes whole."""
+    ontouml_graph = decode_json_project(json_file_path=SELECTION_INPUT_FILE, base_uri=BASE_URI)
+    first_class = sorted(ontouml_graph.subjects(RDF.type, ONTOUML.Class))[0]
+    ontouml_graph.add((first_class, RDFS.seeAlso, BNode("outer")))
+    ontouml_graph.add((BNode("outer"), RDFS.seeAlso, BNode("inner")))
+    ontouml_graph.add((BNode("inner"), RDFS.label, Literal("nested")))
+
+    manifest_file = save_partitioned_graph_files(
+        ontouml_graph, str(tmp_path), "model", "nt", partition_by, partition_size=500
+    )
+    manifest, partition_graphs = load_graph_partitions(Path(manifest_file))
+
+    assert manifest_file == str(tmp_path / "model.manifest.json")
+    assert manifest["triples"] == len(ontouml_graph) == sum(len(graph) for graph in partition_graphs)
+    assert to_isomorphic(sum(partition_graphs, Graph())) == to_isomorphic(ontouml_graph)
+    assert sum(1 for graph in partition_graphs if (first_class, RDF.type, ONTOUML.Class) in graph) == 1
+    assert any(
+        (first_class, RDFS.seeAlso, None) in graph and (None, RDFS.label, Literal("nested")) in graph
+        for graph in partition_graphs
+    )
+
+    keys = [partition["key"] for partition in manifest["partitions"]]
+    if partition_by == "triples":
+        assert len(keys) > 1 and all(len(graph) <= 500 for graph in partition_graphs)
+    elif partition_by == "type":
+        assert str(ONTOUML.Class) in keys and str(ONTOUML.Point) in keys
+    else:
+        owner_type = ONTOUML.Package if partition_by == "package" else ONTOUML.Diagram
+        assert all((URIRef(key), RDF.type, owner_type) in ontouml_graph for key in keys[:-1])
+        assert keys[-1] is None
+
+
+def test_cli_partitions_the_output_and_describes_the_manifest_in_the_metadata(tmp_path: Path) -> None:
+    """Verify that the command line writes compressed partitions and records the manifest as the output artifact."""
+    result = run_metadata_cli(
+        SELECTION_INPUT_FILE, tmp_path, "sidecar", ("--partition", "diagram", "--compression", "gzip")
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert not (tmp_path / "test_048.ttl.gz").exists()
+    manifest = json.loads((tmp_path / "test_048.manifest.json").read_text(encoding="utf-8"))
+    assert manifest["partition"] == "diagram" and manifest["compression"] == "gzip"
+    assert all(partition["file"].endswith(".ttl.gz") for partition in manifest["partitions"])
+    partition_triples = set()
+    for partition in manifest["partitions"]:
+        with gzip.open(tmp_path / partition["file"], "rb") as partition_file:
+            partition_triples.update(Graph().parse(data=partition_file.read(), format="turtle"))
+    assert partition_triples == set(decode_json_project(SELECTION_INPUT_FILE))
+
+    with gzip.open(tmp_path / "test_048.provenance.ttl.gz", "rb") as sidecar_file:
+        metadata_graph = Graph().parse(data=sidecar_file.read(), format="turtle")
+    assert (get_output_artifact(metadata_graph), DCTERMS.title, Literal("test_048.manifest.json")) in metadata_graph
+    assert get_recorded_configuration(metadata_graph)["partition"] == "diagram"
+
+
+@pytest.mark.skipif(
+    importlib.util.find_spec("compression") is not None or importlib.util.find_spec("zstandard") is not None,
+    reason="A Zstandard implementation is available.",
+)
+def test_zstd_compression_requires_an_available_implementation(tmp_path: Path) -> None:
+    """Verify that Zstandard output is rejected before writing when no implementation is available."""
+    ontouml_graph = decode_json_project(json_file_path=ENUMERATION_INPUT_FILE, base_uri=BASE_URI)
+
+    with pytest.raises(ValueError):
+        save_graph_file(ontouml_graph, str(tmp_path / "output.nt.zst"), "nt")
+
+    assert not (tmp_path / "output.nt.zst").exists()
+
+
+def test_graph_snapshot_round_trip(tmp_path: Path) -> None:
+    """Verify that graph snapshots are written reproducibly and reload every kind of term and the namespaces."""
+    ontouml_graph = decode_json_project(json_file_path=ENUMERATION_INPUT_FILE, base_uri=BASE_URI, language="en")
+    ontouml_graph.add((URIRef(BASE_URI + "class"), RDFS.comment, Literal("Plain \u00e9 text\n")))
+    ontouml_graph.add((URIRef(BASE_URI + "class"), RDFS.seeAlso, BNode("snapshotNode")))
+
+    save_graph_file(ontouml_graph, str(tmp_path / "first.snapshot"), "snapshot")
+    save_graph_file(ontouml_graph, str(tmp_path / "second.snapshot"), "snapshot")
+    reloaded_graph = load_graph_file(str(tmp_path / "first.snapshot"))
+
+    assert (tmp_path / "first.snapshot").read_bytes() == (tmp_path / "second.snapshot").read_bytes()
+    assert set(reloaded_graph) == set(ontouml_graph)
+    assert set(iter_graph_file_triples(str(tmp_path / "first.snapshot"))) == set(ontouml_graph)
+    assert dict(reloaded_graph.namespaces())[""] == URIRef(BASE_URI)
+    with pytest.raises(ValueError):
+        save_graph_file(ontouml_graph, str(tmp_path / "output.snapshot.gz"), "snapshot")
+
+
+def test_cli_writes_graph_snapshots(tmp_path: Path) -> None:
+    """Verify that the command line writes snapshots and rejects compressed snapshots."""
+    result = run_metadata_cli(ENUMERATION_INPUT_FILE, tmp_path, extra_arguments=("-f", "snapshot"))
+    compressed_result = run_metadata_cli(
+        ENUMERATION_INPUT_FILE, tmp_path / "compressed", extra_arguments=("-f", "snapshot", "--compression", "xz")
+    )
+
+    assert result.returncode == 0, result.stderr
+    snapshot_file = tmp_path / f"{Path(ENUMERATION_INPUT_FILE).stem}.snapshot"
+    assert set(load_graph_file(str(snapshot_file))) == set(decode_json_project(ENUMERATION_INPUT_FILE))
+    assert compressed_result.returncode != 0
+
+
+def test_invalid_graph_snapshots_are_rejected(tmp_path: Path) -> None:
+    """Verify that files that are not complete snapshots of the supported version are rejected."""
+    ontouml_graph = build_turtle_writer_graph(TURTLE_WRITER_TRIPLES)
+    save_graph_file(ontouml_graph, str(tmp_path / "valid.snapshot"), "snapshot")
+    snapshot_content = (tmp_path / "valid.snapshot").read_bytes()
+    invalid_snapshots = {
+        "empty": b"",
+        "turtle": serialize_graph(ontouml_graph, "ttl").encode("utf-8"),
+        "truncated": snapshot_content[:-4],
+        "future": snapshot_content[:8] + (2).to_bytes(4, "little") + snapshot_content[12:],
+    }
+
+    for name, content in invalid_snapshots.items():
+        (tmp_path / f"{name}.snapshot").write_bytes(content)
+        with pytest.raises(ValueError):
+            load_graph_file(str(tmp_path / f"{name}.snapshot"))
+
+
+def test_batch_inputs_skip_resource_forks_and_keep_colliding_stems_apart(tmp_path: Path) -> None:
+    """Verify that hidden archive members are skipped and that entries sharing a stem get distinct output stems."""
+    project_content = write_cardinality_project(tmp_path, "0..1").read_bytes()
+    input_directory = tmp_path / "inputs"
+    input_directory.mkdir()
+    (input_directory / "a.json").write_bytes(project_content)
+    (input_directory / "b.json").write_bytes(project_content)
+    (input_directory / "b.json.gz").write_bytes(gzip.compress(project_content))
+    with zipfile.ZipFile(input_directory / "a.zip", "w") as archive:
+        archive.writestr("m.json", project_content)
+        archive.writestr("__MACOSX/._m.json", b"\x00\x05\x16\x07")
+    with tarfile.open(input_directory / "a.tar.gz", "w:gz") as archive:
+        for member_name in ("m.json", "._m.json"):
+            member = tarfile.TarInfo(member_name)
+            member.size = len(project_content)
+            archive.addfile(member, io.BytesIO(project_content))
+
+    output_stems = [batch_input.output_stem for batch_input in iter_batch_inputs(str(input_directory))]
+
+    assert output_stems == ["a", "a.tar.gz/m", "a.zip/m", "b.json", "b.json.gz"]
+
+
+def test_batch_mode_reads_compressed_files_and_archive_members(tmp_path: Path) -> None:
+    """Verify that batch mode decodes compressed JSON files and archive members without extracting them."""
+    input_directory = tmp_path / "inputs"
+    output_directory = tmp_path / "outputs"
+    input_directory.mkdir()
+    project_content = {
+        cardinality: write_cardinality_project(tmp_path, cardinality).read_bytes() for cardinality in ("0..1", "1..*")
+    }
+
+    (input_directory / "plain.json").write_bytes(project_content["0..1"])
+    (input_directory / "gzipped.json.gz").write_bytes(gzip.compress(project_content["0..1"]))
+    (input_directory / "xz.json.xz").write_bytes(lzma.compress(project_content["1..*"]))
+    with zipfile.ZipFile(input_directory / "catalogue.zip", "w") as archive:
+        archive.writestr("models/first.json", project_content["0..1"])
+        archive.writestr("models/README.txt", "Not a project.")
+        archive.writestr("../escaping.json", project_content["0..1"])
+    with tarfile.open(input_directory / "bundle.tar.gz", "w:gz") as archive:
+        member = tarfile.TarInfo("second.json")
+        member.size = len(project_content["1..*"])
+        archive.addfile(member, io.BytesIO(project_content["1..*"]))
+
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "json2graph.decode",
+            "-a",
+            "-i",
+            str(input_directory),
+            "-o",
+            str(output_directory),
+            "--silent",
+            "--transformation-metadata",
+            "sidecar",
+        ],
+        capture_output=True,
+        check=False,
+        text=True,
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert "UnsafeArchiveMemberWarning" in result.stderr
+    assert sorted(path.relative_to(output_directory).as_posix() for path in output_directory.rglob("*.ttl")) == [
+        "bundle/second.provenance.ttl",
+        "bundle/second.ttl",
+        "catalogue/models/first.provenance.ttl",
+        "catalogue/models/first.ttl",
+        "gzipped.provenance.ttl",
+        "gzipped.ttl",
+        "plain.provenance.ttl",
+        "plain.ttl",
+        "xz.provenance.ttl",
+        "xz.ttl",
+    ]
+    assert sorted(path.name for path in input_directory.iterdir()) == [
+        "bundle.tar.gz",
+        "catalogue.zip",
+        "gzipped.json.gz",
+        "plain.json",
+        "xz.json.xz",
+    ]
+    assert set(Graph().parse(output_directory / "catalogue" / "models" / "first.ttl")) == set(
+        Graph().parse(output_directory / "plain.ttl")
+    )
+
+    metadata_graph = Graph().parse(output_directory / "bundle" / "second.provenance.ttl")
+    transformation = metadata_graph.value(get_output_artifact(metadata_graph), PROV.wasGeneratedBy)
+    source_artifact = next(
+        entity
+        for entity in metadata_graph.objects(transformation, PROV.used)
+        if (entity, DCTERMS.title, Literal("second.json")) in metadata_graph
+    )
+    expected_digest = hashlib.sha256(project_content["1..*"]).hexdigest()
+    assert (source_artifact, DCTERMS.identifier, Literal(f"sha256:{expected_digest}")) in metadata_graph
+
+
+def test_input_watcher_reports_changes_once_they_are_stable(tmp_path: Path) -> None:
+    """Verify that watch mode converts only changed inputs, and only after they stop changing."""
+    converted_file = tmp_path / "converted.json"
+    converted_file.write_text("{}")
+    (tmp_path / ".hidden.json").write_text("{}")
+    (tmp_path / "notes.txt").write_text("Not a project.")
+    watcher = InputWatcher(str(tmp_path), decode_all=True)
+
+    assert watcher.poll() == []
+
+    for content in ("{ }", '{"a": 1}'):
+        converted_file.write_text(content)
+        assert watcher.poll() == []
+
+    new_file = tmp_path / "new.json.gz"
+    new_file.write_bytes(gzip.compress(b"{}"))
+    (tmp_path / ".hidden.json").write_text('{"a": 1}')
+    (tmp_path / "notes.txt").write_text("Still not a project.")
+
+    assert watcher.poll() == [str(converted_file)]
+    assert watcher.poll() == [str(new_file)]
+    assert watcher.poll() == []
+
+
+@pytest.mark.parametrize("watch_interval", ["0", "-1", "nan"])
+def test_invalid_watch_interval_is_rejected(tmp_path: Path, watch_interval: str) -> None:
+    """Verify that the watch interval must be a positive, finite number of seconds."""
+    input_file = write_cardinality_project(tmp_path, "1")
+    result = run_metadata_cli(input_file, tmp_path, extra_arguments=("--watch", f"--watch-interval={watch_interval}"))
+
+    assert result.returncode != 0
+    assert "watch interval" in result.stderr
+
+
+def test_watch_mode_converts_changed_inputs_again(tmp_path: Path) -> None:
+    """Verify that watch mode converts the input, converts it again after it changes, and stops on Ctrl+C."""
+    input_file = write_cardinality_project(tmp_path, "0..1")
+    output_file = tmp_path / "outputs" / "cardinality.ttl"
+    watch_process = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "json2graph.decode",
+            "-i",
+            str(input_file),
+            "-o",
+            str(tmp_path / "outputs"),
+            "--watch",
+            "--watch-interval",
+            "0.1",
+        ],
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+
+    def wait_for_output(expected_literal: Literal) -> None:
+        deadline = time.monotonic() + 60
+        while time.monotonic() < deadline:
+            if output_file.exists():
+                try:
+                    if expected_literal in set(Graph().parse(output_file).objects()):
+                        return
+                except Exception:
+                    pass
+            assert watch_process.poll() is None
+            time.sleep(0.1)
+        pytest.fail(f"Watch mode did not write {expected_literal} to the output.")
+
+    try:
+        wait_for_output(Literal("0..1"))
+        write_cardinality_project(tmp_path, "1..*")
+        wait_for_output(Literal("1..*"))
+        watch_process.send_signal(signal.SIGINT)
+        _, stderr = watch_process.communicate(timeout=60)
+    finally:
+        if watch_process.poll() is None:
+            watch_process.kill()
+            watch_process.communicate()
+
+    assert watch_process.returncode == 0, stderr
+    assert f"Change detected in {input_file}" in stderr
+    assert "Watch mode stopped." in stderr
+
+
+def run_server(tmp_path: Path, jobs: list[object], extra_arguments: tuple[str, ...] = ()) -> dict[object, dict]:
+    """Send jobs to the conversion server and return its responses by job id."""
+    result = subprocess.run(
+        [sys.executable, "-m", "json2graph.decode", "--serve", "-o", str(tmp_path / "outputs"), *extra_arguments],
+        input="".join((job if isinstance(job, str) else json.dumps(job)) + "\n" for job in jobs),
+        capture_output=True,
+        check=False,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr
+    responses = [json.loads(line) for line in result.stdout.splitlines()]
+    assert len(responses) == len(jobs)
+    return {response["id"]: response for response in responses}
+
+
+def test_server_converts_jobs_and_reuses_cached_results(tmp_path: Path) -> None:
+    """Verify that the server returns graphs or output paths, caches results, and reports job errors."""
+    invalid_project_data = json.loads(write_cardinality_project(tmp_path, "5..1").read_text())
+    project_data = json.loads(write_cardinality_project(tmp_path, "1..*").read_text())
+    responses = run_server(
+        tmp_path,
+        [
+            {"id": "inline", "content": project_data, "options": {"format": "nt", "base_uri": BASE_URI}},
+            {"id": "repeated", "content": json.dumps(project_data), "options": {"format": "nt", "base_uri": BASE_URI}},
+            {"id": "file", "input_path": ENUMERATION_INPUT_FILE, "output_file": "enumeration.ttl"},
+            {"id": "unknown", "content": project_data, "options": {"output_format": "nt"}},
+            {"id": "invalid", "content": invalid_project_data},
+            {"id": "repaired", "content": invalid_project_data, "options": {"invalid_cardinality_policy": "repair"}},
+            "not json",
+        ],
+        ("--invalid-cardinality-policy", "error", "--language", "en"),
+    )
+
+    inline_graph = Graph().parse(data=responses["inline"]["graph"], format="nt")
+    assert responses["inline"]["status"] == "ok"
+    assert (URIRef(BASE_URI + "class-1"), ONTOUML.name, Literal("Example", lang="en")) in inline_graph
+    assert responses["repeated"]["cached"] is True
+    assert responses["repeated"]["graph"] == responses["inline"]["graph"]
+
+    assert responses["file"]["status"] == "ok"
+    assert responses["file"]["output_file"] == str(tmp_path / "outputs" / "enumeration.ttl")
+    assert set(Graph().parse(responses["file"]["output_file"])) == set(
+        decode_json_project(ENUMERATION_INPUT_FILE, language="en")
+    )
+    assert {warning["category"] for warning in responses["file"]["warnings"]} == {"PathPointOrderWarning"}
+
+    assert responses["unknown"]["status"] == "error"
+    assert "output_format" in responses["unknown"]["error"]
+    assert responses["invalid"]["status"] == "error"
+    assert responses["repaired"]["status"] == "ok"
+    assert responses[None]["status"] == "error"
+
+
+def test_server_converts_jobs_concurrently_in_worker_processes(tmp_path: Path) -> None:
+    """Verify that jobs converted by worker processes produce the same graphs as the library."""
+    test_files = [Path(__file__).parent / "test_files" / f"test_00{number}.json" for number in range(1, 5)]
+    responses = run_server(
+        tmp_path,
+        [{"id": test_file.name, "input_path": str(test_file)} for test_file in test_files],
+        ("--serve-workers", "2"),
+    )
+
+    for test_file in test_files:
+        assert responses[test_file.name]["status"] == "ok"
+        served_graph = Graph().parse(data=responses[test_file.name]["graph"], format="ttl")
+        assert set(served_graph) == set(decode_json_project(str(test_file)))
+
+
+def test_input_path_is_required_without_server_mode(tmp_path: Path) -> None:
+    """Verify that the input path is only optional in server mode, where it is rejected."""
+    missing_input = subprocess.run(
+        [sys.executable, "-m", "json2graph.decode", "-o", str(tmp_path)], capture_output=True, check=False, text=True
+    )
+    server_with_input = run_metadata_cli(ENUMERATION_INPUT_FILE, tmp_path, extra_arguments=("--serve",))
+
+    assert missing_input.returncode != 0
+    assert "-i/--input_path" in missing_input.stderr
+    assert server_with_input.returncode != 0
+    assert "--serve" in server_with_input.stderr
+
+
+# Budget for the cumulative import time of the argument parser, measured with -X importtime.
+STARTUP_IMPORT_BUDGET_MICROSECONDS = 100_000
+
+
+@pytest.mark.parametrize("startup_option", ["--version", "--help"])
+def test_startup_options_do_not_load_the_decoder(startup_option: str) -> None:
+    """Verify that the version and help are printed without importing RDFLib or the decoders, within the budget."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "json2graph.decode", startup_option],
+        capture_output=True,
+        check=False,
+        text=True,
+    )
+    import_times = {}
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and line.split("|")[1].strip().isdigit():
+            import_times[line.rsplit("|", 1)[1].strip()] = int(line.split("|")[1])
+
+    assert result.returncode == 0, result.stderr
+    assert METADATA["Version"] in result.stdout
+    assert not [module for module in import_times if module.split(".")[0] == "rdflib" or "json2graph.decoder" in module]
+    assert import_times["json2graph.modules.arguments"] < STARTUP_IMPORT_BUDGET_MICROSECONDS
+
+
+def write_check_project(tmp_path: Path) -> Path:
+    """Write a project with two invalid stereotypes, an invalid cardinality, and an unresolved modelElement."""
+    input_file = write_cardinality_project(tmp_path, "1..x")
+    project = json.loads(input_file.read_text(encoding="utf-8"))
+    project["model"]["contents"].extend(
+        {"id": f"class-{number}", "type": "Class", "name": f"Invalid {number}", "stereotype": "participation"}
+        for number in (2, 3)
+    )
+    project["diagrams"] = json.loads(write_model_element_reference_project(tmp_path).read_text(encoding="utf-8"))[
+        "diagrams"
+    ]
+    input_file.write_text(json.dumps(project), encoding="utf-8")
+    return input_file
+
+
+def test_check_reports_every_element_rejected_by_error_policies(tmp_path: Path) -> None:
+    """Verify that a check reports all rejected elements as errors, before the warnings, without writing a graph."""
+    input_file = write_check_project(tmp_path)
+
+    findings = check_json_project(
+        str(input_file),
+        invalid_stereotype_policy="error",
+        invalid_cardinality_policy="error",
+        unresolved_model_element_policy="error",
+    )
+    errors = [finding for finding in findings if finding.severity == "error"]
+    warning_findings = [finding for finding in findings if finding.severity == "warning"]
+
+    assert findings == errors + warning_findings
+    assert sorted(finding.category for finding in errors) == [
+        "InvalidCardinalityError",
+        "InvalidStereotypeError",
+        "InvalidStereotypeError",
+        "UnresolvedModelElementError",
+    ]
+    assert "PathPointOrderWarning" in {finding.category for finding in warning_findings}
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["cardinality.json", "model-element-reference.json"]
+
+
+def test_check_with_lenient_policies_reports_only_warnings(tmp_path: Path) -> None:
+    """Verify that the warnings of a conversion are returned as findings when no error policy is selected."""
+    input_file = write_check_project(tmp_path)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        findings = check_json_project(str(input_file), invalid_cardinality_policy="repair")
+
+    assert {finding.severity for finding in findings} == {"warning"}
+    assert {"InvalidStereotypeWarning", "UnresolvedModelElementWarning"} <= {finding.category for finding in findings}
+
+
+def test_check_command_exits_with_error_status_on_rejected_content(tmp_path: Path) -> None:
+    """Verify that --check prints one line per finding and exits with status 1 only if content is rejected."""
+    input_file = write_check_project(tmp_path)
+    output_directory = tmp_path / "results"
+
+    rejected = run_metadata_cli(
+        input_file, output_directory, extra_arguments=("--check", "--invalid-stereotype-policy", "error")
+    )
+    accepted = run_metadata_cli(input_file, output_directory, extra_arguments=("--check",))
+
+    assert rejected.returncode == 1, rejected.stderr
+    assert rejected.stdout.count(f"{input_file}: error: InvalidStereotypeError: ") == 2
+    assert accepted.returncode == 0, accepted.stderr
+    assert f"{input_file}: warning: InvalidCardinalityWarning: " in accepted.stdout
+    assert not output_directory.exists()
+
+
+@pytest.mark.parametrize("shard_processes", [1, 2])
+def test_diagnostics_collector_limits_and_counts_per_code(tmp_path: Path, shard_processes: int) -> None:
+    """Verify that a collector keeps the first diagnostics of each code, counts all of them, and issues no warnings."""
+    input_file = write_check_project(tmp_path)
+    diagnostics = DiagnosticsCollector(limit=1)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        decode_json_project(str(input_file), correct=True, shard_processes=shard_processes, diagnostics=diagnostics)
+    report = diagnostics.get_report()
+
+    assert report["counts"]["InvalidStereotypeWarning"] == 2
+    assert report["counts"]["InvalidCardinalityWarning"] == 1
+    assert report["counts"]["DGA1"] > 1
+    assert report["suppressed"] == {code: count - 1 for code, count in report["counts"].items() if count > 1}
+    assert sorted(record["code"] for record in report["diagnostics"]) == sorted(report["counts"])
+    assert [record.element_id for record in diagnostics.records if record.code == "InvalidStereotypeWarning"] == [
+        "class-2"
+    ]
+
+
+def test_diagnostics_report_command(tmp_path: Path) -> None:
+    """Verify that the command prints diagnostics up to the limit and saves the report next to the output graph."""
+    input_file = write_check_project(tmp_path)
+    output_directory = tmp_path / "results"
+
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "json2graph.decode",
+            "-i",
+            str(input_file),
+            "-o",
+            str(output_directory),
+            "-c",
+            "--diagnostics-limit",
+            "1",
+            "--diagnostics-report",
+        ],
+        capture_output=True,
+        check=False,
+        text=True,
+    )
+    report = json.loads((output_directory / "cardinality.diagnostics.json").read_text(encoding="utf-8"))
+
+    assert result.returncode == 0, result.stderr
+    assert result.stderr.count(": InvalidStereotypeWarning: ") == 1
+    assert "1 further InvalidStereotypeWarning diagnostic(s) not shown due to the diagnostics limit." in result.stderr
+    assert report["input"] == str(input_file)
+    assert report["limit"] == 1
+    assert report["suppressed"]["InvalidStereotypeWarning"] == 1
+    assert len(report["diagnostics"]) == len(report["counts"])
@@ -0,0 +1,29 @@
+"""Compile the precompiled tables of every bundled OntoUML Vocabulary version."""
+
+from pathlib import Path
+
+from json2graph.modules.logger import initialize_logger
+from json2graph.modules.vocabulary_tables import build_vocabulary_tables_file
+
+LOGGER = initialize_logger()
+
+ONTOUML_NAMESPACE = "https://w3id.org/ontouml#"
+RESOURCES_RELATIVE_PATH = Path("json2graph") / "resources"
+
+
+def update_vocabulary_tables() -> list[str]:
+    """Write the table file of each bundled vocabulary version, recording the hash of its Turtle file."""
+    resources_dir = Path(__file__).resolve().parent / RESOURCES_RELATIVE_PATH
+    tables_file_paths = []
+
+    for vocabulary_file in sorted(resources_dir.glob("ontouml_*.ttl")):
+        vocabulary_version = vocabulary_file.stem.removeprefix("ontouml_")
+        tables_file_path = build_vocabulary_tables_file(vocabulary_version, ONTOUML_NAMESPACE)
+        LOGGER.info(f"OntoUML Vocabulary {vocabulary_version} tables written to '{tables_file_path}'.")
+        tables_file_paths.append(tables_file_path)
+
+    return tables_file_paths
+
+
+if __name__ == "__main__":
+    update_vocabulary_tables()
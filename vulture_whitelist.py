@@ -0,0 +1,27 @@
+"""Names that vulture reports as unused but that are used outside the analyzed code.
+
+The library module is excluded from the analysis, so the helpers used only by the library interface are listed here,
+as well as the attributes and parameters defined by the RDFLib interfaces that the modules implement.
+"""
+
+from json2graph.decode import open_ontouml_json_lazily
+from json2graph.modules.graph_snapshot import iter_graph_snapshot
+from json2graph.modules.lazy_store import LazyProjectStore
+from json2graph.modules.output_compression import get_compression_from_path
+from vulture.whitelist_utils import Whitelist
+
+# Stands for the parameters whose names are given by the implemented interfaces.
+_ = Whitelist()
+
+# Library interface (json2graph/library.py)
+get_compression_from_path
+iter_graph_snapshot
+open_ontouml_json_lazily
+
+# RDFLib Store interface (json2graph/modules/lazy_store.py)
+LazyProjectStore.context_aware
+LazyProjectStore.formula_aware
+LazyProjectStore.transaction_aware
+LazyProjectStore.graph_aware
+_.quoted  # parameter of LazyProjectStore.add
+_.quads  # parameter of LazyProjectStore.addN